@@ -0,0 +1,6 @@
+-- Raw postcodes resolved into ref_postcode_lookup by --enrich-postcodes
+-- (not listed in order.txt; runs before the transform SQL)
+SELECT t.post_code FROM fin_customer_debtor_no_activity_1_year        t
+UNION
+SELECT t.post_code FROM fin_customer_debtor_activity_2_years          t
+;
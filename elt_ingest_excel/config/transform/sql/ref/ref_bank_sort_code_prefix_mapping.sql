@@ -8,7 +8,5 @@ SELECT
      , TRIM(banking_group)             banking_group
      , TRIM(prefix_type)               prefix_type
      , TRIM(notes)                     notes
-  FROM read_json_auto(
-           '/Users/rpatel/Documents/__code/git/emailrak/elt_lake/elt_ingest_excel/config/data/ref_bank_sort_code_prefix_mapping.json'
-       )
+  FROM refdata_bank_sort_code_prefix_mapping
 ;
@@ -9,7 +9,5 @@ SELECT
      , TRIM(phone_code)                phone_code
      , TRIM(tax_id_type)               tax_id_type
      , TRIM(country_name)              country_name
-  FROM read_json_auto(
-           '/Users/rpatel/Documents/__code/git/emailrak/elt_lake/elt_ingest_excel/config/data/ref_country.json'
-       )
+  FROM refdata_country
 ;
@@ -6,7 +6,5 @@ SELECT
        TRIM(country_code)                     country_code
      , TRIM(tax_id_type_label)                tax_id_type_label
      , CAST(is_default AS BOOLEAN)            is_default
-  FROM read_json_auto(
-           '/Users/rpatel/Documents/__code/git/emailrak/elt_lake/elt_ingest_excel/config/data/ref_country_tax_id_type_mapping.json'
-       )
+  FROM refdata_country_tax_id_type_mapping
 ;
@@ -15,7 +15,5 @@ SELECT
      , TRIM(iso3166_2)                               iso3166_2
      , TRIM(region_code)                             region_code
      , TRIM(region_name)                             region_name
-  FROM read_json_auto(
-           '/Users/rpatel/Documents/__code/git/emailrak/elt_lake/elt_ingest_excel/config/data/ref_post_code_county.json'
-       )
+  FROM refdata_post_code_county
 ;
@@ -17,5 +17,7 @@ CREATE TABLE ref_post_code_district (
     uk_region          VARCHAR,
     post_town          VARCHAR
 );
-COPY ref_post_code_district FROM '/Users/rpatel/Documents/__code/git/emailrak/elt_lake/elt_ingest_excel/config/data/ref_post_code_district.csv' (HEADER TRUE, DELIMITER ',')
+INSERT INTO ref_post_code_district
+SELECT *
+  FROM refdata_post_code_district_csv
 ;
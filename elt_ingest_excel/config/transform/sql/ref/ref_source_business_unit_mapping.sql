@@ -5,7 +5,5 @@ CREATE TABLE ref_source_business_unit_mapping
 SELECT
        TRIM(source_value)               source_value
      , TRIM(target_value)               target_value
-  FROM read_json_auto(
-           '/Users/rpatel/Documents/__code/git/emailrak/elt_lake/elt_ingest_excel/config/data/ref_source_business_unit_mapping.json'
-       )
+  FROM refdata_source_business_unit_mapping
 ;
@@ -5,7 +5,5 @@ CREATE TABLE ref_source_country_name_mapping
 SELECT
        TRIM(source_country_name)         source_country_name
      , TRIM(country_code)                country_code
-  FROM read_json_auto(
-           '/Users/rpatel/Documents/__code/git/emailrak/elt_lake/elt_ingest_excel/config/data/ref_source_country_name_mapping.json'
-       )
+  FROM refdata_source_country_name_mapping
 ;
@@ -5,7 +5,5 @@ CREATE TABLE ref_source_payment_terms
 SELECT
        TRIM(source_payment_terms)           source_payment_terms
      , TRIM(workday_payment_terms)          workday_payment_terms
-  FROM read_json_auto(
-           '/Users/rpatel/Documents/__code/git/emailrak/elt_lake/elt_ingest_excel/config/data/ref_source_payment_terms.json'
-       )
+  FROM refdata_source_payment_terms
 ;
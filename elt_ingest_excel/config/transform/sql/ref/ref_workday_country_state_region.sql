@@ -10,5 +10,7 @@ CREATE TABLE ref_workday_country_state_region (
     workbook_value_descriptor          VARCHAR,
     reference_id                       VARCHAR,
 );
-COPY ref_workday_country_state_region FROM '/Users/rpatel/Documents/__code/git/emailrak/elt_lake/elt_ingest_excel/config/data/ref_workday_country_state_region.csv' (HEADER TRUE, DELIMITER ',')
+INSERT INTO ref_workday_country_state_region
+SELECT *
+  FROM refdata_workday_country_state_region
 ;
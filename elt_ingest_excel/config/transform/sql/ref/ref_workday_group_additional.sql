@@ -6,7 +6,5 @@ SELECT
        TRIM(source_type)                   source_type
      , TRIM(source_value)                  source_value
      , TRIM(target_value)                  target_value
-  FROM read_json_auto(
-             '/Users/rpatel/Documents/__code/git/emailrak/elt_lake/elt_ingest_excel/config/data/ref_workday_group_additional.json'
-       )
+  FROM refdata_workday_group_additional
 ;
@@ -6,7 +6,5 @@ SELECT
        TRIM(user_type)              user_type
      , TRIM(department_1)               department_1
      , TRIM(mapped_value)               mapped_value
-  FROM read_json_auto(
-           '/Users/rpatel/Documents/__code/git/emailrak/elt_lake/elt_ingest_excel/config/data/ref_worker_type_mapping.json'
-       )
+  FROM refdata_worker_type_mapping
 ;
@@ -24,6 +24,75 @@ def create_parser(description: str) -> argparse.ArgumentParser:
         choices=["INGEST", "TRANSFORM", "PUBLISH"],
         help="Pipeline phase to run up to (default: PUBLISH)",
     )
+    parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help="Skip reloading sheets whose source workbook and config are unchanged",
+    )
+    parser.add_argument(
+        "--ingest-chunk-rows",
+        type=int,
+        metavar="N",
+        help="Stream Excel sheets into DuckDB N rows at a time to bound memory (default: whole sheet)",
+    )
+    parser.add_argument(
+        "--typed-load",
+        action="store_true",
+        help="Store loaded columns as inferred INTEGER/DOUBLE/DATE/BOOLEAN/ENUM types instead of VARCHAR",
+    )
+    parser.add_argument(
+        "--transform-workers",
+        type=int,
+        default=1,
+        help="SQL files to run concurrently; above 1 enables dependency-aware DAG mode (default: 1)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip SQL files whose text, upstream tables and UDF versions are unchanged",
+    )
+    parser.add_argument(
+        "--select",
+        nargs="+",
+        metavar="FILE[+]",
+        help="Run only these SQL files; a trailing '+' also runs everything downstream",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile each transform statement (transform_profile table + ranked report)",
+    )
+    parser.add_argument(
+        "--enrich-postcodes",
+        action="store_true",
+        help="Resolve source postcodes into ref_postcode_lookup (bulk postcodes.io) before the transform",
+    )
+    parser.add_argument(
+        "--publish-workers",
+        type=int,
+        default=1,
+        help="Workbooks to publish concurrently in worker processes (openpyxl/ooxml only, default: 1)",
+    )
+    parser.add_argument(
+        "--duckdb-threads",
+        type=int,
+        help="DuckDB worker threads for the shared connection (default: all cores)",
+    )
+    parser.add_argument(
+        "--duckdb-memory-limit",
+        metavar="SIZE",
+        help="DuckDB memory limit for the shared connection, e.g. 4GB (default: 80%% of RAM)",
+    )
+    parser.add_argument(
+        "--duckdb-temp-directory",
+        metavar="DIR",
+        help="Directory DuckDB spills to above the memory limit (default: <database>.tmp)",
+    )
+    parser.add_argument(
+        "--run-log-dir",
+        metavar="DIR",
+        help="Also write run telemetry to DIR/pipeline_run_<run_id>.json (always kept in pipeline_run_log)",
+    )
     return parser
 
 
@@ -39,6 +108,8 @@ def run_pipeline(
     # Publish config
     cfg_publish_path: str,
     cfg_publish_name: str,
+    # Validation config
+    cfg_validation_rules: Optional[str] = None,
     # Optional overrides (sensible defaults provided)
     data_file_name: str = "*",
     database_path: str = "~/Documents/__data/duckdb/rpatel.duckdb",
@@ -47,6 +118,19 @@ def run_pipeline(
     publisher_type: str = "xlwings",
     run_to_phase: PipelinePhase = PipelinePhase.PUBLISH,
     config_base_path: Optional[Path] = None,
+    skip_unchanged: bool = False,
+    ingest_chunk_rows: Optional[int] = None,
+    typed_load: bool = False,
+    transform_workers: int = 1,
+    incremental_transform: bool = False,
+    transform_select: Optional[list[str]] = None,
+    profile_transform: bool = False,
+    enrich_postcodes: bool = False,
+    publish_workers: int = 1,
+    duckdb_threads: Optional[int] = None,
+    duckdb_memory_limit: Optional[str] = None,
+    duckdb_temp_directory: Optional[str] = None,
+    run_log_dir: Optional[str] = None,
 ):
     """
     Run the ELTP pipeline with the given configuration.
@@ -58,6 +142,8 @@ def run_pipeline(
         cfg_transform_path: Path to transform SQL directory (relative to config_base_path)
         cfg_publish_path: Path to publish config directory (relative to config_base_path)
         cfg_publish_name: Name of the publish config JSON file
+        cfg_validation_rules: Validation rules JSON file (relative to config_base_path),
+            evaluated against the transformed tables after the transform SQL runs
         data_file_name: Name of specific Excel file, or "*" to process all workbooks in config
         database_path: Path to DuckDB database file
         sheet_filter: Sheet name filter ("*" for all sheets, or specific name)
@@ -69,11 +155,35 @@ def run_pipeline(
         publisher_type: Excel publisher backend
             - "openpyxl": No Excel required, but may lose drawing shapes in .xlsm files
             - "xlwings": Requires Excel installed, preserves all shapes/macros/formatting
+            - "ooxml": No Excel required; patches worksheet XML in place, preserves
+              macros and drawings
         run_to_phase: Pipeline phase to run up to (inclusive)
             - PipelinePhase.INGEST: Extract and load only
             - PipelinePhase.TRANSFORM: Ingest + SQL transformations
             - PipelinePhase.PUBLISH: Full pipeline
         config_base_path: Base path for config files (defaults to ../config relative to caller)
+        skip_unchanged: Skip reloading sheets whose source workbook and sheet config
+            are unchanged since the last run (see ingest_manifest table)
+        ingest_chunk_rows: Stream Excel sheets in chunks of this many rows, appending
+            each chunk to DuckDB (None loads each sheet whole)
+        typed_load: Store loaded columns as compact inferred types (falling back to
+            VARCHAR) instead of all VARCHAR
+        transform_workers: Number of SQL files to execute concurrently; values above 1
+            schedule order.txt entries by their table dependencies (DAG mode)
+        incremental_transform: Skip SQL files whose inputs are unchanged since their
+            last build (see transform_state table)
+        transform_select: Run only these SQL files; "file+" also runs downstream files
+        profile_transform: Record per-statement timings and query profiles in the
+            transform_profile table and print the slowest statements
+        enrich_postcodes: Resolve the postcodes selected by enrich_postcodes.sql into
+            the ref_postcode_lookup table before the transform SQL runs
+        publish_workers: Number of workbooks to publish concurrently in worker
+            processes (ignored by the xlwings publisher)
+        duckdb_threads: DuckDB worker threads for the connection shared by all phases
+        duckdb_memory_limit: DuckDB memory limit for the shared connection (e.g. "4GB")
+        duckdb_temp_directory: Directory DuckDB spills to when over the memory limit
+        run_log_dir: Directory to also write each run's telemetry to as JSON; telemetry
+            is always stored in the pipeline_run_log table
 
     Returns:
         Tuple of (load_results, transform_results, publish_results)
@@ -88,12 +198,26 @@ def run_pipeline(
         cfg_transform_path=cfg_transform_path,
         cfg_publish_path=cfg_publish_path,
         cfg_publish_name=cfg_publish_name,
+        cfg_validation_rules=cfg_validation_rules,
         data_path=data_path,
         data_file_name=data_file_name,
         database_path=database_path,
         sheet_filter=sheet_filter,
         save_mode=save_mode,
         publisher_type=publisher_type,
+        skip_unchanged=skip_unchanged,
+        ingest_chunk_rows=ingest_chunk_rows,
+        typed_load=typed_load,
+        transform_workers=transform_workers,
+        incremental_transform=incremental_transform,
+        transform_select=transform_select,
+        profile_transform=profile_transform,
+        enrich_postcodes=enrich_postcodes,
+        publish_workers=publish_workers,
+        duckdb_threads=duckdb_threads,
+        duckdb_memory_limit=duckdb_memory_limit,
+        duckdb_temp_directory=duckdb_temp_directory,
+        run_log_dir=run_log_dir,
     )
 
     return ingestor.process(run_to_phase)
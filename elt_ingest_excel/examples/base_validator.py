@@ -9,6 +9,7 @@ specific configuration values.
 
 import argparse
 
+from elt_ingest_excel.macro.manifest_validator import print_summary, validate_workbook
 from elt_ingest_excel.macro.vba_runner import run_validation
 
 
@@ -42,6 +43,11 @@ def create_parser(description: str) -> argparse.ArgumentParser:
         action="store_true",
         help="Close the workbook after validation",
     )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run the ValidationManifest checks in Python without Excel",
+    )
     return parser
 
 
@@ -53,6 +59,7 @@ def run_validation_wrapper(
     excel_visible: bool = False,
     save: bool = True,
     close: bool = False,
+    headless: bool = False,
 ):
     """
     Run VBA validation on a workbook.
@@ -64,7 +71,14 @@ def run_validation_wrapper(
         excel_visible: Show Excel during macro execution
         save: Save the workbook after validation
         close: Close the workbook after validation
+        headless: Run the ValidationManifest checks in Python instead of the
+                  VBA macro (no Excel needed); results go to unhide_sheet
     """
+    if headless:
+        result = validate_workbook(workbook_path=workbook_path, results_sheet=unhide_sheet, save=save)
+        print_summary(result)
+        return
+
     run_validation(
         workbook_path=workbook_path,
         macro_name=macro_name,
@@ -16,4 +16,17 @@ if __name__ == "__main__":
         cfg_publish_path="publish/finance",
         cfg_publish_name="publish_customer.json",
         run_to_phase=PipelinePhase[args.run_to_phase],
+        skip_unchanged=args.skip_unchanged,
+        ingest_chunk_rows=args.ingest_chunk_rows,
+        typed_load=args.typed_load,
+        transform_workers=args.transform_workers,
+        incremental_transform=args.incremental,
+        transform_select=args.select,
+        profile_transform=args.profile,
+        enrich_postcodes=args.enrich_postcodes,
+        publish_workers=args.publish_workers,
+        duckdb_threads=args.duckdb_threads,
+        duckdb_memory_limit=args.duckdb_memory_limit,
+        duckdb_temp_directory=args.duckdb_temp_directory,
+        run_log_dir=args.run_log_dir,
     )
@@ -19,4 +19,5 @@ if __name__ == "__main__":
         excel_visible=args.excel_visible,
         save=not args.no_save,
         close=args.close,
+        headless=args.headless,
     )
@@ -35,11 +35,12 @@ from .models import (
     PublishWorkbookConfig,
     PublishSheetConfig,
 )
-from .parsers import JsonConfigParser, PublishConfigParser
+from .parsers import JsonConfigParser, PublishConfigParser, ValidationRulesParser
 from .loaders import ExcelReader, SheetProcessor
 from .writers import SaveMode, DuckDBWriter, WriteResult
 from .publish import ExcelPublisher, PublishResult
-from .transform import SqlExecutor, TransformResult
+from .transform import RuleEngine, SqlExecutor, TransformResult
+from .connection import ConnectionManager
 from .elt_pipeline import FileIngestor, PipelinePhase
 
 __all__ = [
@@ -55,6 +56,7 @@ __all__ = [
     # Parsers
     "JsonConfigParser",
     "PublishConfigParser",
+    "ValidationRulesParser",
     # Loaders
     "ExcelReader",
     "SheetProcessor",
@@ -68,6 +70,9 @@ __all__ = [
     # Transform
     "SqlExecutor",
     "TransformResult",
+    "RuleEngine",
+    # Connection
+    "ConnectionManager",
     # ELT Pipeline (main workflow)
     "FileIngestor",
     "PipelinePhase",
@@ -0,0 +1,92 @@
+"""Long-lived DuckDB connection shared by the pipeline phases."""
+
+from pathlib import Path
+from typing import Union
+
+import duckdb
+
+from .transform.udf import register_all
+
+
+class ConnectionManager:
+    """Owns one DuckDB connection for the whole pipeline run.
+
+    The connection is opened on first use with the configured settings and
+    has the transform UDFs registered once, so load, transform and publish
+    share the catalog and DuckDB's buffer cache instead of reopening the
+    database file for each phase. Components given a manager use its
+    connection and never close it.
+
+    Example usage:
+        with ConnectionManager("/path/to/database.duckdb", threads=4) as connections:
+            with DuckDBWriter(connections.database_path, connections=connections) as writer:
+                ...
+            SqlExecutor(transform_path, connections.database_path, connections=connections).execute()
+    """
+
+    def __init__(
+        self,
+        database_path: Union[str, Path],
+        threads: int | None = None,
+        memory_limit: str | None = None,
+        temp_directory: Union[str, Path, None] = None,
+    ):
+        """Initialize the connection manager.
+
+        Args:
+            database_path: Path to the DuckDB database file.
+            threads: DuckDB worker threads. Defaults to DuckDB's own choice (all cores).
+            memory_limit: DuckDB memory limit, e.g. "4GB". Defaults to DuckDB's own
+                          choice (80% of system memory).
+            temp_directory: Directory DuckDB spills to when a query exceeds the memory
+                            limit. Defaults to <database>.tmp next to the database.
+        """
+        self.database_path = Path(database_path).expanduser()
+        self.threads = threads
+        self.memory_limit = memory_limit
+        self.temp_directory = Path(temp_directory).expanduser() if temp_directory else None
+        self._connection: duckdb.DuckDBPyConnection | None = None
+        self.open_count = 0
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close the connection if open."""
+        self.close()
+
+    @property
+    def config(self) -> dict[str, str]:
+        """DuckDB settings applied when the connection is opened."""
+        config: dict[str, str] = {}
+        if self.threads:
+            config["threads"] = str(self.threads)
+        if self.memory_limit:
+            config["memory_limit"] = self.memory_limit
+        if self.temp_directory:
+            config["temp_directory"] = str(self.temp_directory)
+        return config
+
+    @property
+    def connection(self) -> duckdb.DuckDBPyConnection:
+        """Get the shared connection, opening it on first use."""
+        if self._connection is None:
+            self._connection = duckdb.connect(str(self.database_path), config=self.config)
+            register_all(self._connection)
+            self.open_count += 1
+        return self._connection
+
+    @property
+    def is_open(self) -> bool:
+        return self._connection is not None
+
+    def close(self) -> None:
+        """Close the connection; the next access to connection reopens it.
+
+        Publishing in worker processes closes it first, since no other
+        process can open a database file held open read-write.
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
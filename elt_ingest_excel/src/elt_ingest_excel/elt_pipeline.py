@@ -4,16 +4,25 @@ from enum import Enum
 from pathlib import Path
 from typing import Union
 
-import duckdb
 import pandas as pd
 
+from .connection import ConnectionManager
 from .loaders import SheetProcessor
-from .parsers import JsonConfigParser, PublishConfigParser
-from .publish import ExcelPublisherOpenpyxl, ExcelPublisherXlwings, PublishResult
+from .parsers import JsonConfigParser, PublishConfigParser, ValidationRulesParser
+from .publish import (
+    ExcelPublisherOoxml,
+    ExcelPublisherOpenpyxl,
+    ExcelPublisherXlwings,
+    PublishResult,
+)
 from .reporting import PipelineReporter
+from .telemetry import RunLog, RunLogEntry
 from .transform import SqlExecutor, TransformResult
+from .transform.enrichment import PostcodeEnrichment
+from .transform.reference_data import ReferenceDataRegistry
+from .transform.rule_engine import RuleEngine, RuleSetResult
 from .transform.validation import validate_counties_against_master
-from .writers import SaveMode, DuckDBWriter, WriteResult
+from .writers import SaveMode, DuckDBWriter, IngestManifest, TableStatistics, WriteResult
 
 
 class PipelinePhase(Enum):
@@ -52,6 +61,7 @@ class FileIngestor:
         cfg_transform_path: str,
         cfg_publish_path: str | None = None,
         cfg_publish_name: str | None = None,
+        cfg_validation_rules: str | None = None,
         data_path: Union[str, Path] = "",
         data_file_name: str = "*",
         database_path: Union[str, Path] = "",
@@ -59,6 +69,21 @@ class FileIngestor:
         save_mode: SaveMode = SaveMode.RECREATE,
         publisher_type: str = "xlwings",
         master_workbook_path: Union[str, Path, None] = None,
+        skip_unchanged: bool = False,
+        ingest_chunk_rows: int | None = None,
+        typed_load: bool = False,
+        transform_workers: int = 1,
+        incremental_transform: bool = False,
+        transform_select: list[str] | None = None,
+        profile_transform: bool = False,
+        udf_cache_path: Union[str, Path, None] = None,
+        enrich_postcodes: bool = False,
+        reference_data_path: Union[str, Path, None] = None,
+        publish_workers: int = 1,
+        duckdb_threads: int | None = None,
+        duckdb_memory_limit: str | None = None,
+        duckdb_temp_directory: Union[str, Path, None] = None,
+        run_log_dir: Union[str, Path, None] = None,
     ):
         """Initialize the file ingestor.
 
@@ -69,17 +94,69 @@ class FileIngestor:
             cfg_transform_path: Relative path to transform config (e.g., "transform/finance").
             cfg_publish_path: Relative path to publish config (e.g., "publish/finance").
             cfg_publish_name: Name of the publish JSON config file.
+            cfg_validation_rules: Relative path to a validation rules JSON file
+                                  (e.g., "validate/finance/supplier/rules_supplier.json").
+                                  Its rules run after the transform SQL files, one fused
+                                  query per table, and write issue rows to DuckDB.
             data_path: Path to the data files directory.
             data_file_name: Name of the data file to process, or "*" for all workbooks in config.
             database_path: Path to DuckDB database file.
             sheet_filter: Sheet name to filter on, or "*" for all sheets.
             save_mode: How to handle existing tables (DROP, RECREATE, OVERWRITE, APPEND).
-            publisher_type: Excel publisher to use - "xlwings" (default) or "openpyxl".
+            publisher_type: Excel publisher to use - "xlwings" (default), "openpyxl" or "ooxml".
                            "xlwings" preserves drawing shapes (requires Excel installed).
                            "openpyxl" works without Excel but may lose shapes in .xlsm files.
+                           "ooxml" works without Excel and rewrites only the target
+                           worksheet XML, leaving macros and drawings untouched.
             master_workbook_path: Optional path to a master reference workbook used for
                                   county/region validation during the transform phase.
                                   Validation is skipped when None or path does not exist.
+                                  Sheets read from it are cached as master_* tables and
+                                  only re-read when the workbook changes.
+            skip_unchanged: Skip reloading sheets whose source file and sheet config
+                            are unchanged since the last load (RECREATE/OVERWRITE only).
+                            Load fingerprints are kept in the ingest_manifest table.
+            ingest_chunk_rows: If set, stream Excel sheets in chunks of this many rows
+                               (openpyxl read-only) and append each chunk to DuckDB, so
+                               memory is bounded by the chunk size. All-blank rows are
+                               dropped. None loads each sheet whole.
+            typed_load: If True, store each loaded column as the most compact type that
+                        reproduces its text (BOOLEAN, INTEGER, BIGINT, DOUBLE, DATE,
+                        TIMESTAMP, or ENUM for repetitive text) instead of VARCHAR.
+                        Blank cells become NULL in non-text columns.
+            transform_workers: Number of SQL files to execute concurrently. Values above 1
+                               enable DAG mode, where order.txt entries are scheduled by
+                               the tables they read and write instead of strictly in order.
+            incremental_transform: If True, skip SQL files whose text, upstream tables and
+                                   UDF versions are unchanged since their last build
+                                   (state is kept in the transform_state table).
+            transform_select: Run only these SQL files; a trailing "+" (e.g.
+                              "workday_supplier_name.sql+") also runs every file
+                              downstream of it.
+            profile_transform: If True, record wall time, rows, peak memory and the DuckDB
+                               query profile of every transform statement in the
+                               transform_profile table and print the slowest statements.
+            udf_cache_path: SQLite file caching UDF results across runs. Defaults to
+                            <database>.udf_cache.sqlite next to the DuckDB database.
+            enrich_postcodes: If True, resolve the postcodes selected by the transform
+                              directory's enrich_postcodes.sql into the ref_postcode_lookup
+                              table (bulk postcodes.io lookups) before running the SQL files.
+            reference_data_path: Directory of reference data files (*.json, *.csv) kept as
+                                 refdata_* tables for the ref_*.sql transforms; a file is
+                                 only reloaded when its content hash changes. Defaults to
+                                 <config_base_path>/data.
+            publish_workers: Number of workbooks to publish concurrently, each in its own
+                             process with its own read-only DuckDB connection
+                             (openpyxl and ooxml publishers only).
+            duckdb_threads: DuckDB worker threads for the connection shared by all phases.
+                            Defaults to DuckDB's choice (all cores).
+            duckdb_memory_limit: DuckDB memory limit for the shared connection, e.g. "4GB".
+                                 Defaults to DuckDB's choice (80% of system memory).
+            duckdb_temp_directory: Directory DuckDB spills to when a query exceeds the
+                                   memory limit. Defaults to <database>.tmp.
+            run_log_dir: Optional directory to also write each run's telemetry to, as
+                         pipeline_run_<run_id>.json. Telemetry is always stored in the
+                         pipeline_run_log table.
         """
         self.config_base_path = Path(config_base_path).expanduser()
         self.cfg_ingest_path = cfg_ingest_path
@@ -87,12 +164,32 @@ class FileIngestor:
         self.cfg_transform_path = cfg_transform_path
         self.cfg_publish_path = cfg_publish_path
         self.cfg_publish_name = cfg_publish_name
+        self.cfg_validation_rules = cfg_validation_rules
         self.publisher_type = publisher_type
         self.data_path = Path(data_path).expanduser()
         self.data_file_name = data_file_name
         self.database_path = Path(database_path).expanduser()
         self.sheet_filter = sheet_filter
         self.save_mode = save_mode
+        self.skip_unchanged = skip_unchanged
+        self.ingest_chunk_rows = ingest_chunk_rows
+        self.typed_load = typed_load
+        self.transform_workers = transform_workers
+        self.incremental_transform = incremental_transform
+        self.transform_select = transform_select
+        self.profile_transform = profile_transform
+        self.udf_cache_path = (
+            Path(udf_cache_path).expanduser()
+            if udf_cache_path
+            else self.database_path.with_suffix(".udf_cache.sqlite")
+        )
+        self.enrich_postcodes = enrich_postcodes
+        self.reference_data_path = (
+            Path(reference_data_path).expanduser()
+            if reference_data_path
+            else self.config_base_path / "data"
+        )
+        self.publish_workers = publish_workers
         self.master_workbook_path = Path(master_workbook_path).expanduser() if master_workbook_path else None
 
         # Build full config paths
@@ -103,6 +200,23 @@ class FileIngestor:
             if cfg_publish_path
             else None
         )
+        self.validation_rules_path = (
+            self.config_base_path / cfg_validation_rules if cfg_validation_rules else None
+        )
+
+        # One DuckDB connection shared by load, transform and publish; it is
+        # opened on first use and closed when process() finishes (or close()).
+        self.connections = ConnectionManager(
+            self.database_path,
+            threads=duckdb_threads,
+            memory_limit=duckdb_memory_limit,
+            temp_directory=duckdb_temp_directory,
+        )
+
+        # Durations, rows, bytes and peak memory of each run; process()
+        # starts a new log and stores it in pipeline_run_log when it ends.
+        self.run_log = RunLog()
+        self.run_log_dir = Path(run_log_dir).expanduser() if run_log_dir else None
 
         # Configure pandas display
         pd.set_option("display.max_columns", None)
@@ -127,6 +241,7 @@ class FileIngestor:
         # Store results
         self.load_results: list[WriteResult] = []
         self.transform_results: list[TransformResult] = []
+        self.validation_results: list[RuleSetResult] = []
         self.publish_results: list[PublishResult] = []
 
     def extract_and_load(self) -> list[WriteResult]:
@@ -140,7 +255,15 @@ class FileIngestor:
         """
         self.load_results = []
 
-        with DuckDBWriter(self.database_path, reporter=self.reporter) as writer:
+        with DuckDBWriter(
+            self.database_path,
+            reporter=self.reporter,
+            connections=self.connections,
+            typed_load=self.typed_load,
+            run_id=self.run_log.run_id,
+        ) as writer:
+            manifest = IngestManifest(writer.connection) if self.skip_unchanged else None
+
             for workbook in self.workbooks:
                 # Get sheets for this workbook (filtered)
                 sheets = JsonConfigParser.get_sheets(workbook, self.sheet_filter)
@@ -161,9 +284,27 @@ class FileIngestor:
                     workbook_config=workbook,
                     save_mode=self.save_mode,
                     reporter=self.reporter,
+                    manifest=manifest,
+                    chunk_rows=self.ingest_chunk_rows,
                 )
 
-                workbook_results = processor.process_sheets(sheets, writer)
+                source_file = self.data_path / workbook.workbook_file_name
+                with self.run_log.measure("ingest", "workbook", workbook.workbook_file_name) as entry:
+                    workbook_results = processor.process_sheets(sheets, writer)
+                    entry.rows = sum(r.rows_written for r in workbook_results)
+                    entry.bytes = source_file.stat().st_size if source_file.exists() else None
+                for result in workbook_results:
+                    self.run_log.add(
+                        RunLogEntry(
+                            phase="ingest",
+                            scope="sheet",
+                            name=result.table_name,
+                            parent=workbook.workbook_file_name,
+                            elapsed_seconds=result.elapsed_seconds,
+                            rows=result.rows_written,
+                            peak_rss_bytes=result.peak_rss_bytes,
+                        )
+                    )
                 self.load_results.extend(workbook_results)
 
         self.reporter.print_load_summary(self.load_results)
@@ -185,6 +326,13 @@ class FileIngestor:
             transform_path=self.transform_config_path,
             database_path=self.database_path,
             reporter=self.reporter,
+            max_workers=self.transform_workers,
+            incremental=self.incremental_transform,
+            select=self.transform_select,
+            profile=self.profile_transform,
+            udf_cache_path=self.udf_cache_path,
+            connections=self.connections,
+            run_id=self.run_log.run_id,
         )
 
         sql_count = executor.get_sql_file_count()
@@ -196,16 +344,67 @@ class FileIngestor:
 
         self.reporter.print_transform_sql_count(sql_count)
 
+        registry = ReferenceDataRegistry(
+            data_path=self.reference_data_path,
+            database_path=self.database_path,
+            connections=self.connections,
+            run_id=self.run_log.run_id,
+        )
+        if registry.source_files():
+            with self.run_log.measure("transform", "stage", "reference_data") as entry:
+                reference_results = registry.load()
+                entry.rows = sum(r.row_count for r in reference_results if r.reloaded)
+            self.reporter.print_reference_data_summary(reference_results)
+
+        if self.enrich_postcodes:
+            enrichment = PostcodeEnrichment(
+                transform_path=self.transform_config_path,
+                database_path=self.database_path,
+                udf_cache_path=self.udf_cache_path,
+                connections=self.connections,
+                run_id=self.run_log.run_id,
+            )
+            enrichment_result = enrichment.execute()
+            if enrichment_result is None:
+                self.reporter.print_enrichment_no_extract_file(enrichment.extract_file)
+            else:
+                self.reporter.print_enrichment_summary(enrichment_result)
+                self.run_log.add(
+                    RunLogEntry(
+                        phase="transform",
+                        scope="stage",
+                        name=enrichment_result.table_name,
+                        elapsed_seconds=enrichment_result.elapsed_seconds,
+                        rows=enrichment_result.postcodes,
+                    )
+                )
+
         self.transform_results = executor.execute()
+        for result in self.transform_results:
+            self.run_log.add(
+                RunLogEntry(
+                    phase="transform",
+                    scope="sql_file",
+                    name=result.sql_file,
+                    elapsed_seconds=result.elapsed_seconds,
+                    peak_rss_bytes=result.peak_rss_bytes,
+                    success=result.success,
+                    error=result.error,
+                )
+            )
 
         self.reporter.print_transform_summary(self.transform_results)
 
+        if self.validation_rules_path is not None and all(r.success for r in self.transform_results):
+            self.validate_rules()
+
         master_path = self.master_workbook_path
         if master_path is not None:
             ok, missing, _ = validate_counties_against_master(
                 database_path=self.database_path,
                 master_workbook_path=master_path,
                 sheet_name="Country States-Regions",
+                connections=self.connections,
             )
         if master_path is not None and master_path.exists():
             print("\n" + "=" * self.reporter.SEPARATOR_WIDTH)
@@ -224,50 +423,84 @@ class FileIngestor:
 
         return self.transform_results
 
+    def validate_rules(self) -> list[RuleSetResult]:
+        """Run the declarative validation rules against the transformed tables.
+
+        Each table's rules are evaluated in a single query and tables are
+        validated concurrently. Issues are written to each rule set's
+        issues table; they do not fail the pipeline.
+
+        Returns:
+            List of RuleSetResult objects, one per validated table.
+        """
+        config = ValidationRulesParser.from_json(self.validation_rules_path)
+        engine = RuleEngine(
+            config,
+            database_path=self.database_path,
+            max_workers=max(self.transform_workers, RuleEngine.DEFAULT_WORKERS),
+            connections=self.connections,
+            run_id=self.run_log.run_id,
+        )
+        self.validation_results = engine.execute()
+        for result in self.validation_results:
+            self.run_log.add(
+                RunLogEntry(
+                    phase="transform",
+                    scope="rule_set",
+                    name=result.table_name,
+                    elapsed_seconds=result.elapsed_seconds,
+                    rows=result.issues,
+                    success=result.success,
+                    error=result.error,
+                )
+            )
+        self.reporter.print_rule_validation_summary(self.validation_results, self.validation_rules_path)
+        return self.validation_results
+
     def _print_reconciliation_results(self) -> None:
-        """Query and print reconciliation results for all matching tables.
+        """Print reconciliation results for all matching tables.
 
-        Discovers any tables named validation_%_reconciliation in the database
-        and prints their contents to verify data loaded correctly.
+        Tables named validation_%_reconciliation are found in table_statistics,
+        where the transform records every table it builds. Their contents are
+        read through the statistics' result cache, so a table the transform
+        left unchanged is not queried again.
         """
-        with duckdb.connect(str(self.database_path)) as conn:
-            table_rows = conn.execute(
-                "SELECT table_name FROM information_schema.tables "
-                "WHERE table_name LIKE 'validation_%_reconciliation' "
-                "ORDER BY table_name",
-            ).fetchall()
-            reconciliation_tables = [row[0] for row in table_rows]
-
-            for table_name in reconciliation_tables:
-                self.reporter.print_reconciliation_header(table_name)
-
-                data_rows = conn.execute(
-                    f"SELECT business_unit, ingested_rows, merged_rows, "
-                    f"deduped_rows, status FROM {table_name} ORDER BY business_unit"
-                ).fetchall()
-
-                total_ingested = 0
-                total_merged = 0
-                total_deduped = 0
-
-                for row in data_rows:
-                    bu, ingested, merged, deduped, status = row
-                    self.reporter.print_reconciliation_row(
-                        business_unit=bu,
-                        ingested_rows=ingested,
-                        merged_rows=merged,
-                        deduped_rows=deduped,
-                        status=status,
-                    )
-                    total_ingested += ingested
-                    total_merged += merged
-                    total_deduped += deduped
-
-                self.reporter.print_reconciliation_totals(
-                    total_ingested=total_ingested,
-                    total_merged=total_merged,
-                    total_deduped=total_deduped,
+        statistics = TableStatistics(self.connections.connection, self.run_log.run_id)
+        reconciliation_tables = [
+            stats.table_name for stats in statistics.matching("validation_%_reconciliation")
+        ]
+
+        for table_name in reconciliation_tables:
+            self.reporter.print_reconciliation_header(table_name)
+
+            data_rows = statistics.cached_query(
+                f"SELECT business_unit, ingested_rows, merged_rows, "
+                f"deduped_rows, status FROM {table_name} ORDER BY business_unit",
+                [table_name],
+            )
+
+            total_ingested = 0
+            total_merged = 0
+            total_deduped = 0
+
+            for row in data_rows:
+                bu, ingested, merged, deduped, status = row
+                self.reporter.print_reconciliation_row(
+                    business_unit=bu,
+                    ingested_rows=ingested,
+                    merged_rows=merged,
+                    deduped_rows=deduped,
+                    status=status,
                 )
+                total_ingested += ingested
+                total_merged += merged
+                total_deduped += deduped
+
+            self.reporter.print_reconciliation_totals(
+                total_ingested=total_ingested,
+                total_merged=total_merged,
+                total_deduped=total_deduped,
+            )
 
     def publish(self) -> list[PublishResult]:
         """Execute Publish phase.
@@ -301,15 +534,62 @@ class FileIngestor:
         # Select publisher based on type and delegate publishing
         if self.publisher_type == "xlwings":
             publisher_class = ExcelPublisherXlwings
+        elif self.publisher_type == "ooxml":
+            publisher_class = ExcelPublisherOoxml
         else:
             publisher_class = ExcelPublisherOpenpyxl
 
-        with publisher_class(self.database_path, reporter=self.reporter) as publisher:
+        with publisher_class(
+            self.database_path,
+            reporter=self.reporter,
+            max_workers=self.publish_workers,
+            connections=self.connections,
+        ) as publisher:
             self.publish_results = publisher.publish(publish_config)
 
+        self._log_publish_results(self.publish_results)
         self.reporter.print_publish_summary(self.publish_results)
         return self.publish_results
 
+    def _log_publish_results(self, results: list[PublishResult]) -> None:
+        """Add publish sheet entries and one entry per target workbook to the run log."""
+        workbooks: dict[str, RunLogEntry] = {}
+        for result in results:
+            workbook_path = Path(result.workbook_path) if result.workbook_path else None
+            parent = workbook_path.name if workbook_path else None
+            self.run_log.add(
+                RunLogEntry(
+                    phase="publish",
+                    scope="publish_sheet",
+                    name=result.sheet_name,
+                    parent=parent,
+                    elapsed_seconds=result.elapsed_seconds,
+                    rows=result.rows_written,
+                    peak_rss_bytes=result.peak_rss_bytes,
+                    success=result.success,
+                    error=result.error,
+                )
+            )
+            if workbook_path is None:
+                continue
+            if parent not in workbooks:
+                workbooks[parent] = RunLogEntry(
+                    phase="publish",
+                    scope="workbook",
+                    name=parent,
+                    elapsed_seconds=0.0,
+                    rows=0,
+                    bytes=workbook_path.stat().st_size if workbook_path.exists() else None,
+                )
+            entry = workbooks[parent]
+            entry.elapsed_seconds += result.elapsed_seconds or 0.0
+            entry.rows += result.rows_written
+            entry.success = entry.success and result.success
+            peaks = [p for p in (entry.peak_rss_bytes, result.peak_rss_bytes) if p is not None]
+            entry.peak_rss_bytes = max(peaks) if peaks else None
+        for entry in workbooks.values():
+            self.run_log.add(entry)
+
     def process(
         self,
         run_to_phase: PipelinePhase | str = PipelinePhase.PUBLISH,
@@ -330,14 +610,33 @@ class FileIngestor:
         if isinstance(run_to_phase, str):
             run_to_phase = PipelinePhase(run_to_phase.lower())
 
+        self.run_log = RunLog()
+        try:
+            with self.run_log.measure("pipeline", "run", "pipeline"):
+                return self._run_phases(run_to_phase)
+        finally:
+            try:
+                self._write_run_log()
+            finally:
+                self.close()
+
+    def _run_phases(
+        self,
+        run_to_phase: PipelinePhase,
+    ) -> tuple[list[WriteResult], list[TransformResult], list[PublishResult]]:
+        """Run the phases up to run_to_phase on the shared connection."""
         # Always run ingest
-        load_results = self.extract_and_load()
+        with self.run_log.measure("ingest", "phase", "ingest") as entry:
+            load_results = self.extract_and_load()
+            entry.rows = sum(r.rows_written for r in load_results)
 
         if run_to_phase == PipelinePhase.INGEST:
             return load_results, [], []
 
         # Run transform
-        transform_results = self.transform()
+        with self.run_log.measure("transform", "phase", "transform") as entry:
+            transform_results = self.transform()
+            entry.success = all(r.success for r in transform_results)
 
         # Abort on any transform failure
         if any(not r.success for r in transform_results):
@@ -347,5 +646,30 @@ class FileIngestor:
             return load_results, transform_results, []
 
         # Run publish
-        publish_results = self.publish()
+        with self.run_log.measure("publish", "phase", "publish") as entry:
+            publish_results = self.publish()
+            entry.rows = sum(r.rows_written for r in publish_results)
+            entry.success = all(r.success for r in publish_results)
         return load_results, transform_results, publish_results
+
+    def _write_run_log(self) -> None:
+        """Store the run's telemetry in pipeline_run_log (and JSON if configured).
+
+        Telemetry failures are reported, not raised, so they neither fail a
+        successful run nor replace the exception of a failed one.
+        """
+        try:
+            self.run_log.write(self.connections.connection)
+            json_path = self.run_log.write_json(self.run_log_dir) if self.run_log_dir else None
+        except Exception as e:
+            self.reporter.print_run_telemetry_error(str(e))
+            return
+        self.reporter.print_run_telemetry(self.run_log, json_path)
+
+    def close(self) -> None:
+        """Close the DuckDB connection shared by the phases.
+
+        process() calls this when it finishes; call it after running
+        extract_and_load(), transform() or publish() on their own.
+        """
+        self.connections.close()
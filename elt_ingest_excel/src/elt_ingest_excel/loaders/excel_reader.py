@@ -1,5 +1,8 @@
 # src/elt_ingest_excel/loader/excel_reader.py
+import datetime
 import re
+from typing import Any, Iterator
+
 import pandas as pd
 from pathlib import Path
 
@@ -160,6 +163,116 @@ class ExcelReader:
         self.df.dropna(how='all', axis=0, inplace=True)
         return self.df
 
+    def iter_chunks(self, chunk_rows: int) -> Iterator[pd.DataFrame]:
+        """Stream the sheet as DataFrames of at most chunk_rows rows.
+
+        Rows are read with openpyxl's read-only iterator, so memory is
+        bounded by the chunk size rather than the sheet size. Cells are
+        converted to the strings load() produces and columns get the same
+        cleaned names; rows whose cells are all blank are dropped per chunk.
+        Columns beyond the last non-empty header cell are not read.
+
+        Args:
+            chunk_rows: Maximum rows per yielded DataFrame.
+
+        Yields:
+            DataFrames of string columns. A sheet with a header but no data
+            yields nothing; use columns() to get its column names.
+        """
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be at least 1, got {chunk_rows}")
+        import openpyxl
+
+        if not self.file_path.exists():
+            raise FileNotFoundError(f"File not found: {self.file_path}")
+        wb = openpyxl.load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            rows = self._resolve_sheet(wb).iter_rows(min_row=int(self.header_row) + 1, values_only=True)
+            columns = self._stream_columns(next(rows, ()))
+            width = len(columns)
+            chunk: list[list[str]] = []
+            for row in rows:
+                values = [self._cell_text(value) for value in row[:width]]
+                if not any(values):
+                    continue
+                values.extend([""] * (width - len(values)))
+                chunk.append(values)
+                if len(chunk) >= chunk_rows:
+                    yield self._chunk_frame(chunk, columns)
+                    chunk = []
+            if chunk:
+                yield self._chunk_frame(chunk, columns)
+        finally:
+            wb.close()
+
+    def columns(self) -> list[str]:
+        """Return the cleaned column names iter_chunks() yields, reading only the header row."""
+        import openpyxl
+
+        if not self.file_path.exists():
+            raise FileNotFoundError(f"File not found: {self.file_path}")
+        wb = openpyxl.load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            rows = self._resolve_sheet(wb).iter_rows(min_row=int(self.header_row) + 1, values_only=True)
+            columns = self._stream_columns(next(rows, ()))
+        finally:
+            wb.close()
+        if "department" in columns and "department_1" not in columns:
+            columns.append("department_1")
+        return columns
+
+    def _resolve_sheet(self, wb):
+        """Find the worksheet by index, exact name, or whitespace/case-insensitive name."""
+        if isinstance(self.sheet_name, int):
+            return wb.worksheets[self.sheet_name]
+        if self.sheet_name in wb.sheetnames:
+            return wb[self.sheet_name]
+        normalized_target = self._normalize_sheet_name(self.sheet_name)
+        matches = [n for n in wb.sheetnames if self._normalize_sheet_name(n) == normalized_target]
+        if len(matches) == 1:
+            return wb[matches[0]]
+        if len(wb.sheetnames) == 1:
+            return wb.worksheets[0]
+        raise ValueError(
+            f"Worksheet named '{self.sheet_name}' not found. Available worksheets: {wb.sheetnames}"
+        )
+
+    def _stream_columns(self, header: tuple) -> list[str]:
+        """Name columns the way read_excel does, then clean them."""
+        values = [self._cell_text(value) for value in header]
+        while values and not values[-1]:
+            values.pop()
+        names: list[str] = []
+        seen: dict[str, int] = {}
+        for i, value in enumerate(values):
+            name = value or f"Unnamed: {i}"
+            # read_excel mangles duplicate headers as "name.1", "name.2", ...
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+            else:
+                seen[name] = 0
+            names.append(name)
+        return [self.clean_column_name(name) for name in names]
+
+    @staticmethod
+    def _cell_text(value: Any) -> str:
+        """Convert a cell value to the string read_excel(dtype=str) would give."""
+        if value is None:
+            return ""
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        if isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):
+            return str(datetime.datetime.combine(value, datetime.time()))
+        return str(value)
+
+    @staticmethod
+    def _chunk_frame(rows: list[list[str]], columns: list[str]) -> pd.DataFrame:
+        df = pd.DataFrame(rows, columns=columns, dtype=object)
+        if "department" in df.columns and "department_1" not in df.columns:
+            df["department_1"] = df["department"]
+        return df
+
     def preview(self, n=5, full=True):
         if self.df is None:
             print("No data loaded.")
@@ -1,10 +1,14 @@
 """Sheet processor for extracting and loading data from various file types."""
 
+import time
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import pandas as pd
+
 from ..models import FileType, SheetConfig, WorkbookConfig
-from ..writers import DuckDBWriter, SaveMode, WriteResult
+from ..telemetry import peak_rss_bytes
+from ..writers import DuckDBWriter, FileFingerprint, IngestManifest, SaveMode, WriteResult
 from .excel_reader import ExcelReader
 
 if TYPE_CHECKING:
@@ -25,6 +29,8 @@ class SheetProcessor:
         workbook_config: WorkbookConfig,
         save_mode: SaveMode = SaveMode.RECREATE,
         reporter: "PipelineReporter | None" = None,
+        manifest: IngestManifest | None = None,
+        chunk_rows: int | None = None,
     ):
         """Initialize the sheet processor.
 
@@ -34,13 +40,22 @@ class SheetProcessor:
             workbook_config: Configuration for the workbook.
             save_mode: How to handle existing tables.
             reporter: Optional reporter for output. If None, no output is produced.
+            manifest: Optional ingest manifest. When provided, sheets whose source
+                      file and configuration are unchanged since the last load
+                      are skipped.
+            chunk_rows: If set, Excel sheets are streamed in chunks of this many rows,
+                        each appended to the target table, so memory is bounded by
+                        the chunk size instead of the sheet size.
         """
         self.data_path = Path(data_path)
         self.data_file_name = data_file_name
         self.workbook_config = workbook_config
         self.save_mode = save_mode
         self.reporter = reporter
+        self.manifest = manifest
+        self.chunk_rows = chunk_rows
         self.file_path = self.data_path / self.data_file_name
+        self._file_fingerprint: FileFingerprint | None = None
 
     def process_sheets(
         self,
@@ -58,8 +73,11 @@ class SheetProcessor:
         """
         results = []
         for sheet_config in sheets:
+            start = time.perf_counter()
             result = self.process_sheet(sheet_config, writer)
             if result:
+                result.elapsed_seconds = time.perf_counter() - start
+                result.peak_rss_bytes = peak_rss_bytes()
                 results.append(result)
         return results
 
@@ -85,13 +103,77 @@ class SheetProcessor:
                 data_row=sheet_config.data_row,
             )
 
+        use_manifest = (
+            self.manifest is not None
+            and self.save_mode in IngestManifest.SKIPPABLE_MODES
+            and self.file_path.exists()
+        )
+        if use_manifest:
+            skipped = self._skip_if_unchanged(sheet_config, writer)
+            if skipped:
+                return skipped
+
         if self.workbook_config.file_type == FileType.EXCEL:
-            return self._process_excel_sheet(sheet_config, writer)
+            result = self._process_excel_sheet(sheet_config, writer)
         elif self.workbook_config.file_type == FileType.DELIMITED:
-            return self._process_delimited_file(sheet_config, writer)
+            result = self._process_delimited_file(sheet_config, writer)
         else:
             raise ValueError(f"Unsupported file type: {self.workbook_config.file_type}")
 
+        if self.manifest is not None:
+            if use_manifest:
+                self.manifest.record(
+                    self.file_path,
+                    sheet_config,
+                    self._get_file_fingerprint(),
+                    IngestManifest.fingerprint_sheet(sheet_config, self.save_mode, writer.typed_load),
+                    result.row_count,
+                )
+            else:
+                self.manifest.forget(self.file_path, sheet_config)
+
+        return result
+
+    def _get_file_fingerprint(self) -> FileFingerprint:
+        """Fingerprint the source file once per processor.
+
+        Returns:
+            FileFingerprint of the source file.
+        """
+        if self._file_fingerprint is None:
+            self._file_fingerprint = self.manifest.fingerprint_file(self.file_path)
+        return self._file_fingerprint
+
+    def _skip_if_unchanged(self, sheet_config: SheetConfig, writer: DuckDBWriter) -> WriteResult | None:
+        """Check the manifest and build a skipped result for unchanged sheets.
+
+        Args:
+            sheet_config: Configuration for the sheet to process.
+            writer: DuckDBWriter the sheet would be written with.
+
+        Returns:
+            WriteResult marked as skipped if the sheet is unchanged, None otherwise.
+        """
+        row_count = self.manifest.get_unchanged_row_count(
+            self.file_path,
+            sheet_config,
+            self._get_file_fingerprint(),
+            IngestManifest.fingerprint_sheet(sheet_config, self.save_mode, writer.typed_load),
+        )
+        if row_count is None:
+            return None
+
+        if self.reporter:
+            self.reporter.print_sheet_skipped_unchanged(row_count)
+
+        return WriteResult(
+            table_name=sheet_config.target_table_name,
+            rows_written=0,
+            row_count=row_count,
+            save_mode=self.save_mode,
+            skipped=True,
+        )
+
     def _process_excel_sheet(
         self,
         sheet_config: SheetConfig,
@@ -112,6 +194,9 @@ class SheetProcessor:
             header_row=sheet_config.header_row - 1,  # pandas uses 0-indexed
             dtype=str,
         )
+        if self.chunk_rows:
+            return self._process_excel_sheet_chunked(reader, sheet_config, writer)
+
         df = reader.load()
 
         if self.reporter:
@@ -122,6 +207,58 @@ class SheetProcessor:
 
         if self.reporter:
             self.reporter.print_sheet_rows_written(result.rows_written)
+            if result.column_types:
+                self.reporter.print_sheet_column_types(result.column_types)
+
+        return result
+
+    def _process_excel_sheet_chunked(
+        self,
+        reader: ExcelReader,
+        sheet_config: SheetConfig,
+        writer: DuckDBWriter,
+    ) -> WriteResult:
+        """Stream an Excel sheet into DuckDB chunk by chunk.
+
+        The first chunk is written with the configured save mode and the
+        rest are appended, so the table ends up as a single load would
+        leave it. A typed load infers column types once, after the last chunk.
+
+        Args:
+            reader: ExcelReader for the sheet.
+            sheet_config: Configuration for the sheet to process.
+            writer: DuckDBWriter instance for database operations.
+
+        Returns:
+            WriteResult with totals across all chunks.
+        """
+        table_name = sheet_config.target_table_name
+        rows_read = 0
+        result: WriteResult | None = None
+
+        if self.save_mode != SaveMode.DROP:
+            for chunk in reader.iter_chunks(self.chunk_rows):
+                save_mode = self.save_mode if result is None else SaveMode.APPEND
+                chunk_result = writer.write(chunk, table_name, save_mode, infer_types=False)
+                rows_read += len(chunk)
+                if result is None:
+                    result = chunk_result
+                else:
+                    result.rows_written += chunk_result.rows_written
+                    result.row_count = chunk_result.row_count
+
+        if result is None:
+            # No data rows (or DROP): apply the save mode to an empty frame
+            columns = reader.columns() if self.save_mode != SaveMode.DROP else []
+            result = writer.write(pd.DataFrame(columns=columns), table_name, self.save_mode)
+        elif writer.typed_load:
+            result.column_types = writer.apply_column_types(table_name)
+
+        if self.reporter:
+            self.reporter.print_sheet_rows_read(rows_read)
+            self.reporter.print_sheet_rows_written(result.rows_written)
+            if result.column_types:
+                self.reporter.print_sheet_column_types(result.column_types)
 
         return result
 
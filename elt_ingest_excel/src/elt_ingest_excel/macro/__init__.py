@@ -1,6 +1,6 @@
 """VBA Macro utilities for Excel workbooks."""
 
-__all__ = ["run_validation", "list_vba_entry_points"]
+__all__ = ["run_validation", "list_vba_entry_points", "validate_workbook"]
 
 
 def __getattr__(name: str):
@@ -11,4 +11,7 @@ def __getattr__(name: str):
     if name == "list_vba_entry_points":
         from elt_ingest_excel.macro.vba_analyzer import list_vba_entry_points
         return list_vba_entry_points
+    if name == "validate_workbook":
+        from elt_ingest_excel.macro.manifest_validator import validate_workbook
+        return validate_workbook
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
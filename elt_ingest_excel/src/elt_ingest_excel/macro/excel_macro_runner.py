@@ -5,21 +5,21 @@ This module provides low-level AppleScript-based execution of VBA macros
 in Excel workbooks on macOS.
 """
 
-import os
-import re
 import subprocess
 import sys
-import zipfile
 from pathlib import Path
 from typing import Iterable
 
+from elt_ingest_excel.macro.vba_analyzer import WORKBOOK_SUFFIXES
+from elt_ingest_excel.macro.vba_analyzer import list_vba_entry_points as _list_vba_entry_points
+
 
 def list_vba_entry_points(workbook_path: str | Path) -> list[str]:
     """
     List VBA macro entry points in a workbook.
 
-    This extracts macro names from the compiled VBA project binary.
-    Note: Results may include some false positives from string fragments.
+    Macro names are parsed from the decompressed VBA module source
+    (see vba_analyzer.read_vba_modules).
 
     Args:
         workbook_path: Path to the .xlsm workbook
@@ -30,38 +30,9 @@ def list_vba_entry_points(workbook_path: str | Path) -> list[str]:
     path = Path(workbook_path).expanduser()
     if not path.exists():
         raise FileNotFoundError(str(path))
-    if path.suffix.lower() not in {".xlsm", ".xlam", ".xlsb"}:
+    if path.suffix.lower() not in WORKBOOK_SUFFIXES:
         return []
-
-    with zipfile.ZipFile(path) as zf:
-        try:
-            vba = zf.read("xl/vbaProject.bin")
-        except KeyError:
-            return []
-
-    txt = "\n".join(_iter_printable_strings(vba, min_len=4))
-    names: set[str] = set()
-
-    for m in re.finditer(r"\b(?:Sub|Function)\s+([A-Za-z_][A-Za-z0-9_]*)\b", txt):
-        n = m.group(1)
-        if n and n.lower() not in {"auto_open", "auto_close"}:
-            names.add(n)
-
-    return sorted(names, key=str.lower)
-
-
-def _iter_printable_strings(data: bytes, min_len: int = 4) -> Iterable[str]:
-    """Extract printable ASCII strings from binary data."""
-    current: list[int] = []
-    for b in data:
-        if 32 <= b <= 126:
-            current.append(b)
-            continue
-        if len(current) >= min_len:
-            yield bytes(current).decode("ascii", errors="ignore")
-        current = []
-    if len(current) >= min_len:
-        yield bytes(current).decode("ascii", errors="ignore")
+    return sorted(set(_list_vba_entry_points(path)), key=str.lower)
 
 
 def run_excel_vba_macro(
@@ -0,0 +1,573 @@
+#!/usr/bin/env python3
+"""
+Run the ValidationManifest checks of a published workbook without Excel.
+
+The VBA validation macros (see vba_runner) walk the ValidationManifest
+sheet and check the data cell by cell inside Excel, which needs macOS and
+an Excel install. This module runs the same checks on any platform:
+
+1. The ValidationManifest sheet is read with openpyxl's streaming reader.
+2. Each data sheet the manifest names is streamed once into an in-memory
+   DuckDB table of text columns.
+3. Each sheet's rules are compiled into one query by the rule engine
+   (transform.rule_engine.compile_rule_set) and run over the whole sheet.
+4. The issues are written to the "Validation Results" sheet by patching
+   its worksheet XML (every other part, including the VBA project, is
+   copied unchanged) and/or to a CSV report.
+
+Manifest layout: a header row within the first rows of the sheet, then
+one rule per row. Headers are matched ignoring case, spaces and
+underscores:
+
+    Sheet        Data sheet the rule applies to (required)
+    Column       Header text of the checked column (required; alias: Col)
+    Rule Type    DUPLICATE, MISSING, MATCH, ENSURE_DATA, FORMAT or CROSS_TAB
+                 (required; alias: Rule)
+    Values       MATCH: allowed values separated by ";" or line breaks, or
+                 "=Name" for a defined name (default: the column's drop-down
+                 list). ENSURE_DATA: When Column values that make the column
+                 required. FORMAT: regular expression. CROSS_TAB: "Sheet" or
+                 "Sheet!Column" the value must exist in.
+    When Column  ENSURE_DATA: column whose value makes Column required
+                 (alias: Depends On)
+    Key Column   Column reported as the row's key (default: first column)
+    Message      Issue message
+    Enabled      Rows set to N/No/False/0 are skipped
+
+Usage:
+    uv run python -m elt_ingest_excel.macro.manifest_validator \
+        --workbook ~/Documents/workday_fin_creditor_supplier_active_v1.xlsm
+
+    # Write a CSV report and leave the workbook untouched
+    uv run python -m elt_ingest_excel.macro.manifest_validator \
+        --workbook ~/Documents/workday_fin_creditor_supplier_active_v1.xlsm \
+        --report validation_results.csv --no-save
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+import duckdb
+import pyarrow as pa
+from openpyxl import load_workbook
+from openpyxl.utils import get_column_letter
+
+from elt_ingest_excel.models.validation_rules import DEFAULT_RULE_TYPES, RuleKind, TableRuleSet, ValidationRule
+from elt_ingest_excel.ooxml import OoxmlWorkbook, WorkbookMetadataIndex, cell_text
+from elt_ingest_excel.transform.rule_engine import compile_rule_set
+
+MANIFEST_SHEET = "ValidationManifest"
+RESULTS_SHEET = "Validation Results"
+RESULT_COLUMNS = ("sheet", "rule_type", "col", "key", "detail", "message", "row")
+
+# Rows searched for the manifest and data sheet header rows
+HEADER_SCAN_ROWS = 20
+
+# Manifest header (normalized) -> field
+_MANIFEST_FIELDS = {
+    "sheet": "sheet",
+    "sheetname": "sheet",
+    "column": "column",
+    "col": "column",
+    "columnname": "column",
+    "ruletype": "rule_type",
+    "rule": "rule_type",
+    "values": "values",
+    "allowedvalues": "values",
+    "value": "values",
+    "whencolumn": "when_column",
+    "when": "when_column",
+    "dependson": "when_column",
+    "keycolumn": "key_column",
+    "key": "key_column",
+    "message": "message",
+    "enabled": "enabled",
+    "active": "enabled",
+}
+_REQUIRED_FIELDS = ("sheet", "column", "rule_type")
+_DISABLED = {"n", "no", "false", "0", "off"}
+
+_RULE_KINDS = {
+    **{label: kind for kind, label in DEFAULT_RULE_TYPES.items()},
+    **{kind.value.upper(): kind for kind in RuleKind},
+}
+_DEFAULT_MESSAGES = {
+    RuleKind.UNIQUE: "Duplicate value",
+    RuleKind.NOT_NULL: "Required value is missing",
+    RuleKind.ALLOWED_VALUES: "Value is not in the allowed list",
+    RuleKind.REGEX: "Value does not match the required format",
+    RuleKind.REQUIRED_IF: "Required when {when_column} is populated",
+    RuleKind.FOREIGN_KEY: "Value not found in {values}",
+}
+_VALUE_SEPARATOR = re.compile(r"[;\n]")
+
+
+@dataclass
+class ManifestRule:
+    """One rule row of the ValidationManifest sheet.
+
+    Attributes:
+        sheet: Data sheet the rule applies to.
+        column: Header text of the checked column.
+        rule_type: Rule type label as written in the manifest.
+        values: Raw Values cell (meaning depends on the rule type).
+        when_column: ENSURE_DATA trigger column.
+        key_column: Column reported as the row's key.
+        message: Issue message.
+        row: Manifest row number, used in skip reasons.
+    """
+    sheet: str
+    column: str
+    rule_type: str
+    values: str | None = None
+    when_column: str | None = None
+    key_column: str | None = None
+    message: str | None = None
+    row: int = 0
+
+
+@dataclass
+class ManifestValidationResult:
+    """Outcome of validating a workbook against its ValidationManifest.
+
+    Attributes:
+        workbook_path: Workbook validated.
+        rule_count: Manifest rules evaluated.
+        issues: Issue rows in RESULT_COLUMNS order.
+        rows_checked: Data rows read per sheet.
+        skipped: Manifest rules that were not evaluated, with the reason.
+        elapsed_seconds: Wall-clock time of the validation.
+    """
+    workbook_path: str
+    rule_count: int = 0
+    issues: list[tuple] = field(default_factory=list)
+    rows_checked: dict[str, int] = field(default_factory=dict)
+    skipped: list[str] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+
+@dataclass
+class _SheetTable:
+    """A data sheet loaded into DuckDB."""
+    table_name: str
+    columns: list[str]
+    # normalized header -> DuckDB column name
+    lookup: dict[str, str]
+    header_row: int
+
+
+def read_manifest(workbook_path: str | Path, sheet_name: str = MANIFEST_SHEET) -> list[ManifestRule]:
+    """
+    Read the rules of a workbook's ValidationManifest sheet.
+
+    Args:
+        workbook_path: Path to the .xlsm/.xlsx workbook
+        sheet_name: Manifest sheet name (default: ValidationManifest)
+
+    Returns:
+        Manifest rules in sheet order.
+
+    Raises:
+        ValueError: If the sheet is missing or has no recognizable header row.
+    """
+    wb = load_workbook(Path(workbook_path).expanduser(), read_only=True, data_only=True)
+    try:
+        return _read_manifest(wb, sheet_name)
+    finally:
+        wb.close()
+
+
+def validate_workbook(
+    workbook_path: str | Path,
+    manifest_sheet: str = MANIFEST_SHEET,
+    results_sheet: str | None = RESULTS_SHEET,
+    report_path: str | Path | None = None,
+    save: bool = True,
+    output_path: str | Path | None = None,
+) -> ManifestValidationResult:
+    """
+    Run the ValidationManifest checks of a workbook without Excel.
+
+    Args:
+        workbook_path: Path to the .xlsm/.xlsx workbook
+        manifest_sheet: Sheet holding the validation rules (default: ValidationManifest)
+        results_sheet: Existing sheet the issues are written to (default: Validation
+                       Results); None to only write the report
+        report_path: Optional CSV file the issues are also written to
+        save: Save the workbook with the results sheet (default: True)
+        output_path: Where to save the workbook (default: in place)
+
+    Returns:
+        ManifestValidationResult with the issues found.
+
+    Raises:
+        FileNotFoundError: If the workbook does not exist.
+        ValueError: If the manifest cannot be read or the results sheet does not exist.
+    """
+    start = time.perf_counter()
+    path = Path(workbook_path).expanduser().resolve()
+    if not path.exists():
+        raise FileNotFoundError(f"Workbook not found: {path}")
+
+    result = ManifestValidationResult(workbook_path=str(path))
+    conn = duckdb.connect()
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rules = _read_manifest(wb, manifest_sheet)
+        if save and results_sheet and results_sheet not in wb.sheetnames:
+            raise ValueError(
+                f"Sheet '{results_sheet}' not found in {path.name}; use a report file instead"
+            )
+        tables = _load_sheets(conn, wb, rules, result)
+    finally:
+        wb.close()
+
+    metadata: list[WorkbookMetadataIndex] = []
+    rule_sets: dict[str, TableRuleSet] = {}
+    for manifest_rule in rules:
+        try:
+            rule, key_column = _build_rule(manifest_rule, tables, path, metadata)
+        except ValueError as e:
+            result.skipped.append(f"Row {manifest_rule.row}: {e}")
+            continue
+        table = tables[manifest_rule.sheet]
+        rule_set = rule_sets.setdefault(
+            manifest_rule.sheet,
+            TableRuleSet(table.table_name, manifest_rule.sheet, key_column),
+        )
+        rule_set.rules.append(rule)
+        result.rule_count += 1
+
+    for rule_set in rule_sets.values():
+        result.issues.extend(_run_rule_set(conn, rule_set))
+    conn.close()
+
+    if report_path:
+        _write_report(Path(report_path).expanduser(), result.issues)
+    if save and results_sheet:
+        _write_results_sheet(path, results_sheet, result.issues, output_path)
+
+    result.elapsed_seconds = time.perf_counter() - start
+    return result
+
+
+def _normalize(value: Any) -> str:
+    return re.sub(r"[\s_]+", "", str(value)).casefold() if value is not None else ""
+
+
+def _header_key(value: Any) -> str:
+    """Header text compared case-insensitively with whitespace collapsed."""
+    return " ".join(str(value).split()).casefold() if value is not None else ""
+
+
+def _read_manifest(wb, sheet_name: str) -> list[ManifestRule]:
+    if sheet_name not in wb.sheetnames:
+        raise ValueError(f"Sheet '{sheet_name}' not found in workbook")
+    fields: dict[int, str] | None = None
+    rules = []
+    for row_number, values in enumerate(wb[sheet_name].iter_rows(values_only=True), 1):
+        if fields is None:
+            found = {i: _MANIFEST_FIELDS[_normalize(v)] for i, v in enumerate(values) if _normalize(v) in _MANIFEST_FIELDS}
+            if set(_REQUIRED_FIELDS) <= set(found.values()):
+                fields = found
+            elif row_number >= HEADER_SCAN_ROWS:
+                break
+            continue
+        row = {}
+        for index, name in fields.items():
+            if index < len(values) and name not in row:
+                text = cell_text(values[index])
+                row[name] = text.strip() if text else None
+        if not all(row.get(name) for name in _REQUIRED_FIELDS):
+            continue
+        if (row.pop("enabled", None) or "").casefold() in _DISABLED:
+            continue
+        rules.append(ManifestRule(row=row_number, **row))
+    if fields is None:
+        raise ValueError(
+            f"Sheet '{sheet_name}' has no header row with Sheet, Column and Rule Type "
+            f"in its first {HEADER_SCAN_ROWS} rows"
+        )
+    return rules
+
+
+def _required_columns(rules: list[ManifestRule]) -> dict[str, set[str]]:
+    """Sheet -> header keys its rules read (including cross-sheet references)."""
+    required: dict[str, set[str]] = {}
+    for rule in rules:
+        columns = required.setdefault(rule.sheet, set())
+        columns.update(_header_key(c) for c in (rule.column, rule.when_column, rule.key_column) if c)
+        if _RULE_KINDS.get(_rule_label(rule.rule_type)) == RuleKind.FOREIGN_KEY and rule.values:
+            ref_sheet, _, ref_column = rule.values.partition("!")
+            required.setdefault(ref_sheet.strip(), set()).add(_header_key(ref_column.strip() or rule.column))
+    return required
+
+
+def _load_sheets(conn, wb, rules: list[ManifestRule], result: ManifestValidationResult) -> dict[str, _SheetTable]:
+    """Stream each sheet the rules read into a DuckDB table of text columns."""
+    tables: dict[str, _SheetTable] = {}
+    for index, (sheet, required) in enumerate(_required_columns(rules).items(), 1):
+        if sheet not in wb.sheetnames:
+            continue
+        header_row, header, rows = _find_header(wb[sheet].iter_rows(values_only=True), required)
+        if header is None:
+            continue
+
+        columns: list[str] = []
+        lookup: dict[str, str] = {}
+        for position, value in enumerate(header, 1):
+            name = " ".join(str(value).split()) if value is not None else get_column_letter(position)
+            while name in columns:
+                name = f"{name}_{position}"
+            columns.append(name)
+            lookup.setdefault(_header_key(value) or name.casefold(), name)
+
+        data: list[list[str | None]] = [[] for _ in columns]
+        row_numbers: list[int] = []
+        for row_number, values in enumerate(rows, header_row + 1):
+            texts = [cell_text(v) for v in values[:len(columns)]]
+            if not any(texts):
+                continue
+            texts.extend([None] * (len(columns) - len(texts)))
+            for column, text in zip(data, texts):
+                column.append(text)
+            row_numbers.append(row_number)
+
+        table_name = f"sheet_{index}"
+        arrow = pa.table(
+            [pa.array(column, type=pa.string()) for column in data] + [pa.array(row_numbers, type=pa.int64())],
+            names=columns + ["__row"],
+        )
+        conn.from_arrow(arrow).create(table_name)
+        tables[sheet] = _SheetTable(table_name, columns, lookup, header_row)
+        result.rows_checked[sheet] = len(row_numbers)
+    return tables
+
+
+def _find_header(rows: Iterator[tuple], required: set[str]) -> tuple[int, tuple | None, Iterator[tuple]]:
+    """Find the header row: the first holding every required header, else the most of them.
+
+    A mistyped column in one rule therefore only skips that rule. Returns
+    the header row number, its values (None if no row holds any required
+    header) and the rows below it.
+    """
+    scanned: list[tuple] = []
+    best_row, best_count = 0, 0
+    for row_number, values in enumerate(rows, 1):
+        scanned.append(values)
+        count = len(required & {_header_key(v) for v in values})
+        if count == len(required):
+            return row_number, values, rows
+        if count > best_count:
+            best_row, best_count = row_number, count
+        if row_number >= HEADER_SCAN_ROWS:
+            break
+    if not best_count:
+        return 0, None, rows
+    return best_row, scanned[best_row - 1], itertools.chain(scanned[best_row:], rows)
+
+
+def _rule_label(rule_type: str) -> str:
+    return re.sub(r"[\s-]+", "_", rule_type.strip()).upper()
+
+
+def _build_rule(
+    rule: ManifestRule,
+    tables: dict[str, _SheetTable],
+    workbook_path: Path,
+    metadata: list[WorkbookMetadataIndex],
+) -> tuple[ValidationRule, str]:
+    """Translate a manifest rule into a rule engine rule and the sheet's key column."""
+    kind = _RULE_KINDS.get(_rule_label(rule.rule_type))
+    if kind is None:
+        raise ValueError(f"unsupported rule type '{rule.rule_type}'")
+    table = tables.get(rule.sheet)
+    if table is None:
+        raise ValueError(
+            f"sheet '{rule.sheet}' not found or has none of its rules' columns "
+            f"in its first {HEADER_SCAN_ROWS} rows"
+        )
+
+    column = _resolve_column(table, rule.sheet, rule.column)
+    key_column = _resolve_column(table, rule.sheet, rule.key_column) if rule.key_column else table.columns[0]
+    when_column = _resolve_column(table, rule.sheet, rule.when_column) if rule.when_column else None
+    message = rule.message or _DEFAULT_MESSAGES[kind].format(when_column=when_column, values=rule.values)
+    options: dict[str, Any] = {}
+
+    if kind == RuleKind.ALLOWED_VALUES:
+        options["values"] = _allowed_values(rule, table, column, workbook_path, metadata)
+    elif kind == RuleKind.REQUIRED_IF:
+        if when_column is None:
+            raise ValueError(f"{rule.rule_type} needs a When Column")
+        options["when_column"] = when_column
+        options["values"] = _split_values(rule.values) or None
+    elif kind == RuleKind.REGEX:
+        if not rule.values:
+            raise ValueError(f"{rule.rule_type} needs a pattern in Values")
+        options["pattern"] = rule.values
+    elif kind == RuleKind.FOREIGN_KEY:
+        if not rule.values:
+            raise ValueError(f"{rule.rule_type} needs a reference sheet in Values")
+        ref_sheet, _, ref_column = rule.values.partition("!")
+        ref_table = tables.get(ref_sheet.strip())
+        if ref_table is None:
+            raise ValueError(f"reference sheet '{ref_sheet.strip()}' not found")
+        options["ref_table"] = ref_table.table_name
+        options["ref_column"] = _resolve_column(ref_table, ref_sheet.strip(), ref_column.strip() or rule.column)
+        options["ignore_blank"] = True
+
+    return (
+        ValidationRule(kind=kind, column=column, message=message, **options),
+        key_column,
+    )
+
+
+def _resolve_column(table: _SheetTable, sheet: str, header: str) -> str:
+    """DuckDB column of a sheet's header text."""
+    column = table.lookup.get(_header_key(header))
+    if column is None:
+        raise ValueError(f"column '{header}' not found on sheet '{sheet}'")
+    return column
+
+
+def _split_values(values: str | None) -> list[str]:
+    return [v.strip() for v in _VALUE_SEPARATOR.split(values or "") if v.strip()]
+
+
+def _allowed_values(
+    rule: ManifestRule,
+    table: _SheetTable,
+    column: str,
+    workbook_path: Path,
+    metadata: list[WorkbookMetadataIndex],
+) -> list[str]:
+    """MATCH values from the manifest, a defined name or the column's drop-down list."""
+    if rule.values and not rule.values.startswith("="):
+        return _split_values(rule.values)
+    if not metadata:
+        metadata.append(WorkbookMetadataIndex.build(workbook_path))
+    index = metadata[0]
+    if rule.values:
+        name = rule.values[1:].strip()
+        if name not in index.named_values:
+            raise ValueError(f"defined name '{name}' not found or not resolvable")
+        return index.named_values[name]
+    values = index.list_values(rule.sheet, column=table.columns.index(column) + 1)
+    if not values:
+        raise ValueError(f"no Values given and column '{rule.column}' has no drop-down list")
+    return values
+
+
+def _run_rule_set(conn: duckdb.DuckDBPyConnection, rule_set: TableRuleSet) -> list[tuple]:
+    """Issues of one sheet in RESULT_COLUMNS order, sorted by row.
+
+    The rules are compiled with the row number as key so each issue can be
+    joined back to its row for the sheet's key column and the sort.
+    """
+    by_row = TableRuleSet(rule_set.table_name, rule_set.sheet_name, "__row", rules=rule_set.rules)
+    key = '"' + rule_set.key_column.replace('"', '""') + '"'
+    return conn.execute(
+        f"""
+        SELECT issues.sheet, issues.rule_type, issues.col, src.{key}, issues.detail, issues.message, src.__row
+          FROM ({compile_rule_set(by_row)}) issues
+          JOIN "{rule_set.table_name}" src ON src.__row = CAST(issues.__row AS BIGINT)
+         ORDER BY src.__row, issues.rule_type, issues.col
+        """
+    ).fetchall()
+
+
+def _write_report(report_path: Path, issues: list[tuple]) -> None:
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(RESULT_COLUMNS)
+        writer.writerows(issues)
+
+
+def _write_results_sheet(
+    workbook_path: Path,
+    sheet_name: str,
+    issues: list[tuple],
+    output_path: str | Path | None,
+) -> None:
+    """Replace the results sheet's rows with the issues; everything else is copied unchanged."""
+    with OoxmlWorkbook(workbook_path) as wb:
+        sheet = wb.worksheet(sheet_name)
+        rows = [RESULT_COLUMNS, *issues]
+        # Blank the rows of earlier results below the new ones
+        rows.extend([(None,) * len(RESULT_COLUMNS)] * max(0, sheet.last_row - len(rows)))
+        sheet.write_rows(rows, start_row=1)
+        wb.save(Path(output_path).expanduser() if output_path else None)
+
+
+def print_summary(result: ManifestValidationResult) -> None:
+    """Print issue counts per sheet and rule type, and any skipped rules."""
+    print(f"Validated {Path(result.workbook_path).name}: {result.rule_count} rules "
+          f"in {result.elapsed_seconds:.2f}s")
+    for sheet, rows in result.rows_checked.items():
+        counts: dict[str, int] = {}
+        for issue in result.issues:
+            if issue[0] == sheet:
+                counts[issue[1]] = counts.get(issue[1], 0) + 1
+        detail = ", ".join(f"{rule_type} {count:,}" for rule_type, count in sorted(counts.items()))
+        print(f"  {sheet}: {rows:,} rows, {sum(counts.values()):,} issues" + (f" ({detail})" if detail else ""))
+    for reason in result.skipped:
+        print(f"  ⚠ Skipped: {reason}")
+    print(f"Total issues: {len(result.issues):,}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Run the ValidationManifest checks of a workbook without Excel"
+    )
+    parser.add_argument("--workbook", required=True, help="Path to the .xlsm workbook")
+    parser.add_argument(
+        "--manifest-sheet",
+        default=MANIFEST_SHEET,
+        help=f"Sheet holding the validation rules (default: {MANIFEST_SHEET})",
+    )
+    parser.add_argument(
+        "--results-sheet",
+        default=RESULTS_SHEET,
+        help=f"Sheet the issues are written to (default: {RESULTS_SHEET})",
+    )
+    parser.add_argument("--report", help="Also write the issues to this CSV file")
+    parser.add_argument("--output", help="Save the validated workbook here instead of in place")
+    parser.add_argument(
+        "--no-save",
+        action="store_true",
+        help="Do not write the results sheet into the workbook",
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        result = validate_workbook(
+            workbook_path=args.workbook,
+            manifest_sheet=args.manifest_sheet,
+            results_sheet=args.results_sheet,
+            report_path=args.report,
+            save=not args.no_save,
+            output_path=args.output,
+        )
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    print_summary(result)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
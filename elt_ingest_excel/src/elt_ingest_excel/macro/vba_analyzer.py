@@ -3,14 +3,47 @@ VBA Macro Analyzer for Excel Workbooks.
 
 This module provides tools to extract and document VBA macro names
 from Excel .xlsm, .xlam, and .xlsb files.
+
+Macros are read from the VBA project's module source: the OLE container
+in xl/vbaProject.bin is opened, the VBA/dir stream lists the modules, and
+each module stream is decompressed (MS-OVBA 2.4.1) from its source offset.
+Projects that cannot be parsed fall back to scanning printable strings.
+
+Usage:
+    python -m elt_ingest_excel.macro.vba_analyzer ~/Documents/workbooks --workers 4
 """
 
 from __future__ import annotations
 
+import argparse
+import json
 import re
+import struct
 import zipfile
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterator
+
+WORKBOOK_SUFFIXES = {".xlsm", ".xlam", ".xlsb"}
+
+# VBA/dir stream record ids (MS-OVBA 2.3.4.2)
+_DIR_PROJECTCODEPAGE = 0x0003
+_DIR_PROJECTVERSION = 0x0009
+_DIR_TERMINATOR = 0x0010
+_DIR_MODULENAME = 0x0019
+_DIR_MODULESTREAMNAME = 0x001A
+_DIR_MODULETYPE_STANDARD = 0x0021
+_DIR_MODULETYPE_DOCUMENT = 0x0022
+_DIR_MODULE_TERMINATOR = 0x002B
+_DIR_MODULEOFFSET = 0x0031
+
+# Sub/Function declarations at the start of a source line
+_DECLARATION = re.compile(
+    r"^[ \t]*(?:(Public|Private|Friend)[ \t]+)?(?:Static[ \t]+)?(Sub|Function)[ \t]+([A-Za-z_][A-Za-z0-9_]*)",
+    re.IGNORECASE | re.MULTILINE,
+)
 
 
 @dataclass
@@ -19,6 +52,18 @@ class VbaMacro:
 
     name: str
     macro_type: str  # "Sub" or "Function"
+    module: str = ""  # Empty when found by the printable-string fallback
+    scope: str = "Public"
+
+
+@dataclass
+class VbaModule:
+    """A VBA module and its decompressed source."""
+
+    name: str
+    stream_name: str
+    module_type: str  # "standard" or "document" (sheet, workbook and class modules)
+    source: str
 
 
 @dataclass
@@ -27,9 +72,11 @@ class VbaAnalysisResult:
 
     workbook_path: str
     macros: list[VbaMacro] = field(default_factory=list)
+    modules: list[str] = field(default_factory=list)
     sheet_names: list[str] = field(default_factory=list)
     named_ranges: list[str] = field(default_factory=list)
     validation_sheets: list[str] = field(default_factory=list)
+    error: str | None = None
 
 
 class VbaMacroAnalyzer:
@@ -53,7 +100,7 @@ class VbaMacroAnalyzer:
         result = VbaAnalysisResult(workbook_path=str(self.workbook_path))
 
         with zipfile.ZipFile(self.workbook_path) as zf:
-            result.macros = self._extract_macros(zf)
+            result.macros, result.modules = self._extract_macros(zf)
             result.sheet_names = self._extract_sheet_names(zf)
             result.named_ranges = self._extract_named_ranges(zf)
             result.validation_sheets = self._find_validation_sheets(
@@ -62,33 +109,38 @@ class VbaMacroAnalyzer:
 
         return result
 
-    def _extract_vba_strings(self, zf: zipfile.ZipFile, min_len: int = 2) -> list[str]:
-        """Extract printable strings from VBA project."""
+    def _extract_macros(self, zf: zipfile.ZipFile) -> tuple[list[VbaMacro], list[str]]:
+        """Extract VBA macro definitions and module names from the workbook."""
         try:
             vba = zf.read("xl/vbaProject.bin")
         except KeyError:
-            return []
+            return [], []
 
-        strings: list[str] = []
-        current: list[int] = []
-
-        for b in vba:
-            if 32 <= b <= 126:
-                current.append(b)
-            else:
-                if len(current) >= min_len:
-                    strings.append(bytes(current).decode("ascii", errors="ignore"))
-                current = []
-
-        if len(current) >= min_len:
-            strings.append(bytes(current).decode("ascii", errors="ignore"))
-
-        return strings
+        try:
+            modules = read_vba_modules(vba)
+        except (ImportError, OSError, ValueError, KeyError, IndexError, struct.error):
+            return self._extract_macros_from_strings(vba), []
 
-    def _extract_macros(self, zf: zipfile.ZipFile) -> list[VbaMacro]:
-        """Extract VBA macro definitions from the workbook."""
-        strings = self._extract_vba_strings(zf, min_len=2)
-        txt = "\n".join(strings)
+        macros: list[VbaMacro] = []
+        for module in modules:
+            for match in _DECLARATION.finditer(module.source):
+                scope, macro_type, macro_name = match.groups()
+                if macro_name.lower() in {"auto_open", "auto_close"}:
+                    continue
+                macros.append(
+                    VbaMacro(
+                        name=macro_name,
+                        macro_type=macro_type.capitalize(),
+                        module=module.name,
+                        scope=(scope or "Public").capitalize(),
+                    )
+                )
+        macros.sort(key=lambda m: (m.macro_type, m.name.lower()))
+        return macros, [module.name for module in modules]
+
+    def _extract_macros_from_strings(self, vba: bytes) -> list[VbaMacro]:
+        """Guess macro names from printable strings of an unparseable VBA project."""
+        txt = "\n".join(iter_printable_strings(vba, min_len=2))
 
         macros: list[VbaMacro] = []
         seen: set[str] = set()
@@ -162,8 +214,216 @@ class VbaMacroAnalyzer:
         return sorted(set(n for n in all_names if any(k in n.lower() for k in keywords)))
 
 
+@lru_cache(maxsize=None)
+def _printable_pattern(min_len: int) -> re.Pattern[bytes]:
+    return re.compile(rb"[\x20-\x7e]{%d,}" % max(min_len, 1))
+
+
+def iter_printable_strings(data: bytes, min_len: int = 4) -> Iterator[str]:
+    """Extract runs of at least min_len printable ASCII bytes from binary data."""
+    for match in _printable_pattern(min_len).finditer(data):
+        yield match.group().decode("ascii")
+
+
+def read_vba_modules(vba_project: bytes) -> list[VbaModule]:
+    """Read the modules of a VBA project and decompress their source.
+
+    Args:
+        vba_project: Contents of xl/vbaProject.bin (an OLE compound file).
+
+    Returns:
+        Modules in VBA/dir order.
+
+    Raises:
+        ImportError: If olefile is not installed.
+        OSError: If the data is not an OLE compound file.
+        ValueError: If a stream is not valid MS-OVBA compressed data.
+    """
+    import olefile
+
+    ole = olefile.OleFileIO(vba_project)
+    try:
+        dir_path = next((e for e in ole.listdir() if [p.lower() for p in e[-2:]] == ["vba", "dir"]), None)
+        if dir_path is None:
+            raise ValueError("VBA/dir stream not found")
+        root = dir_path[:-1]
+        directory = decompress_vba_stream(ole.openstream(root + ["dir"]).read())
+
+        codepage = 1252
+        modules: list[VbaModule] = []
+        current: dict = {}
+        position = 0
+        while position + 6 <= len(directory):
+            record_id, size = struct.unpack_from("<HI", directory, position)
+            position += 6
+            # PROJECTVERSION's size field is a reserved constant; its data is 6 bytes
+            data = directory[position:position + (6 if record_id == _DIR_PROJECTVERSION else size)]
+            position += len(data)
+            if record_id == _DIR_TERMINATOR:
+                break
+            if record_id == _DIR_PROJECTCODEPAGE:
+                codepage = struct.unpack("<H", data)[0]
+            elif record_id == _DIR_MODULENAME:
+                current = {"name": _decode(data, codepage), "module_type": "standard", "offset": 0}
+            elif record_id == _DIR_MODULESTREAMNAME:
+                current["stream_name"] = _decode(data, codepage)
+            elif record_id == _DIR_MODULEOFFSET:
+                current["offset"] = struct.unpack("<I", data)[0]
+            elif record_id == _DIR_MODULETYPE_DOCUMENT:
+                current["module_type"] = "document"
+            elif record_id == _DIR_MODULETYPE_STANDARD:
+                current["module_type"] = "standard"
+            elif record_id == _DIR_MODULE_TERMINATOR and current:
+                stream_name = current.get("stream_name", current["name"])
+                stream = ole.openstream(root + [stream_name]).read()
+                source = decompress_vba_stream(stream[current["offset"]:])
+                modules.append(
+                    VbaModule(
+                        name=current["name"],
+                        stream_name=stream_name,
+                        module_type=current["module_type"],
+                        source=_decode(source, codepage).replace("\r\n", "\n"),
+                    )
+                )
+                current = {}
+        return modules
+    finally:
+        ole.close()
+
+
+def decompress_vba_stream(data: bytes) -> bytes:
+    """Decompress an MS-OVBA compressed container (MS-OVBA 2.4.1.3.1).
+
+    Raises:
+        ValueError: If the signature byte or a chunk header is invalid.
+    """
+    if not data or data[0] != 0x01:
+        raise ValueError("Invalid MS-OVBA compressed container signature")
+    out = bytearray()
+    position = 1
+    while position + 2 <= len(data):
+        header = struct.unpack_from("<H", data, position)[0]
+        if (header >> 12) & 0x07 != 0b011:
+            raise ValueError(f"Invalid MS-OVBA chunk signature at offset {position}")
+        chunk_end = min(position + (header & 0x0FFF) + 3, len(data))
+        position += 2
+        chunk_start = len(out)
+        if not header & 0x8000:
+            # Uncompressed chunk: always 4096 raw bytes
+            out += data[position:position + 4096]
+            position += 4096
+            continue
+        while position < chunk_end:
+            flags = data[position]
+            position += 1
+            for bit in range(8):
+                if position >= chunk_end:
+                    break
+                if not flags & (1 << bit):
+                    out.append(data[position])
+                    position += 1
+                    continue
+                token = struct.unpack_from("<H", data, position)[0]
+                position += 2
+                # Offset/length split depends on how much of the chunk is decompressed
+                bit_count = max((len(out) - chunk_start - 1).bit_length(), 4)
+                length = (token & (0xFFFF >> bit_count)) + 3
+                source = len(out) - ((token >> (16 - bit_count)) + 1)
+                if source < chunk_start:
+                    raise ValueError("Invalid MS-OVBA copy token")
+                for k in range(length):
+                    out.append(out[source + k])
+    return bytes(out)
+
+
+def _decode(data: bytes, codepage: int) -> str:
+    try:
+        return bytes(data).decode(f"cp{codepage}", errors="replace")
+    except LookupError:
+        return bytes(data).decode("latin-1")
+
+
 def list_vba_entry_points(workbook_path: str | Path) -> list[str]:
-    """List VBA macro entry points in a workbook."""
+    """List VBA macro entry points (non-Private Subs and Functions) in a workbook."""
     analyzer = VbaMacroAnalyzer(workbook_path)
     result = analyzer.analyze()
-    return [macro.name for macro in result.macros]
+    return [macro.name for macro in result.macros if macro.scope != "Private"]
+
+
+def _analyze_file(path: str) -> VbaAnalysisResult:
+    """Analyze one workbook, capturing failures in the result."""
+    try:
+        return VbaMacroAnalyzer(path).analyze()
+    except Exception as e:
+        return VbaAnalysisResult(workbook_path=path, error=str(e))
+
+
+def find_workbooks(folder: str | Path, recursive: bool = True) -> list[Path]:
+    """Find macro-enabled workbooks in a folder, skipping Office lock files (~$*)."""
+    folder = Path(folder).expanduser()
+    pattern = "**/*" if recursive else "*"
+    return sorted(
+        p
+        for p in folder.glob(pattern)
+        if p.is_file() and p.suffix.lower() in WORKBOOK_SUFFIXES and not p.name.startswith("~$")
+    )
+
+
+def analyze_folder(
+    folder: str | Path,
+    workers: int | None = None,
+    recursive: bool = True,
+) -> list[VbaAnalysisResult]:
+    """Analyze every macro-enabled workbook in a folder in parallel.
+
+    Args:
+        folder: Folder to search for .xlsm, .xlam and .xlsb files.
+        workers: Worker processes. Defaults to the number of CPUs; 1 runs in-process.
+        recursive: Also search subfolders.
+
+    Returns:
+        One result per workbook, in path order. Workbooks that cannot be
+        analyzed have error set instead of macros.
+    """
+    paths = [str(p) for p in find_workbooks(folder, recursive=recursive)]
+    if workers == 1 or len(paths) <= 1:
+        return [_analyze_file(p) for p in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_analyze_file, paths))
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point: analyze workbooks or folders of workbooks."""
+    parser = argparse.ArgumentParser(
+        description="List VBA macros of .xlsm/.xlam/.xlsb workbooks, optionally whole folders in parallel"
+    )
+    parser.add_argument("paths", nargs="+", help="Workbooks or folders to analyze")
+    parser.add_argument("--workers", type=int, help="Worker processes for folders (default: CPU count)")
+    parser.add_argument("--no-recursive", action="store_true", help="Do not search subfolders")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    results: list[VbaAnalysisResult] = []
+    for path in args.paths:
+        if Path(path).expanduser().is_dir():
+            results.extend(analyze_folder(path, workers=args.workers, recursive=not args.no_recursive))
+        else:
+            results.append(_analyze_file(str(Path(path).expanduser())))
+
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+    else:
+        for result in results:
+            print(f"{result.workbook_path}")
+            if result.error:
+                print(f"  Error: {result.error}")
+                continue
+            for macro in result.macros:
+                location = f"  [{macro.module}]" if macro.module else ""
+                print(f"  {macro.macro_type:8} {macro.scope:8} {macro.name}{location}")
+            print(f"  Total: {len(result.macros)} macros in {len(result.modules)} modules")
+    return 1 if any(r.error for r in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
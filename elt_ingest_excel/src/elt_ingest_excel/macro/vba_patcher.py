@@ -15,6 +15,8 @@ import tempfile
 import zipfile
 from pathlib import Path
 
+from ..ooxml.zip_surgery import replace_members
+
 
 def remove_module_private(xlsm_path: str | Path, module_name: str) -> None:
     """
@@ -254,14 +256,8 @@ def _find_moduleprivate_decompressed_offset(
 
 
 def _repack_xlsm(xlsm_path: Path, member: str, new_data: bytes) -> None:
-    """Replace one zip member in an xlsm file with new_data."""
-    tmp_out = xlsm_path.with_suffix(".tmp")
-    with zipfile.ZipFile(xlsm_path, "r") as zin, zipfile.ZipFile(
-        tmp_out, "w", compression=zipfile.ZIP_DEFLATED
-    ) as zout:
-        for item in zin.infolist():
-            if item.filename == member:
-                zout.writestr(item, new_data)
-            else:
-                zout.writestr(item, zin.read(item.filename))
-    tmp_out.replace(xlsm_path)
+    """Replace one zip member in an xlsm file with new_data.
+
+    The other members are copied as stored, without recompressing them.
+    """
+    replace_members(xlsm_path, {member: new_data})
@@ -13,6 +13,11 @@ Usage:
     uv run python -m elt_ingest_excel.macro.vba_runner \
         --workbook ~/Documents/workday_fin_creditor_supplier_active_v1.xlsm
 
+    # Run the ValidationManifest checks in Python instead (no Excel needed)
+    uv run python -m elt_ingest_excel.macro.vba_runner \
+        --workbook ~/Documents/workday_fin_creditor_supplier_active_v1.xlsm \
+        --headless
+
     # Run specific validations (single sheet)
     uv run python -m elt_ingest_excel.macro.vba_runner \
         --workbook ~/Documents/workday_fin_creditor_supplier_active_v1.xlsm \
@@ -128,6 +133,11 @@ def main() -> int:
         action="store_true",
         help="Close the workbook after validation",
     )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Run the ValidationManifest checks in Python without Excel (see manifest_validator)",
+    )
 
     args = parser.parse_args()
 
@@ -152,6 +162,18 @@ def main() -> int:
 
             return 0
 
+        # Excel-free validation mode
+        if args.headless:
+            from elt_ingest_excel.macro.manifest_validator import print_summary, validate_workbook
+
+            result = validate_workbook(
+                workbook_path=args.workbook,
+                results_sheet=args.unhide_sheet,
+                save=not args.no_save,
+            )
+            print_summary(result)
+            return 0
+
         # Run validation mode
         run_validation(
             workbook_path=args.workbook,
@@ -169,6 +191,9 @@ def main() -> int:
     except RuntimeError as e:
         print(f"Error running macro: {e}", file=sys.stderr)
         return 2
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
     except Exception as e:
         print(f"Unexpected error: {e}", file=sys.stderr)
         return 3
@@ -5,6 +5,7 @@ from .ingest_config_excel import ExcelIngestConfig
 from .publish_config import PublishSheetConfig, PublishWorkbookConfig, PublishConfig
 from .results import PublishResult, TransformResult, WriteResult
 from .save_mode import SaveMode
+from .validation_rules import RuleKind, TableRuleSet, ValidationRule, ValidationRuleConfig
 
 __all__ = [
     # Ingest config
@@ -16,10 +17,15 @@ __all__ = [
     "PublishSheetConfig",
     "PublishWorkbookConfig",
     "PublishConfig",
+    # Validation rules
+    "TableRuleSet",
+    "ValidationRule",
+    "ValidationRuleConfig",
     # Results
     "PublishResult",
     "TransformResult",
     "WriteResult",
     # Enums
+    "RuleKind",
     "SaveMode",
 ]
@@ -11,13 +11,25 @@ class PublishSheetConfig:
     Attributes:
         src_table_name: DuckDB table to query for data.
         sheet_name: Name of the worksheet in the target workbook.
-        header_row: Row number containing headers (1-indexed, informational).
+        header_row: Row number containing headers (1-indexed). Used to place
+            columns mapped by template header.
         data_row: Row number where data starts (1-indexed).
+        columns: Columns to publish. A list of source columns is written in
+            order from column A; a dict maps template header text (read from
+            header_row) to the source column written under it. None publishes
+            all columns in table order.
+        where: Optional SQL filter applied to the source table.
+        order_by: Optional SQL ORDER BY expression list.
+        chunk_size: Rows per batch streamed from DuckDB (publisher default if None).
     """
     src_table_name: str
     sheet_name: str
     header_row: int = 1
     data_row: int = 2
+    columns: list[str] | dict[str, str] | None = None
+    where: str | None = None
+    order_by: str | None = None
+    chunk_size: int | None = None
 
 
 @dataclass
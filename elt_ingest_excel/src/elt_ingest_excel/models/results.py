@@ -14,11 +14,19 @@ class WriteResult:
         rows_written: Number of rows written.
         row_count: Verified count from the table after writing.
         save_mode: The save mode used.
+        skipped: True if the load was skipped because its inputs were unchanged.
+        elapsed_seconds: Wall-clock time spent, if measured.
+        peak_rss_bytes: Peak process memory in bytes when it finished, if measured.
+        column_types: Column name to type name after a typed load, None otherwise.
     """
     table_name: str
     rows_written: int
     row_count: int
     save_mode: SaveMode
+    skipped: bool = False
+    elapsed_seconds: float | None = None
+    peak_rss_bytes: int | None = None
+    column_types: dict[str, str] | None = None
 
 
 @dataclass
@@ -29,10 +37,16 @@ class TransformResult:
         sql_file: Name of the SQL file executed.
         success: Whether execution succeeded.
         error: Error message if failed, None otherwise.
+        skipped: True if the file's tables were left as built by an earlier run.
+        elapsed_seconds: Wall-clock time spent, if measured.
+        peak_rss_bytes: Peak process memory in bytes when it finished, if measured.
     """
     sql_file: str
     success: bool
     error: str | None = None
+    skipped: bool = False
+    elapsed_seconds: float | None = None
+    peak_rss_bytes: int | None = None
 
 
 @dataclass
@@ -45,9 +59,15 @@ class PublishResult:
         rows_written: Number of rows written.
         success: Whether the publish succeeded.
         error: Error message if failed, None otherwise.
+        workbook_path: Target workbook the sheet was written to.
+        elapsed_seconds: Wall-clock time spent, if measured.
+        peak_rss_bytes: Peak process memory in bytes when it finished, if measured.
     """
     sheet_name: str
     table_name: str
     rows_written: int
     success: bool
     error: str | None = None
+    workbook_path: str | None = None
+    elapsed_seconds: float | None = None
+    peak_rss_bytes: int | None = None
@@ -0,0 +1,90 @@
+"""Configuration models for declarative validation rules."""
+
+from dataclasses import dataclass, field
+from enum import Enum
+
+
+class RuleKind(Enum):
+    """Supported validation rule kinds (JSON "type" values)."""
+    UNIQUE = "unique"
+    NOT_NULL = "notNull"
+    FOREIGN_KEY = "foreignKey"
+    ALLOWED_VALUES = "allowedValues"
+    REGEX = "regex"
+    REQUIRED_IF = "requiredIf"
+
+
+# Issue rule_type written for each kind unless a rule overrides it; these
+# match the labels used by the hand-written validate_*.sql files.
+DEFAULT_RULE_TYPES = {
+    RuleKind.UNIQUE: "DUPLICATE",
+    RuleKind.NOT_NULL: "MISSING",
+    RuleKind.FOREIGN_KEY: "CROSS_TAB",
+    RuleKind.ALLOWED_VALUES: "MATCH",
+    RuleKind.REGEX: "FORMAT",
+    RuleKind.REQUIRED_IF: "ENSURE_DATA",
+}
+
+
+@dataclass
+class ValidationRule:
+    """A single rule on one column of a table.
+
+    Attributes:
+        kind: What the rule checks.
+        column: Column the rule applies to (reported as the issue's col).
+        message: Issue message shown to the user.
+        rule_type: Issue rule_type label. Defaults to DEFAULT_RULE_TYPES[kind].
+        values: ALLOWED_VALUES: permitted values. REQUIRED_IF: values of
+            when_column that make column required (any non-blank value if None).
+        pattern: REGEX: regular expression non-blank values must match.
+        ref_table: FOREIGN_KEY: table the value must exist in.
+        ref_column: FOREIGN_KEY: column of ref_table (defaults to column).
+        when_column: REQUIRED_IF: column whose value makes column required.
+        ignore_blank: FOREIGN_KEY: do not report blank values.
+    """
+    kind: RuleKind
+    column: str
+    message: str
+    rule_type: str | None = None
+    values: list[str] | None = None
+    pattern: str | None = None
+    ref_table: str | None = None
+    ref_column: str | None = None
+    when_column: str | None = None
+    ignore_blank: bool = False
+
+    def __post_init__(self):
+        """Set rule_type and ref_column defaults if not provided."""
+        if self.rule_type is None:
+            self.rule_type = DEFAULT_RULE_TYPES[self.kind]
+        if self.kind == RuleKind.FOREIGN_KEY and self.ref_column is None:
+            self.ref_column = self.column
+
+
+@dataclass
+class TableRuleSet:
+    """Rules for one table, compiled into a single query.
+
+    Attributes:
+        table_name: DuckDB table to validate.
+        sheet_name: Sheet name reported on each issue.
+        key_column: Column identifying the row on each issue (e.g. supplier_id).
+        issues_table: Table issue rows are written to.
+        rules: Rules to evaluate.
+    """
+    table_name: str
+    sheet_name: str
+    key_column: str
+    issues_table: str = "validation_issues"
+    rules: list[ValidationRule] = field(default_factory=list)
+
+
+@dataclass
+class ValidationRuleConfig:
+    """Top-level configuration for rule-based validation.
+
+    Attributes:
+        tables: Rule sets, one per validated table.
+    """
+    tables: list[TableRuleSet] = field(default_factory=list)
@@ -0,0 +1,16 @@
+"""Direct OOXML package patching for Excel workbooks."""
+
+from .metadata_index import ListValidation, WorkbookMetadataIndex
+from .workbook import OoxmlWorkbook
+from .worksheet import WorksheetPatch, cell_text
+from .zip_surgery import copy_with_replacements, replace_members
+
+__all__ = [
+    "ListValidation",
+    "OoxmlWorkbook",
+    "WorkbookMetadataIndex",
+    "WorksheetPatch",
+    "cell_text",
+    "copy_with_replacements",
+    "replace_members",
+]
@@ -0,0 +1,306 @@
+"""Index of a workbook's list validations and defined names, cached by file hash."""
+
+import hashlib
+import json
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Union
+from xml.etree import ElementTree
+
+from openpyxl.utils import column_index_from_string, range_boundaries
+
+from .workbook import NS_MAIN, OoxmlWorkbook
+from .worksheet import cell_text
+
+NS_X14 = "http://schemas.microsoft.com/office/spreadsheetml/2009/9/main"
+NS_XM = "http://schemas.microsoft.com/office/excel/2006/main"
+
+# Bump when the index layout or resolution rules change; older files are rebuilt.
+INDEX_VERSION = 2
+
+DEFAULT_INDEX_DIR = Path.home() / ".cache" / "elt_ingest_excel" / "workbook_index"
+
+_AREA = re.compile(
+    r"^(?:'(?P<quoted>(?:[^']|'')+)'|(?P<plain>[^'!]+))!(?P<range>\$?[A-Z]+\$?\d+(?::\$?[A-Z]+\$?\d+)?)$"
+)
+_NAME = re.compile(r"^[A-Za-z_\\][\w.\\]*$")
+_CELL_REF = re.compile(r"^\$?([A-Za-z]+)\$?(\d+)$")
+
+# (sheet, min_col, min_row, max_col, max_row)
+Area = tuple[str, int, int, int, int]
+
+
+@dataclass
+class ListValidation:
+    """One list-type data validation of a worksheet.
+
+    Attributes:
+        sqref: Space-separated cell ranges the validation applies to.
+        formula: List source formula (quoted list, range or defined name).
+        values: Allowed values resolved from the formula, or None if it
+                cannot be resolved statically (e.g. INDIRECT).
+    """
+    sqref: str
+    formula: str
+    values: list[str] | None = None
+
+    def applies_to(self, column: int, row: int | None = None) -> bool:
+        """Whether the validation covers the cell (or, without row, any cell of the column)."""
+        for part in self.sqref.split():
+            min_col, min_row, max_col, max_row = range_boundaries(part.replace("$", ""))
+            if not (min_col or 1) <= column <= (max_col or min_col or column):
+                continue
+            if row is None or (min_row or 1) <= row <= (max_row or row):
+                return True
+        return False
+
+
+@dataclass
+class WorkbookMetadataIndex:
+    """List validations, defined names and their resolved values for one workbook file.
+
+    build() reads the package once: workbook.xml for sheets and defined
+    names, each worksheet's XML streamed once for its dataValidation and
+    x14:dataValidation elements, and then only the cells that list
+    formulas and defined names point at. load() keeps the result as
+    <sha256>.json in an index directory, so later lookups for the same
+    file content read the JSON instead of the workbook.
+
+    Example usage:
+        index = WorkbookMetadataIndex.load("~/data/supplier.xlsm")
+        index.list_values("Supplier Tax", cell="E12")
+        index.named_values["United_Kingdom_Tax_Type"]
+    """
+    file_hash: str
+    validations: dict[str, list[ListValidation]] = field(default_factory=dict)
+    defined_names: dict[str, str] = field(default_factory=dict)
+    named_values: dict[str, list[str]] = field(default_factory=dict)
+
+    @classmethod
+    def load(
+        cls,
+        path: Union[str, Path],
+        index_dir: Union[str, Path, None] = None,
+    ) -> "WorkbookMetadataIndex":
+        """Return the index for a workbook, building and saving it if not cached.
+
+        Args:
+            path: Workbook file (.xlsx or .xlsm).
+            index_dir: Directory of <sha256>.json index files. Defaults to
+                       ~/.cache/elt_ingest_excel/workbook_index.
+
+        Returns:
+            WorkbookMetadataIndex for the file's current content.
+        """
+        path = Path(path).expanduser()
+        index_dir = Path(index_dir).expanduser() if index_dir else DEFAULT_INDEX_DIR
+        file_hash = cls.hash_file(path)
+        index_path = index_dir / f"{file_hash}.json"
+        if index_path.exists():
+            try:
+                data = json.loads(index_path.read_text(encoding="utf-8"))
+                if data.get("version") == INDEX_VERSION:
+                    return cls.from_dict(data)
+            except (OSError, ValueError):
+                pass
+        index = cls.build(path, file_hash=file_hash)
+        index_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = index_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(index.to_dict(), ensure_ascii=False), encoding="utf-8")
+        temp_path.replace(index_path)
+        return index
+
+    @classmethod
+    def build(cls, path: Union[str, Path], file_hash: str | None = None) -> "WorkbookMetadataIndex":
+        """Index a workbook without using the cache."""
+        path = Path(path).expanduser()
+        with OoxmlWorkbook(path) as workbook:
+            index = cls(
+                file_hash=file_hash or cls.hash_file(path),
+                defined_names=workbook.defined_names(),
+            )
+            for sheet_name, part_name in workbook.sheet_parts.items():
+                found = _read_validations(workbook, part_name)
+                if found:
+                    index.validations[sheet_name] = found
+
+            # Resolve every list formula and defined name in one read of the cells they reference
+            formulas = [v.formula for found in index.validations.values() for v in found]
+            formulas += list(index.defined_names.values())
+            areas = {
+                area
+                for formula in formulas
+                for area in (index._formula_areas(formula) or [])
+            }
+            cells = _read_cells(workbook, areas)
+
+            for name, refers_to in index.defined_names.items():
+                values = index._resolve(refers_to, cells)
+                if values is not None:
+                    index.named_values[name] = values
+            for found in index.validations.values():
+                for validation in found:
+                    validation.values = index._resolve(validation.formula, cells)
+        return index
+
+    def list_values(
+        self,
+        sheet: str,
+        cell: str | None = None,
+        column: Union[str, int, None] = None,
+    ) -> list[str]:
+        """Allowed values for a cell, or for any validation on a column.
+
+        Args:
+            sheet: Worksheet name.
+            cell: Cell reference such as "E12".
+            column: Column letter or 1-based index, used when no cell is given.
+
+        Returns:
+            Sorted distinct values of every resolvable list validation that applies.
+        """
+        row = None
+        if cell:
+            match = _CELL_REF.match(cell.strip())
+            if not match:
+                return []
+            column_index, row = column_index_from_string(match.group(1).upper()), int(match.group(2))
+        elif column is not None:
+            column_index = int(column) if str(column).isdigit() else column_index_from_string(str(column).upper())
+        else:
+            return []
+        values: set[str] = set()
+        for validation in self.validations.get(sheet, []):
+            if validation.values and validation.applies_to(column_index, row):
+                values.update(validation.values)
+        return sorted(values)
+
+    def to_dict(self) -> dict:
+        return {"version": INDEX_VERSION, **asdict(self)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "WorkbookMetadataIndex":
+        return cls(
+            file_hash=data["file_hash"],
+            validations={
+                sheet: [ListValidation(**v) for v in found]
+                for sheet, found in data.get("validations", {}).items()
+            },
+            defined_names=data.get("defined_names", {}),
+            named_values=data.get("named_values", {}),
+        )
+
+    @staticmethod
+    def hash_file(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _formula_areas(self, formula: str, depth: int = 0) -> list[Area] | None:
+        """Cell areas a list formula reads; [] for a quoted list, None if unresolvable."""
+        text = formula.strip().lstrip("=")
+        if text.startswith('"') and text.endswith('"'):
+            return []
+        if _NAME.match(text) and text in self.defined_names:
+            return None if depth else self._formula_areas(self.defined_names[text], depth + 1)
+        areas: list[Area] = []
+        for part in text.split(","):
+            match = _AREA.match(part.strip())
+            if not match:
+                return None
+            sheet = match.group("quoted").replace("''", "'") if match.group("quoted") else match.group("plain")
+            min_col, min_row, max_col, max_row = range_boundaries(match.group("range").replace("$", ""))
+            areas.append((sheet, min_col, min_row, max_col, max_row))
+        return areas
+
+    def _resolve(self, formula: str, cells: dict[tuple[str, int, int], str]) -> list[str] | None:
+        text = formula.strip().lstrip("=")
+        if text.startswith('"') and text.endswith('"'):
+            return [x.strip() for x in text.strip('"').split(",") if x.strip()]
+        areas = self._formula_areas(text)
+        if areas is None:
+            return None
+        values: list[str] = []
+        for sheet, min_col, min_row, max_col, max_row in areas:
+            for row in range(min_row, max_row + 1):
+                for col in range(min_col, max_col + 1):
+                    value = cells.get((sheet, row, col))
+                    if value:
+                        values.append(value)
+        return values
+
+
+def _read_validations(workbook: OoxmlWorkbook, part_name: str) -> list[ListValidation]:
+    """Stream a worksheet once, keeping its list validations and discarding cell data."""
+    found: list[ListValidation] = []
+    main_dv, x14_dv = f"{{{NS_MAIN}}}dataValidation", f"{{{NS_X14}}}dataValidation"
+    row_tag = f"{{{NS_MAIN}}}row"
+    with workbook.open_part(part_name) as stream:
+        for _, elem in ElementTree.iterparse(stream, events=("end",)):
+            if elem.tag == row_tag:
+                elem.clear()
+            elif elem.tag == main_dv:
+                formula = elem.find(f"{{{NS_MAIN}}}formula1")
+                if elem.get("type") == "list" and formula is not None and formula.text:
+                    found.append(ListValidation(sqref=elem.get("sqref", ""), formula=formula.text))
+            elif elem.tag == x14_dv:
+                sqref = elem.find(f"{{{NS_XM}}}sqref")
+                formula = elem.find(f"{{{NS_X14}}}formula1/{{{NS_XM}}}f")
+                if elem.get("type") == "list" and formula is not None and formula.text:
+                    found.append(
+                        ListValidation(sqref=sqref.text if sqref is not None else "", formula=formula.text)
+                    )
+    return found
+
+
+def _read_cells(workbook: OoxmlWorkbook, areas: set[Area]) -> dict[tuple[str, int, int], str]:
+    """Read the stripped non-empty values of the cells inside the given areas."""
+    cells: dict[tuple[str, int, int], str] = {}
+    by_sheet: dict[str, list[Area]] = {}
+    for area in areas:
+        if area[0] in workbook.sheet_parts:
+            by_sheet.setdefault(area[0], []).append(area)
+    cell_tag, row_tag = f"{{{NS_MAIN}}}c", f"{{{NS_MAIN}}}row"
+    for sheet, sheet_areas in by_sheet.items():
+        last_row = max(area[4] for area in sheet_areas)
+        with workbook.open_part(workbook.sheet_parts[sheet]) as stream:
+            for _, elem in ElementTree.iterparse(stream, events=("end",)):
+                if elem.tag == cell_tag:
+                    match = _CELL_REF.match(elem.get("r", ""))
+                    if not match:
+                        continue
+                    col, row = column_index_from_string(match.group(1)), int(match.group(2))
+                    if any(a[1] <= col <= a[3] and a[2] <= row <= a[4] for a in sheet_areas):
+                        value = _element_value(elem, workbook)
+                        if value:
+                            cells[(sheet, row, col)] = value
+                elif elem.tag == row_tag:
+                    row_number = int(elem.get("r") or 0)
+                    elem.clear()
+                    if row_number >= last_row:
+                        break
+    return cells
+
+
+def _element_value(elem: ElementTree.Element, workbook: OoxmlWorkbook) -> str:
+    """Stripped cell text, rendered by cell_text() like the cells it is compared with."""
+    cell_type = elem.get("t")
+    value: Union[str, bool, float]
+    if cell_type == "inlineStr":
+        value = "".join(t.text or "" for t in elem.iter(f"{{{NS_MAIN}}}t"))
+    else:
+        raw = elem.findtext(f"{{{NS_MAIN}}}v")
+        if raw is None:
+            return ""
+        if cell_type == "s":
+            value = workbook.shared_strings()[int(raw)]
+        elif cell_type == "b":
+            value = raw == "1"
+        elif cell_type in ("str", "e"):
+            value = raw
+        else:
+            value = float(raw)
+    return (cell_text(value) or "").strip()
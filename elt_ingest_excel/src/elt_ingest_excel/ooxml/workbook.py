@@ -0,0 +1,223 @@
+"""Patch worksheet parts of an .xlsx/.xlsm package without loading the workbook."""
+
+import html
+import os
+import posixpath
+import re
+import zipfile
+from pathlib import Path
+from typing import IO, Union
+from xml.etree import ElementTree
+
+from .worksheet import WorksheetPatch
+from .zip_surgery import MemberContent, copy_with_replacements
+
+NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+NS_DOC_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+REL_OFFICE_DOCUMENT = f"{NS_DOC_REL}/officeDocument"
+REL_STYLES = f"{NS_DOC_REL}/styles"
+REL_SHARED_STRINGS = f"{NS_DOC_REL}/sharedStrings"
+REL_CALC_CHAIN = f"{NS_DOC_REL}/calcChain"
+CONTENT_TYPES_PART = "[Content_Types].xml"
+
+_CELL_XFS = re.compile(
+    r"(?P<open><(?P<prefix>(?:\w+:)?)cellXfs\b[^>]*>)(?P<body>.*?)(?P<close></(?P=prefix)cellXfs>)", re.S
+)
+_COUNT = re.compile(r'\bcount="\d+"')
+_XF = re.compile(r"<(?:\w+:)?xf\b")
+_RELATIONSHIP = re.compile(r"<(?:\w+:)?Relationship\b[^>]*?(?:/>|>\s*</(?:\w+:)?Relationship>)")
+_OVERRIDE = re.compile(r"<(?:\w+:)?Override\b[^>]*?(?:/>|>\s*</(?:\w+:)?Override>)")
+_SHARED_STRING = re.compile(r"<(?:\w+:)?si(?:\s[^>]*)?(?:/>|>(.*?)</(?:\w+:)?si>)", re.S)
+# Text runs of a shared string, excluding phonetic (rPh) runs
+_RUN_TEXT = re.compile(
+    r"<(?:\w+:)?rPh\b.*?</(?:\w+:)?rPh>|<(?:\w+:)?t(?:\s[^>]*)?(?<!/)>(.*?)</(?:\w+:)?t>", re.S
+)
+
+
+def _rels_part(part_name: str) -> str:
+    folder, name = posixpath.split(part_name)
+    return posixpath.join(folder, "_rels", f"{name}.rels")
+
+
+def _resolve_target(source_part: str, target: str) -> str:
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source_part), target))
+
+
+class OoxmlWorkbook:
+    """An Excel package opened for direct worksheet XML patching.
+
+    Only the workbook part, its relationships and (when a date style is
+    needed) the styles part are parsed. Worksheets requested through
+    worksheet() are rewritten on save(); every other zip member (VBA
+    project, drawings, shared strings, other sheets) is copied unchanged.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._zip = zipfile.ZipFile(self.path)
+        self._members = set(self._zip.namelist())
+        self._workbook_part = self._office_document_part()
+        self._relationships = self._read_relationships(self._workbook_part)
+        self.sheet_parts = self._read_sheet_parts()
+        self._patches: dict[str, WorksheetPatch] = {}
+        self._styles_xml: str | None = None
+        self._number_format_styles: dict[int, int] = {}
+        self._shared_strings: list[str] | None = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def sheetnames(self) -> list[str]:
+        return list(self.sheet_parts)
+
+    def worksheet(self, sheet_name: str) -> WorksheetPatch:
+        """Return the patch for a worksheet, reading its template XML once."""
+        if sheet_name not in self._patches:
+            part_name = self.sheet_parts[sheet_name]
+            self._patches[sheet_name] = WorksheetPatch(self, sheet_name, part_name, self._zip.read(part_name))
+        return self._patches[sheet_name]
+
+    def open_part(self, part_name: str) -> IO[bytes]:
+        """Open a package part for streaming (e.g. with ElementTree.iterparse)."""
+        return self._zip.open(part_name)
+
+    def defined_names(self) -> dict[str, str]:
+        """Return workbook-scoped defined names -> refers-to formula (without "=")."""
+        root = ElementTree.fromstring(self._zip.read(self._workbook_part))
+        return {
+            name.get("name"): (name.text or "").lstrip("=")
+            for name in root.iter(f"{{{NS_MAIN}}}definedName")
+            if name.get("localSheetId") is None
+        }
+
+    def shared_strings(self) -> list[str]:
+        """Return the shared string table, read on first use."""
+        if self._shared_strings is None:
+            part_name = next(
+                (target for rel_type, target in self._relationships.values() if rel_type == REL_SHARED_STRINGS),
+                None,
+            )
+            xml = self._zip.read(part_name).decode("utf-8") if part_name in self._members else ""
+            self._shared_strings = [
+                html.unescape("".join(text for text in _RUN_TEXT.findall(item) if text))
+                for item in _SHARED_STRING.findall(xml)
+            ]
+        return self._shared_strings
+
+    def number_format_style(self, number_format_id: int) -> int:
+        """Return a cellXfs index applying a built-in number format, adding it if needed."""
+        if number_format_id not in self._number_format_styles:
+            if self._styles_xml is None:
+                self._styles_xml = self._zip.read(self._styles_part()).decode("utf-8")
+            match = _CELL_XFS.search(self._styles_xml)
+            if match is None:
+                raise ValueError("Workbook styles part has no cellXfs element")
+            index = len(_XF.findall(match.group("body")))
+            prefix = match.group("prefix")
+            xf = (
+                f'<{prefix}xf numFmtId="{number_format_id}" fontId="0" fillId="0" '
+                f'borderId="0" xfId="0" applyNumberFormat="1"/>'
+            )
+            open_tag = _COUNT.sub(f'count="{index + 1}"', match.group("open"))
+            self._styles_xml = (
+                self._styles_xml[:match.start()]
+                + open_tag + match.group("body") + xf + match.group("close")
+                + self._styles_xml[match.end():]
+            )
+            self._number_format_styles[number_format_id] = index
+        return self._number_format_styles[number_format_id]
+
+    def save(self, path: Union[str, Path, None] = None) -> None:
+        """Write the patched package to path (default: in place) and close the source."""
+        target = Path(path) if path else self.path
+        # Untouched parts (images, VBA project, other sheets) are copied without recompression
+        replacements: dict[str, MemberContent] = {
+            patch.part_name: patch.write_to for patch in self._patches.values() if patch.modified
+        }
+        if self._styles_xml is not None:
+            replacements[self._styles_part()] = self._styles_xml.encode("utf-8")
+        if any(patch.formulas_replaced for patch in self._patches.values() if patch.modified):
+            replacements.update(self._calc_chain_removal())
+
+        temp_path = target.with_name(f".{target.name}.tmp")
+        try:
+            copy_with_replacements(self.path, temp_path, replacements)
+            self.close()
+            os.replace(temp_path, target)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        for patch in self._patches.values():
+            patch.close()
+        self._zip.close()
+
+    def _calc_chain_removal(self) -> dict[str, MemberContent]:
+        """Replacements dropping calcChain.xml, its relationship and its content type.
+
+        The calculation chain lists formula cells; once written values replace
+        some of them Excel would report the file as needing repair, and it
+        rebuilds a missing chain on the next calculation.
+        """
+        part_name = next(
+            (target for rel_type, target in self._relationships.values() if rel_type == REL_CALC_CHAIN),
+            None,
+        )
+        if part_name is None:
+            return {}
+        rels_part = _rels_part(self._workbook_part)
+        rels_xml = self._zip.read(rels_part).decode("utf-8")
+        rels_xml = _RELATIONSHIP.sub(lambda m: "" if f'"{REL_CALC_CHAIN}"' in m.group(0) else m.group(0), rels_xml)
+        replacements: dict[str, MemberContent] = {
+            rels_part: rels_xml.encode("utf-8"),
+            part_name: None,
+        }
+        if CONTENT_TYPES_PART in self._members:
+            types_xml = self._zip.read(CONTENT_TYPES_PART).decode("utf-8")
+            types_xml = _OVERRIDE.sub(
+                lambda m: "" if f'PartName="/{part_name}"' in m.group(0) else m.group(0), types_xml
+            )
+            replacements[CONTENT_TYPES_PART] = types_xml.encode("utf-8")
+        return replacements
+
+    def _office_document_part(self) -> str:
+        for rel_type, target in self._read_relationships("").values():
+            if rel_type == REL_OFFICE_DOCUMENT:
+                return target
+        return "xl/workbook.xml"
+
+    def _read_relationships(self, part_name: str) -> dict[str, tuple[str, str]]:
+        """Return rId -> (type, resolved part name) for a part ("" for the package)."""
+        rels_part = _rels_part(part_name) if part_name else "_rels/.rels"
+        if rels_part not in self._members:
+            return {}
+        root = ElementTree.fromstring(self._zip.read(rels_part))
+        return {
+            rel.get("Id"): (rel.get("Type"), _resolve_target(part_name, rel.get("Target", "")))
+            for rel in root.iter(f"{{{NS_PKG_REL}}}Relationship")
+            if rel.get("TargetMode") != "External"
+        }
+
+    def _read_sheet_parts(self) -> dict[str, str]:
+        root = ElementTree.fromstring(self._zip.read(self._workbook_part))
+        parts: dict[str, str] = {}
+        for sheet in root.iter(f"{{{NS_MAIN}}}sheet"):
+            rel = self._relationships.get(sheet.get(f"{{{NS_DOC_REL}}}id"))
+            # Chartsheets and dialog sheets have no sheetData to patch
+            if rel and rel[1] in self._members and rel[0].endswith("/worksheet"):
+                parts[sheet.get("name")] = rel[1]
+        return parts
+
+    def _styles_part(self) -> str:
+        for rel_type, target in self._relationships.values():
+            if rel_type == REL_STYLES:
+                return target
+        raise ValueError("Workbook has no styles part")
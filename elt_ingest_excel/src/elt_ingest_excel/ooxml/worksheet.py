@@ -0,0 +1,274 @@
+"""Streaming rewrite of a worksheet part's sheetData."""
+
+import datetime
+import html
+import math
+import re
+import shutil
+import tempfile
+from decimal import Decimal
+from typing import IO, TYPE_CHECKING, Any, Callable
+
+from openpyxl.utils.cell import column_index_from_string, get_column_letter, range_boundaries
+from openpyxl.utils.datetime import to_excel
+
+if TYPE_CHECKING:
+    from .workbook import OoxmlWorkbook
+
+# Built-in number formats applied to dates/times written without a template style
+DATE_FORMAT_ID = 14
+TIME_FORMAT_ID = 21
+DATETIME_FORMAT_ID = 22
+
+_SHEET_DATA = re.compile(
+    r"<(?P<prefix>(?:\w+:)?)sheetData\b[^>]*?(?:/>|>(?P<body>.*?)</(?P=prefix)sheetData>)", re.S
+)
+_ROW = re.compile(r"<(?:\w+:)?row\b(?P<attrs>[^>]*?)(?:/>|>(?P<body>.*?)</(?:\w+:)?row>)", re.S)
+_CELL = re.compile(r"<(?:\w+:)?c\b(?P<attrs>[^>]*?)(?:/>|>.*?</(?:\w+:)?c>)", re.S)
+_DIMENSION = re.compile(r'(<(?:\w+:)?dimension\b[^>]*?\bref=")([^"]*)(")')
+_ROW_NUMBER = re.compile(r'\br="(\d+)"')
+_CELL_REF = re.compile(r'\br="([A-Z]+)\d+"')
+_STYLE = re.compile(r'\bs="(\d+)"')
+_SPANS = re.compile(r'\s+spans="[^"]*"')
+_CELL_TYPE = re.compile(r'\bt="(\w+)"')
+_FORMULA = re.compile(r"<(?:\w+:)?f[\s/>]")
+_VALUE = re.compile(r"<(?:\w+:)?v>(.*?)</(?:\w+:)?v>", re.S)
+_TEXT = re.compile(r"<(?:\w+:)?t(?:\s[^>]*)?(?<!/)>(.*?)</(?:\w+:)?t>", re.S)
+# Characters XML 1.0 does not allow (openpyxl rejects them too)
+_ILLEGAL_CHARACTERS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def cell_text(value: Any) -> str | None:
+    """Text of a cell value as Excel shows it, for comparing cells (None for blanks).
+
+    Booleans are TRUE/FALSE and whole floats lose their ".0", so values read
+    from worksheet XML and through openpyxl give the same text.
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value if value.strip() else None
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, datetime.datetime):
+        if value.time() == datetime.time():
+            return value.date().isoformat()
+        return value.isoformat(sep=" ")
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return str(value)
+
+
+def _escape(text: str) -> str:
+    text = _ILLEGAL_CHARACTERS.sub("", text)
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+class _TemplateRow:
+    """A row of the template's sheetData, kept as raw XML."""
+
+    def __init__(self, number: int, attrs: str, raw: str, body: str | None):
+        self.number = number
+        self.attrs = attrs
+        self.raw = raw
+        self.body = body or ""
+
+    def cells(self) -> dict[int, tuple[str | None, str]]:
+        """Return column -> (style index, raw cell XML)."""
+        cells: dict[int, tuple[str | None, str]] = {}
+        column = 0
+        for match in _CELL.finditer(self.body):
+            ref = _CELL_REF.search(match.group("attrs"))
+            column = column_index_from_string(ref.group(1)) if ref else column + 1
+            style = _STYLE.search(match.group("attrs"))
+            cells[column] = (style.group(1) if style else None, match.group(0))
+        return cells
+
+    def values(self, shared_strings: Callable[[], list[str]]) -> list[Any]:
+        """Return the row's cell values from column A, with gaps as None."""
+        values: list[Any] = []
+        for column, (_, raw) in sorted(self.cells().items()):
+            values.extend([None] * (column - 1 - len(values)))
+            values.append(_cell_value(raw, shared_strings))
+        return values
+
+
+class WorksheetPatch:
+    """Rows to write into one worksheet part of an OoxmlWorkbook.
+
+    The template part is split around its sheetData element. Rows above
+    the first written row are kept verbatim; template rows inside the
+    written range donate their row attributes and cell styles and keep
+    cells to the right of the data; rows below the data are kept
+    verbatim. Written rows are serialised as they arrive into a spooled
+    temporary file, with strings stored inline so sharedStrings.xml is
+    left untouched.
+    """
+
+    SPOOL_MAX_BYTES = 16 * 1024 * 1024
+
+    def __init__(self, workbook: "OoxmlWorkbook", sheet_name: str, part_name: str, xml: bytes):
+        self.workbook = workbook
+        self.sheet_name = sheet_name
+        self.part_name = part_name
+        self.rows_written = 0
+        # Set when a written value replaced a template formula cell
+        self.formulas_replaced = False
+
+        text = xml.decode("utf-8")
+        match = _SHEET_DATA.search(text)
+        if match is None:
+            raise ValueError(f"Worksheet part {part_name} has no sheetData element")
+        self._prefix = match.group("prefix")
+        self._head = text[:match.start()]
+        self._tail = text[match.end():]
+        self._sheet_data_open = re.match(r"<[^>]*?(?=/?>)", match.group(0)).group(0) + ">"
+        self._template_rows: list[_TemplateRow] = []
+        number = 0
+        for row in _ROW.finditer(match.group("body") or ""):
+            found = _ROW_NUMBER.search(row.group("attrs"))
+            number = int(found.group(1)) if found else number + 1
+            self._template_rows.append(_TemplateRow(number, row.group("attrs"), row.group(0), row.group("body")))
+
+        self._before: list[_TemplateRow] | None = None
+        self._overlay: dict[int, _TemplateRow] = {}
+        self._next_row: int | None = None
+        self._max_column = 0
+        self._spool: IO[bytes] | None = None
+
+    @property
+    def modified(self) -> bool:
+        return self._spool is not None
+
+    @property
+    def last_row(self) -> int:
+        """Number of the template's last row (0 if sheetData is empty)."""
+        return max((row.number for row in self._template_rows), default=0)
+
+    def row_values(self, number: int) -> list[Any]:
+        """Return the template's cell values for a row (empty if the row is absent)."""
+        for row in self._template_rows:
+            if row.number == number:
+                return row.values(self.workbook.shared_strings)
+        return []
+
+    def write_rows(self, rows: list[tuple], start_row: int) -> None:
+        """Serialise rows starting at start_row (1-indexed).
+
+        Successive calls must continue at or below the last written row.
+        """
+        if not rows:
+            return
+        if self._spool is None:
+            self._spool = tempfile.SpooledTemporaryFile(max_size=self.SPOOL_MAX_BYTES)
+            self._before = [row for row in self._template_rows if row.number < start_row]
+            self._overlay = {row.number: row for row in self._template_rows if row.number >= start_row}
+        elif start_row < self._next_row:
+            raise ValueError(
+                f"Rows for sheet '{self.sheet_name}' must be written in ascending order "
+                f"(row {start_row} after row {self._next_row - 1})"
+            )
+
+        prefix = self._prefix
+        chunks: list[str] = []
+        for number, values in enumerate(rows, start_row):
+            template = self._overlay.pop(number, None)
+            template_cells = template.cells() if template else {}
+            if not self.formulas_replaced:
+                self.formulas_replaced = any(
+                    _FORMULA.search(raw) for column, (_, raw) in template_cells.items() if column <= len(values)
+                )
+            row_attrs = _SPANS.sub("", template.attrs) if template else f' r="{number}"'
+            cells: list[str] = []
+            for column, value in enumerate(values, 1):
+                style = template_cells[column][0] if column in template_cells else None
+                cell = self._cell_xml(f"{get_column_letter(column)}{number}", value, style)
+                if cell:
+                    cells.append(cell)
+            # Template cells beyond the data's columns are kept as they are
+            cells.extend(raw for column, (_, raw) in sorted(template_cells.items()) if column > len(values))
+            chunks.append(f"<{prefix}row{row_attrs}>{''.join(cells)}</{prefix}row>")
+            self._max_column = max(self._max_column, len(values))
+        self._spool.write("".join(chunks).encode("utf-8"))
+        self._next_row = start_row + len(rows)
+        self.rows_written += len(rows)
+
+    def write_to(self, target: IO[bytes]) -> None:
+        """Write the patched worksheet XML to a binary stream."""
+        before = self._before or []
+        after = sorted(self._overlay.values(), key=lambda row: row.number)
+        target.write(self._patch_dimension(self._head).encode("utf-8"))
+        target.write(self._sheet_data_open.encode("utf-8"))
+        target.write("".join(row.raw for row in before).encode("utf-8"))
+        self._spool.seek(0)
+        shutil.copyfileobj(self._spool, target)
+        target.write("".join(row.raw for row in after).encode("utf-8"))
+        target.write(f"</{self._prefix}sheetData>".encode("utf-8"))
+        target.write(self._tail.encode("utf-8"))
+
+    def close(self) -> None:
+        if self._spool is not None:
+            self._spool.close()
+
+    def _patch_dimension(self, head: str) -> str:
+        match = _DIMENSION.search(head)
+        if match is None:
+            return head
+        try:
+            min_col, min_row, max_col, max_row = range_boundaries(match.group(2))
+        except (TypeError, ValueError):
+            min_col = min_row = max_col = max_row = None
+        last_row = max(max_row or 1, self._next_row - 1)
+        last_col = max(max_col or 1, self._max_column)
+        ref = f"{get_column_letter(min_col or 1)}{min_row or 1}:{get_column_letter(last_col)}{last_row}"
+        return head[:match.start()] + match.group(1) + ref + match.group(3) + head[match.end():]
+
+    def _cell_xml(self, ref: str, value: Any, style: str | None) -> str | None:
+        style_attr = f' s="{style}"' if style is not None else ""
+        prefix = self._prefix
+        if value is None:
+            return f'<{prefix}c r="{ref}"{style_attr}/>' if style_attr else None
+        if isinstance(value, bool):
+            return f'<{prefix}c r="{ref}"{style_attr} t="b"><{prefix}v>{int(value)}</{prefix}v></{prefix}c>'
+        if isinstance(value, (int, Decimal)) or (isinstance(value, float) and math.isfinite(value)):
+            return f'<{prefix}c r="{ref}"{style_attr}><{prefix}v>{value}</{prefix}v></{prefix}c>'
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+            if getattr(value, "tzinfo", None) is not None:
+                raise TypeError("Excel does not support timezones in datetimes")
+            if style is None:
+                style_attr = f' s="{self.workbook.number_format_style(_format_id(value))}"'
+            return f'<{prefix}c r="{ref}"{style_attr}><{prefix}v>{to_excel(value)}</{prefix}v></{prefix}c>'
+        text = _escape(str(value))
+        return (
+            f'<{prefix}c r="{ref}"{style_attr} t="inlineStr"><{prefix}is>'
+            f'<{prefix}t xml:space="preserve">{text}</{prefix}t></{prefix}is></{prefix}c>'
+        )
+
+
+def _cell_value(raw: str, shared_strings: Callable[[], list[str]]) -> Any:
+    cell_type = _CELL_TYPE.search(raw.split(">", 1)[0])
+    cell_type = cell_type.group(1) if cell_type else "n"
+    if cell_type == "inlineStr":
+        return html.unescape("".join(_TEXT.findall(raw)))
+    value = _VALUE.search(raw)
+    if value is None:
+        return None
+    text = html.unescape(value.group(1))
+    if cell_type == "s":
+        return shared_strings()[int(text)]
+    if cell_type in ("str", "e"):
+        return text
+    if cell_type == "b":
+        return text == "1"
+    number = float(text)
+    return int(number) if number.is_integer() else number
+
+
+def _format_id(value: datetime.date | datetime.time) -> int:
+    if isinstance(value, datetime.datetime):
+        return DATETIME_FORMAT_ID
+    if isinstance(value, datetime.date):
+        return DATE_FORMAT_ID
+    return TIME_FORMAT_ID
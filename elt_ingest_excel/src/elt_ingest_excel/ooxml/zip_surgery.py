@@ -0,0 +1,277 @@
+"""Replace members of a zip package without recompressing the others.
+
+zipfile can only copy a member by inflating it and deflating it again.
+copy_with_replacements() instead copies each unchanged member's local
+header fields and compressed bytes straight from the source file, so a
+template's images, VBA project and untouched sheets cost one buffered
+copy each. Only the replaced members are compressed.
+"""
+
+import os
+import shutil
+import struct
+import time
+import zipfile
+import zlib
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import IO, Union
+
+# A replacement is either the member's bytes or a function that writes them to a stream;
+# None removes the member
+MemberContent = Union[bytes, Callable[[IO[bytes]], None], None]
+
+_LOCAL_HEADER = struct.Struct("<4s5H3I2H")
+_CENTRAL_HEADER = struct.Struct("<4s6H3I5H2I")
+_END_RECORD = struct.Struct("<4s4H2IH")
+_LOCAL_SIGNATURE = b"PK\x03\x04"
+_CENTRAL_SIGNATURE = b"PK\x01\x02"
+_END_SIGNATURE = b"PK\x05\x06"
+
+_FLAG_DATA_DESCRIPTOR = 0x08
+_FLAG_UTF8 = 0x800
+_ZIP64_LIMIT = 0xFFFFFFFF
+_COPY_BUFFER = 1024 * 1024
+
+
+def copy_with_replacements(
+    src_path: Union[str, Path],
+    dst_path: Union[str, Path],
+    replacements: Mapping[str, MemberContent],
+    compresslevel: int = 6,
+) -> None:
+    """Write src_path to dst_path with some members replaced.
+
+    Members keep their order, names, timestamps and attributes. Unchanged
+    members are copied as raw compressed bytes; replaced members are
+    deflated. Names in replacements that are not in the source are added
+    at the end; members replaced by None are left out.
+
+    Args:
+        src_path: Source zip package.
+        dst_path: Output path; must differ from src_path (see replace_members).
+        replacements: Member name -> new bytes, a callable writing them to a stream,
+                      or None to remove the member.
+        compresslevel: zlib level for replaced members.
+
+    Raises:
+        ValueError: If either package would need ZIP64 (members or offsets over 4 GiB).
+    """
+    src_path, dst_path = Path(src_path), Path(dst_path)
+    if src_path.resolve() == dst_path.resolve():
+        raise ValueError("copy_with_replacements cannot write over its source; use replace_members")
+
+    with zipfile.ZipFile(src_path) as source, open(src_path, "rb") as raw, open(dst_path, "wb") as out:
+        central: list[bytes] = []
+        for info in source.infolist():
+            _check_size(max(info.header_offset + info.compress_size, info.file_size))
+            offset = out.tell()
+            if info.filename in replacements and replacements[info.filename] is None:
+                continue
+            if info.filename in replacements:
+                name = _raw_name(raw, info)
+                central.append(_write_replaced(out, info, name, replacements[info.filename], compresslevel, offset))
+            else:
+                central.append(_copy_raw(raw, out, info, offset))
+
+        for name in replacements:
+            if name not in source.NameToInfo and replacements[name] is not None:
+                info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+                info.external_attr = 0o600 << 16
+                encoded = _encode_name(name)
+                if encoded != name.encode("ascii", "replace"):
+                    info.flag_bits |= _FLAG_UTF8
+                central.append(_write_replaced(out, info, encoded, replacements[name], compresslevel, out.tell()))
+
+        directory_offset = out.tell()
+        for entry in central:
+            out.write(entry)
+        directory_size = out.tell() - directory_offset
+        _check_size(out.tell())
+        if len(central) > 0xFFFF:
+            raise ValueError("Packages with more than 65535 members need ZIP64, which is not supported")
+        comment = source.comment
+        out.write(
+            _END_RECORD.pack(
+                _END_SIGNATURE, 0, 0, len(central), len(central), directory_size, directory_offset, len(comment)
+            )
+        )
+        out.write(comment)
+
+
+def replace_members(
+    path: Union[str, Path],
+    replacements: Mapping[str, MemberContent],
+    compresslevel: int = 6,
+) -> None:
+    """Replace members of a zip package in place (via a temporary file and rename).
+
+    Args:
+        path: Zip package to update.
+        replacements: Member name -> new bytes, a callable writing them to a stream,
+                      or None to remove the member.
+        compresslevel: zlib level for replaced members.
+    """
+    path = Path(path)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        copy_with_replacements(path, temp_path, replacements, compresslevel)
+        shutil.copystat(path, temp_path)
+        os.replace(temp_path, path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def _copy_raw(raw: IO[bytes], out: IO[bytes], info: zipfile.ZipInfo, offset: int) -> bytes:
+    """Copy one member's local header and compressed bytes; return its central entry."""
+    raw.seek(info.header_offset)
+    header = _LOCAL_HEADER.unpack(raw.read(_LOCAL_HEADER.size))
+    if header[0] != _LOCAL_SIGNATURE:
+        raise zipfile.BadZipFile(f"Bad local file header for {info.filename}")
+    name = raw.read(header[9])
+    raw.seek(header[10], os.SEEK_CUR)
+
+    # Sizes and CRC go in the local header, so a data descriptor is not copied
+    flags = info.flag_bits & ~_FLAG_DATA_DESCRIPTOR
+    dos_time, dos_date = _dos_datetime(info)
+    out.write(
+        _LOCAL_HEADER.pack(
+            _LOCAL_SIGNATURE, info.extract_version, flags, info.compress_type, dos_time, dos_date,
+            info.CRC, info.compress_size, info.file_size, len(name), 0,
+        )
+    )
+    out.write(name)
+    remaining = info.compress_size
+    while remaining:
+        block = raw.read(min(_COPY_BUFFER, remaining))
+        if not block:
+            raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+        out.write(block)
+        remaining -= len(block)
+    return _central_entry(info, name, flags, info.compress_type, info.CRC, info.compress_size, info.file_size, offset)
+
+
+def _write_replaced(
+    out: IO[bytes],
+    info: zipfile.ZipInfo,
+    name: bytes,
+    content: MemberContent,
+    compresslevel: int,
+    offset: int,
+) -> bytes:
+    """Deflate a replacement member; return its central entry."""
+    flags = info.flag_bits & _FLAG_UTF8
+    dos_time, dos_date = _dos_datetime(info)
+    header_offset = out.tell()
+    # CRC and sizes are filled in once the data is written
+    out.write(
+        _LOCAL_HEADER.pack(
+            _LOCAL_SIGNATURE, 20, flags, zipfile.ZIP_DEFLATED, dos_time, dos_date, 0, 0, 0, len(name), 0
+        )
+    )
+    out.write(name)
+
+    writer = _DeflateWriter(out, compresslevel)
+    if callable(content):
+        content(writer)
+    else:
+        writer.write(content)
+    writer.finish()
+    _check_size(max(writer.size, writer.compressed_size, out.tell()))
+
+    end = out.tell()
+    out.seek(header_offset + 14)
+    out.write(struct.pack("<3I", writer.crc, writer.compressed_size, writer.size))
+    out.seek(end)
+    info.extract_version = 20
+    return _central_entry(
+        info, name, flags, zipfile.ZIP_DEFLATED, writer.crc, writer.compressed_size, writer.size, offset
+    )
+
+
+class _DeflateWriter:
+    """Binary stream that deflates what is written to it into the package."""
+
+    def __init__(self, out: IO[bytes], compresslevel: int):
+        self._out = out
+        self._compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+        self.crc = 0
+        self.size = 0
+        self.compressed_size = 0
+
+    def write(self, data: bytes) -> int:
+        self.crc = zlib.crc32(data, self.crc)
+        self.size += len(data)
+        self._emit(self._compressor.compress(data))
+        return len(data)
+
+    def finish(self) -> None:
+        self._emit(self._compressor.flush())
+
+    def _emit(self, block: bytes) -> None:
+        if block:
+            self._out.write(block)
+            self.compressed_size += len(block)
+
+
+def _central_entry(
+    info: zipfile.ZipInfo,
+    name: bytes,
+    flags: int,
+    compress_type: int,
+    crc: int,
+    compress_size: int,
+    file_size: int,
+    offset: int,
+) -> bytes:
+    _check_size(offset)
+    dos_time, dos_date = _dos_datetime(info)
+    extra, comment = info.extra, info.comment
+    return (
+        _CENTRAL_HEADER.pack(
+            _CENTRAL_SIGNATURE,
+            (info.create_system << 8) | info.create_version,
+            info.extract_version,
+            flags,
+            compress_type,
+            dos_time,
+            dos_date,
+            crc,
+            compress_size,
+            file_size,
+            len(name),
+            len(extra),
+            len(comment),
+            0,
+            info.internal_attr,
+            info.external_attr,
+            offset,
+        )
+        + name
+        + extra
+        + comment
+    )
+
+
+def _raw_name(raw: IO[bytes], info: zipfile.ZipInfo) -> bytes:
+    """Read a member's name bytes from its local header, as stored."""
+    raw.seek(info.header_offset)
+    header = _LOCAL_HEADER.unpack(raw.read(_LOCAL_HEADER.size))
+    return raw.read(header[9])
+
+
+def _encode_name(name: str) -> bytes:
+    try:
+        return name.encode("ascii")
+    except UnicodeEncodeError:
+        return name.encode("utf-8")
+
+
+def _dos_datetime(info: zipfile.ZipInfo) -> tuple[int, int]:
+    year, month, day, hour, minute, second = info.date_time
+    return (hour << 11) | (minute << 5) | (second // 2), ((year - 1980) << 9) | (month << 5) | day
+
+
+def _check_size(value: int) -> None:
+    if value >= _ZIP64_LIMIT:
+        raise ValueError("Packages over 4 GiB need ZIP64, which is not supported")
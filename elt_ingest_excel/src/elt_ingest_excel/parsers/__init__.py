@@ -3,10 +3,12 @@
 from .base_parser import BaseConfigParser
 from .ingest_config_parser import IngestConfigParser, JsonConfigParser
 from .publish_config_parser import PublishConfigParser
+from .validation_rules_parser import ValidationRulesParser
 
 __all__ = [
     "BaseConfigParser",
     "IngestConfigParser",
     "JsonConfigParser",  # Backward compatibility alias
     "PublishConfigParser",
+    "ValidationRulesParser",
 ]
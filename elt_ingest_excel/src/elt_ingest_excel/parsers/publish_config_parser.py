@@ -22,7 +22,11 @@ class PublishConfigParser(BaseConfigParser):
                     "srcTableName": "table_name",
                     "sheetName": "Sheet Name",
                     "headerRow": "3",
-                    "dataRow": "4"
+                    "dataRow": "4",
+                    "columns": {"Supplier ID": "supplier_id"},
+                    "where": "is_active",
+                    "orderBy": "supplier_id",
+                    "chunkSize": 5000
                 }
             ]
         }
@@ -114,11 +118,36 @@ class PublishConfigParser(BaseConfigParser):
             data_row_raw = sheet_data.get("dataRow", 2)
             data_row = int(data_row_raw) if data_row_raw is not None else 2
 
+            # Parse columns: list of source columns, or {template header: source column}
+            columns = sheet_data.get("columns")
+            if columns is not None:
+                valid = (
+                    isinstance(columns, list) and all(isinstance(c, str) for c in columns)
+                ) or (
+                    isinstance(columns, dict)
+                    and all(isinstance(k, str) and isinstance(v, str) for k, v in columns.items())
+                )
+                if not valid or not columns:
+                    raise ValueError(
+                        f"Invalid columns for sheet '{sheet_data['sheetName']}': expected a non-empty "
+                        "list of column names or an object mapping template headers to column names"
+                    )
+
+            # Parse chunkSize (handle string or int)
+            chunk_size_raw = sheet_data.get("chunkSize")
+            chunk_size = int(chunk_size_raw) if chunk_size_raw is not None else None
+            if chunk_size is not None and chunk_size < 1:
+                raise ValueError(f"chunkSize must be positive, got {chunk_size}")
+
             sheet = PublishSheetConfig(
                 src_table_name=sheet_data["srcTableName"],
                 sheet_name=sheet_data["sheetName"],
                 header_row=header_row,
                 data_row=data_row,
+                columns=columns,
+                where=sheet_data.get("where") or None,
+                order_by=sheet_data.get("orderBy") or None,
+                chunk_size=chunk_size,
             )
             sheets.append(sheet)
 
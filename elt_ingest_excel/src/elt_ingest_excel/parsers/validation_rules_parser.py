@@ -0,0 +1,139 @@
+"""Configuration parser for declarative validation rules."""
+
+from pathlib import Path
+from typing import Union
+
+from ..models.validation_rules import RuleKind, TableRuleSet, ValidationRule, ValidationRuleConfig
+from .base_parser import BaseConfigParser
+
+
+class ValidationRulesParser(BaseConfigParser):
+    """Parser for validation rule JSON files.
+
+    JSON format:
+    [
+        {
+            "tableName": "workday_supplier_email",
+            "sheetName": "Supplier Email",
+            "keyColumn": "supplier_id",
+            "issuesTable": "validation_supplier_issues",
+            "rules": [
+                {"type": "foreignKey", "column": "supplier_id",
+                 "refTable": "workday_supplier_name", "message": "..."},
+                {"type": "unique", "column": "email_id", "message": "..."},
+                {"type": "notNull", "column": "email_address", "message": "..."},
+                {"type": "allowedValues", "column": "public_flag",
+                 "values": ["Yes", "No"], "message": "..."},
+                {"type": "regex", "column": "email_address",
+                 "pattern": "^[^@ ]+@[^@ ]+$", "message": "..."},
+                {"type": "requiredIf", "column": "supplier_source",
+                 "when": "external_entity_id", "message": "..."}
+            ]
+        }
+    ]
+
+    Every rule also accepts "ruleType" to override the issue label.
+    """
+
+    # Fields each rule kind needs besides type, column and message
+    REQUIRED_RULE_FIELDS = {
+        RuleKind.FOREIGN_KEY: ["refTable"],
+        RuleKind.ALLOWED_VALUES: ["values"],
+        RuleKind.REGEX: ["pattern"],
+        RuleKind.REQUIRED_IF: ["when"],
+    }
+
+    @classmethod
+    def from_json(
+        cls,
+        json_data: Union[str, Path, dict, list],
+    ) -> ValidationRuleConfig:
+        """Load validation rules from JSON.
+
+        Args:
+            json_data: JSON file path, JSON string, dict, or list of table rule sets.
+
+        Returns:
+            ValidationRuleConfig instance.
+
+        Raises:
+            FileNotFoundError: If json_data is a path that doesn't exist.
+            json.JSONDecodeError: If JSON parsing fails.
+            ValueError: If configuration is invalid.
+        """
+        data = cls.load_json_data(json_data)
+        return ValidationRuleConfig(tables=[cls._parse_table(table_data) for table_data in data])
+
+    @classmethod
+    def _parse_table(cls, table_data: dict) -> TableRuleSet:
+        """Parse one table rule set.
+
+        Args:
+            table_data: Table rule set dictionary.
+
+        Returns:
+            TableRuleSet instance.
+        """
+        for field in ["tableName", "sheetName", "keyColumn"]:
+            if field not in table_data:
+                raise ValueError(f"Missing required field: {field}")
+        table_name = table_data["tableName"]
+        rules = [cls._parse_rule(rule_data, table_name) for rule_data in table_data.get("rules", [])]
+        if not rules:
+            raise ValueError(f"No rules configured for table '{table_name}'")
+
+        return TableRuleSet(
+            table_name=table_name,
+            sheet_name=table_data["sheetName"],
+            key_column=table_data["keyColumn"],
+            issues_table=table_data.get("issuesTable") or "validation_issues",
+            rules=rules,
+        )
+
+    @classmethod
+    def _parse_rule(cls, rule_data: dict, table_name: str) -> ValidationRule:
+        """Parse one rule.
+
+        Args:
+            rule_data: Rule dictionary.
+            table_name: Table the rule belongs to (for error messages).
+
+        Returns:
+            ValidationRule instance.
+        """
+        for field in ["type", "column", "message"]:
+            if field not in rule_data:
+                raise ValueError(f"Missing required field in rule for '{table_name}': {field}")
+        try:
+            kind = RuleKind(rule_data["type"])
+        except ValueError:
+            valid = ", ".join(k.value for k in RuleKind)
+            raise ValueError(
+                f"Unknown rule type '{rule_data['type']}' for '{table_name}'. Valid types: {valid}"
+            ) from None
+        for field in cls.REQUIRED_RULE_FIELDS.get(kind, []):
+            if not rule_data.get(field):
+                raise ValueError(
+                    f"Rule '{kind.value}' on '{table_name}.{rule_data['column']}' requires: {field}"
+                )
+
+        values = rule_data.get("values")
+        if values is not None and (
+            not isinstance(values, list) or not all(isinstance(v, str) for v in values)
+        ):
+            raise ValueError(
+                f"Invalid values for rule on '{table_name}.{rule_data['column']}': expected a list of strings"
+            )
+
+        return ValidationRule(
+            kind=kind,
+            column=rule_data["column"],
+            message=rule_data["message"],
+            rule_type=rule_data.get("ruleType") or None,
+            values=values,
+            pattern=rule_data.get("pattern"),
+            ref_table=rule_data.get("refTable"),
+            ref_column=rule_data.get("refColumn"),
+            when_column=rule_data.get("when"),
+            ignore_blank=bool(rule_data.get("ignoreBlank", False)),
+        )
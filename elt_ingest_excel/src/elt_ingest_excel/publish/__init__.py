@@ -2,6 +2,7 @@
 
 from ..models import PublishResult
 from .base import BaseExcelPublisher
+from .excel_publisher_ooxml import ExcelPublisherOoxml
 from .excel_publisher_openpyxl import ExcelPublisherOpenpyxl
 from .excel_publisher_xlwings import ExcelPublisherXlwings
 
@@ -12,6 +13,7 @@ __all__ = [
     "BaseExcelPublisher",
     "PublishResult",
     "ExcelPublisher",
+    "ExcelPublisherOoxml",
     "ExcelPublisherOpenpyxl",
     "ExcelPublisherXlwings",
 ]
@@ -1,9 +1,12 @@
 """Base classes and types for Excel publishers."""
 
+import multiprocessing
 import shutil
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Union
+from typing import TYPE_CHECKING, Any, Iterator, Union
 
 import duckdb
 
@@ -13,8 +16,11 @@ from ..models import (
     PublishSheetConfig,
     PublishWorkbookConfig,
 )
+from ..telemetry import peak_rss_bytes
+from ..writers import TableStatistics
 
 if TYPE_CHECKING:
+    from ..connection import ConnectionManager
     from ..reporting import PipelineReporter
 
 
@@ -30,31 +36,55 @@ class BaseExcelPublisher(ABC):
     Subclasses implement library-specific workbook and sheet operations.
     """
 
+    # Rows per Arrow record batch streamed from DuckDB into a sheet
+    BATCH_ROWS = 10_000
+    # Whether workbooks can be published concurrently in worker processes
+    SUPPORTS_PARALLEL = True
+
     def __init__(
         self,
         database_path: Union[str, Path],
         reporter: "PipelineReporter | None" = None,
+        max_workers: int = 1,
+        connections: "ConnectionManager | None" = None,
     ):
         """Initialize the publisher.
 
         Args:
             database_path: Path to the DuckDB database file.
             reporter: Optional reporter for output messages.
+            max_workers: Number of workbooks to publish concurrently, each in its own
+                         process with its own read-only connection. Ignored by
+                         publishers that do not support parallel publishing.
+            connections: Optional shared connection manager. When given, queries run on
+                         its connection (left open on exit) instead of a new read-only one.
         """
         self.database_path = Path(database_path).expanduser()
         self.connection: duckdb.DuckDBPyConnection | None = None
         self.reporter = reporter
+        self.max_workers = max_workers
+        self.connections = connections
 
     def __enter__(self):
         """Context manager entry."""
-        self.connection = duckdb.connect(str(self.database_path), read_only=True)
+        self.connection = self._connect()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        if self.connection:
+        self._disconnect()
+
+    def _connect(self) -> duckdb.DuckDBPyConnection:
+        """Return the shared connection, or open a read-only one."""
+        if self.connections is not None:
+            return self.connections.connection
+        return duckdb.connect(str(self.database_path), read_only=True)
+
+    def _disconnect(self) -> None:
+        """Drop the connection, closing it unless it is shared."""
+        if self.connection and self.connections is None:
             self.connection.close()
-            self.connection = None
+        self.connection = None
 
     def publish(
         self,
@@ -68,6 +98,10 @@ class BaseExcelPublisher(ABC):
         Returns:
             List of PublishResult for each sheet processed.
         """
+        workers = min(self.max_workers, len(config.workbooks))
+        if workers > 1 and self.SUPPORTS_PARALLEL:
+            return self._publish_parallel(config, workers)
+
         all_results = []
 
         for workbook_config in config.workbooks:
@@ -76,6 +110,49 @@ class BaseExcelPublisher(ABC):
 
         return all_results
 
+    def _publish_parallel(
+        self,
+        config: PublishConfig,
+        workers: int,
+    ) -> list[PublishResult]:
+        """Publish workbooks concurrently in a process pool.
+
+        Each worker publishes whole workbooks through its own publisher
+        instance and read-only connection. The parent's connection (the
+        shared one included) is closed while the pool runs so it holds no
+        lock on the database file, and is reopened afterwards.
+
+        Args:
+            config: PublishConfig with workbook configurations.
+            workers: Number of worker processes.
+
+        Returns:
+            List of PublishResult in workbook config order.
+        """
+        self._disconnect()
+        if self.connections is not None:
+            self.connections.close()
+
+        results_by_workbook: dict[int, list[PublishResult]] = {}
+        try:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                futures = {
+                    pool.submit(_publish_workbook_in_worker, type(self), self.database_path, workbook_config): i
+                    for i, workbook_config in enumerate(config.workbooks)
+                }
+                for future in as_completed(futures):
+                    i = futures[future]
+                    results_by_workbook[i] = future.result()
+                    if self.reporter:
+                        self.reporter.print_publish_workbook_completed(
+                            config.workbooks[i].tgt_workbook_full_path, results_by_workbook[i]
+                        )
+        finally:
+            self.connection = self._connect()
+
+        return [result for i in sorted(results_by_workbook) for result in results_by_workbook[i]]
+
     def _publish_workbook(
         self,
         workbook_config: PublishWorkbookConfig,
@@ -107,13 +184,27 @@ class BaseExcelPublisher(ABC):
         # Clone the template
         if self.reporter:
             self.reporter.print_workbook_cloning()
-        shutil.copy2(src_path, tgt_path)
+        self._clone_template(src_path, tgt_path)
 
         # Open and process workbook using library-specific implementation
         results = self._open_and_process_workbook(workbook_config, tgt_path)
+        for result in results:
+            result.workbook_path = str(tgt_path)
 
         return results
 
+    def _clone_template(self, src_path: Path, tgt_path: Path) -> None:
+        """Copy the template workbook to the target path before it is opened.
+
+        Publishers that write the target from the template themselves
+        override this to skip the copy.
+
+        Args:
+            src_path: Path to the template workbook.
+            tgt_path: Path to the target workbook file.
+        """
+        shutil.copy2(src_path, tgt_path)
+
     @abstractmethod
     def _open_and_process_workbook(
         self,
@@ -150,7 +241,10 @@ class BaseExcelPublisher(ABC):
         """
         results = []
         for sheet_config in workbook_config.sheets:
+            start = time.perf_counter()
             result = self._publish_sheet(workbook, sheet_config)
+            result.elapsed_seconds = time.perf_counter() - start
+            result.peak_rss_bytes = peak_rss_bytes()
             results.append(result)
         return results
 
@@ -192,24 +286,33 @@ class BaseExcelPublisher(ABC):
             # Get the sheet
             ws = self._get_sheet(workbook, sheet_name)
 
-            # Query DuckDB table
-            query = f"SELECT * FROM {table_name}"
-            result = self.connection.execute(query)
-            rows = result.fetchall()
+            # Query DuckDB table, projecting and filtering in the query
+            projection = self._build_projection(ws, sheet_config)
+            source = f"FROM {table_name}"
+            if sheet_config.where:
+                source += f" WHERE {sheet_config.where}"
+            row_count = self._count_rows(table_name, source, sheet_config.where)
 
             if self.reporter:
-                self.reporter.print_publish_rows_from_table(len(rows))
+                self.reporter.print_publish_rows_from_table(row_count)
 
-            # Write data using library-specific implementation
-            self._write_data_to_sheet(ws, rows, data_row)
+            query = f"SELECT {projection} {source}"
+            if sheet_config.order_by:
+                query += f" ORDER BY {sheet_config.order_by}"
+
+            # Stream the rows in batches; write each using the library-specific implementation
+            rows_written = 0
+            for rows in self._fetch_batches(query, sheet_config.chunk_size):
+                self._write_data_to_sheet(ws, rows, data_row + rows_written)
+                rows_written += len(rows)
 
             if self.reporter:
-                self.reporter.print_publish_rows_written(len(rows))
+                self.reporter.print_publish_rows_written(rows_written)
 
             return PublishResult(
                 sheet_name=sheet_name,
                 table_name=table_name,
-                rows_written=len(rows),
+                rows_written=rows_written,
                 success=True,
             )
 
@@ -225,6 +328,85 @@ class BaseExcelPublisher(ABC):
                 error=error,
             )
 
+    def _count_rows(self, table_name: str, source: str, where: str | None) -> int:
+        """Count the rows to publish, from table_statistics when the whole table is published.
+
+        Args:
+            table_name: Source DuckDB table.
+            source: FROM (and WHERE) clause of the publish query.
+            where: Row filter from the sheet config, if any.
+
+        Returns:
+            Number of rows the publish query returns.
+        """
+        if not where:
+            stats = TableStatistics(self.connection, read_only=True).get(table_name)
+            if stats is not None:
+                return stats.row_count
+        return self.connection.execute(f"SELECT count(*) {source}").fetchone()[0]
+
+    def _build_projection(self, sheet: Any, sheet_config: PublishSheetConfig) -> str:
+        """Build the SELECT list for a sheet from its configured columns.
+
+        Columns mapped by template header are placed at the position of their
+        header cell in header_row; template columns between mapped ones are
+        filled with NULL.
+
+        Args:
+            sheet: Library-specific sheet object.
+            sheet_config: Configuration for the sheet.
+
+        Returns:
+            SQL select list ("*" when no columns are configured).
+
+        Raises:
+            ValueError: If a mapped header is not found in the template header row.
+        """
+        columns = sheet_config.columns
+        if not columns:
+            return "*"
+        if isinstance(columns, list):
+            return ", ".join(_quote_identifier(c) for c in columns)
+
+        positions: dict[str, int] = {}
+        for col, header in enumerate(self._read_header_row(sheet, sheet_config.header_row), 1):
+            if header is not None:
+                positions.setdefault(_normalize_header(header), col)
+
+        mapped: dict[int, str] = {}
+        missing = []
+        for header, column in columns.items():
+            position = positions.get(_normalize_header(header))
+            if position is None:
+                missing.append(header)
+            else:
+                mapped[position] = column
+        if missing:
+            raise ValueError(
+                f"Template header(s) not found in row {sheet_config.header_row}: {', '.join(missing)}"
+            )
+        return ", ".join(
+            _quote_identifier(mapped[col]) if col in mapped else "NULL"
+            for col in range(1, max(mapped) + 1)
+        )
+
+    def _fetch_batches(self, query: str, batch_rows: int | None = None) -> Iterator[list[tuple]]:
+        """Execute a query and yield its rows in batches.
+
+        Rows are streamed as Arrow record batches, so the full result is never
+        materialised; each batch is converted column by column.
+
+        Args:
+            query: SQL query to execute.
+            batch_rows: Rows per batch (default BATCH_ROWS).
+
+        Yields:
+            List of row tuples per record batch.
+        """
+        reader = self.connection.execute(query).fetch_record_batch(batch_rows or self.BATCH_ROWS)
+        for batch in reader:
+            yield list(zip(*(column.to_pylist() for column in batch.columns)))
+
     @abstractmethod
     def _sheet_exists(self, workbook: Any, sheet_name: str) -> bool:
         """Check if a sheet exists in the workbook.
@@ -251,6 +433,19 @@ class BaseExcelPublisher(ABC):
         """
         pass
 
+    @abstractmethod
+    def _read_header_row(self, sheet: Any, header_row: int) -> list[Any]:
+        """Read the values of the template's header row.
+
+        Args:
+            sheet: Library-specific sheet object.
+            header_row: Header row number (1-indexed).
+
+        Returns:
+            Cell values from column A to the last used column.
+        """
+        pass
+
     @abstractmethod
     def _write_data_to_sheet(
         self,
@@ -260,6 +455,9 @@ class BaseExcelPublisher(ABC):
     ) -> None:
         """Write data to the sheet.
 
+        Called once per streamed batch, with start_row advanced past the
+        rows already written.
+
         Args:
             sheet: Library-specific sheet object.
             rows: Data rows to write.
@@ -284,3 +482,22 @@ class BaseExcelPublisher(ABC):
         """
         if self.reporter:
             self.reporter.print_workbook_saved(tgt_path)
+
+
+def _quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _normalize_header(header: Any) -> str:
+    # Template headers often wrap onto several lines
+    return " ".join(str(header).split()).casefold()
+
+
+def _publish_workbook_in_worker(
+    publisher_class: type[BaseExcelPublisher],
+    database_path: Path,
+    workbook_config: PublishWorkbookConfig,
+) -> list[PublishResult]:
+    """Publish one workbook in a worker process with its own connection."""
+    with publisher_class(database_path) as publisher:
+        return publisher._publish_workbook(workbook_config)
@@ -0,0 +1,132 @@
+"""Excel publisher that patches worksheet XML while cloning the template.
+
+The workbook is never loaded as a whole: only the target worksheet parts are
+rewritten and every other zip member (VBA project, drawings, shapes, other
+sheets) is copied as stored, without recompression. Works without Excel
+installed.
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Union
+
+from ..models import PublishWorkbookConfig
+from ..ooxml import OoxmlWorkbook
+from .base import BaseExcelPublisher, PublishResult
+
+if TYPE_CHECKING:
+    from ..connection import ConnectionManager
+    from ..reporting import PipelineReporter
+
+
+class ExcelPublisherOoxml(BaseExcelPublisher):
+    """Publisher for writing DuckDB data to Excel workbooks by XML patching.
+
+    This class handles:
+    1. Streaming DuckDB tables into the template's worksheet parts
+    2. Writing the target package with all other parts copied as stored
+    """
+
+    def __init__(
+        self,
+        database_path: Union[str, Path],
+        reporter: "PipelineReporter | None" = None,
+        max_workers: int = 1,
+        connections: "ConnectionManager | None" = None,
+    ):
+        """Initialize the publisher.
+
+        Args:
+            database_path: Path to the DuckDB database file.
+            reporter: Optional reporter for output messages.
+            max_workers: Number of workbooks to publish concurrently in worker processes.
+            connections: Optional shared connection manager for queries.
+        """
+        super().__init__(database_path, reporter, max_workers, connections)
+
+    def _clone_template(self, src_path: Path, tgt_path: Path) -> None:
+        """Skip the copy: saving writes the target from the template.
+
+        Unchanged template parts are copied as raw compressed bytes by
+        OoxmlWorkbook.save, so cloning first would copy them twice.
+
+        Args:
+            src_path: Path to the template workbook.
+            tgt_path: Path to the target workbook file.
+        """
+
+    def _open_and_process_workbook(
+        self,
+        workbook_config: PublishWorkbookConfig,
+        tgt_path: Path,
+    ) -> list[PublishResult]:
+        """Open the workbook package and process all sheets.
+
+        Args:
+            workbook_config: Configuration for the workbook.
+            tgt_path: Path to the target workbook file.
+
+        Returns:
+            List of PublishResult for each sheet processed.
+        """
+        # The template is read directly; saving writes the target in one pass
+        with OoxmlWorkbook(workbook_config.src_workbook_full_path) as wb:
+            # Process each sheet
+            results = self._process_sheets(wb, workbook_config)
+
+            # Save the workbook
+            self._report_saving(tgt_path)
+            wb.save(tgt_path)
+            self._report_saved(tgt_path)
+
+        return results
+
+    def _sheet_exists(self, workbook: Any, sheet_name: str) -> bool:
+        """Check if a sheet exists in the workbook.
+
+        Args:
+            workbook: OoxmlWorkbook object.
+            sheet_name: Name of the sheet to check.
+
+        Returns:
+            True if sheet exists, False otherwise.
+        """
+        return sheet_name in workbook.sheetnames
+
+    def _get_sheet(self, workbook: Any, sheet_name: str) -> Any:
+        """Get a sheet from the workbook.
+
+        Args:
+            workbook: OoxmlWorkbook object.
+            sheet_name: Name of the sheet to get.
+
+        Returns:
+            WorksheetPatch for the sheet.
+        """
+        return workbook.worksheet(sheet_name)
+
+    def _read_header_row(self, sheet: Any, header_row: int) -> list[Any]:
+        """Read the values of the template's header row.
+
+        Args:
+            sheet: WorksheetPatch object.
+            header_row: Header row number (1-indexed).
+
+        Returns:
+            Cell values from column A to the last used column.
+        """
+        return sheet.row_values(header_row)
+
+    def _write_data_to_sheet(
+        self,
+        sheet: Any,
+        rows: list[tuple],
+        start_row: int,
+    ) -> None:
+        """Serialise rows into the sheet's patched XML.
+
+        Args:
+            sheet: WorksheetPatch object.
+            rows: Data rows to write.
+            start_row: Starting row number (1-indexed).
+        """
+        sheet.write_rows(rows, start_row)
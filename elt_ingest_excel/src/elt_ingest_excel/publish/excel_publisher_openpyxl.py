@@ -13,6 +13,7 @@ from ..models import PublishWorkbookConfig
 from .base import BaseExcelPublisher, PublishResult
 
 if TYPE_CHECKING:
+    from ..connection import ConnectionManager
     from ..reporting import PipelineReporter
 
 
@@ -29,14 +30,18 @@ class ExcelPublisherOpenpyxl(BaseExcelPublisher):
         self,
         database_path: Union[str, Path],
         reporter: "PipelineReporter | None" = None,
+        max_workers: int = 1,
+        connections: "ConnectionManager | None" = None,
     ):
         """Initialize the publisher.
 
         Args:
             database_path: Path to the DuckDB database file.
             reporter: Optional reporter for output messages.
+            max_workers: Number of workbooks to publish concurrently in worker processes.
+            connections: Optional shared connection manager for queries.
         """
-        super().__init__(database_path, reporter)
+        super().__init__(database_path, reporter, max_workers, connections)
 
     def _open_and_process_workbook(
         self,
@@ -93,6 +98,18 @@ class ExcelPublisherOpenpyxl(BaseExcelPublisher):
         """
         return workbook[sheet_name]
 
+    def _read_header_row(self, sheet: Any, header_row: int) -> list[Any]:
+        """Read the values of the template's header row.
+
+        Args:
+            sheet: openpyxl Worksheet object.
+            header_row: Header row number (1-indexed).
+
+        Returns:
+            Cell values from column A to the last used column.
+        """
+        return [cell.value for cell in sheet[header_row]]
+
     def _write_data_to_sheet(
         self,
         sheet: Any,
@@ -106,8 +123,7 @@ class ExcelPublisherOpenpyxl(BaseExcelPublisher):
             rows: Data rows to write.
             start_row: Starting row number (1-indexed).
         """
-        for row_idx, row_data in enumerate(rows):
-            excel_row = start_row + row_idx
-            for col_idx, value in enumerate(row_data):
-                col = col_idx + 1  # Excel columns are 1-indexed
+        for excel_row, row_data in enumerate(rows, start_row):
+            # Excel columns are 1-indexed
+            for col, value in enumerate(row_data, 1):
                 sheet.cell(row=excel_row, column=col, value=value)
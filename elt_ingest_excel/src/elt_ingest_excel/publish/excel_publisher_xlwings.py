@@ -19,6 +19,7 @@ from ..models import PublishWorkbookConfig
 from .base import BaseExcelPublisher, PublishResult
 
 if TYPE_CHECKING:
+    from ..connection import ConnectionManager
     from ..reporting import PipelineReporter
 
 
@@ -33,18 +34,26 @@ class ExcelPublisherXlwings(BaseExcelPublisher):
     Uses xlwings to control Excel directly, preserving all features.
     """
 
+    # Excel automation is driven through one application instance
+    SUPPORTS_PARALLEL = False
+
     def __init__(
         self,
         database_path: Union[str, Path],
         reporter: "PipelineReporter | None" = None,
+        max_workers: int = 1,
+        connections: "ConnectionManager | None" = None,
     ):
         """Initialize the publisher.
 
         Args:
             database_path: Path to the DuckDB database file.
             reporter: Optional reporter for output messages.
+            max_workers: Ignored; workbooks are always published one at a time
+                         through a single Excel instance.
+            connections: Optional shared connection manager for queries.
         """
-        super().__init__(database_path, reporter)
+        super().__init__(database_path, reporter, max_workers, connections)
 
     def _open_and_process_workbook(
         self,
@@ -129,6 +138,20 @@ class ExcelPublisherXlwings(BaseExcelPublisher):
         """
         return workbook.sheets[sheet_name]
 
+    def _read_header_row(self, sheet: Any, header_row: int) -> list[Any]:
+        """Read the values of the template's header row.
+
+        Args:
+            sheet: xlwings Sheet object.
+            header_row: Header row number (1-indexed).
+
+        Returns:
+            Cell values from column A to the last used column.
+        """
+        last_column = sheet.used_range.last_cell.column
+        values = sheet.range((header_row, 1), (header_row, last_column)).value
+        return values if isinstance(values, list) else [values]
+
     def _write_data_to_sheet(
         self,
         sheet: Any,
@@ -143,6 +166,6 @@ class ExcelPublisherXlwings(BaseExcelPublisher):
             start_row: Starting row number (1-indexed).
         """
         if rows:
-            # Write all data at once using xlwings range
+            # Write the whole batch with one xlwings range assignment
             # xlwings uses 1-indexed rows/columns
             sheet.range((start_row, 1)).value = rows
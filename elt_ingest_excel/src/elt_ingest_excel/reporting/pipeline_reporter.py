@@ -3,7 +3,11 @@
 from pathlib import Path
 
 from ..publish import PublishResult
-from ..transform import TransformResult
+from ..telemetry import RunLog
+from ..transform import RuleSetResult, StatementProfile, TransformResult
+from ..transform.enrichment import EnrichmentResult
+from ..transform.reference_data import ReferenceTableResult
+from ..transform.udf.cache import CacheStats
 from ..writers import SaveMode, WriteResult
 
 
@@ -65,6 +69,43 @@ class PipelineReporter:
         """
         print(f"No order.txt found at {order_file}")
 
+    def print_enrichment_no_extract_file(self, extract_file: Path) -> None:
+        """Print message when postcode enrichment has no extract SQL.
+
+        Args:
+            extract_file: Path where enrich_postcodes.sql was expected.
+        """
+        print(f"Postcode enrichment skipped: no {extract_file.name} found at {extract_file.parent}")
+
+    def print_reference_data_summary(self, results: list[ReferenceTableResult]) -> None:
+        """Print summary of the reference data registry.
+
+        Args:
+            results: ReferenceTableResult objects, one per reference data file.
+        """
+        reloaded = [r for r in results if r.reloaded]
+        print(
+            f"Reference data: {len(results)} files, {len(reloaded)} reloaded, "
+            f"{len(results) - len(reloaded)} unchanged"
+        )
+        for result in reloaded:
+            print(f"  {result.source_file} -> {result.table_name}: {result.row_count:,} rows")
+
+    def print_enrichment_summary(self, result: EnrichmentResult) -> None:
+        """Print summary of the postcode enrichment stage.
+
+        Args:
+            result: EnrichmentResult from PostcodeEnrichment.
+        """
+        print(f"Postcode enrichment -> {result.table_name}: {result.postcodes:,} distinct postcodes")
+        print(
+            f"  cached {result.cached:,}, postcodes.io {result.remote:,}, "
+            f"offline {result.offline:,}, unresolved {result.unresolved:,} "
+            f"({result.requests:,} requests, {result.elapsed_seconds:.2f}s)"
+        )
+        if result.failed_batches:
+            print(f"  WARNING: {result.failed_batches} bulk request(s) failed after retries")
+
     def print_transform_sql_count(self, count: int) -> None:
         """Print number of SQL files to execute.
 
@@ -81,6 +122,40 @@ class PipelineReporter:
         """
         print(f"\n  Executing: {sql_file}")
 
+    def print_transform_dag(
+        self,
+        file_count: int,
+        critical_path: int,
+        max_workers: int,
+    ) -> None:
+        """Print the shape of the SQL dependency graph in DAG mode.
+
+        Args:
+            file_count: Number of SQL files in the graph.
+            critical_path: Number of files on the longest dependency chain.
+            max_workers: Maximum number of files executed concurrently.
+        """
+        print(f"DAG mode: {file_count} files, critical path {critical_path} files, {max_workers} workers")
+
+    def print_sql_file_completed(self, result: TransformResult, elapsed: float) -> None:
+        """Print the outcome of a SQL file executed in DAG mode.
+
+        Args:
+            result: TransformResult for the SQL file.
+            elapsed: Wall-clock seconds spent executing the file.
+        """
+        status = "SUCCESS" if result.success else f"ERROR: {result.error}"
+        print(f"  {result.sql_file} ({elapsed:.2f}s): {status}")
+
+    def print_sql_file_skipped(self, sql_file: str, reason: str) -> None:
+        """Print message when a SQL file is skipped by an incremental or selective run.
+
+        Args:
+            sql_file: Name of the SQL file.
+            reason: Why the file was skipped (e.g. "unchanged", "not selected").
+        """
+        print(f"\n  Skipped: {sql_file} ({reason})")
+
     def print_sql_file_not_found(self, sql_file: str, path: str) -> None:
         """Print error when SQL file is not found.
 
@@ -180,6 +255,26 @@ class PipelineReporter:
         """
         print(f"    Rows written: {count}")
 
+    def print_sheet_column_types(self, column_types: dict[str, str]) -> None:
+        """Print how many columns a typed load stored as each type.
+
+        Args:
+            column_types: Column name to type name after the load.
+        """
+        counts: dict[str, int] = {}
+        for type_name in column_types.values():
+            counts[type_name] = counts.get(type_name, 0) + 1
+        summary = ", ".join(f"{type_name} {count}" for type_name, count in sorted(counts.items()))
+        print(f"    Column types: {summary}")
+
+    def print_sheet_skipped_unchanged(self, row_count: int) -> None:
+        """Print message when a sheet is skipped because its inputs are unchanged.
+
+        Args:
+            row_count: Number of rows already in the target table.
+        """
+        print(f"    Unchanged since last load, skipped ({row_count} rows in table)")
+
     def print_load_summary(self, results: list[WriteResult]) -> None:
         """Print summary of load results.
 
@@ -189,10 +284,17 @@ class PipelineReporter:
         print("\n" + "-" * self.SUMMARY_WIDTH)
         print("Load Summary:")
         total_rows = 0
+        skipped_count = 0
         for result in results:
-            print(f"  {result.table_name}: {result.row_count} rows")
+            if result.skipped:
+                print(f"  {result.table_name}: {result.row_count} rows (unchanged)")
+                skipped_count += 1
+            else:
+                print(f"  {result.table_name}: {result.row_count} rows")
             total_rows += result.row_count
         print(f"Total: {len(results)} tables, {total_rows} rows")
+        if skipped_count:
+            print(f"Skipped unchanged: {skipped_count} tables")
 
     def print_transform_summary(self, results: list[TransformResult]) -> None:
         """Print summary of transform results.
@@ -204,17 +306,90 @@ class PipelineReporter:
         print("Transform Summary:")
         success_count = sum(1 for r in results if r.success)
         fail_count = len(results) - success_count
+        skipped_count = sum(1 for r in results if r.skipped)
 
         for result in results:
-            status = "OK" if result.success else f"FAILED: {result.error}"
+            if result.skipped and result.success:
+                status = "SKIPPED"
+            elif result.success:
+                status = "OK"
+            else:
+                status = f"FAILED: {result.error}"
             print(f"  {result.sql_file}: {status}")
 
         print(f"Total: {success_count} succeeded, {fail_count} failed")
+        if skipped_count:
+            print(f"Skipped: {skipped_count} files (unchanged or not selected)")
+
+    def print_rule_validation_summary(self, results: list[RuleSetResult], config_path: Path) -> None:
+        """Print summary of rule-based validation.
+
+        Args:
+            results: RuleSetResult objects, one per validated table.
+            config_path: Validation rules JSON file.
+        """
+        print("\n" + "-" * self.SUMMARY_WIDTH)
+        print(f"Rule Validation: {config_path.name}")
+        for result in results:
+            if result.success:
+                status = f"{result.issues:,} issues ({result.rule_count} rules, {result.elapsed_seconds:.2f}s)"
+            else:
+                status = f"FAILED: {result.error}"
+            print(f"  {result.sheet_name} [{result.table_name}]: {status}")
+        total = sum(r.issues for r in results if r.success)
+        issue_tables = sorted({r.issues_table for r in results})
+        print(f"Total: {total:,} issues written to {', '.join(issue_tables)}")
 
     def print_transform_abort_on_failure(self) -> None:
         """Print notice when aborting remaining SQL files after a failure."""
         print("  Aborting remaining SQL files due to failure")
 
+    def print_transform_profile(
+        self,
+        profiles: list[StatementProfile],
+        total_seconds: float,
+    ) -> None:
+        """Print the slowest transform statements, ranked by wall time.
+
+        Args:
+            profiles: StatementProfile objects, slowest first.
+            total_seconds: Wall time of all profiled statements.
+        """
+        print("\n" + "-" * self.SUMMARY_WIDTH)
+        print(f"Transform Profile (slowest statements, {total_seconds:.2f}s total):")
+        for rank, profile in enumerate(profiles, 1):
+            share = profile.elapsed_seconds / total_seconds * 100 if total_seconds else 0.0
+            rows = f"{profile.rows:,} rows" if profile.rows is not None else "- rows"
+            memory = (
+                f"{profile.peak_buffer_memory / (1024 * 1024):.1f} MiB"
+                if profile.peak_buffer_memory is not None
+                else "- MiB"
+            )
+            print(
+                f"  {rank:>2}. {profile.sql_file} #{profile.statement_index} "
+                f"{profile.statement_type}: {profile.elapsed_seconds:.3f}s ({share:.0f}%), "
+                f"{rows}, peak {memory}"
+            )
+            if profile.hottest_operator:
+                print(
+                    f"      hottest: {profile.hottest_operator} "
+                    f"({profile.hottest_operator_seconds or 0:.3f}s)"
+                )
+
+    def print_udf_cache_stats(self, stats: dict[str, CacheStats]) -> None:
+        """Print UDF cache hit rates for the transform phase.
+
+        Args:
+            stats: CacheStats per UDF (or remote lookup) name.
+        """
+        print("\n" + "-" * self.SUMMARY_WIDTH)
+        print("UDF Cache:")
+        for name, s in sorted(stats.items()):
+            print(
+                f"  {name}: {s.lookups:,} lookups, {s.hit_rate:.1%} hit "
+                f"(memory {s.memory_hits:,}, disk {s.disk_hits:,}, computed {s.misses:,})"
+            )
+
     def print_publish_summary(self, results: list[PublishResult]) -> None:
         """Print summary of publish results.
 
@@ -277,6 +452,20 @@ class PipelineReporter:
         """
         print(f"  Workbook saved: {tgt_path}")
 
+    def print_publish_workbook_completed(self, tgt_path: Path, results: list[PublishResult]) -> None:
+        """Print the outcome of a workbook published by a worker process.
+
+        Args:
+            tgt_path: Path to the published workbook.
+            results: PublishResult for each sheet of the workbook.
+        """
+        failed = [r for r in results if not r.success]
+        rows = sum(r.rows_written for r in results if r.success)
+        status = "SUCCESS" if not failed else f"{len(failed)} sheet(s) FAILED"
+        print(f"  {tgt_path.name}: {len(results)} sheets, {rows} rows - {status}")
+        for result in failed:
+            print(f"    {result.sheet_name}: {result.error}")
+
     def print_publish_sheet_start(self, sheet_name: str, table_name: str) -> None:
         """Print message when starting to publish a sheet.
 
@@ -372,3 +561,33 @@ class PipelineReporter:
         print(f"    Ingested:    {total_ingested:>8} rows")
         print(f"    Merged:      {total_merged:>8} rows")
         print(f"    Deduplicated:{total_deduped:>8} rows")
+
+    def print_run_telemetry(self, run_log: RunLog, json_path: Path | None = None) -> None:
+        """Print per-phase durations and peak memory of a pipeline run.
+
+        Args:
+            run_log: RunLog of the finished run.
+            json_path: JSON export of the run log, if one was written.
+        """
+        print("\n" + "-" * self.SUMMARY_WIDTH)
+        print(f"Run {run_log.run_id}:")
+        for entry in run_log.phase_entries("phase") + run_log.phase_entries("run"):
+            rows = f", {entry.rows:,} rows" if entry.rows is not None else ""
+            memory = (
+                f", peak {entry.peak_rss_bytes / (1024 * 1024):.1f} MiB"
+                if entry.peak_rss_bytes is not None
+                else ""
+            )
+            status = "" if entry.success else " (FAILED)"
+            print(f"  {entry.name}: {entry.elapsed_seconds or 0:.2f}s{rows}{memory}{status}")
+        print(f"Telemetry: {RunLog.TABLE_NAME} ({len(run_log.entries)} entries)")
+        if json_path:
+            print(f"Telemetry JSON: {json_path}")
+
+    def print_run_telemetry_error(self, error: str) -> None:
+        """Print error message for a run log that could not be written.
+
+        Args:
+            error: The error message.
+        """
+        print(f"\nWARNING: Run telemetry not written: {error}")
@@ -0,0 +1,166 @@
+"""Run telemetry: durations, rows, bytes and peak memory for each pipeline run."""
+
+import datetime
+import json
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator, Union
+
+import duckdb
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_bytes() -> int | None:
+    """Peak resident set size of this process so far, in bytes.
+
+    Returns None where the platform does not report it (Windows).
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class RunLogEntry:
+    """One measured unit of a pipeline run.
+
+    Attributes:
+        phase: Pipeline phase ("ingest", "transform", "publish") or "pipeline".
+        scope: What was measured: "run", "phase", "workbook", "sheet", "stage",
+               "sql_file", "rule_set" or "publish_sheet".
+        name: Workbook file, table, SQL file or sheet name.
+        parent: Enclosing workbook for sheet-level entries, None otherwise.
+        elapsed_seconds: Wall-clock duration, if measured.
+        rows: Rows loaded, resolved or written.
+        bytes: Size of the source (ingest) or target (publish) workbook file.
+        peak_rss_bytes: Peak process memory when the unit finished. Publish sheets
+                        written in worker processes report the worker's peak.
+        success: Whether the unit succeeded.
+        error: Error message if it failed.
+    """
+    phase: str
+    scope: str
+    name: str
+    parent: str | None = None
+    elapsed_seconds: float | None = None
+    rows: int | None = None
+    bytes: int | None = None
+    peak_rss_bytes: int | None = None
+    success: bool = True
+    error: str | None = None
+
+
+class RunLog:
+    """Collects RunLogEntry records for one pipeline run.
+
+    Entries are kept in memory in the order they were recorded until
+    write() stores them in the pipeline_run_log table under the run id,
+    and write_json() exports them to pipeline_run_<run_id>.json.
+    """
+
+    TABLE_NAME = "pipeline_run_log"
+
+    def __init__(self, run_id: str | None = None):
+        self.run_id = run_id or uuid.uuid4().hex
+        self.started_at = datetime.datetime.now()
+        self.entries: list[RunLogEntry] = []
+
+    def add(self, entry: RunLogEntry) -> RunLogEntry:
+        self.entries.append(entry)
+        return entry
+
+    @contextmanager
+    def measure(
+        self,
+        phase: str,
+        scope: str,
+        name: str,
+        parent: str | None = None,
+    ) -> Iterator[RunLogEntry]:
+        """Record the duration and peak memory of the enclosed block.
+
+        The entry is yielded so the block can fill in rows and bytes. An
+        exception marks it failed and is re-raised.
+        """
+        entry = self.add(RunLogEntry(phase=phase, scope=scope, name=name, parent=parent))
+        start = time.perf_counter()
+        try:
+            yield entry
+        except BaseException as e:
+            entry.success = False
+            entry.error = str(e) or type(e).__name__
+            raise
+        finally:
+            entry.elapsed_seconds = time.perf_counter() - start
+            entry.peak_rss_bytes = peak_rss_bytes()
+
+    def phase_entries(self, scope: str = "phase") -> list[RunLogEntry]:
+        return [entry for entry in self.entries if entry.scope == scope]
+
+    def write(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Store the entries in the pipeline_run_log table."""
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
+                run_id VARCHAR,
+                run_started_at TIMESTAMP,
+                seq INTEGER,
+                phase VARCHAR,
+                scope VARCHAR,
+                name VARCHAR,
+                parent VARCHAR,
+                elapsed_seconds DOUBLE,
+                row_count BIGINT,
+                bytes BIGINT,
+                peak_rss_bytes BIGINT,
+                success BOOLEAN,
+                error VARCHAR
+            )
+            """
+        )
+        if not self.entries:
+            return
+        conn.executemany(
+            f"INSERT INTO {self.TABLE_NAME} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                [
+                    self.run_id,
+                    self.started_at,
+                    seq,
+                    e.phase,
+                    e.scope,
+                    e.name,
+                    e.parent,
+                    e.elapsed_seconds,
+                    e.rows,
+                    e.bytes,
+                    e.peak_rss_bytes,
+                    e.success,
+                    e.error,
+                ]
+                for seq, e in enumerate(self.entries, 1)
+            ],
+        )
+
+    def write_json(self, directory: Union[str, Path]) -> Path:
+        """Write the run to <directory>/pipeline_run_<run_id>.json and return its path."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"pipeline_run_{self.run_id}.json"
+        payload = {
+            "run_id": self.run_id,
+            "run_started_at": self.started_at.isoformat(),
+            "entries": [asdict(entry) for entry in self.entries],
+        }
+        path.write_text(json.dumps(payload, indent=2))
+        return path
@@ -1,4 +1,16 @@
 from ..models import TransformResult
 from .executor import SqlExecutor
+from .master_workbook import MasterWorkbookCache
+from .profiler import StatementProfile, TransformProfiler
+from .rule_engine import RuleEngine, RuleSetResult, compile_rule_set
 
-__all__ = ["SqlExecutor", "TransformResult"]
+__all__ = [
+    "MasterWorkbookCache",
+    "RuleEngine",
+    "RuleSetResult",
+    "SqlExecutor",
+    "StatementProfile",
+    "TransformProfiler",
+    "TransformResult",
+    "compile_rule_set",
+]
@@ -1,3 +1,4 @@
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -8,8 +9,20 @@ from .udf import register_all
 if TYPE_CHECKING:
     from duckdb import DuckDBPyConnection
 
+    from ..connection import ConnectionManager
+
 
 def open_connection(database_path: Path) -> "DuckDBPyConnection":
     conn = duckdb.connect(str(database_path))
     register_all(conn)
     return conn
+
+
+def connection_scope(
+    database_path: Path,
+    connections: "ConnectionManager | None" = None,
+) -> AbstractContextManager["DuckDBPyConnection"]:
+    """The shared connection (left open on exit) or a new one closed on exit."""
+    if connections is not None:
+        return nullcontext(connections.connection)
+    return open_connection(database_path)
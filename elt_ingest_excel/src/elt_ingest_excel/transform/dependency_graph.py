@@ -0,0 +1,156 @@
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import duckdb
+
+_COMMENT_LINE = re.compile(r"--[^\n]*")
+_COMMENT_BLOCK = re.compile(r"/\*.*?\*/", re.DOTALL)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+
+_NAME = r'((?:"[^"]+"|\w+)(?:\.(?:"[^"]+"|\w+))*)'
+_TARGET = re.compile(
+    r"\b(?:"
+    r"CREATE\s+(?:OR\s+REPLACE\s+)?(?:(?:TEMP|TEMPORARY)\s+)?"
+    r"(?:TABLE|VIEW|MACRO|FUNCTION|SEQUENCE|TYPE)\s+(?:IF\s+NOT\s+EXISTS\s+)?"
+    r"|INSERT\s+(?:OR\s+\w+\s+)?INTO\s+"
+    r"|DROP\s+(?:TABLE|VIEW|MACRO|FUNCTION|SEQUENCE|TYPE)\s+(?:IF\s+EXISTS\s+)?"
+    r"|ALTER\s+TABLE\s+(?:IF\s+EXISTS\s+)?"
+    r"|DELETE\s+FROM\s+"
+    r"|(?<!DO\s)UPDATE\s+"
+    r")" + _NAME,
+    re.IGNORECASE,
+)
+_SOURCE = re.compile(r"\b(?:FROM|JOIN)\s+" + _NAME, re.IGNORECASE)
+# Further tables of a comma join ("FROM a x\n , b y"), matched right after the previous one
+_NEXT_SOURCE = re.compile(r"(?:\s+(?:AS\s+)?\w+)?\s*,\s*" + _NAME, re.IGNORECASE)
+_CALL = re.compile(r"\b(\w+)\s*\(")
+
+# Statement types whose effects are fully described by the tables they read and write.
+# Anything else (LOAD, SET, ATTACH, ...) changes session or database state, so the file
+# that contains it is treated as a barrier.
+_CATALOG_STATEMENTS = {
+    duckdb.StatementType.SELECT,
+    duckdb.StatementType.INSERT,
+    duckdb.StatementType.UPDATE,
+    duckdb.StatementType.DELETE,
+    duckdb.StatementType.CREATE,
+    duckdb.StatementType.CREATE_FUNC,
+    duckdb.StatementType.DROP,
+    duckdb.StatementType.ALTER,
+    duckdb.StatementType.COPY,
+    duckdb.StatementType.EXPLAIN,
+}
+
+
+def is_catalog_statement(statement: duckdb.Statement) -> bool:
+    return statement.type in _CATALOG_STATEMENTS
+
+
+def _normalize_name(name: str) -> str:
+    last = name.split(".")[-1]
+    return last.strip('"').lower()
+
+
+def _strip_sql(sql: str) -> str:
+    sql = _COMMENT_BLOCK.sub(" ", sql)
+    sql = _COMMENT_LINE.sub(" ", sql)
+    return _STRING.sub("''", sql)
+
+
+@dataclass
+class SqlFileNode:
+    """One order.txt entry (entries may repeat, so nodes are keyed by index)."""
+
+    index: int
+    sql_file: str
+    targets: set[str] = field(default_factory=set)
+    sources: set[str] = field(default_factory=set)
+    barrier: bool = False
+    depends_on: set[int] = field(default_factory=set)
+
+
+class SqlDependencyGraph:
+    """Dependencies between order.txt entries, derived from the SQL text.
+
+    A file depends on an earlier entry when it reads what the earlier entry
+    writes, writes what it reads, or both write the same object, so any
+    schedule respecting the graph builds the same tables as order.txt.
+    """
+
+    def __init__(self, nodes: list[SqlFileNode]):
+        self.nodes = nodes
+        self._link()
+
+    @classmethod
+    def build(
+        cls,
+        conn: duckdb.DuckDBPyConnection,
+        transform_path: Path,
+        sql_files: list[str],
+    ) -> "SqlDependencyGraph":
+        nodes = [
+            cls._parse_file(conn, Path(transform_path), index, sql_file)
+            for index, sql_file in enumerate(sql_files)
+        ]
+        return cls(nodes)
+
+    @staticmethod
+    def _parse_file(
+        conn: duckdb.DuckDBPyConnection,
+        transform_path: Path,
+        index: int,
+        sql_file: str,
+    ) -> SqlFileNode:
+        node = SqlFileNode(index=index, sql_file=sql_file)
+        try:
+            statements = conn.extract_statements((transform_path / sql_file).read_text())
+        except (OSError, duckdb.Error):
+            # Unreadable or unparsable files keep their place in the order;
+            # SqlFileExecutor reports the actual error when the file is run.
+            node.barrier = True
+            return node
+
+        for statement in statements:
+            if not is_catalog_statement(statement):
+                node.barrier = True
+            sql = _strip_sql(statement.query)
+            for match in _TARGET.finditer(sql):
+                node.targets.add(_normalize_name(match.group(1)))
+            for match in _SOURCE.finditer(sql):
+                node.sources.add(_normalize_name(match.group(1)))
+                while match := _NEXT_SOURCE.match(sql, match.end()):
+                    node.sources.add(_normalize_name(match.group(1)))
+            for match in _CALL.finditer(sql):
+                node.sources.add(match.group(1).lower())
+        node.sources -= node.targets
+        return node
+
+    def _link(self) -> None:
+        last_barrier: int | None = None
+        for i, node in enumerate(self.nodes):
+            if last_barrier is not None:
+                node.depends_on.add(last_barrier)
+            for earlier in self.nodes[last_barrier + 1 if last_barrier is not None else 0:i]:
+                if node.barrier or (
+                    node.sources & earlier.targets
+                    or node.targets & earlier.sources
+                    or node.targets & earlier.targets
+                ):
+                    node.depends_on.add(earlier.index)
+            if node.barrier:
+                last_barrier = i
+
+    def downstream_of(self, indices: set[int]) -> set[int]:
+        """Return the given nodes plus every node that transitively depends on them."""
+        selected = set(indices)
+        for node in self.nodes:
+            if node.depends_on & selected:
+                selected.add(node.index)
+        return selected
+
+    def critical_path_length(self) -> int:
+        depth: dict[int, int] = {}
+        for node in self.nodes:
+            depth[node.index] = 1 + max((depth[d] for d in node.depends_on), default=0)
+        return max(depth.values(), default=0)
@@ -0,0 +1,358 @@
+import asyncio
+import json
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import duckdb
+import pandas as pd
+
+from ..writers.table_statistics import TableStatistics
+from .db import connection_scope
+from .udf.address import POSTCODES_IO_CACHE
+from .udf.cache import UdfCache, get_udf_cache, set_udf_cache
+from .udf.postcode_index import DEFAULT_DATA_PATH, load_postcode_index
+
+if TYPE_CHECKING:
+    from ..connection import ConnectionManager
+
+DEFAULT_BASE_URL = "https://api.postcodes.io"
+# postcodes.io accepts at most 100 postcodes per bulk lookup
+BULK_LIMIT = 100
+
+EXTRACT_FILE = "enrich_postcodes.sql"
+
+# Normalises the first column of enrich_postcodes.sql to "OUT IN" form,
+# matching nrm_postal_code in the finance transforms. Only postcodes are
+# extracted: addresses without one are not geocoded by this stage.
+_DISTINCT_POSTCODES = r"""
+SELECT DISTINCT regexp_replace(pc, '^(.+)(.{{3}})$', '\1 \2') AS postcode
+  FROM (
+        SELECT regexp_replace(
+                   regexp_extract(upper(regexp_replace(CAST(src.value AS VARCHAR), '[,.-]', ' ', 'g')),
+                                  '[A-Z]{{1,2}}[0-9][0-9A-Z]?\s*[0-9][A-Z]{{2}}'),
+                   '\s+', '', 'g') AS pc
+          FROM ({extract_sql}) AS src(value)
+       )
+ WHERE pc <> ''
+ ORDER BY postcode
+"""
+
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """Token bucket limiting how often requests may start.
+
+    Allows bursts of up to `burst` requests, refilled at `rate` tokens per
+    second. Coroutines waiting in acquire() are released in turn.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class PostcodesIoClient:
+    """Async client for the postcodes.io bulk lookup endpoint.
+
+    Postcodes are sent in batches of up to BULK_LIMIT per POST /postcodes
+    request. At most `concurrency` requests are in flight, and request
+    starts are rate limited. Blocking HTTP calls run on worker threads.
+    Requests failing with 429/5xx or a connection error are retried with
+    exponential backoff; postcodes of batches that still fail are
+    reported as unresolved.
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        concurrency: int = 4,
+        requests_per_second: float = 10.0,
+        batch_size: int = BULK_LIMIT,
+        timeout: float = 10.0,
+        retries: int = 3,
+        backoff_seconds: float = 0.5,
+    ):
+        if not 1 <= batch_size <= BULK_LIMIT:
+            raise ValueError(f"batch_size must be between 1 and {BULK_LIMIT}, got {batch_size}")
+        self.base_url = base_url.rstrip("/")
+        self.concurrency = concurrency
+        self.requests_per_second = requests_per_second
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self.requests_sent = 0
+        self.failed_batches = 0
+
+    async def lookup(self, postcodes: list[str]) -> dict[str, dict | None]:
+        """Resolve postcodes; returns the postcodes.io result (or None) per postcode.
+
+        Postcodes of failed batches are absent from the returned dict.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        limiter = RateLimiter(self.requests_per_second, burst=self.concurrency)
+        batches = [
+            postcodes[start:start + self.batch_size]
+            for start in range(0, len(postcodes), self.batch_size)
+        ]
+
+        async def run(batch: list[str]) -> dict[str, dict | None]:
+            async with semaphore:
+                return await self._lookup_batch(batch, limiter)
+
+        resolved: dict[str, dict | None] = {}
+        for result in await asyncio.gather(*(run(batch) for batch in batches)):
+            resolved.update(result)
+        return resolved
+
+    async def _lookup_batch(self, batch: list[str], limiter: RateLimiter) -> dict[str, dict | None]:
+        for attempt in range(self.retries + 1):
+            await limiter.acquire()
+            self.requests_sent += 1
+            try:
+                body = await asyncio.to_thread(self._post, "/postcodes", {"postcodes": batch})
+            except urllib.error.HTTPError as e:
+                if e.code not in _RETRY_STATUSES:
+                    break
+            except (urllib.error.URLError, TimeoutError, ConnectionError):
+                pass
+            else:
+                return {item["query"]: item.get("result") for item in body.get("result") or []}
+            if attempt < self.retries:
+                await asyncio.sleep(self.backoff_seconds * 2 ** attempt)
+        self.failed_batches += 1
+        return {}
+
+    def _post(self, path: str, payload: dict) -> dict:
+        request = urllib.request.Request(
+            self.base_url + path,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json", "User-Agent": "elt-ingest-excel"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read())
+
+
+@dataclass
+class EnrichmentResult:
+    """Outcome of the postcode enrichment stage.
+
+    Attributes:
+        table_name: Lookup table written.
+        postcodes: Distinct postcodes extracted from the source tables.
+        cached: Postcodes answered by the UDF cache.
+        remote: Postcodes resolved by the postcode service.
+        offline: Postcodes resolved by the offline PostcodeIndex.
+        unresolved: Postcodes no source could resolve.
+        requests: HTTP requests sent, including retries.
+        failed_batches: Bulk requests that failed after all retries.
+        elapsed_seconds: Wall-clock time of the stage.
+    """
+    table_name: str
+    postcodes: int = 0
+    cached: int = 0
+    remote: int = 0
+    offline: int = 0
+    unresolved: int = 0
+    requests: int = 0
+    failed_batches: int = 0
+    elapsed_seconds: float = 0.0
+
+
+class PostcodeEnrichment:
+    """Pre-transform stage resolving source postcodes into a lookup table.
+
+    The transform directory's enrich_postcodes.sql selects the raw postcode
+    values (first column) to resolve. Distinct, normalised postcodes are
+    answered from the UDF cache where possible, the rest are resolved in
+    bulk through PostcodesIoClient, and anything the service cannot resolve
+    falls back to the offline PostcodeIndex. Results are upserted into
+    ref_postcode_lookup, keyed by the "OUT IN" postcode, for transform SQL
+    to join against.
+    """
+
+    TABLE_NAME = "ref_postcode_lookup"
+
+    def __init__(
+        self,
+        transform_path: Path,
+        database_path: Path,
+        client: PostcodesIoClient | None = None,
+        udf_cache_path: Path | None = None,
+        data_path: Path = DEFAULT_DATA_PATH,
+        connections: "ConnectionManager | None" = None,
+        run_id: str | None = None,
+    ):
+        self.transform_path = Path(transform_path)
+        self.database_path = Path(database_path)
+        self.client = client or PostcodesIoClient()
+        self.udf_cache_path = Path(udf_cache_path) if udf_cache_path else None
+        self.data_path = Path(data_path)
+        self.connections = connections
+        self.run_id = run_id
+
+    @property
+    def extract_file(self) -> Path:
+        return self.transform_path / EXTRACT_FILE
+
+    def exists(self) -> bool:
+        return self.extract_file.exists()
+
+    def execute(self) -> EnrichmentResult | None:
+        """Run the stage; returns None if the transform has no enrich_postcodes.sql."""
+        if not self.exists():
+            return None
+        start = time.perf_counter()
+        result = EnrichmentResult(table_name=self.TABLE_NAME)
+        udf_cache = UdfCache(self.udf_cache_path)
+        set_udf_cache(udf_cache)
+        try:
+            with connection_scope(self.database_path, self.connections) as conn:
+                postcodes = self._extract(conn)
+                result.postcodes = len(postcodes)
+                rows = self._resolve(postcodes, result)
+                self._write(conn, rows)
+                TableStatistics(conn, self.run_id).refresh(self.TABLE_NAME)
+        finally:
+            set_udf_cache(None)
+            udf_cache.close()
+        result.requests = self.client.requests_sent
+        result.failed_batches = self.client.failed_batches
+        result.elapsed_seconds = time.perf_counter() - start
+        return result
+
+    def _extract(self, conn: duckdb.DuckDBPyConnection) -> list[str]:
+        extract_sql = self.extract_file.read_text().strip().rstrip(";")
+        query = _DISTINCT_POSTCODES.format(extract_sql=extract_sql)
+        return [row[0] for row in conn.execute(query).fetchall()]
+
+    def _resolve(self, postcodes: list[str], result: EnrichmentResult) -> list[dict]:
+        cache = get_udf_cache()
+        keys = {postcode: postcode.replace(" ", "") for postcode in postcodes}
+        # Empty entries are misses cached by the UDF; look them up again
+        cached = {
+            key: value
+            for key, value in cache.get_many(*POSTCODES_IO_CACHE, list(keys.values())).items()
+            if value
+        }
+        result.cached = len(cached)
+
+        pending = [postcode for postcode, key in keys.items() if key not in cached]
+        fetched = asyncio.run(self.client.lookup(pending)) if pending else {}
+        cache.put_many(
+            *POSTCODES_IO_CACHE,
+            {keys[postcode]: value for postcode, value in fetched.items() if value and postcode in keys},
+        )
+
+        index = load_postcode_index(self.data_path)
+        rows: list[dict] = []
+        for postcode, key in keys.items():
+            remote = cached.get(key) or fetched.get(postcode)
+            if remote:
+                if postcode in fetched:
+                    result.remote += 1
+                rows.append(_remote_row(postcode, remote))
+                continue
+            offline = index.lookup(postcode)
+            if offline:
+                result.offline += 1
+                rows.append(_offline_row(postcode, offline))
+            else:
+                result.unresolved += 1
+        return rows
+
+    def _write(self, conn: duckdb.DuckDBPyConnection, rows: list[dict]) -> None:
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
+                postcode VARCHAR PRIMARY KEY,
+                outcode VARCHAR,
+                post_town VARCHAR,
+                admin_district VARCHAR,
+                admin_county VARCHAR,
+                region VARCHAR,
+                country VARCHAR,
+                latitude DOUBLE,
+                longitude DOUBLE,
+                source VARCHAR,
+                resolved_at TIMESTAMP
+            )
+            """
+        )
+        if not rows:
+            return
+        frame = pd.DataFrame(rows, columns=_COLUMNS)
+        conn.register("_enriched_postcodes", frame)
+        try:
+            conn.execute(
+                f"""
+                INSERT OR REPLACE INTO {self.TABLE_NAME}
+                SELECT {", ".join(_COLUMNS)}, current_timestamp FROM _enriched_postcodes
+                """
+            )
+        finally:
+            conn.unregister("_enriched_postcodes")
+
+
+_COLUMNS = [
+    "postcode",
+    "outcode",
+    "post_town",
+    "admin_district",
+    "admin_county",
+    "region",
+    "country",
+    "latitude",
+    "longitude",
+    "source",
+]
+
+
+def _remote_row(postcode: str, result: dict) -> dict:
+    return {
+        "postcode": postcode,
+        "outcode": result.get("outcode") or postcode.split(" ")[0],
+        "post_town": None,
+        "admin_district": result.get("admin_district"),
+        "admin_county": result.get("admin_county"),
+        "region": result.get("region"),
+        "country": result.get("country"),
+        "latitude": result.get("latitude"),
+        "longitude": result.get("longitude"),
+        "source": "postcodes.io",
+    }
+
+
+def _offline_row(postcode: str, result: dict) -> dict:
+    return {
+        "postcode": postcode,
+        "outcode": postcode.split(" ")[0],
+        "post_town": result.get("post_town"),
+        "admin_district": None,
+        "admin_county": result.get("admin_county"),
+        "region": result.get("region"),
+        "country": result.get("country"),
+        "latitude": None,
+        "longitude": None,
+        "source": "offline",
+    }
@@ -1,43 +1,267 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import duckdb
+
 from ..models import TransformResult
-from .db import open_connection
+from ..telemetry import peak_rss_bytes
+from ..writers.table_statistics import TableStatistics
+from .db import connection_scope
+from .dependency_graph import SqlDependencyGraph
 from .order_reader import OrderReader
+from .profiler import TransformProfiler
 from .sql_file_executor import SqlFileExecutor
+from .transform_state import TransformState
+from .udf.cache import UdfCache, set_udf_cache
 
 if TYPE_CHECKING:
+    from ..connection import ConnectionManager
     from ..reporting import PipelineReporter
 
 
 class SqlExecutor:
+    PROFILE_REPORT_LIMIT = 15
+
     def __init__(
         self,
         transform_path: Path,
         database_path: Path,
         reporter: "PipelineReporter | None" = None,
+        max_workers: int = 1,
+        incremental: bool = False,
+        select: list[str] | None = None,
+        profile: bool = False,
+        udf_cache_path: Path | None = None,
+        connections: "ConnectionManager | None" = None,
+        run_id: str | None = None,
     ):
         self.transform_path = Path(transform_path)
         self.database_path = Path(database_path)
         self.reporter = reporter
+        # max_workers > 1 switches to DAG mode: independent SQL files run
+        # concurrently, each on its own cursor of the shared connection.
+        self.max_workers = max_workers
+        # incremental skips files whose fingerprint matches the last build;
+        # select ("file" or "file+") runs only the named files (and their
+        # downstream files for "file+"). Both record state in transform_state.
+        self.incremental = incremental
+        self.select = select or []
+        # profile records per-statement timings and DuckDB query profiles
+        # in transform_profile and prints the slowest statements.
+        self.profile = profile
+        # UDF results persist in this SQLite file across runs; without it
+        # the cache only lives for one execute() call.
+        self.udf_cache_path = Path(udf_cache_path) if udf_cache_path else None
+        # A shared connection manager supplies an open connection with the
+        # UDFs already registered; without one execute() opens its own.
+        self.connections = connections
+        # Profiles are stored under this run id (the pipeline run's, when
+        # given) so they can be joined to pipeline_run_log. It is also
+        # recorded in table_statistics against tables whose content changes.
+        self.run_id = run_id
 
     def execute(self) -> list[TransformResult]:
         reader = OrderReader(self.transform_path)
         if not reader.exists():
             return []
         sql_files = reader.read()
+        with connection_scope(self.database_path, self.connections) as conn:
+            # The graph also names each file's output tables for table_statistics
+            graph = SqlDependencyGraph.build(conn, self.transform_path, sql_files)
+            statistics = TableStatistics(conn, self.run_id)
+            state = None
+            skipped: dict[int, str] = {}
+            if self.incremental or self.select:
+                state = TransformState(conn, self.transform_path, graph)
+                skipped = self._plan_skips(graph, state)
+            profiler = TransformProfiler(self.run_id) if self.profile else None
+            udf_cache = UdfCache(self.udf_cache_path)
+            set_udf_cache(udf_cache)
+            try:
+                if self.max_workers > 1:
+                    results = self._execute_parallel(conn, graph, state, skipped, profiler, statistics)
+                else:
+                    results = self._execute_sequential(conn, graph, state, skipped, profiler, statistics)
+                if profiler:
+                    profiler.write(conn)
+                    if self.reporter:
+                        self.reporter.print_transform_profile(
+                            profiler.ranked(self.PROFILE_REPORT_LIMIT),
+                            total_seconds=sum(p.elapsed_seconds for p in profiler.profiles),
+                        )
+                if self.reporter and udf_cache.stats:
+                    self.reporter.print_udf_cache_stats(udf_cache.stats)
+            finally:
+                set_udf_cache(None)
+                udf_cache.close()
+                if profiler:
+                    profiler.close()
+            return results
+
+    def _plan_skips(self, graph: SqlDependencyGraph, state: TransformState) -> dict[int, str]:
+        """Map the index of each file that will not run to the reason why."""
+        if self.select:
+            selected = graph.downstream_of(self._match_selected(graph, "+"))
+            selected |= self._match_selected(graph, "")
+            return {
+                node.index: "not selected"
+                for node in graph.nodes
+                if node.index not in selected
+            }
+        return {
+            node.index: "unchanged"
+            for node in graph.nodes
+            if state.is_unchanged(node.index)
+        }
+
+    def _match_selected(self, graph: SqlDependencyGraph, suffix: str) -> set[int]:
+        matched: set[int] = set()
+        for pattern in self.select:
+            if suffix and not pattern.endswith(suffix):
+                continue
+            name = pattern.removesuffix("+")
+            indices = {
+                node.index
+                for node in graph.nodes
+                if name in (node.sql_file, Path(node.sql_file).name, Path(node.sql_file).stem)
+            }
+            if not indices:
+                raise ValueError(f"--select pattern matches no order.txt entry: {pattern}")
+            matched |= indices
+        return matched
+
+    def _execute_sequential(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        graph: SqlDependencyGraph,
+        state: TransformState | None,
+        skipped: dict[int, str],
+        profiler: TransformProfiler | None,
+        statistics: TableStatistics,
+    ) -> list[TransformResult]:
         results: list[TransformResult] = []
-        with open_connection(self.database_path) as conn:
-            runner = SqlFileExecutor(self.transform_path, self.reporter)
-            for sql_file in sql_files:
+        runner = SqlFileExecutor(self.transform_path, self.reporter, profiler)
+        for node in graph.nodes:
+            index, sql_file = node.index, node.sql_file
+            if index in skipped:
+                result = self._skip(runner, conn, sql_file, skipped[index])
+            else:
+                start = time.perf_counter()
                 result = runner.run(conn, sql_file)
-                results.append(result)
-                if not result.success:
-                    if self.reporter:
-                        self.reporter.print_transform_abort_on_failure()
-                    break
+                result.elapsed_seconds = time.perf_counter() - start
+                result.peak_rss_bytes = peak_rss_bytes()
+                if result.success and state:
+                    state.record(index)
+            if result.success:
+                self._update_statistics(statistics, node.targets, result.skipped)
+            results.append(result)
+            if not result.success:
+                if self.reporter:
+                    self.reporter.print_transform_abort_on_failure()
+                break
         return results
 
+    def _execute_parallel(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        graph: SqlDependencyGraph,
+        state: TransformState | None,
+        skipped: dict[int, str],
+        profiler: TransformProfiler | None,
+        statistics: TableStatistics,
+    ) -> list[TransformResult]:
+        if self.reporter:
+            self.reporter.print_transform_dag(
+                file_count=len(graph.nodes),
+                critical_path=graph.critical_path_length(),
+                max_workers=self.max_workers,
+            )
+
+        # Per-statement output would interleave across threads, so files
+        # run silently and are reported as they complete.
+        runner = SqlFileExecutor(self.transform_path, profiler=profiler)
+        sql_files = [node.sql_file for node in graph.nodes]
+        pending = {node.index: set(node.depends_on) for node in graph.nodes}
+        running: dict[Future, int] = {}
+        results: dict[int, TransformResult] = {}
+        failed = False
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while True:
+                ready = [] if failed else sorted(i for i, deps in pending.items() if not deps)
+                for index in ready:
+                    del pending[index]
+                    if index in skipped:
+                        # Skipped files resolve immediately so their dependents become ready
+                        future = Future()
+                        future.set_result(
+                            (self._skip(runner, conn, sql_files[index], skipped[index]), 0.0)
+                        )
+                    else:
+                        future = pool.submit(self._run_on_cursor, runner, conn, sql_files[index])
+                    running[future] = index
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    result, elapsed = future.result()
+                    if not result.skipped:
+                        result.elapsed_seconds = elapsed
+                        result.peak_rss_bytes = peak_rss_bytes()
+                    results[index] = result
+                    if self.reporter and not result.skipped:
+                        self.reporter.print_sql_file_completed(result, elapsed)
+                    if result.success:
+                        if state and not result.skipped:
+                            state.record(index)
+                        self._update_statistics(statistics, graph.nodes[index].targets, result.skipped)
+                        for deps in pending.values():
+                            deps.discard(index)
+                    elif not failed:
+                        failed = True
+                        if self.reporter:
+                            self.reporter.print_transform_abort_on_failure()
+
+        return [results[i] for i in sorted(results)]
+
+    @staticmethod
+    def _update_statistics(statistics: TableStatistics, targets: set[str], skipped: bool) -> None:
+        # Rebuilt tables are rescanned once; tables left from an earlier run
+        # are only scanned if they have no statistics yet
+        for table_name in sorted(targets):
+            if skipped:
+                statistics.ensure(table_name)
+            else:
+                statistics.refresh(table_name)
+
+    def _skip(
+        self,
+        runner: SqlFileExecutor,
+        conn: duckdb.DuckDBPyConnection,
+        sql_file: str,
+        reason: str,
+    ) -> TransformResult:
+        if self.reporter:
+            self.reporter.print_sql_file_skipped(sql_file, reason)
+        return runner.replay_session(conn, sql_file)
+
+    @staticmethod
+    def _run_on_cursor(
+        runner: SqlFileExecutor,
+        conn: duckdb.DuckDBPyConnection,
+        sql_file: str,
+    ) -> tuple[TransformResult, float]:
+        start = time.perf_counter()
+        cursor = conn.cursor()
+        try:
+            result = runner.run(cursor, sql_file)
+        finally:
+            cursor.close()
+        return result, time.perf_counter() - start
+
     def get_sql_file_count(self) -> int:
         reader = OrderReader(self.transform_path)
         if not reader.exists():
@@ -0,0 +1,164 @@
+import datetime
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from ..loaders.excel_reader import ExcelReader
+from ..writers.table_statistics import TableStatistics
+from .db import connection_scope
+
+if TYPE_CHECKING:
+    from ..connection import ConnectionManager
+
+
+@dataclass
+class MasterSheetResult:
+    """A master workbook sheet available in the cache.
+
+    Attributes:
+        table_name: Cache table holding the sheet's rows.
+        sheet_name: Worksheet name in the master workbook.
+        row_count: Rows in the cache table.
+        reloaded: True if the sheet was read from the workbook, False if cached.
+    """
+    table_name: str
+    sheet_name: str
+    row_count: int
+    reloaded: bool
+
+
+class MasterWorkbookCache:
+    """Caches sheets of the master reference workbook as DuckDB tables.
+
+    A sheet is read from the workbook once and stored as master_<sheet>
+    (VARCHAR columns named with ExcelReader.clean_column_name). The
+    master_workbook_manifest table keys each cached sheet by the workbook's
+    SHA-256, header row and sheet name; the workbook is only re-hashed when
+    its size or modification time changes, and only re-read when the hash
+    does. Validations query the cache tables instead of parsing Excel.
+
+    Example usage:
+        cache = MasterWorkbookCache(master_path, database_path, connections=connections)
+        sheet = cache.sheet("Country States-Regions", header=2)
+        if sheet is not None:
+            conn.execute(f"SELECT country, instance FROM {sheet.table_name}")
+    """
+
+    MANIFEST_TABLE = "master_workbook_manifest"
+    TABLE_PREFIX = "master_"
+
+    def __init__(
+        self,
+        workbook_path: Path,
+        database_path: Path,
+        connections: "ConnectionManager | None" = None,
+        run_id: str | None = None,
+    ):
+        self.workbook_path = Path(workbook_path).expanduser()
+        self.database_path = Path(database_path)
+        self.connections = connections
+        self.run_id = run_id
+
+    @classmethod
+    def table_name(cls, sheet_name: str) -> str:
+        return cls.TABLE_PREFIX + ExcelReader.clean_column_name(sheet_name)
+
+    def sheet(self, sheet_name: str, header: int = 0) -> MasterSheetResult | None:
+        """Get a cached sheet, extracting it from the workbook if it changed.
+
+        Args:
+            sheet_name: Worksheet to cache.
+            header: Zero-based row holding the column headers (as pandas header=).
+
+        Returns:
+            MasterSheetResult, or None if the workbook does not exist or the
+            sheet cannot be read.
+        """
+        if not self.workbook_path.exists():
+            return None
+        table_name = self.table_name(sheet_name)
+        with connection_scope(self.database_path, self.connections) as conn:
+            self._ensure_manifest(conn)
+            stat = self.workbook_path.stat()
+            row = conn.execute(
+                f"SELECT file_size, file_mtime_ns, file_hash, header_row, row_count "
+                f"FROM {self.MANIFEST_TABLE} WHERE table_name = ? AND workbook_path = ?",
+                [table_name, str(self.workbook_path)],
+            ).fetchone()
+            if row is not None and (row[0], row[1]) == (stat.st_size, stat.st_mtime_ns):
+                file_hash = row[2]
+            else:
+                file_hash = self._hash_file(self.workbook_path)
+            table_exists = conn.execute(
+                "SELECT count(*) FROM duckdb_tables() WHERE table_name = ?", [table_name]
+            ).fetchone()[0]
+            if row is not None and table_exists and row[2] == file_hash and row[3] == header:
+                if (row[0], row[1]) != (stat.st_size, stat.st_mtime_ns):
+                    # Touched but unchanged: remember the new stat so it is not re-hashed
+                    conn.execute(
+                        f"UPDATE {self.MANIFEST_TABLE} SET file_size = ?, file_mtime_ns = ? WHERE table_name = ?",
+                        [stat.st_size, stat.st_mtime_ns, table_name],
+                    )
+                return MasterSheetResult(table_name, sheet_name, row[4], reloaded=False)
+
+            try:
+                df = pd.read_excel(
+                    str(self.workbook_path),
+                    sheet_name=sheet_name,
+                    header=header,
+                    dtype=str,
+                )
+            except Exception:
+                return None
+            df.columns = [ExcelReader.clean_column_name(c) for c in df.columns]
+            df = df.loc[:, ~df.columns.duplicated()]
+
+            conn.register("master_sheet_df", df)
+            try:
+                conn.execute(f'CREATE OR REPLACE TABLE "{table_name}" AS SELECT * FROM master_sheet_df')
+            finally:
+                conn.unregister("master_sheet_df")
+            TableStatistics(conn, self.run_id).refresh(table_name)
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.MANIFEST_TABLE} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    table_name,
+                    str(self.workbook_path),
+                    sheet_name,
+                    header,
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    file_hash,
+                    len(df),
+                    datetime.datetime.now(),
+                ],
+            )
+            return MasterSheetResult(table_name, sheet_name, len(df), reloaded=True)
+
+    def _ensure_manifest(self, conn) -> None:
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.MANIFEST_TABLE} (
+                table_name VARCHAR PRIMARY KEY,
+                workbook_path VARCHAR,
+                sheet_name VARCHAR,
+                header_row INTEGER,
+                file_size BIGINT,
+                file_mtime_ns BIGINT,
+                file_hash VARCHAR,
+                row_count BIGINT,
+                loaded_at TIMESTAMP
+            )
+            """
+        )
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
@@ -0,0 +1,312 @@
+"""Convert a plain-text pg_dump (such as the postcodes.io dump) to Parquet for DuckDB.
+
+The dump is memory-mapped and scanned once for its COPY sections; section
+bodies are skipped with a single search for their "\\." terminator rather
+than read line by line. Large sections are split at line boundaries into
+parts, and worker processes each read one part's byte range in blocks
+and write it to its own Parquet file, so memory per worker is bounded by
+the block size. A DuckDB load script then creates one table per section
+from the Parquet files.
+
+Usage:
+    python -m elt_ingest_excel.transform.pg_dump_converter \\
+        .tmp/postcodesio-2025-12-18-1017.sql config/transform/sql/ref/postcodes/data --prune
+"""
+
+import argparse
+import io
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Union
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+# Tables needed for postcode -> county/district/ward/town mapping
+POSTCODE_REF_TABLES = ("postcodes", "outcodes", "counties", "districts", "wards")
+
+# Columns kept by --prune. No SQL in the repo reads these tables (the
+# ref_post_code_*.sql tables are built from the refdata_* registry), so this
+# is a curated guess at what a postcode -> county/district/ward/town lookup
+# needs: location, country/region and the admin codes with their names.
+# Names missing from a dump are ignored.
+POSTCODE_REF_COLUMNS = {
+    "postcodes": [
+        "postcode", "pc_compact", "outcode", "incode", "eastings", "northings", "latitude", "longitude",
+        "country", "region", "admin_county_id", "admin_district_id", "admin_ward_id",
+    ],
+    "outcodes": [
+        "outcode", "eastings", "northings", "latitude", "longitude",
+        "country", "admin_county", "admin_district", "admin_ward",
+    ],
+    "counties": ["code", "name"],
+    "districts": ["code", "name"],
+    "wards": ["code", "name"],
+}
+
+# Sections larger than this are split into several Parquet parts
+PART_BYTES = 256 * 1024 * 1024
+# Bytes of COPY data parsed at a time by each worker
+BLOCK_BYTES = 32 * 1024 * 1024
+
+_COPY_HEADER = re.compile(rb"COPY (?:(\w+)\.)?(\w+) \((.*?)\) FROM stdin;")
+_COPY_END = b"\\.\n"
+_ESCAPE = re.compile(r"\\(?:([0-7]{1,3})|x([0-9A-Fa-f]{1,2})|(.))", re.DOTALL)
+_ESCAPES = {"b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v"}
+
+
+@dataclass
+class CopySection:
+    """One COPY ... FROM stdin block of a dump, as a byte range of its data rows."""
+
+    table: str
+    columns: list[str]
+    start: int
+    end: int
+
+
+@dataclass
+class ConversionResult:
+    """Outcome of converting a dump to Parquet."""
+
+    output_dir: str
+    load_script: str
+    row_counts: dict[str, int] = field(default_factory=dict)
+    parquet_files: dict[str, list[str]] = field(default_factory=dict)
+
+
+def scan_dump(dump_path: Union[str, Path]) -> list[CopySection]:
+    """Find every COPY section in a plain-text dump.
+
+    Args:
+        dump_path: Path to the .sql dump.
+
+    Returns:
+        The sections in dump order.
+    """
+    sections = []
+    with open(dump_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return sections
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = 0 if mm[:5] == b"COPY " else _next_copy(mm, 0)
+            while pos >= 0:
+                line_end = mm.find(b"\n", pos)
+                if line_end < 0:
+                    break
+                match = _COPY_HEADER.match(mm[pos:line_end])
+                if not match:
+                    pos = _next_copy(mm, line_end)
+                    continue
+                start = line_end + 1
+                if mm[start:start + len(_COPY_END)] == _COPY_END:
+                    end = start
+                else:
+                    end = mm.find(b"\n" + _COPY_END, start) + 1
+                    if end <= 0:
+                        raise ValueError(f"Unterminated COPY section for {match.group(2).decode()}")
+                columns = [c.strip().strip('"') for c in match.group(3).decode("utf-8").split(",")]
+                sections.append(CopySection(match.group(2).decode("utf-8"), columns, start, end))
+                pos = _next_copy(mm, end)
+    return sections
+
+
+def _next_copy(mm: mmap.mmap, start: int) -> int:
+    """Offset of the next line starting with "COPY ", or -1."""
+    index = mm.find(b"\nCOPY ", start)
+    return index + 1 if index >= 0 else -1
+
+
+def convert_dump(
+    dump_path: Union[str, Path],
+    output_dir: Union[str, Path],
+    tables: list[str] | None = None,
+    keep_columns: dict[str, list[str]] | None = None,
+    workers: int | None = None,
+    part_bytes: int = PART_BYTES,
+    block_bytes: int = BLOCK_BYTES,
+    load_script: Union[str, Path, None] = None,
+) -> ConversionResult:
+    """Convert a dump's COPY sections to Parquet and write a DuckDB load script.
+
+    Every column is written as a string, as the previous CSV conversion loaded
+    them; the ref_*.sql files cast what they use.
+
+    Args:
+        dump_path: Path to the plain-text pg_dump.
+        output_dir: Directory for <table>/part-NNNNN.parquet files.
+        tables: Tables to convert (default: every table with a COPY section).
+        keep_columns: Table -> columns to keep; other tables keep every column.
+        workers: Worker processes (default: CPU count); 1 converts in-process.
+        part_bytes: Sections larger than this are split into several parts.
+        block_bytes: Bytes of COPY data each worker parses at a time.
+        load_script: Path of the DuckDB load script (default: output_dir/load.duckdb.sql).
+
+    Returns:
+        ConversionResult with the row count and Parquet files of each table.
+    """
+    dump_path = Path(dump_path)
+    output_dir = Path(output_dir).resolve()
+    load_script = Path(load_script) if load_script else output_dir / "load.duckdb.sql"
+
+    sections = [s for s in scan_dump(dump_path) if tables is None or s.table in tables]
+    result = ConversionResult(output_dir=str(output_dir), load_script=str(load_script))
+    # (table, _convert_part arguments) per Parquet file
+    parts: list[tuple[str, tuple]] = []
+    for section in sections:
+        keep = None
+        if keep_columns and section.table in keep_columns:
+            keep = [c for c in section.columns if c in keep_columns[section.table]]
+        table_dir = output_dir / section.table
+        table_dir.mkdir(parents=True, exist_ok=True)
+        files = result.parquet_files.setdefault(section.table, [])
+        if not files:
+            for old in table_dir.glob("part-*.parquet"):
+                old.unlink()
+        for start, end in _split_section(dump_path, section, part_bytes):
+            target = str(table_dir / f"part-{len(files):05d}.parquet")
+            files.append(target)
+            parts.append((section.table, (str(dump_path), section.columns, keep, start, end, target, block_bytes)))
+
+    if workers == 1 or len(parts) <= 1:
+        counts = [_convert_part(*args) for _, args in parts]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            counts = list(executor.map(_convert_part, *zip(*(args for _, args in parts))))
+    for (table, _), count in zip(parts, counts):
+        result.row_counts[table] = result.row_counts.get(table, 0) + count
+
+    load_script.parent.mkdir(parents=True, exist_ok=True)
+    load_script.write_text(_load_script(output_dir, list(result.parquet_files)), encoding="utf-8")
+    return result
+
+
+def _split_section(dump_path: Path, section: CopySection, part_bytes: int) -> list[tuple[int, int]]:
+    """Byte ranges of at most about part_bytes each, ending on line boundaries."""
+    ranges = []
+    with open(dump_path, "rb") as f:
+        start = section.start
+        while True:
+            if section.end - start <= part_bytes:
+                ranges.append((start, section.end))
+                return ranges
+            f.seek(start + part_bytes)
+            cut = start + part_bytes + len(f.readline())
+            ranges.append((start, cut))
+            start = cut
+
+
+def _convert_part(
+    dump_path: str,
+    columns: list[str],
+    keep: list[str] | None,
+    start: int,
+    end: int,
+    target: str,
+    block_bytes: int,
+) -> int:
+    """Convert one byte range of COPY data to a Parquet file; return its row count."""
+    names = keep if keep is not None else columns
+    schema = pa.schema([(name, pa.string()) for name in names])
+    read_options = pa_csv.ReadOptions(column_names=columns, use_threads=False)
+    parse_options = pa_csv.ParseOptions(delimiter="\t", quote_char=False, escape_char=False)
+    convert_options = pa_csv.ConvertOptions(
+        column_types={name: pa.string() for name in columns},
+        null_values=["\\N"],
+        strings_can_be_null=True,
+        include_columns=names,
+    )
+
+    rows = 0
+    with open(dump_path, "rb") as f, pq.ParquetWriter(target, schema) as writer:
+        f.seek(start)
+        remaining, carry = end - start, b""
+        while remaining or carry:
+            block = f.read(min(block_bytes, remaining))
+            remaining -= len(block)
+            block = carry + block
+            cut = block.rfind(b"\n") + 1 if remaining else len(block)
+            block, carry = block[:cut], block[cut:]
+            if not block:
+                continue
+            batch = pa_csv.read_csv(io.BytesIO(block), read_options, parse_options, convert_options)
+            batch = pa.table([_unescape(batch.column(name)) for name in names], schema=schema)
+            writer.write_table(batch)
+            rows += batch.num_rows
+    return rows
+
+
+def _unescape(column: pa.ChunkedArray) -> pa.ChunkedArray:
+    """Decode COPY text-format backslash escapes; columns without any are returned as is."""
+    if not pc.any(pc.match_substring(column, "\\")).as_py():
+        return column
+    return pa.chunked_array(
+        [[None if value is None else _ESCAPE.sub(_unescape_match, value) for value in column.to_pylist()]],
+        type=pa.string(),
+    )
+
+
+def _unescape_match(match: re.Match) -> str:
+    octal, hexadecimal, char = match.groups()
+    if octal:
+        return chr(int(octal, 8))
+    if hexadecimal:
+        return chr(int(hexadecimal, 16))
+    return _ESCAPES.get(char, char)
+
+
+def _load_script(output_dir: Path, tables: list[str]) -> str:
+    lines = ["-- DuckDB load script generated by elt_ingest_excel.transform.pg_dump_converter", ""]
+    for table in tables:
+        files = (output_dir / table / "part-*.parquet").as_posix().replace("'", "''")
+        lines.append(f"DROP TABLE IF EXISTS {table};")
+        lines.append(f"CREATE TABLE {table} AS SELECT * FROM read_parquet('{files}');")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point: convert a dump to Parquet and a DuckDB load script."""
+    parser = argparse.ArgumentParser(description="Convert a plain-text pg_dump to Parquet files for DuckDB")
+    parser.add_argument("dump", help="Plain-text .sql dump (e.g. the postcodes.io dump)")
+    parser.add_argument("output_dir", help="Directory for the Parquet files")
+    parser.add_argument(
+        "--tables",
+        nargs="+",
+        help=f"Tables to convert (default: {' '.join(POSTCODE_REF_TABLES)})",
+    )
+    parser.add_argument("--all-tables", action="store_true", help="Convert every table in the dump")
+    parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="Keep only a curated guess at the postcode lookup columns (see POSTCODE_REF_COLUMNS)",
+    )
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--part-mb", type=int, default=PART_BYTES // 2**20, help="Split sections into parts of this size")
+    parser.add_argument("--load-script", help="Path of the DuckDB load script (default: <output_dir>/load.duckdb.sql)")
+    args = parser.parse_args(argv)
+
+    tables = None if args.all_tables else (args.tables or list(POSTCODE_REF_TABLES))
+    result = convert_dump(
+        args.dump,
+        args.output_dir,
+        tables=tables,
+        keep_columns=POSTCODE_REF_COLUMNS if args.prune else None,
+        workers=args.workers,
+        part_bytes=args.part_mb * 2**20,
+        load_script=args.load_script,
+    )
+    for table, rows in result.row_counts.items():
+        print(f"  {table}: {rows:,} rows in {len(result.parquet_files[table])} Parquet file(s)")
+    print(f"Conversion complete. Parquet in {result.output_dir}. SQL: {result.load_script}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,182 @@
+import json
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+import duckdb
+
+# Statement types whose result is a single row count
+_COUNT_STATEMENTS = {
+    duckdb.StatementType.INSERT,
+    duckdb.StatementType.UPDATE,
+    duckdb.StatementType.DELETE,
+    duckdb.StatementType.CREATE,
+}
+
+
+@dataclass
+class StatementProfile:
+    """Measurements for one executed transform SQL statement.
+
+    Attributes:
+        sql_file: SQL file the statement belongs to.
+        statement_index: Position of the statement in the file (1-indexed).
+        statement_type: DuckDB statement type (e.g. CREATE, INSERT).
+        query: Statement text.
+        elapsed_seconds: Wall-clock time spent executing the statement.
+        rows: Rows written (CREATE AS, INSERT, UPDATE, DELETE) or returned.
+        peak_buffer_memory: Peak DuckDB buffer memory in bytes, if profiled.
+        hottest_operator: Operator with the largest own time, with its detail.
+        hottest_operator_seconds: Own time of the hottest operator.
+        profile: DuckDB JSON query profile.
+    """
+    sql_file: str
+    statement_index: int
+    statement_type: str
+    query: str
+    elapsed_seconds: float
+    rows: int | None = None
+    peak_buffer_memory: int | None = None
+    hottest_operator: str | None = None
+    hottest_operator_seconds: float | None = None
+    profile: dict | None = None
+
+
+class TransformProfiler:
+    """Collects per-statement profiles of transform SQL and stores them in DuckDB.
+
+    Each SQL file run attaches the profiler to its connection (or cursor),
+    pointing DuckDB's JSON profiler at a scratch file of its own that is
+    read back after every statement. Profiles are kept in memory until
+    write() stores them in the transform_profile table under the run id.
+    """
+
+    TABLE_NAME = "transform_profile"
+
+    def __init__(self, run_id: str | None = None):
+        self.run_id = run_id or uuid.uuid4().hex
+        self.profiles: list[StatementProfile] = []
+        self._lock = threading.Lock()
+        self._scratch = tempfile.TemporaryDirectory(prefix="transform_profile_")
+        self._attached = 0
+
+    def attach(self, conn: duckdb.DuckDBPyConnection) -> Path:
+        """Enable JSON profiling on conn; returns the file profiles are written to."""
+        with self._lock:
+            self._attached += 1
+            output = Path(self._scratch.name) / f"{self._attached}.json"
+        conn.execute("PRAGMA enable_profiling = 'json'")
+        conn.execute(f"SET profiling_output = '{output.as_posix()}'")
+        return output
+
+    def execute(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        output: Path,
+        sql_file: str,
+        statement_index: int,
+        statement: duckdb.Statement,
+    ) -> None:
+        """Execute a statement on an attached conn and record its profile."""
+        output.unlink(missing_ok=True)
+
+        start = time.perf_counter()
+        conn.execute(statement)
+        rows = None
+        if statement.type in _COUNT_STATEMENTS and conn.description:
+            row = conn.fetchone()
+            rows = row[0] if row else None
+        elapsed = time.perf_counter() - start
+
+        profile = json.loads(output.read_text()) if output.exists() else None
+        result = StatementProfile(
+            sql_file=sql_file,
+            statement_index=statement_index,
+            statement_type=statement.type.name,
+            query=statement.query.strip(),
+            elapsed_seconds=elapsed,
+            rows=rows,
+            profile=profile,
+        )
+        if profile:
+            if result.rows is None:
+                result.rows = profile.get("rows_returned")
+            result.peak_buffer_memory = profile.get("system_peak_buffer_memory")
+            hottest = max(_operators(profile), key=lambda op: op.get("operator_timing", 0), default=None)
+            if hottest:
+                result.hottest_operator = _describe_operator(hottest)
+                result.hottest_operator_seconds = hottest.get("operator_timing")
+        with self._lock:
+            self.profiles.append(result)
+
+    def ranked(self, limit: int | None = None) -> list[StatementProfile]:
+        """Return profiles ordered by elapsed time, slowest first."""
+        ranked = sorted(self.profiles, key=lambda p: p.elapsed_seconds, reverse=True)
+        return ranked[:limit] if limit else ranked
+
+    def write(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Store the collected profiles in the transform_profile table."""
+        conn.execute("PRAGMA disable_profiling")
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
+                run_id VARCHAR,
+                sql_file VARCHAR,
+                statement_index INTEGER,
+                statement_type VARCHAR,
+                query VARCHAR,
+                elapsed_seconds DOUBLE,
+                row_count BIGINT,
+                peak_buffer_memory BIGINT,
+                hottest_operator VARCHAR,
+                hottest_operator_seconds DOUBLE,
+                profile JSON,
+                profiled_at TIMESTAMP DEFAULT current_timestamp
+            )
+            """
+        )
+        if not self.profiles:
+            return
+        conn.executemany(
+            f"INSERT INTO {self.TABLE_NAME} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, current_timestamp)",
+            [
+                [
+                    self.run_id,
+                    p.sql_file,
+                    p.statement_index,
+                    p.statement_type,
+                    p.query,
+                    p.elapsed_seconds,
+                    p.rows,
+                    p.peak_buffer_memory,
+                    p.hottest_operator,
+                    p.hottest_operator_seconds,
+                    json.dumps(p.profile) if p.profile else None,
+                ]
+                for p in self.profiles
+            ],
+        )
+
+    def close(self) -> None:
+        self._scratch.cleanup()
+
+
+def _operators(node: dict):
+    for child in node.get("children", []):
+        yield child
+        yield from _operators(child)
+
+
+def _describe_operator(operator: dict) -> str:
+    name = (operator.get("operator_name") or operator.get("operator_type") or "").strip()
+    extra = operator.get("extra_info") or {}
+    detail = extra.get("Function") or extra.get("Table") or extra.get("Projections")
+    if isinstance(detail, list):
+        detail = ", ".join(detail)
+    if detail:
+        detail = str(detail)
+        return f"{name} [{detail[:80]}{'...' if len(detail) > 80 else ''}]"
+    return name
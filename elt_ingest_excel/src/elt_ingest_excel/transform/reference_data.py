@@ -0,0 +1,169 @@
+import datetime
+import hashlib
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import duckdb
+
+from ..writers.table_statistics import TableStatistics
+from .db import connection_scope
+
+if TYPE_CHECKING:
+    from ..connection import ConnectionManager
+
+# Bump when the way files are read changes, so every table reloads once.
+LOADER_VERSION = "1"
+
+TABLE_PREFIX = "refdata_"
+SOURCE_SUFFIXES = (".json", ".csv")
+
+
+@dataclass
+class ReferenceTableResult:
+    """Outcome of registering one reference data file.
+
+    Attributes:
+        table_name: Registry table holding the file's rows.
+        source_file: Reference data file name.
+        row_count: Rows in the registry table.
+        reloaded: True if the file was (re)loaded, False if its hash was unchanged.
+        elapsed_seconds: Wall-clock time spent on the file.
+    """
+    table_name: str
+    source_file: str
+    row_count: int
+    reloaded: bool
+    elapsed_seconds: float = 0.0
+
+
+def registry_table_name(path: Path) -> str:
+    """Registry table for a reference data file.
+
+    ref_country.json becomes refdata_country. A CSV sharing its name with a
+    JSON file (ref_post_code_county.csv/.json) gets a _csv suffix.
+    """
+    name = TABLE_PREFIX + path.stem.removeprefix("ref_")
+    if path.suffix.lower() == ".csv" and path.with_suffix(".json").exists():
+        name += "_csv"
+    return name
+
+
+class ReferenceDataRegistry:
+    """Materialises reference data files into persistent DuckDB tables.
+
+    Every *.json and *.csv file in the data directory is stored as a
+    refdata_* table (JSON with the types read_json_auto infers, CSV as
+    VARCHAR columns under its header names). The reference_data_manifest
+    table records each file's content hash; a file is only re-read when
+    its hash changes, so the ref_*.sql transforms read tables instead of
+    re-parsing the files on every run.
+    """
+
+    MANIFEST_TABLE = "reference_data_manifest"
+
+    def __init__(
+        self,
+        data_path: Path,
+        database_path: Path,
+        connections: "ConnectionManager | None" = None,
+        run_id: str | None = None,
+    ):
+        self.data_path = Path(data_path)
+        self.database_path = Path(database_path)
+        self.connections = connections
+        self.run_id = run_id
+
+    def source_files(self) -> list[Path]:
+        if not self.data_path.is_dir():
+            return []
+        return sorted(
+            path for path in self.data_path.iterdir()
+            if path.is_file() and path.suffix.lower() in SOURCE_SUFFIXES
+        )
+
+    def load(self) -> list[ReferenceTableResult]:
+        """Register every reference data file, reloading only changed ones."""
+        files = self.source_files()
+        if not files:
+            return []
+        with connection_scope(self.database_path, self.connections) as conn:
+            self._ensure_manifest(conn)
+            manifest = {
+                table_name: source_hash
+                for table_name, source_hash in conn.execute(
+                    f"SELECT table_name, source_hash FROM {self.MANIFEST_TABLE}"
+                ).fetchall()
+            }
+            existing = {row[0] for row in conn.execute("SELECT table_name FROM duckdb_tables()").fetchall()}
+            return [self._register(conn, path, manifest, existing) for path in files]
+
+    def _ensure_manifest(self, conn: duckdb.DuckDBPyConnection) -> None:
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.MANIFEST_TABLE} (
+                table_name VARCHAR PRIMARY KEY,
+                source_file VARCHAR,
+                source_hash VARCHAR,
+                row_count BIGINT,
+                loaded_at TIMESTAMP
+            )
+            """
+        )
+
+    def _register(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        path: Path,
+        manifest: dict[str, str],
+        existing: set[str],
+    ) -> ReferenceTableResult:
+        start = time.perf_counter()
+        table_name = registry_table_name(path)
+        source_hash = self.file_hash(path)
+        if manifest.get(table_name) == source_hash and table_name in existing:
+            row_count = conn.execute(f'SELECT count(*) FROM "{table_name}"').fetchone()[0]
+            return ReferenceTableResult(
+                table_name=table_name,
+                source_file=path.name,
+                row_count=row_count,
+                reloaded=False,
+                elapsed_seconds=time.perf_counter() - start,
+            )
+
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            conn.execute(f'CREATE OR REPLACE TABLE "{table_name}" AS SELECT * FROM {self._reader(path)}')
+            row_count = conn.execute(f'SELECT count(*) FROM "{table_name}"').fetchone()[0]
+            conn.execute(
+                f"INSERT OR REPLACE INTO {self.MANIFEST_TABLE} VALUES (?, ?, ?, ?, ?)",
+                [table_name, path.name, source_hash, row_count, datetime.datetime.now()],
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        TableStatistics(conn, self.run_id).refresh(table_name)
+        return ReferenceTableResult(
+            table_name=table_name,
+            source_file=path.name,
+            row_count=row_count,
+            reloaded=True,
+            elapsed_seconds=time.perf_counter() - start,
+        )
+
+    @staticmethod
+    def _reader(path: Path) -> str:
+        literal = "'" + str(path).replace("'", "''") + "'"
+        if path.suffix.lower() == ".csv":
+            return f"read_csv({literal}, header = true, all_varchar = true)"
+        return f"read_json_auto({literal})"
+
+    @staticmethod
+    def file_hash(path: Path) -> str:
+        digest = hashlib.sha256(LOADER_VERSION.encode("utf-8"))
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
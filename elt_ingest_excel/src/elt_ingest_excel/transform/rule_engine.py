@@ -0,0 +1,237 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import duckdb
+
+from ..models.validation_rules import RuleKind, TableRuleSet, ValidationRule, ValidationRuleConfig
+from ..writers.table_statistics import TableStatistics
+from .db import connection_scope
+
+if TYPE_CHECKING:
+    from ..connection import ConnectionManager
+
+
+@dataclass
+class RuleSetResult:
+    """Outcome of validating one table.
+
+    Attributes:
+        table_name: Table validated.
+        sheet_name: Sheet name the issues are reported under.
+        issues_table: Table the issues were written to.
+        rule_count: Rules evaluated.
+        issues: Issue rows written.
+        elapsed_seconds: Wall-clock time of the fused query.
+        success: Whether the query succeeded.
+        error: Error message if it failed.
+    """
+    table_name: str
+    sheet_name: str
+    issues_table: str
+    rule_count: int
+    issues: int = 0
+    elapsed_seconds: float = 0.0
+    success: bool = True
+    error: str | None = None
+
+
+def _ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _literal(value: str | None) -> str:
+    if value is None:
+        return "NULL"
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _text(expr: str) -> str:
+    return f"CAST({expr} AS VARCHAR)"
+
+
+def _blank(expr: str) -> str:
+    return f"NULLIF(TRIM({_text(expr)}), '') IS NULL"
+
+
+def _in_list(expr: str, values: list[str]) -> str:
+    return f"{_text(expr)} IN ({', '.join(_literal(v) for v in values)})"
+
+
+def _rule_condition(rule: ValidationRule, index: int) -> tuple[str, str]:
+    """SQL condition flagging a row, and the issue detail expression."""
+    col = f"src.{_ident(rule.column)}"
+    if rule.kind == RuleKind.UNIQUE:
+        return f"{col} IS NOT NULL AND src.__rule_{index} > 1", _text(col)
+    if rule.kind == RuleKind.NOT_NULL:
+        return _blank(col), "NULL"
+    if rule.kind == RuleKind.FOREIGN_KEY:
+        condition = f"src.__rule_{index}"
+        if rule.ignore_blank:
+            condition = f"NOT {_blank(col)} AND {condition}"
+        return condition, _text(col)
+    if rule.kind == RuleKind.ALLOWED_VALUES:
+        return f"NOT {_blank(col)} AND NOT {_in_list(col, rule.values)}", _text(col)
+    if rule.kind == RuleKind.REGEX:
+        return f"NOT {_blank(col)} AND NOT regexp_matches({_text(col)}, {_literal(rule.pattern)})", _text(col)
+    if rule.kind == RuleKind.REQUIRED_IF:
+        trigger = f"src.{_ident(rule.when_column)}"
+        when = _in_list(trigger, rule.values) if rule.values else f"NOT {_blank(trigger)}"
+        return f"{when} AND {_blank(col)}", _text(trigger)
+    raise ValueError(f"Unsupported rule kind: {rule.kind}")
+
+
+def compile_rule_set(rule_set: TableRuleSet) -> str:
+    """Compile every rule of a table into one query returning its issue rows.
+
+    The table is scanned once: uniqueness counts are window aggregates and
+    foreign keys are left joins to the distinct referenced values, computed
+    alongside the source columns. Each row then yields a list with one
+    issue struct per failed rule, which is unnested into issue rows
+    (sheet, rule_type, col, <key>, detail, message).
+    """
+    helpers: list[str] = []
+    joins: list[str] = []
+    issues: list[str] = []
+    for index, rule in enumerate(rule_set.rules, 1):
+        col = f"t.{_ident(rule.column)}"
+        if rule.kind == RuleKind.UNIQUE:
+            helpers.append(f"count(*) OVER (PARTITION BY {col}) AS __rule_{index}")
+        elif rule.kind == RuleKind.FOREIGN_KEY:
+            alias = f"__ref_{index}"
+            joins.append(
+                f"LEFT JOIN (SELECT DISTINCT {_ident(rule.ref_column)} AS value "
+                f"FROM {_ident(rule.ref_table)}) {alias} ON {alias}.value = {col}"
+            )
+            helpers.append(f"{alias}.value IS NULL AS __rule_{index}")
+        condition, detail = _rule_condition(rule, index)
+        issues.append(
+            f"CASE WHEN {condition} THEN {{"
+            f"'rule_type': {_literal(rule.rule_type)}, "
+            f"'col': {_literal(rule.column)}, "
+            f"'detail': {detail}, "
+            f"'message': {_literal(rule.message)}"
+            f"}} END"
+        )
+
+    select_list = ", ".join(["t.*", *helpers])
+    join_sql = "".join(f"\n    {join}" for join in joins)
+    issue_list = ",\n             ".join(issues)
+    key = _ident(rule_set.key_column)
+    return f"""
+SELECT {_literal(rule_set.sheet_name)} AS sheet,
+       issue.rule_type,
+       issue.col,
+       {_text("src." + key)} AS {key},
+       issue.detail,
+       issue.message
+  FROM (
+    SELECT {select_list}
+      FROM {_ident(rule_set.table_name)} t{join_sql}
+  ) src,
+  LATERAL (
+    SELECT unnest([
+             {issue_list}
+           ]) AS issue
+  )
+ WHERE issue IS NOT NULL
+"""
+
+
+class RuleEngine:
+    """Evaluates declarative validation rules with one query per table.
+
+    Each table's rules run as a single fused query (see compile_rule_set)
+    whose issue rows are inserted into the rule set's issues table. Tables
+    are validated concurrently, each on its own cursor of the connection.
+    """
+
+    DEFAULT_WORKERS = 4
+
+    def __init__(
+        self,
+        config: ValidationRuleConfig,
+        database_path: Path,
+        max_workers: int = DEFAULT_WORKERS,
+        connections: "ConnectionManager | None" = None,
+        run_id: str | None = None,
+    ):
+        self.config = config
+        self.database_path = Path(database_path)
+        self.max_workers = max(1, max_workers)
+        # A shared connection manager supplies an open connection; without
+        # one execute() opens its own.
+        self.connections = connections
+        # Recorded in table_statistics against issues tables whose content changes
+        self.run_id = run_id
+
+    def execute(self) -> list[RuleSetResult]:
+        with connection_scope(self.database_path, self.connections) as conn:
+            self._prepare_issue_tables(conn)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                results = list(pool.map(lambda rule_set: self._run_rule_set(conn, rule_set), self.config.tables))
+            # Rescan each issues table once, so publishers counting its rows
+            # from table_statistics see this run's issues
+            statistics = TableStatistics(conn, self.run_id)
+            for issues_table in dict.fromkeys(rule_set.issues_table for rule_set in self.config.tables):
+                statistics.refresh(issues_table)
+            return results
+
+    def _prepare_issue_tables(self, conn: duckdb.DuckDBPyConnection) -> None:
+        """Create the issues tables and clear the earlier issues of the rules being run.
+
+        Only rows matching a rule's (sheet, rule_type, col) are deleted, so
+        issues written to the same table by validation SQL (e.g. ONE_PRIMARY)
+        are kept.
+        """
+        tables: dict[str, tuple[str, set[tuple[str, str, str]]]] = {}
+        for rule_set in self.config.tables:
+            _, produced = tables.setdefault(rule_set.issues_table, (rule_set.key_column, set()))
+            produced.update((rule_set.sheet_name, rule.rule_type, rule.column) for rule in rule_set.rules)
+        for issues_table, (key_column, produced) in tables.items():
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {_ident(issues_table)} (
+                    sheet VARCHAR,
+                    rule_type VARCHAR,
+                    col VARCHAR,
+                    {_ident(key_column)} VARCHAR,
+                    detail VARCHAR,
+                    message VARCHAR
+                )
+                """
+            )
+            if not produced:
+                continue
+            keys = sorted(produced)
+            conn.execute(
+                f"DELETE FROM {_ident(issues_table)} AS t WHERE EXISTS ("
+                f"SELECT 1 FROM (VALUES {', '.join(['(?, ?, ?)'] * len(keys))}) AS r(sheet, rule_type, col) "
+                "WHERE r.sheet = t.sheet AND r.rule_type = t.rule_type AND r.col = t.col)",
+                [value for key in keys for value in key],
+            )
+
+    @staticmethod
+    def _run_rule_set(conn: duckdb.DuckDBPyConnection, rule_set: TableRuleSet) -> RuleSetResult:
+        result = RuleSetResult(
+            table_name=rule_set.table_name,
+            sheet_name=rule_set.sheet_name,
+            issues_table=rule_set.issues_table,
+            rule_count=len(rule_set.rules),
+        )
+        start = time.perf_counter()
+        cursor = conn.cursor()
+        try:
+            row = cursor.execute(
+                f"INSERT INTO {_ident(rule_set.issues_table)} {compile_rule_set(rule_set)}"
+            ).fetchone()
+            result.issues = row[0] if row else 0
+        except duckdb.Error as e:
+            result.success = False
+            result.error = str(e)
+        finally:
+            cursor.close()
+            result.elapsed_seconds = time.perf_counter() - start
+        return result
@@ -4,13 +4,20 @@ from typing import TYPE_CHECKING
 import duckdb
 
 from ..models import TransformResult
+from .dependency_graph import is_catalog_statement
 
 if TYPE_CHECKING:
     from ..reporting import PipelineReporter
+    from .profiler import TransformProfiler
 
 
 class SqlFileExecutor:
-    def __init__(self, transform_path: Path, reporter: "PipelineReporter | None" = None):
+    def __init__(
+        self,
+        transform_path: Path,
+        reporter: "PipelineReporter | None" = None,
+        profiler: "TransformProfiler | None" = None,
+    ):
         self.transform_path = Path(transform_path).resolve()
         shared_ref = self.transform_path.parent.parent / "ref"
         shared_macro = self.transform_path.parent.parent / "macro"
@@ -20,6 +27,7 @@ class SqlFileExecutor:
         if shared_macro.exists():
             self.allowed_paths.append(shared_macro.resolve())
         self.reporter = reporter
+        self.profiler = profiler
 
     def run(
         self,
@@ -45,9 +53,13 @@ class SqlFileExecutor:
         try:
             sql_content = sql_path.read_text()
             statements = conn.extract_statements(sql_content)
+            profile_output = self.profiler.attach(conn) if self.profiler else None
             for i, statement in enumerate(statements, 1):
                 try:
-                    conn.execute(statement)
+                    if self.profiler:
+                        self.profiler.execute(conn, profile_output, sql_file, i, statement)
+                    else:
+                        conn.execute(statement)
                 except duckdb.Error as e:
                     msg = f"Statement {i} failed: {e}"
                     if self.reporter:
@@ -63,3 +75,26 @@ class SqlFileExecutor:
             if self.reporter:
                 self.reporter.print_sql_file_error(error)
             return TransformResult(sql_file=sql_file, success=False, error=error)
+
+    def replay_session(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        sql_file: str,
+    ) -> TransformResult:
+        """Run only the session statements (LOAD, SET, ...) of a skipped file.
+
+        Later files may rely on extensions or settings a skipped file sets up,
+        so those statements still run; table-building statements do not.
+        """
+        sql_path = (self.transform_path / sql_file).resolve()
+        try:
+            statements = conn.extract_statements(sql_path.read_text())
+            for statement in statements:
+                if not is_catalog_statement(statement):
+                    conn.execute(statement)
+        except (OSError, duckdb.Error) as e:
+            error = str(e)
+            if self.reporter:
+                self.reporter.print_sql_file_error(error)
+            return TransformResult(sql_file=sql_file, success=False, error=error)
+        return TransformResult(sql_file=sql_file, success=True, skipped=True)
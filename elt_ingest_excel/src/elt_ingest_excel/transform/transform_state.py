@@ -0,0 +1,185 @@
+import hashlib
+import json
+import re
+from collections import Counter
+from pathlib import Path
+
+import duckdb
+
+from .dependency_graph import SqlDependencyGraph, SqlFileNode
+from .udf import udf_versions
+
+_STRING = re.compile(r"'((?:[^']|'')*)'")
+
+
+class TransformState:
+    """Fingerprints of the last successful build of each order.txt entry.
+
+    A file's fingerprint covers its SQL text, the data files it reads, the
+    versions of the UDFs it calls and the version of every upstream object.
+    Objects built earlier in the same order.txt are versioned by their
+    producer's fingerprint; anything else (ingested tables, tables from
+    other pipelines) by a row-count and content checksum. A file can be
+    skipped when its fingerprint matches the last build and the objects it
+    left behind still exist.
+    """
+
+    TABLE_NAME = "transform_state"
+
+    def __init__(
+        self,
+        connection: duckdb.DuckDBPyConnection,
+        transform_path: Path,
+        graph: SqlDependencyGraph,
+    ):
+        self.connection = connection
+        self.transform_path = Path(transform_path).resolve()
+        self.graph = graph
+        self.connection.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
+                transform_path VARCHAR,
+                sql_file VARCHAR,
+                occurrence INTEGER,
+                fingerprint VARCHAR,
+                outputs VARCHAR[],
+                built_at TIMESTAMP DEFAULT current_timestamp,
+                PRIMARY KEY (transform_path, sql_file, occurrence)
+            )
+            """
+        )
+        # A file listed twice in order.txt is tracked once per occurrence
+        seen: Counter[str] = Counter()
+        self.occurrences: dict[int, int] = {}
+        for node in graph.nodes:
+            self.occurrences[node.index] = seen[node.sql_file]
+            seen[node.sql_file] += 1
+        self.fingerprints = self._fingerprint_all()
+
+    def is_unchanged(self, index: int) -> bool:
+        node = self.graph.nodes[index]
+        fingerprint = self.fingerprints[index]
+        if fingerprint is None:
+            return False
+        row = self.connection.execute(
+            f"SELECT fingerprint, outputs FROM {self.TABLE_NAME} "
+            "WHERE transform_path = ? AND sql_file = ? AND occurrence = ?",
+            [str(self.transform_path), node.sql_file, self.occurrences[index]],
+        ).fetchone()
+        if not row or row[0] != fingerprint:
+            return False
+        return set(row[1]) <= self._existing_objects()
+
+    def record(self, index: int) -> None:
+        node = self.graph.nodes[index]
+        fingerprint = self.fingerprints[index]
+        if fingerprint is None:
+            return
+        outputs = sorted(node.targets & self._existing_objects())
+        self.connection.execute(
+            f"INSERT OR REPLACE INTO {self.TABLE_NAME} "
+            "(transform_path, sql_file, occurrence, fingerprint, outputs, built_at) "
+            "VALUES (?, ?, ?, ?, ?, current_timestamp)",
+            [
+                str(self.transform_path),
+                node.sql_file,
+                self.occurrences[index],
+                fingerprint,
+                outputs,
+            ],
+        )
+
+    def _fingerprint_all(self) -> dict[int, str | None]:
+        # None marks files that cannot be read (and everything downstream of them)
+        udfs = udf_versions()
+        catalog = self._catalog_objects()
+        fingerprints: dict[int, str | None] = {}
+        producers: dict[str, int] = {}
+        for node in self.graph.nodes:
+            fingerprints[node.index] = self._fingerprint_node(
+                node, udfs, catalog, producers, fingerprints
+            )
+            for target in node.targets:
+                producers[target] = node.index
+        return fingerprints
+
+    def _fingerprint_node(
+        self,
+        node: SqlFileNode,
+        udfs: dict[str, str],
+        catalog: dict[str, str | None],
+        producers: dict[str, int],
+        fingerprints: dict[int, str | None],
+    ) -> str | None:
+        try:
+            sql = (self.transform_path / node.sql_file).read_text()
+        except OSError:
+            return None
+
+        upstream: dict[str, str | None] = {}
+        for name in sorted(node.sources):
+            if name in producers:
+                upstream[name] = fingerprints[producers[name]]
+            elif name in udfs:
+                upstream[name] = udfs[name]
+            elif name in catalog:
+                upstream[name] = self._external_version(name, catalog)
+        if None in upstream.values():
+            return None
+
+        payload = json.dumps(
+            {
+                "sql": hashlib.sha256(sql.encode("utf-8")).hexdigest(),
+                "upstream": upstream,
+                "files": self._data_file_versions(sql),
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _catalog_objects(self) -> dict[str, str | None]:
+        # Views are versioned by their definition; table checksums are only
+        # computed for the tables a file actually reads (see _external_version).
+        objects: dict[str, str | None] = {}
+        for name, in self.connection.execute(
+            "SELECT table_name FROM duckdb_tables()"
+        ).fetchall():
+            objects[name.lower()] = None
+        for name, view_sql in self.connection.execute(
+            "SELECT view_name, sql FROM duckdb_views() WHERE NOT internal"
+        ).fetchall():
+            objects[name.lower()] = hashlib.sha256(view_sql.encode("utf-8")).hexdigest()
+        return objects
+
+    def _external_version(self, name: str, catalog: dict[str, str | None]) -> str:
+        if catalog[name] is None:
+            count, checksum = self.connection.execute(
+                f'SELECT count(*), sum(hash(t))::VARCHAR FROM "{name}" AS t'
+            ).fetchone()
+            catalog[name] = f"{count}:{checksum}"
+        return catalog[name]
+
+    def _existing_objects(self) -> set[str]:
+        rows = self.connection.execute(
+            """
+            SELECT table_name FROM duckdb_tables()
+            UNION ALL SELECT view_name FROM duckdb_views() WHERE NOT internal
+            UNION ALL SELECT function_name FROM duckdb_functions()
+             WHERE function_type IN ('macro', 'table_macro') AND NOT internal
+            """
+        ).fetchall()
+        return {row[0].lower() for row in rows}
+
+    @staticmethod
+    def _data_file_versions(sql: str) -> dict[str, list[int]]:
+        # String literals naming existing files (read_json_auto('...'), read_csv(...))
+        files: dict[str, list[int]] = {}
+        for match in _STRING.finditer(sql):
+            literal = match.group(1).replace("''", "'")
+            if "/" not in literal and "\\" not in literal:
+                continue
+            path = Path(literal).expanduser()
+            if path.is_file():
+                stat = path.stat()
+                files[literal] = [stat.st_size, stat.st_mtime_ns]
+        return files
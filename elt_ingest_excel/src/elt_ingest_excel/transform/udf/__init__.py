@@ -8,3 +8,9 @@ def register_all(conn: "duckdb.DuckDBPyConnection") -> None:
     from . import phone
 
     phone.register(conn)
+
+
+def udf_versions() -> dict[str, str]:
+    from . import phone
+
+    return {name: phone.UDF_VERSION for name in phone.UDF_NAMES}
@@ -1,9 +1,12 @@
+from pathlib import Path
 from typing import TYPE_CHECKING
 import re
 import duckdb
-import requests
 from duckdb.typing import VARCHAR
 
+from .cache import get_udf_cache
+from .postcode_index import DEFAULT_DATA_PATH, load_postcode_index
+
 if TYPE_CHECKING:
     import duckdb as duckdb_types
 
@@ -17,9 +20,13 @@ _PAT_FR = re.compile(r"\b\d{5}\b")
 _PAT_NL = re.compile(r"\b\d{4}\s?[A-Z]{2}\b", re.IGNORECASE)
 _PAT_IE = re.compile(r"\b[A-Z][0-9][A-Z0-9]\s?[A-Z0-9]{4}\b", re.IGNORECASE)
 
-_CACHE_POSTCODES: dict[str, dict] = {}
-_CACHE_ZIP: dict[str, dict] = {}
-_CACHE_GEOCODE: dict[str, dict] = {}
+# Cache namespaces for the remote lookups; bump a version if the stored
+# response shape changes. POSTCODES_IO_CACHE is shared with
+# PostcodeEnrichment: both store the postcodes.io "result" object keyed by
+# the upper-case postcode with its spaces removed ("AL52LG").
+POSTCODES_IO_CACHE = ("postcodes_io", "1")
+_CACHE_ZIP = ("zippopotam_us", "1")
+_CACHE_GEOCODE = ("nominatim", "1")
 
 
 def _clean(s: str | None) -> str | None:
@@ -76,14 +83,19 @@ def _libpostal_parse(address: str) -> dict | None:
 
 
 def _lookup_gb(postcode: str) -> dict | None:
-    key = postcode.upper()
-    if key in _CACHE_POSTCODES:
-        return _CACHE_POSTCODES[key]
+    # Compact upper-case key, as PostcodeEnrichment stores its bulk results
+    key = _WS.sub("", postcode).upper()
+    cache = get_udf_cache()
+    cached = cache.get(*POSTCODES_IO_CACHE, key)
+    if cached is not None:
+        return cached
     try:
+        import requests
+
         r = requests.get(f"https://api.postcodes.io/postcodes/{key}", timeout=3)
         if r.status_code == 200:
             data = r.json().get("result") or {}
-            _CACHE_POSTCODES[key] = data
+            cache.put(*POSTCODES_IO_CACHE, key, data)
             return data
     except Exception:
         pass
@@ -92,13 +104,17 @@ def _lookup_gb(postcode: str) -> dict | None:
 
 def _lookup_us(zipcode: str) -> dict | None:
     key = zipcode
-    if key in _CACHE_ZIP:
-        return _CACHE_ZIP[key]
+    cache = get_udf_cache()
+    cached = cache.get(*_CACHE_ZIP, key)
+    if cached is not None:
+        return cached
     try:
+        import requests
+
         r = requests.get(f"https://api.zippopotam.us/us/{key}", timeout=3)
         if r.status_code == 200:
             data = r.json()
-            _CACHE_ZIP[key] = data
+            cache.put(*_CACHE_ZIP, key, data)
             return data
     except Exception:
         pass
@@ -107,8 +123,10 @@ def _lookup_us(zipcode: str) -> dict | None:
 
 def _geocode(address: str, cc_hint: str | None) -> dict | None:
     key = (address + "|" + (cc_hint or "")).lower()
-    if key in _CACHE_GEOCODE:
-        return _CACHE_GEOCODE[key]
+    cache = get_udf_cache()
+    cached = cache.get(*_CACHE_GEOCODE, key)
+    if cached is not None:
+        return cached
     params = {
         "q": address,
         "format": "jsonv2",
@@ -118,19 +136,38 @@ def _geocode(address: str, cc_hint: str | None) -> dict | None:
     if cc_hint:
         params["countrycodes"] = cc_hint.lower()
     try:
+        import requests
+
         r = requests.get("https://nominatim.openstreetmap.org/search", params=params, timeout=4, headers={"User-Agent": "elt-ingest-excel"})
         if r.status_code == 200:
             arr = r.json()
             if isinstance(arr, list) and arr:
                 res = arr[0]
-                _CACHE_GEOCODE[key] = res
+                cache.put(*_CACHE_GEOCODE, key, res)
                 return res
     except Exception:
         pass
     return None
 
 
-def register(conn: "duckdb.DuckDBPyConnection") -> None:
+def register(
+    conn: "duckdb.DuckDBPyConnection",
+    data_path: Path = DEFAULT_DATA_PATH,
+    remote_fallback: bool = False,
+) -> None:
+    """Register udf_normalize_address.
+
+    GB postcodes are resolved from the offline PostcodeIndex built from the
+    postcode CSVs in data_path. The postcodes.io, zippopotam.us and Nominatim
+    web services are only called when remote_fallback is True.
+    """
+
+    def _resolve_gb(postcode: str) -> dict | None:
+        found = load_postcode_index(Path(data_path)).lookup(postcode)
+        if found is None and remote_fallback:
+            found = _lookup_gb(postcode)
+        return found
+
     def udf_normalize_address(
         address_1: str | None,
         address_2: str | None,
@@ -160,9 +197,9 @@ def register(conn: "duckdb.DuckDBPyConnection") -> None:
         if (cc or "").upper() == "GB":
             gb = None
             if p:
-                gb = _lookup_gb(p)
+                gb = _resolve_gb(p)
             if gb is None and p1 and p1 != p:
-                gb = _lookup_gb(p1)
+                gb = _resolve_gb(p1)
             if gb:
                 norm_postcode = gb.get("postcode") or p or p1
                 post_town = gb.get("post_town")
@@ -172,7 +209,7 @@ def register(conn: "duckdb.DuckDBPyConnection") -> None:
                 norm_city = _clean(_first(post_town, norm_city))
                 norm_region = _clean(_first(admin_county, region_name, norm_region))
                 norm_cc = "GB"
-        elif (cc or "").upper() == "US":
+        elif (cc or "").upper() == "US" and remote_fallback:
             us = None
             if p:
                 us = _lookup_us(p)
@@ -196,7 +233,7 @@ def register(conn: "duckdb.DuckDBPyConnection") -> None:
                     country_name = lp.get("country") or ""
                     cc_guess = country_name.strip().upper() if len(country_name.strip()) == 2 else None
                 norm_cc = _first(cc_guess, norm_cc)
-        if not norm_city or not norm_region or not norm_postcode or not norm_cc:
+        if remote_fallback and (not norm_city or not norm_region or not norm_postcode or not norm_cc):
             q = " ".join([x for x in [a1, a2, a3, a4, c0, r0] if x])
             g = _geocode(q, cc)
             if g and isinstance(g, dict):
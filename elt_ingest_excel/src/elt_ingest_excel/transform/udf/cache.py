@@ -0,0 +1,157 @@
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Hashable
+
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+@dataclass
+class CacheStats:
+    """Lookup counters for one UDF.
+
+    Attributes:
+        memory_hits: Lookups answered by the in-memory LRU.
+        disk_hits: Lookups answered by the on-disk store.
+        misses: Lookups that had to be computed.
+    """
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.memory_hits + self.disk_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return (self.memory_hits + self.disk_hits) / self.lookups if self.lookups else 0.0
+
+
+class UdfCache:
+    """Result cache shared by the Python UDFs.
+
+    Entries are keyed by UDF name, UDF version and the (normalised) input
+    arguments. A bounded in-memory LRU sits in front of an optional SQLite
+    file, so results survive across pipeline runs; bumping a UDF's version
+    makes its old entries unreachable. SQLite is used rather than the
+    pipeline's DuckDB database because UDFs run inside DuckDB queries.
+    Values must be JSON-serialisable.
+    """
+
+    def __init__(self, path: Path | None = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = Path(path) if path else None
+        self.max_entries = max_entries
+        self.stats: dict[str, CacheStats] = {}
+        self._memory: OrderedDict[tuple, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS udf_cache (
+                    udf_name TEXT NOT NULL,
+                    udf_version TEXT NOT NULL,
+                    input_key TEXT NOT NULL,
+                    value TEXT,
+                    PRIMARY KEY (udf_name, udf_version, input_key)
+                ) WITHOUT ROWID
+                """
+            )
+            self._db.commit()
+
+    def get_many(self, udf_name: str, udf_version: str, keys: list[Hashable]) -> dict[Hashable, Any]:
+        """Return cached values for the keys that have one."""
+        found: dict[Hashable, Any] = {}
+        with self._lock:
+            stats = self.stats.setdefault(udf_name, CacheStats())
+            missing: dict[str, Hashable] = {}
+            for key in keys:
+                memory_key = (udf_name, udf_version, key)
+                if memory_key in self._memory:
+                    self._memory.move_to_end(memory_key)
+                    found[key] = self._memory[memory_key]
+                    stats.memory_hits += 1
+                else:
+                    missing[json.dumps(key)] = key
+
+            if missing and self._db is not None:
+                for input_key, value in self._select(udf_name, udf_version, list(missing)):
+                    key = missing.pop(input_key)
+                    found[key] = json.loads(value)
+                    self._remember((udf_name, udf_version, key), found[key])
+                    stats.disk_hits += 1
+            stats.misses += len(missing)
+        return found
+
+    def put_many(self, udf_name: str, udf_version: str, values: dict[Hashable, Any]) -> None:
+        """Store computed values in memory and, if configured, on disk."""
+        if not values:
+            return
+        with self._lock:
+            for key, value in values.items():
+                self._remember((udf_name, udf_version, key), value)
+            if self._db is not None:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO udf_cache VALUES (?, ?, ?, ?)",
+                    [
+                        (udf_name, udf_version, json.dumps(key), json.dumps(value))
+                        for key, value in values.items()
+                    ],
+                )
+                self._db.commit()
+
+    def get(self, udf_name: str, udf_version: str, key: Hashable, default: Any = None) -> Any:
+        return self.get_many(udf_name, udf_version, [key]).get(key, default)
+
+    def put(self, udf_name: str, udf_version: str, key: Hashable, value: Any) -> None:
+        self.put_many(udf_name, udf_version, {key: value})
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, memory_key: tuple, value: Any) -> None:
+        self._memory[memory_key] = value
+        self._memory.move_to_end(memory_key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _select(self, udf_name: str, udf_version: str, input_keys: list[str]) -> list[tuple[str, str]]:
+        rows: list[tuple[str, str]] = []
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(input_keys), 500):
+            chunk = input_keys[start:start + 500]
+            placeholders = ", ".join("?" * len(chunk))
+            rows.extend(
+                self._db.execute(
+                    "SELECT input_key, value FROM udf_cache "
+                    f"WHERE udf_name = ? AND udf_version = ? AND input_key IN ({placeholders})",
+                    [udf_name, udf_version, *chunk],
+                ).fetchall()
+            )
+        return rows
+
+
+_active_cache: UdfCache | None = None
+
+
+def get_udf_cache() -> UdfCache:
+    """Return the cache UDFs should use, creating an in-memory one if none is installed."""
+    global _active_cache
+    if _active_cache is None:
+        _active_cache = UdfCache()
+    return _active_cache
+
+
+def set_udf_cache(cache: UdfCache | None) -> None:
+    """Install the cache used by UDFs in this process (None resets to in-memory)."""
+    global _active_cache
+    _active_cache = cache
@@ -1,15 +1,44 @@
-from typing import TYPE_CHECKING
+import atexit
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import TYPE_CHECKING, Callable
 
 import phonenumbers
+import pyarrow as pa
 import re
 from phonenumbers.phonenumberutil import length_of_geographical_area_code
 import duckdb
 
 from duckdb.typing import VARCHAR
 
+from .cache import get_udf_cache
+
 if TYPE_CHECKING:
     import duckdb as duckdb_types
 
+# Bump UDF_VERSION when a change here alters UDF output, so incremental
+# transforms rebuild the SQL files that call these functions.
+UDF_VERSION = f"1+phonenumbers-{phonenumbers.__version__}"
+UDF_NAMES = ("get_area_code", "get_phone_type", "udf_parse_phone")
+
+# DuckDB hands Arrow UDFs one vector (up to 2048 rows) per call. Batches with
+# at least this many distinct (phone, country) pairs are parsed in a process pool.
+PROCESS_POOL_MIN_BATCH = 512
+PROCESS_POOL_WORKERS = os.cpu_count() or 1
+
+_PARSE_PHONE_FIELDS = {
+    "phone_country_code": "VARCHAR",
+    "area_code": "VARCHAR",
+    "phone_number": "VARCHAR",
+    "full_phone_number": "VARCHAR",
+    "device_type": "VARCHAR",
+}
+_PARSE_PHONE_ARROW_TYPE = pa.struct([(name, pa.string()) for name in _PARSE_PHONE_FIELDS])
+
+_process_pool: ProcessPoolExecutor | None = None
+
 
 def _try_parse(phone_str: str, country_code: str | None):
     raw = phone_str or ""
@@ -50,181 +79,246 @@ def _try_parse(phone_str: str, country_code: str | None):
     return None
 
 
+def _get_area_code(phone_str: str, country_code: str | None) -> str | None:
+    if not phone_str:
+        return None
+    p = _try_parse(phone_str, country_code)
+    if p is None:
+        return None
+    nsn = phonenumbers.national_significant_number(p)
+    ac_len = length_of_geographical_area_code(p)
+    return nsn[:ac_len] if ac_len > 0 else None
+
+
+def _get_phone_type(phone_str: str, country_code: str | None) -> str | None:
+    if not phone_str:
+        return None
+    p = _try_parse(phone_str, country_code)
+    if p is None:
+        digits = re.sub(r"[^0-9]", "", phone_str)
+        if digits.startswith("44") and len(digits) > 2:
+            nsn = digits[2:]
+            if nsn.startswith("7"):
+                return "Mobile"
+            return "Landline"
+        return None
+    num_type = phonenumbers.number_type(p)
+    if num_type == phonenumbers.PhoneNumberType.MOBILE:
+        return "Mobile"
+    if num_type in (
+        phonenumbers.PhoneNumberType.FIXED_LINE,
+        phonenumbers.PhoneNumberType.FIXED_LINE_OR_MOBILE,
+        phonenumbers.PhoneNumberType.VOIP,
+    ):
+        return "Landline"
+    return None
+
+
+def _parse_phone(
+    phone_str: str | None, domicile_country_code: str | None
+) -> dict[str, str | None]:
+    raw = phone_str or ""
+    domicile = (domicile_country_code or "").upper() or None
+    parsed = _try_parse(raw, domicile)
+    digits = re.sub(r"[^0-9]", "", raw)
+    if parsed is None:
+        if not digits and not domicile:
+            return {
+                "phone_country_code": None,
+                "area_code": None,
+                "phone_number": None,
+                "full_phone_number": None,
+                "device_type": "Landline",
+            }
+        phone_country_code = domicile
+        if not digits:
+            return {
+                "phone_country_code": phone_country_code,
+                "area_code": None,
+                "phone_number": None,
+                "full_phone_number": None,
+                "device_type": "Landline",
+            }
+        if len(digits) > 3:
+            area = digits[:3]
+            local = digits[3:]
+        else:
+            area = digits
+            local = ""
+        return {
+            "phone_country_code": phone_country_code,
+            "area_code": area,
+            "phone_number": local,
+            "full_phone_number": area + local,
+            "device_type": "Landline",
+        }
+    country_code_int = parsed.country_code
+    region_from_number = phonenumbers.region_code_for_number(parsed)
+    phone_country_code = region_from_number or (
+        phonenumbers.region_code_for_country_code(country_code_int)
+        if country_code_int
+        else None
+    )
+    if not phone_country_code and domicile:
+        phone_country_code = domicile
+    nsn = phonenumbers.national_significant_number(parsed)
+    num_type = phonenumbers.number_type(parsed)
+    ac_len = length_of_geographical_area_code(parsed)
+    is_gb = country_code_int == 44
+    is_us = country_code_int == 1
+    if num_type == phonenumbers.PhoneNumberType.MOBILE:
+        if len(nsn) > 4:
+            area = nsn[:4]
+            local = nsn[4:]
+        else:
+            area = None
+            local = nsn
+    elif (
+        is_gb
+        and len(nsn) > 3
+        and nsn[0] == "8"
+    ):
+        area = nsn[:3]
+        local = nsn[3:]
+    elif (
+        is_us
+        and len(nsn) > 3
+        and nsn[:3] in ("800", "888", "877", "866", "855", "844", "833")
+    ):
+        area = nsn[:3]
+        local = nsn[3:]
+    elif ac_len and ac_len > 0 and ac_len < len(nsn):
+        area = nsn[:ac_len]
+        local = nsn[ac_len:]
+    else:
+        area = None
+        local = nsn
+    if area is None and local:
+        if len(local) > 3:
+            area = local[:3]
+            local = local[3:]
+        else:
+            area = local
+            local = ""
+    if num_type == phonenumbers.PhoneNumberType.MOBILE:
+        device = "Mobile"
+    elif num_type in (
+        phonenumbers.PhoneNumberType.FIXED_LINE,
+        phonenumbers.PhoneNumberType.FIXED_LINE_OR_MOBILE,
+        phonenumbers.PhoneNumberType.VOIP,
+        phonenumbers.PhoneNumberType.PREMIUM_RATE,
+        phonenumbers.PhoneNumberType.TOLL_FREE,
+        phonenumbers.PhoneNumberType.SHARED_COST,
+        phonenumbers.PhoneNumberType.UAN,
+        phonenumbers.PhoneNumberType.PERSONAL_NUMBER,
+        phonenumbers.PhoneNumberType.VOICEMAIL,
+    ):
+        device = "Landline"
+    else:
+        device = None
+    full_phone_number = (area or "") + (local or "")
+    if not full_phone_number:
+        full_phone_number = None
+    return {
+        "phone_country_code": phone_country_code,
+        "area_code": area,
+        "phone_number": local,
+        "full_phone_number": full_phone_number,
+        "device_type": device,
+    }
+
+
+_FUNCTIONS: dict[str, Callable] = {
+    "get_area_code": _get_area_code,
+    "get_phone_type": _get_phone_type,
+    "udf_parse_phone": _parse_phone,
+}
+
+
+def _apply(name: str, pairs: list[tuple[str | None, str | None]]) -> list:
+    func = _FUNCTIONS[name]
+    return [func(phone, country) for phone, country in pairs]
+
+
+def _get_process_pool() -> ProcessPoolExecutor | None:
+    global _process_pool
+    if PROCESS_POOL_WORKERS < 2:
+        return None
+    if _process_pool is None:
+        # spawn, not fork: the parent holds DuckDB's worker threads
+        _process_pool = ProcessPoolExecutor(
+            max_workers=PROCESS_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        atexit.register(_process_pool.shutdown, cancel_futures=True)
+    return _process_pool
+
+
+def _normalize_key(phone: str | None, country: str | None) -> tuple[str | None, str | None]:
+    # Parsing only looks at digits/+ of the number and the upper-cased
+    # country, so these inputs are interchangeable.
+    return (phone or "").strip() or None, (country or "").upper() or None
+
+
+def _evaluate_batch(name: str, phones: pa.Array, countries: pa.Array) -> list:
+    """Evaluate a phone UDF once per distinct (phone, country) pair in a batch.
+
+    Pairs already in the UDF cache are not parsed again.
+    """
+    keys = [_normalize_key(p, c) for p, c in zip(phones.to_pylist(), countries.to_pylist())]
+    cache = get_udf_cache()
+    lookup = cache.get_many(name, UDF_VERSION, list(dict.fromkeys(keys)))
+    unique = [key for key in dict.fromkeys(keys) if key not in lookup]
+
+    pool = _get_process_pool() if len(unique) >= PROCESS_POOL_MIN_BATCH else None
+    if pool is None:
+        values = _apply(name, unique)
+    else:
+        size = -(-len(unique) // PROCESS_POOL_WORKERS)
+        chunks = [unique[i:i + size] for i in range(0, len(unique), size)]
+        values = [v for part in pool.map(_apply, repeat(name), chunks) for v in part]
+    computed = dict(zip(unique, values))
+    cache.put_many(name, UDF_VERSION, computed)
+    lookup.update(computed)
+    return [lookup[key] for key in keys]
+
+
 def register(conn: "duckdb.DuckDBPyConnection") -> None:
-    def get_area_code(phone_str: str, country_code: str | None) -> str | None:
-        if not phone_str:
-            return None
-        p = _try_parse(phone_str, country_code)
-        if p is None:
-            return None
-        nsn = phonenumbers.national_significant_number(p)
-        ac_len = length_of_geographical_area_code(p)
-        return nsn[:ac_len] if ac_len > 0 else None
+    def get_area_code(phones: pa.Array, countries: pa.Array) -> pa.Array:
+        return pa.array(_evaluate_batch("get_area_code", phones, countries), type=pa.string())
 
     conn.create_function(
         "get_area_code",
         get_area_code,
         [VARCHAR, VARCHAR],
         VARCHAR,
+        type="arrow",
         null_handling="special",
     )
 
-    def get_phone_type(phone_str: str, country_code: str | None) -> str | None:
-        if not phone_str:
-            return None
-        p = _try_parse(phone_str, country_code)
-        if p is None:
-            digits = re.sub(r"[^0-9]", "", phone_str)
-            if digits.startswith("44") and len(digits) > 2:
-                nsn = digits[2:]
-                if nsn.startswith("7"):
-                    return "Mobile"
-                return "Landline"
-            return None
-        num_type = phonenumbers.number_type(p)
-        if num_type == phonenumbers.PhoneNumberType.MOBILE:
-            return "Mobile"
-        if num_type in (
-            phonenumbers.PhoneNumberType.FIXED_LINE,
-            phonenumbers.PhoneNumberType.FIXED_LINE_OR_MOBILE,
-            phonenumbers.PhoneNumberType.VOIP,
-        ):
-            return "Landline"
-        return None
+    def get_phone_type(phones: pa.Array, countries: pa.Array) -> pa.Array:
+        return pa.array(_evaluate_batch("get_phone_type", phones, countries), type=pa.string())
 
     conn.create_function(
         "get_phone_type",
         get_phone_type,
         [VARCHAR, VARCHAR],
         VARCHAR,
+        type="arrow",
         null_handling="special",
     )
 
-    def udf_parse_phone(
-        phone_str: str | None, domicile_country_code: str | None
-    ) -> dict[str, str | None]:
-        raw = phone_str or ""
-        domicile = (domicile_country_code or "").upper() or None
-        parsed = _try_parse(raw, domicile)
-        digits = re.sub(r"[^0-9]", "", raw)
-        if parsed is None:
-            if not digits and not domicile:
-                return {
-                    "phone_country_code": None,
-                    "area_code": None,
-                    "phone_number": None,
-                    "full_phone_number": None,
-                    "device_type": "Landline",
-                }
-            phone_country_code = domicile
-            if not digits:
-                return {
-                    "phone_country_code": phone_country_code,
-                    "area_code": None,
-                    "phone_number": None,
-                    "full_phone_number": None,
-                    "device_type": "Landline",
-                }
-            if len(digits) > 3:
-                area = digits[:3]
-                local = digits[3:]
-            else:
-                area = digits
-                local = ""
-            return {
-                "phone_country_code": phone_country_code,
-                "area_code": area,
-                "phone_number": local,
-                "full_phone_number": area + local,
-                "device_type": "Landline",
-            }
-        country_code_int = parsed.country_code
-        region_from_number = phonenumbers.region_code_for_number(parsed)
-        phone_country_code = region_from_number or (
-            phonenumbers.region_code_for_country_code(country_code_int)
-            if country_code_int
-            else None
+    def udf_parse_phone(phones: pa.Array, countries: pa.Array) -> pa.Array:
+        return pa.array(
+            _evaluate_batch("udf_parse_phone", phones, countries),
+            type=_PARSE_PHONE_ARROW_TYPE,
         )
-        if not phone_country_code and domicile:
-            phone_country_code = domicile
-        nsn = phonenumbers.national_significant_number(parsed)
-        num_type = phonenumbers.number_type(parsed)
-        ac_len = length_of_geographical_area_code(parsed)
-        is_gb = country_code_int == 44
-        is_us = country_code_int == 1
-        if num_type == phonenumbers.PhoneNumberType.MOBILE:
-            if len(nsn) > 4:
-                area = nsn[:4]
-                local = nsn[4:]
-            else:
-                area = None
-                local = nsn
-        elif (
-            is_gb
-            and len(nsn) > 3
-            and nsn[0] == "8"
-        ):
-            area = nsn[:3]
-            local = nsn[3:]
-        elif (
-            is_us
-            and len(nsn) > 3
-            and nsn[:3] in ("800", "888", "877", "866", "855", "844", "833")
-        ):
-            area = nsn[:3]
-            local = nsn[3:]
-        elif ac_len and ac_len > 0 and ac_len < len(nsn):
-            area = nsn[:ac_len]
-            local = nsn[ac_len:]
-        else:
-            area = None
-            local = nsn
-        if area is None and local:
-            if len(local) > 3:
-                area = local[:3]
-                local = local[3:]
-            else:
-                area = local
-                local = ""
-        if num_type == phonenumbers.PhoneNumberType.MOBILE:
-            device = "Mobile"
-        elif num_type in (
-            phonenumbers.PhoneNumberType.FIXED_LINE,
-            phonenumbers.PhoneNumberType.FIXED_LINE_OR_MOBILE,
-            phonenumbers.PhoneNumberType.VOIP,
-            phonenumbers.PhoneNumberType.PREMIUM_RATE,
-            phonenumbers.PhoneNumberType.TOLL_FREE,
-            phonenumbers.PhoneNumberType.SHARED_COST,
-            phonenumbers.PhoneNumberType.UAN,
-            phonenumbers.PhoneNumberType.PERSONAL_NUMBER,
-            phonenumbers.PhoneNumberType.VOICEMAIL,
-        ):
-            device = "Landline"
-        else:
-            device = None
-        full_phone_number = (area or "") + (local or "")
-        if not full_phone_number:
-            full_phone_number = None
-        return {
-            "phone_country_code": phone_country_code,
-            "area_code": area,
-            "phone_number": local,
-            "full_phone_number": full_phone_number,
-            "device_type": device,
-        }
 
     conn.create_function(
         "udf_parse_phone",
         udf_parse_phone,
         [VARCHAR, VARCHAR],
-        duckdb.struct_type(
-            {
-                "phone_country_code": "VARCHAR",
-                "area_code": "VARCHAR",
-                "phone_number": "VARCHAR",
-                "full_phone_number": "VARCHAR",
-                "device_type": "VARCHAR",
-            }
-        ),
+        duckdb.struct_type(_PARSE_PHONE_FIELDS),
+        type="arrow",
         null_handling="special",
     )
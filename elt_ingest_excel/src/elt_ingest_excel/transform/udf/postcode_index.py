@@ -0,0 +1,132 @@
+import csv
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+# <project>/config/data, next to src/ in the repository layout
+DEFAULT_DATA_PATH = Path(__file__).resolve().parents[4] / "config" / "data"
+
+COUNTY_FILE = "ref_post_code_county.csv"
+DISTRICT_FILE = "ref_post_code_district.csv"
+
+_INWARD = re.compile(r"\d[A-Z]{2}$")
+_SPACES = re.compile(r"\s+")
+
+
+def _value(row: dict, *keys: str) -> str | None:
+    for key in keys:
+        value = (row.get(key) or "").strip()
+        if value:
+            return value
+    return None
+
+
+@dataclass(frozen=True)
+class PostcodeDistrict:
+    """Reference data for one GB postcode district (outward code)."""
+
+    outward_code: str
+    post_town: str | None = None
+    admin_county: str | None = None
+    region: str | None = None
+    country: str | None = None
+
+
+class PostcodeIndex:
+    """Offline GB postcode lookup keyed by outward code.
+
+    Districts are held in a sorted array and resolved with binary search.
+    A sub-district missing from the data falls back to its parent district
+    by dropping the trailing letter (e.g. EC1A -> EC1), so a lookup never
+    leaves the process. Other unknown districts do not resolve.
+    """
+
+    def __init__(self, districts: list[PostcodeDistrict]):
+        ordered = sorted({d.outward_code: d for d in districts}.values(), key=lambda d: d.outward_code)
+        self._codes = [d.outward_code for d in ordered]
+        self._districts = ordered
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    @classmethod
+    def from_csv(cls, data_path: Path) -> "PostcodeIndex":
+        """Build the index from the postcode reference CSVs in config/data.
+
+        ref_post_code_county.csv supplies county, region and country;
+        ref_post_code_district.csv supplies the post town and fills gaps.
+        Missing files leave the index (partially) empty.
+        """
+        data_path = Path(data_path)
+        merged: dict[str, dict[str, str | None]] = {}
+
+        county_file = data_path / COUNTY_FILE
+        if county_file.exists():
+            with open(county_file, newline="", encoding="utf-8") as f:
+                for row in csv.DictReader(f):
+                    code = _value(row, "postcode")
+                    if not code:
+                        continue
+                    merged[code.upper()] = {
+                        "post_town": _value(row, "city"),
+                        "admin_county": _value(row, "county"),
+                        "region": _value(row, "region_name"),
+                        "country": _value(row, "country_name"),
+                    }
+
+        district_file = data_path / DISTRICT_FILE
+        if district_file.exists():
+            with open(district_file, newline="", encoding="utf-8-sig") as f:
+                for row in csv.DictReader(f):
+                    code = _value(row, "Postcode")
+                    if not code:
+                        continue
+                    entry = merged.setdefault(code.upper(), {})
+                    entry["post_town"] = _value(row, "Post Town", "Town/Area") or entry.get("post_town")
+                    for key, column in (("admin_county", "Region"), ("region", "UK region")):
+                        if entry.get(key) is None:
+                            entry[key] = _value(row, column)
+
+        return cls([PostcodeDistrict(outward_code=code, **fields) for code, fields in merged.items()])
+
+    def lookup(self, postcode: str) -> dict | None:
+        """Resolve a GB postcode or outward code.
+
+        Returns:
+            Dict shaped like a postcodes.io result (postcode, post_town,
+            admin_county, region, country), or None if no district matches.
+        """
+        compact = _SPACES.sub("", postcode or "").upper()
+        if not compact:
+            return None
+        if len(compact) >= 5 and _INWARD.search(compact):
+            outward, inward = compact[:-3], compact[-3:]
+        else:
+            outward, inward = compact, ""
+
+        district = self._find(outward)
+        if district is None and len(outward) > 2 and outward[-1].isalpha() and outward[-2].isdigit():
+            district = self._find(outward[:-1])
+        if district is None:
+            return None
+        return {
+            "postcode": f"{outward} {inward}" if inward else outward,
+            "post_town": district.post_town,
+            "admin_county": district.admin_county,
+            "region": district.region,
+            "country": district.country,
+        }
+
+    def _find(self, outward_code: str) -> PostcodeDistrict | None:
+        i = bisect_left(self._codes, outward_code)
+        if i < len(self._codes) and self._codes[i] == outward_code:
+            return self._districts[i]
+        return None
+
+
+@lru_cache(maxsize=None)
+def load_postcode_index(data_path: Path = DEFAULT_DATA_PATH) -> PostcodeIndex:
+    """Return the index for data_path, building it once per process."""
+    return PostcodeIndex.from_csv(data_path)
@@ -1,58 +1,64 @@
 from pathlib import Path
-from typing import Iterable
+from typing import TYPE_CHECKING
 
-import duckdb
-import pandas as pd
+from .db import connection_scope
+from .master_workbook import MasterWorkbookCache
 
+if TYPE_CHECKING:
+    from ..connection import ConnectionManager
 
-def _normalize(values: Iterable[str]) -> set[str]:
-    out: set[str] = set()
-    for v in values:
-        if v is None:
-            continue
-        s = str(v).strip()
-        if s:
-            out.add(s.casefold())
-    return out
+UK_COUNTRIES = ("england", "scotland", "wales", "northern ireland")
+
+OBSOLETE_SUFFIX = " (obsolete)"
+
+# UK instances of the master sheet, plus the base form of "(obsolete)"
+# entries, compared case-insensitively with the distinct UK counties.
+_COUNTY_CHECK = """
+WITH master AS (
+    SELECT TRIM(instance) AS instance
+      FROM "{master_table}"
+     WHERE LOWER(TRIM(country)) = 'united kingdom'
+       AND NULLIF(TRIM(instance), '') IS NOT NULL
+),
+allowed AS (
+    SELECT LOWER(instance) AS name
+      FROM master
+     UNION
+    SELECT LOWER(TRIM(left(instance, length(instance) - {suffix_length})))
+      FROM master
+     WHERE ends_with(instance, '{suffix}')
+),
+counties AS (
+    SELECT DISTINCT LOWER(TRIM(county)) AS name
+      FROM ref_post_code_county
+     WHERE NULLIF(TRIM(county), '') IS NOT NULL
+       AND LOWER(country_name) IN ({countries})
+)
+"""
 
 
 def validate_counties_against_master(
     database_path: Path,
     master_workbook_path: Path,
     sheet_name: str = "Country States-Regions",
+    connections: "ConnectionManager | None" = None,
 ) -> tuple[bool, set[str], set[str]]:
-    if not master_workbook_path.exists():
-        return True, set(), set()
-    with duckdb.connect(str(database_path)) as conn:
-        rows = conn.execute(
-            """
-            SELECT DISTINCT county
-            FROM ref_post_code_county
-            WHERE NULLIF(TRIM(county),'') IS NOT NULL
-              AND LOWER(country_name) IN ('england','scotland','wales','northern ireland')
-            """
-        ).fetchall()
-    counties = [r[0] for r in rows]
-    try:
-        df = pd.read_excel(
-            str(master_workbook_path),
-            sheet_name=sheet_name,
-            header=2,
-            engine=None,
-        )
-    except Exception:
+    cache = MasterWorkbookCache(master_workbook_path, database_path, connections=connections)
+    sheet = cache.sheet(sheet_name, header=2)
+    if sheet is None:
         return True, set(), set()
-    df = df[["Country", "Instance"]].dropna(subset=["Country", "Instance"])
-    df["Country_norm"] = df["Country"].astype(str).str.strip().str.casefold()
-    uk = df[df["Country_norm"] == "united kingdom"]["Instance"].astype(str).str.strip()
-    allowed_list: list[str] = uk.tolist()
-    allowed_norm = _normalize(allowed_list)
-    # Also allow base forms of '(obsolete)' entries
-    obsolete_suffix = " (obsolete)"
-    for inst in allowed_list:
-        if inst.endswith(obsolete_suffix):
-            allowed_norm.add(inst[: -len(obsolete_suffix)].strip().casefold())
-    current = _normalize(counties)
-    missing = {c for c in current if c not in allowed_norm}
-    ok = len(missing) == 0
-    return ok, missing, allowed_norm
+    check = _COUNTY_CHECK.format(
+        master_table=sheet.table_name,
+        suffix=OBSOLETE_SUFFIX,
+        suffix_length=len(OBSOLETE_SUFFIX),
+        countries=", ".join(f"'{c}'" for c in UK_COUNTRIES),
+    )
+    with connection_scope(database_path, connections) as conn:
+        missing = {
+            row[0]
+            for row in conn.execute(
+                check + "SELECT c.name FROM counties c ANTI JOIN allowed a ON a.name = c.name"
+            ).fetchall()
+        }
+        allowed = {row[0] for row in conn.execute(check + "SELECT name FROM allowed").fetchall()}
+    return len(missing) == 0, missing, allowed
@@ -1,10 +1,18 @@
 """Database writers for saving ingested data."""
 
 from ..models import SaveMode, WriteResult
+from .column_types import ColumnTypeInference
 from .duckdb_writer import DuckDBWriter
+from .ingest_manifest import FileFingerprint, IngestManifest
+from .table_statistics import TableStatistics, TableStats
 
 __all__ = [
     "SaveMode",
+    "ColumnTypeInference",
     "DuckDBWriter",
+    "FileFingerprint",
+    "IngestManifest",
+    "TableStatistics",
+    "TableStats",
     "WriteResult",
 ]
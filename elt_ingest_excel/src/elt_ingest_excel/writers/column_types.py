@@ -0,0 +1,214 @@
+"""Column type inference for typed loads of all-VARCHAR tables."""
+
+import duckdb
+
+
+class ColumnTypeInference:
+    """Infers compact DuckDB types for the VARCHAR columns of a loaded table.
+
+    Sheets are read as strings, so every loaded column starts as VARCHAR.
+    Inference samples each column and picks the first candidate type whose
+    values all survive a round trip back to the original text (so "007",
+    " 42", "1.50" or "true" stay VARCHAR). The pick is then checked against
+    every row of the table; any failure falls back to VARCHAR. Columns that
+    stay VARCHAR but repeat a few distinct values become an ENUM.
+
+    Blank strings are ignored when inferring and become NULL in columns
+    converted to a non-text type; columns holding NULLs stay text, so every
+    NULL of a converted column was a blank. VARCHAR and ENUM columns keep
+    blanks and NULLs as they are. widen() therefore restores the exact
+    original text.
+
+    Example usage:
+        inference = ColumnTypeInference(connection)
+        types = inference.apply("supplier_name")
+        # {"supplier_id": "INTEGER", "country": "ENUM", "name": "VARCHAR", ...}
+    """
+
+    # Rows sampled per table to choose a candidate type
+    SAMPLE_ROWS = 10_000
+
+    # ENUM only for columns with at most this many distinct values, each
+    # appearing on average at least ENUM_MIN_REPEATS times
+    ENUM_MAX_VALUES = 255
+    ENUM_MIN_REPEATS = 4
+
+    # Candidate types in order of preference, with the SQL rendering a typed
+    # value {x} as text. A value converts without loss only if its rendering
+    # is the original text, and widen() renders with the same SQL.
+    CANDIDATES = {
+        # Excel booleans arrive as "True"/"False"
+        "BOOLEAN": "CASE WHEN {x} THEN 'True' WHEN NOT {x} THEN 'False' END",
+        "INTEGER": "CAST({x} AS VARCHAR)",
+        "BIGINT": "CAST({x} AS VARCHAR)",
+        # Whole numbers arrive without a decimal point
+        "DOUBLE": (
+            "CASE WHEN {x} = trunc({x}) AND abs({x}) < 1e18 "
+            "THEN CAST(CAST({x} AS BIGINT) AS VARCHAR) ELSE CAST({x} AS VARCHAR) END"
+        ),
+        # Excel dates arrive as "YYYY-MM-DD 00:00:00"
+        "DATE": "strftime({x}, '%Y-%m-%d 00:00:00')",
+        "TIMESTAMP": "CAST({x} AS VARCHAR)",
+    }
+
+    def __init__(self, connection: duckdb.DuckDBPyConnection, sample_rows: int = SAMPLE_ROWS):
+        """Initialize the inference.
+
+        Args:
+            connection: Open DuckDB connection to the database holding the tables.
+            sample_rows: Rows sampled per table to choose each column's candidate type.
+        """
+        self.connection = connection
+        self.sample_rows = sample_rows
+
+    def apply(self, table_name: str) -> dict[str, str]:
+        """Infer the types of a table's VARCHAR columns and convert the table.
+
+        Columns that already have another type are left as they are. The
+        table is rewritten once, and only if at least one column changes.
+
+        Args:
+            table_name: Name of the table to convert.
+
+        Returns:
+            Mapping of every column name to its resulting type name
+            (ENUM columns are reported as "ENUM").
+        """
+        current = self._column_types(table_name)
+        inferred = self.infer(table_name)
+        types = {column: inferred.get(column, type_name) for column, type_name in current.items()}
+
+        changed = [column for column in current if types[column] != current[column]]
+        if changed:
+            selects = []
+            for column, type_name in types.items():
+                quoted = _quote(column)
+                if column not in changed:
+                    selects.append(quoted)
+                elif type_name == "ENUM":
+                    selects.append(f"CAST({quoted} AS {self._enum_type(table_name, column)}) AS {quoted}")
+                else:
+                    selects.append(f"CAST(NULLIF({quoted}, '') AS {type_name}) AS {quoted}")
+            self.connection.execute(
+                f'CREATE OR REPLACE TABLE "{table_name}" AS SELECT {", ".join(selects)} FROM "{table_name}"'
+            )
+        return types
+
+    def infer(self, table_name: str) -> dict[str, str]:
+        """Infer a type for each VARCHAR column of a table without changing it.
+
+        Args:
+            table_name: Name of the table to inspect.
+
+        Returns:
+            Mapping of VARCHAR column name to "BOOLEAN", "INTEGER", "BIGINT",
+            "DOUBLE", "DATE", "TIMESTAMP", "ENUM" or "VARCHAR".
+        """
+        columns = [c for c, t in self._column_types(table_name).items() if t == "VARCHAR"]
+        if not columns:
+            return {}
+
+        # One pass over a sample: the first candidate with no failures per column
+        aggregates = []
+        for i, column in enumerate(columns):
+            value = f"NULLIF({_quote(column)}, '')"
+            for j, type_name in enumerate(self.CANDIDATES):
+                failed = f"NOT coalesce({self._round_trips(type_name, value)}, false)"
+                aggregates.append(f"count_if({value} IS NOT NULL AND {failed}) AS f{i}_{j}")
+            aggregates.append(f"count({value}) AS n{i}")
+        sample = self.connection.execute(
+            f'SELECT {", ".join(aggregates)} FROM (SELECT * FROM "{table_name}" '
+            f"USING SAMPLE reservoir({int(self.sample_rows)} ROWS) REPEATABLE (42))"
+        ).fetchone()
+        width = len(self.CANDIDATES) + 1
+        names = list(self.CANDIDATES)
+        candidates: dict[str, str] = {}
+        for i, column in enumerate(columns):
+            row = sample[i * width:(i + 1) * width]
+            if row[-1] == 0:
+                candidates[column] = "VARCHAR"
+            else:
+                candidates[column] = next((names[j] for j in range(len(names)) if row[j] == 0), "VARCHAR")
+
+        # One pass over the full table: confirm each candidate, count distinct values
+        aggregates = []
+        for i, column in enumerate(columns):
+            value = f"NULLIF({_quote(column)}, '')"
+            candidate = candidates[column]
+            if candidate == "VARCHAR":
+                aggregates.append(f"0 AS f{i}")
+            else:
+                # NULLs could not be told apart from converted blanks
+                condition = self._round_trips(candidate, value)
+                aggregates.append(
+                    f"count_if({_quote(column)} IS NULL "
+                    f"OR ({value} IS NOT NULL AND NOT coalesce({condition}, false))) AS f{i}"
+                )
+            aggregates.append(f"approx_count_distinct({value}) AS d{i}")
+            aggregates.append(f"count({value}) AS n{i}")
+        full = self.connection.execute(f'SELECT {", ".join(aggregates)} FROM "{table_name}"').fetchone()
+
+        types: dict[str, str] = {}
+        for i, column in enumerate(columns):
+            failures, distinct, non_blank = full[i * 3:(i + 1) * 3]
+            type_name = candidates[column] if failures == 0 else "VARCHAR"
+            if (
+                type_name == "VARCHAR"
+                and 0 < distinct <= self.ENUM_MAX_VALUES
+                and non_blank >= distinct * self.ENUM_MIN_REPEATS
+            ):
+                type_name = "ENUM"
+            types[column] = type_name
+        return types
+
+    def widen(self, table_name: str) -> list[str]:
+        """Convert a table's non-VARCHAR columns back to VARCHAR.
+
+        Used before appending string rows to a table converted by an
+        earlier typed load, so the new rows cannot fail to cast. Columns
+        converted by apply() get back their original text, with NULLs as
+        blanks.
+
+        Args:
+            table_name: Name of the table to widen.
+
+        Returns:
+            Names of the columns that were converted.
+        """
+        types = {c: t for c, t in self._column_types(table_name).items() if t != "VARCHAR"}
+        for column, type_name in types.items():
+            quoted = _quote(column)
+            using = (
+                f" USING coalesce({self.CANDIDATES[type_name].format(x=quoted)}, '')"
+                if type_name in self.CANDIDATES
+                else ""
+            )
+            self.connection.execute(f'ALTER TABLE "{table_name}" ALTER {quoted} TYPE VARCHAR{using}')
+        return list(types)
+
+    def _round_trips(self, type_name: str, value: str) -> str:
+        """SQL condition under which a text value converts to type_name without loss."""
+        rendered = self.CANDIDATES[type_name].format(x=f"TRY_CAST({value} AS {type_name})")
+        return f"{rendered} = {value}"
+
+    def _column_types(self, table_name: str) -> dict[str, str]:
+        """Column names and type names of a table, with ENUM types reported as "ENUM"."""
+        rows = self.connection.execute(
+            "SELECT column_name, data_type FROM information_schema.columns "
+            "WHERE table_name = ? ORDER BY ordinal_position",
+            [table_name],
+        ).fetchall()
+        return {name: "ENUM" if data_type.startswith("ENUM") else data_type for name, data_type in rows}
+
+    def _enum_type(self, table_name: str, column: str) -> str:
+        """ENUM type literal listing a column's distinct non-NULL values."""
+        values = self.connection.execute(
+            f'SELECT DISTINCT {_quote(column)} FROM "{table_name}" '
+            f"WHERE {_quote(column)} IS NOT NULL ORDER BY 1"
+        ).fetchall()
+        members = ", ".join("'" + value.replace("'", "''") + "'" for (value,) in values)
+        return f"ENUM({members})"
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
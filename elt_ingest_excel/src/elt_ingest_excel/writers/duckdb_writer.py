@@ -7,8 +7,11 @@ import duckdb
 import pandas as pd
 
 from ..models import SaveMode, WriteResult
+from .column_types import ColumnTypeInference
+from .table_statistics import TableStatistics
 
 if TYPE_CHECKING:
+    from ..connection import ConnectionManager
     from ..reporting import PipelineReporter
 
 
@@ -21,6 +24,13 @@ class DuckDBWriter:
     - OVERWRITE: Delete existing rows and insert new data
     - APPEND: Add new rows to existing table
 
+    With typed_load, each written table's VARCHAR columns are converted to
+    compact types inferred from their values (see ColumnTypeInference).
+
+    Every write keeps the table's row count and checksum current in
+    table_statistics (see TableStatistics); appends update them from the
+    new rows alone, and the reported row count is read from them.
+
     Example usage:
         with DuckDBWriter("/path/to/database.duckdb") as writer:
             result = writer.write(df, "my_table", SaveMode.RECREATE)
@@ -31,27 +41,44 @@ class DuckDBWriter:
         self,
         database_path: Union[str, Path],
         reporter: "PipelineReporter | None" = None,
+        connections: "ConnectionManager | None" = None,
+        typed_load: bool = False,
+        run_id: str | None = None,
     ):
         """Initialize the DuckDB writer.
 
         Args:
             database_path: Path to the DuckDB database file.
             reporter: Optional reporter for output. If None, no output is produced.
+            connections: Optional shared connection manager. When given, the writer
+                         uses its connection and leaves it open on exit.
+            typed_load: If True, infer INTEGER/DOUBLE/DATE/BOOLEAN/ENUM (etc.) types
+                        for written tables instead of keeping every column VARCHAR.
+            run_id: Run recorded in table_statistics for tables whose content changes.
         """
         self.database_path = Path(database_path).expanduser()
         self._connection: duckdb.DuckDBPyConnection | None = None
         self.reporter = reporter
+        self.connections = connections
+        self.typed_load = typed_load
+        self.run_id = run_id
+        self._statistics: TableStatistics | None = None
 
     def __enter__(self):
         """Context manager entry - connect to DuckDB."""
-        self._connection = duckdb.connect(str(self.database_path))
+        if self.connections is not None:
+            self._connection = self.connections.connection
+        else:
+            self._connection = duckdb.connect(str(self.database_path))
+        self._statistics = TableStatistics(self._connection, self.run_id)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit - close DuckDB connection."""
-        if self._connection:
+        """Context manager exit - close DuckDB connection unless it is shared."""
+        if self._connection and self.connections is None:
             self._connection.close()
-            self._connection = None
+        self._connection = None
+        self._statistics = None
 
     @property
     def connection(self) -> duckdb.DuckDBPyConnection:
@@ -64,11 +91,23 @@ class DuckDBWriter:
             raise RuntimeError("DuckDBWriter must be used as a context manager")
         return self._connection
 
+    @property
+    def statistics(self) -> TableStatistics:
+        """Get the table statistics kept current by this writer.
+
+        Raises:
+            RuntimeError: If not used within a context manager.
+        """
+        if self._statistics is None:
+            raise RuntimeError("DuckDBWriter must be used as a context manager")
+        return self._statistics
+
     def write(
         self,
         df: pd.DataFrame,
         table_name: str,
         save_mode: SaveMode = SaveMode.RECREATE,
+        infer_types: bool | None = None,
     ) -> WriteResult:
         """Write a DataFrame to a DuckDB table.
 
@@ -76,6 +115,9 @@ class DuckDBWriter:
             df: The pandas DataFrame to write.
             table_name: Name of the target table.
             save_mode: How to handle existing table/data.
+            infer_types: Convert the table to inferred types after writing.
+                         Defaults to typed_load; pass False to defer it (e.g.
+                         until the last chunk) and call apply_column_types().
 
         Returns:
             WriteResult with details of the write operation.
@@ -92,7 +134,13 @@ class DuckDBWriter:
                 save_mode=save_mode,
             )
 
-        elif save_mode == SaveMode.RECREATE:
+        if self.typed_load and save_mode in (SaveMode.OVERWRITE, SaveMode.APPEND):
+            # Rows arrive as strings; a table typed by an earlier load must accept them
+            if self._table_exists(table_name) and ColumnTypeInference(self.connection).widen(table_name):
+                # Appended rows are hashed as VARCHAR, so the checksum must be too
+                self.statistics.refresh(table_name)
+
+        if save_mode == SaveMode.RECREATE:
             rows_written = self._recreate_table(df, table_name)
 
         elif save_mode == SaveMode.OVERWRITE:
@@ -101,15 +149,37 @@ class DuckDBWriter:
         elif save_mode == SaveMode.APPEND:
             rows_written = self._append_to_table(df, table_name)
 
-        row_count = self._get_table_count(table_name)
+        if infer_types is None:
+            infer_types = self.typed_load
+        column_types = self.apply_column_types(table_name) if infer_types else None
+
+        stats = self.statistics.ensure(table_name)
+        row_count = stats.row_count if stats else 0
 
         return WriteResult(
             table_name=table_name,
             rows_written=rows_written,
             row_count=row_count,
             save_mode=save_mode,
+            column_types=column_types,
         )
 
+    def apply_column_types(self, table_name: str) -> dict[str, str] | None:
+        """Convert a table's VARCHAR columns to their inferred types.
+
+        Args:
+            table_name: Name of the table.
+
+        Returns:
+            Column name to type name after conversion, or None if the table
+            does not exist.
+        """
+        if not self._table_exists(table_name):
+            return None
+        types = ColumnTypeInference(self.connection).apply(table_name)
+        self.statistics.refresh(table_name)
+        return types
+
     def _drop_table(self, table_name: str) -> None:
         """Drop a table if it exists.
 
@@ -117,6 +187,7 @@ class DuckDBWriter:
             table_name: Name of the table to drop.
         """
         self.connection.execute(f'DROP TABLE IF EXISTS "{table_name}"')
+        self.statistics.remove(table_name)
         if self.reporter:
             self.reporter.print_table_dropped(table_name)
 
@@ -160,6 +231,7 @@ class DuckDBWriter:
         df_prepared = self._prepare_df(df)
         rel = self.connection.from_df(df_prepared)
         rel.create(table_name)
+        self.statistics.refresh(table_name)
 
         return len(df)
 
@@ -179,6 +251,7 @@ class DuckDBWriter:
             # Just truncate if table exists
             if self._table_exists(table_name):
                 self.connection.execute(f'DELETE FROM "{table_name}"')
+                self.statistics.refresh(table_name)
             return 0
 
         if self._table_exists(table_name):
@@ -187,6 +260,7 @@ class DuckDBWriter:
             df_prepared = self._prepare_df(df)
             rel = self.connection.from_df(df_prepared)
             rel.insert_into(table_name)
+            self.statistics.refresh(table_name)
         else:
             # Table doesn't exist - create it
             return self._recreate_table(df, table_name)
@@ -209,10 +283,11 @@ class DuckDBWriter:
             return 0
 
         if self._table_exists(table_name):
-            # Table exists - just insert
+            # Table exists - just insert, and add the new rows to its statistics
             df_prepared = self._prepare_df(df)
             rel = self.connection.from_df(df_prepared)
             rel.insert_into(table_name)
+            self.statistics.add_rows(table_name, rel)
         else:
             # Table doesn't exist - create it
             return self._recreate_table(df, table_name)
@@ -234,17 +309,3 @@ class DuckDBWriter:
             [table_name]
         ).fetchone()
         return result[0] > 0 if result else False
-
-    def _get_table_count(self, table_name: str) -> int:
-        """Get the row count from a table.
-
-        Args:
-            table_name: Name of the table.
-
-        Returns:
-            Number of rows in the table.
-        """
-        result = self.connection.execute(
-            f'SELECT COUNT(*) FROM "{table_name}"'
-        ).fetchone()
-        return result[0] if result else 0
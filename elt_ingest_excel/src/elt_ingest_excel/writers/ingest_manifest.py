@@ -0,0 +1,248 @@
+"""Ingest manifest for detecting unchanged source sheets."""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import duckdb
+
+from ..models import SaveMode, SheetConfig
+
+
+@dataclass
+class FileFingerprint:
+    """Fingerprint of a source file on disk.
+
+    Attributes:
+        file_size: Size of the file in bytes.
+        file_mtime_ns: Modification time in nanoseconds.
+        file_hash: SHA-256 hex digest of the file contents.
+    """
+    file_size: int
+    file_mtime_ns: int
+    file_hash: str
+
+
+class IngestManifest:
+    """Tracks what was loaded from each workbook sheet.
+
+    Records, per workbook and sheet, the source file fingerprint, a
+    fingerprint of the sheet configuration and the row count loaded.
+    A sheet is considered unchanged when the file hash and config
+    fingerprint match the last load and the target table still holds
+    the recorded number of rows.
+
+    The manifest lives in the same DuckDB database as the loaded tables,
+    so deleting the database also resets it.
+    """
+
+    TABLE_NAME = "ingest_manifest"
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    # Save modes that fully replace the target table; only these can be skipped.
+    SKIPPABLE_MODES = (SaveMode.RECREATE, SaveMode.OVERWRITE)
+
+    def __init__(self, connection: duckdb.DuckDBPyConnection):
+        """Initialize the manifest and create its table if needed.
+
+        Args:
+            connection: Open DuckDB connection to the target database.
+        """
+        self.connection = connection
+        self.connection.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
+                workbook_file_name VARCHAR,
+                sheet_name VARCHAR,
+                target_table_name VARCHAR,
+                file_size BIGINT,
+                file_mtime_ns BIGINT,
+                file_hash VARCHAR,
+                config_hash VARCHAR,
+                row_count BIGINT,
+                loaded_at TIMESTAMP DEFAULT current_timestamp,
+                PRIMARY KEY (workbook_file_name, sheet_name)
+            )
+            """
+        )
+
+    def fingerprint_file(self, file_path: Path) -> FileFingerprint:
+        """Fingerprint a source file.
+
+        The file is only re-hashed when its size or modification time differs
+        from every manifest entry for it; otherwise the stored hash is reused.
+
+        Args:
+            file_path: Path to the source file.
+
+        Returns:
+            FileFingerprint for the file.
+        """
+        stat = file_path.stat()
+        row = self.connection.execute(
+            f"SELECT file_hash FROM {self.TABLE_NAME} "
+            "WHERE workbook_file_name = ? AND file_size = ? AND file_mtime_ns = ? "
+            "LIMIT 1",
+            [str(file_path), stat.st_size, stat.st_mtime_ns],
+        ).fetchone()
+        if row:
+            file_hash = row[0]
+        else:
+            file_hash = self._hash_file(file_path)
+        return FileFingerprint(
+            file_size=stat.st_size,
+            file_mtime_ns=stat.st_mtime_ns,
+            file_hash=file_hash,
+        )
+
+    @staticmethod
+    def fingerprint_sheet(sheet_config: SheetConfig, save_mode: SaveMode, typed_load: bool = False) -> str:
+        """Fingerprint the configuration used to load a sheet.
+
+        Args:
+            sheet_config: Configuration for the sheet.
+            save_mode: Save mode used for the load.
+            typed_load: Whether the load inferred column types.
+
+        Returns:
+            SHA-256 hex digest of the sheet configuration.
+        """
+        config = {
+            "sheet_name": sheet_config.sheet_name,
+            "target_table_name": sheet_config.target_table_name,
+            "header_row": sheet_config.header_row,
+            "data_row": sheet_config.data_row,
+            "save_mode": save_mode.value,
+        }
+        if typed_load:
+            # Only present when set, so untyped fingerprints match earlier runs
+            config["typed_load"] = True
+        payload = json.dumps(config, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_unchanged_row_count(
+        self,
+        file_path: Path,
+        sheet_config: SheetConfig,
+        file_fingerprint: FileFingerprint,
+        config_hash: str,
+    ) -> int | None:
+        """Return the loaded row count if a sheet's inputs are unchanged.
+
+        Args:
+            file_path: Path to the source file.
+            sheet_config: Configuration for the sheet.
+            file_fingerprint: Current fingerprint of the source file.
+            config_hash: Current fingerprint of the sheet configuration.
+
+        Returns:
+            Row count of the previous load if the sheet can be skipped,
+            None if it must be reloaded.
+        """
+        row = self.connection.execute(
+            f"SELECT target_table_name, file_hash, config_hash, row_count "
+            f"FROM {self.TABLE_NAME} "
+            "WHERE workbook_file_name = ? AND sheet_name = ?",
+            [str(file_path), sheet_config.sheet_name],
+        ).fetchone()
+        if not row:
+            return None
+
+        target_table_name, file_hash, stored_config_hash, row_count = row
+        if (
+            target_table_name != sheet_config.target_table_name
+            or file_hash != file_fingerprint.file_hash
+            or stored_config_hash != config_hash
+        ):
+            return None
+
+        # The target table must still exist with the rows we loaded
+        if not self._table_exists(target_table_name):
+            return None
+        current_count = self.connection.execute(
+            f'SELECT COUNT(*) FROM "{target_table_name}"'
+        ).fetchone()[0]
+        if current_count != row_count:
+            return None
+        return row_count
+
+    def record(
+        self,
+        file_path: Path,
+        sheet_config: SheetConfig,
+        file_fingerprint: FileFingerprint,
+        config_hash: str,
+        row_count: int,
+    ) -> None:
+        """Record a successful load of a sheet.
+
+        Args:
+            file_path: Path to the source file.
+            sheet_config: Configuration for the sheet.
+            file_fingerprint: Fingerprint of the source file that was loaded.
+            config_hash: Fingerprint of the sheet configuration.
+            row_count: Number of rows in the target table after the load.
+        """
+        self.connection.execute(
+            f"INSERT OR REPLACE INTO {self.TABLE_NAME} "
+            "(workbook_file_name, sheet_name, target_table_name, file_size, "
+            "file_mtime_ns, file_hash, config_hash, row_count, loaded_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, current_timestamp)",
+            [
+                str(file_path),
+                sheet_config.sheet_name,
+                sheet_config.target_table_name,
+                file_fingerprint.file_size,
+                file_fingerprint.file_mtime_ns,
+                file_fingerprint.file_hash,
+                config_hash,
+                row_count,
+            ],
+        )
+
+    def forget(self, file_path: Path, sheet_config: SheetConfig) -> None:
+        """Remove the manifest entry for a sheet.
+
+        Used after loads that do not fully replace the target table
+        (APPEND, DROP), so the next run always reloads the sheet.
+
+        Args:
+            file_path: Path to the source file.
+            sheet_config: Configuration for the sheet.
+        """
+        self.connection.execute(
+            f"DELETE FROM {self.TABLE_NAME} "
+            "WHERE workbook_file_name = ? AND sheet_name = ?",
+            [str(file_path), sheet_config.sheet_name],
+        )
+
+    def _table_exists(self, table_name: str) -> bool:
+        """Check if a table exists in the database.
+
+        Args:
+            table_name: Name of the table to check.
+
+        Returns:
+            True if table exists, False otherwise.
+        """
+        result = self.connection.execute(
+            "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
+            [table_name],
+        ).fetchone()
+        return result[0] > 0 if result else False
+
+    def _hash_file(self, file_path: Path) -> str:
+        """Compute the SHA-256 digest of a file in fixed-size chunks.
+
+        Args:
+            file_path: Path to the file.
+
+        Returns:
+            Hex digest of the file contents.
+        """
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            while chunk := f.read(self.HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
@@ -0,0 +1,257 @@
+"""Row counts and content checksums of pipeline tables."""
+
+import datetime
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any
+
+import duckdb
+
+
+@dataclass
+class TableStats:
+    """Statistics recorded for one table.
+
+    Attributes:
+        table_name: Name of the table.
+        row_count: Number of rows.
+        checksum: Sum of the row hashes, so equal content gives an equal
+                  checksum whatever the row order.
+        run_id: Run that last changed the table's content.
+        updated_at: When the content last changed.
+    """
+    table_name: str
+    row_count: int
+    checksum: str
+    run_id: str | None = None
+    updated_at: datetime.datetime | None = None
+
+    @property
+    def version(self) -> str:
+        """Row count and checksum, changing whenever the content does."""
+        return f"{self.row_count}:{self.checksum}"
+
+
+class TableStatistics:
+    """Tracks row count, checksum and last-changing run of each table.
+
+    DuckDBWriter and SqlExecutor keep the statistics current as they write:
+    appends add the new rows' count and hashes to the stored values, other
+    writes rescan the table once. The transform's reference data, master
+    workbook, postcode enrichment and rule engine stages rescan the tables
+    they write. A table whose content did not change keeps its run id, so
+    comparing run ids (or versions) is a cheap change check for later
+    stages. Tables changed by anything else are not tracked.
+
+    Results of queries over tracked tables can be cached with cached_query();
+    a cached result is reused until the version of a table it reads changes.
+
+    Example usage:
+        statistics = TableStatistics(connection, run_id=run_log.run_id)
+        statistics.refresh("supplier")
+        print(statistics.get("supplier").row_count)
+    """
+
+    TABLE_NAME = "table_statistics"
+    CACHE_TABLE_NAME = "table_result_cache"
+
+    def __init__(
+        self,
+        connection: duckdb.DuckDBPyConnection,
+        run_id: str | None = None,
+        read_only: bool = False,
+    ):
+        """Initialize the statistics and create their tables if needed.
+
+        Args:
+            connection: Open DuckDB connection to the database holding the tables.
+            run_id: Run recorded against tables whose content changes.
+            read_only: Only read recorded statistics (for read-only connections);
+                       get() returns None when none have been recorded.
+        """
+        self.connection = connection
+        self.run_id = run_id
+        self.read_only = read_only
+        if read_only:
+            return
+        self.connection.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} (
+                table_name VARCHAR PRIMARY KEY,
+                row_count BIGINT,
+                checksum VARCHAR,
+                run_id VARCHAR,
+                updated_at TIMESTAMP DEFAULT current_timestamp
+            )
+            """
+        )
+        self.connection.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.CACHE_TABLE_NAME} (
+                query_hash VARCHAR PRIMARY KEY,
+                table_versions VARCHAR,
+                result_rows VARCHAR,
+                cached_at TIMESTAMP DEFAULT current_timestamp
+            )
+            """
+        )
+
+    def get(self, table_name: str) -> TableStats | None:
+        """Return the recorded statistics of a table, or None if it is not tracked.
+
+        Args:
+            table_name: Name of the table.
+        """
+        try:
+            row = self.connection.execute(
+                f"SELECT table_name, row_count, checksum, run_id, updated_at FROM {self.TABLE_NAME} "
+                "WHERE table_name = ?",
+                [table_name],
+            ).fetchone()
+        except duckdb.CatalogException:
+            if not self.read_only:
+                raise
+            return None
+        return TableStats(*row) if row else None
+
+    def matching(self, pattern: str = "%") -> list[TableStats]:
+        """Return the statistics of every tracked table matching a LIKE pattern.
+
+        Args:
+            pattern: SQL LIKE pattern for the table names.
+        """
+        rows = self.connection.execute(
+            f"SELECT table_name, row_count, checksum, run_id, updated_at FROM {self.TABLE_NAME} "
+            "WHERE table_name LIKE ? ORDER BY table_name",
+            [pattern],
+        ).fetchall()
+        return [TableStats(*row) for row in rows]
+
+    def refresh(self, table_name: str) -> TableStats | None:
+        """Scan a table once and record its row count and checksum.
+
+        Args:
+            table_name: Name of the table.
+
+        Returns:
+            The table's statistics, or None if it does not exist (any stored
+            statistics are removed).
+        """
+        if not self._table_exists(table_name):
+            self.remove(table_name)
+            return None
+        count, checksum = self.connection.execute(
+            f'SELECT count(*), coalesce(sum(hash(t)), 0)::VARCHAR FROM "{table_name}" AS t'
+        ).fetchone()
+        return self._record(table_name, count, checksum)
+
+    def ensure(self, table_name: str) -> TableStats | None:
+        """Return a table's statistics, scanning it only if it is not tracked yet.
+
+        Args:
+            table_name: Name of the table.
+        """
+        return self.get(table_name) or self.refresh(table_name)
+
+    def add_rows(self, table_name: str, rows: duckdb.DuckDBPyRelation) -> TableStats | None:
+        """Add rows just appended to a table to its statistics without rescanning it.
+
+        The rows are cast to the table's column types, as the insert did, so
+        their hashes match what a rescan would compute. Untracked tables are
+        rescanned instead.
+
+        Args:
+            table_name: Name of the table the rows were appended to.
+            rows: Relation over the appended rows, in the table's column order.
+
+        Returns:
+            The updated statistics, or None if the table does not exist.
+        """
+        stats = self.get(table_name)
+        if stats is None:
+            return self.refresh(table_name)
+        columns = self.connection.execute(
+            "SELECT column_name, data_type FROM information_schema.columns "
+            "WHERE table_name = ? ORDER BY ordinal_position",
+            [table_name],
+        ).fetchall()
+        casts = ", ".join(
+            f"CAST({_quote(source)} AS {data_type}) AS {_quote(name)}"
+            for source, (name, data_type) in zip(rows.columns, columns)
+        )
+        count, checksum = rows.query(
+            "appended_rows",
+            f"SELECT count(*), coalesce(sum(hash(t)), 0)::VARCHAR FROM (SELECT {casts} FROM appended_rows) AS t",
+        ).fetchone()
+        return self._record(table_name, stats.row_count + count, str(int(stats.checksum) + int(checksum)))
+
+    def remove(self, table_name: str) -> None:
+        """Forget a table (after it is dropped).
+
+        Args:
+            table_name: Name of the table.
+        """
+        self.connection.execute(f"DELETE FROM {self.TABLE_NAME} WHERE table_name = ?", [table_name])
+
+    def cached_query(self, sql: str, tables: list[str]) -> list[tuple[Any, ...]]:
+        """Run a query, or return its cached result if the tables it reads are unchanged.
+
+        Results are only cached when every table is tracked and the rows are
+        JSON-serializable (numbers, strings, booleans and NULLs).
+
+        Args:
+            sql: Query to run.
+            tables: Tables the query reads.
+
+        Returns:
+            The result rows.
+        """
+        versions = {}
+        for table_name in tables:
+            stats = self.get(table_name)
+            if stats is None:
+                return self.connection.execute(sql).fetchall()
+            versions[table_name] = stats.version
+        query_hash = hashlib.sha256(sql.encode("utf-8")).hexdigest()
+        table_versions = json.dumps(versions, sort_keys=True)
+
+        cached = self.connection.execute(
+            f"SELECT table_versions, result_rows FROM {self.CACHE_TABLE_NAME} WHERE query_hash = ?",
+            [query_hash],
+        ).fetchone()
+        if cached and cached[0] == table_versions:
+            return [tuple(row) for row in json.loads(cached[1])]
+
+        rows = self.connection.execute(sql).fetchall()
+        try:
+            result_rows = json.dumps(rows)
+        except TypeError:
+            return rows
+        self.connection.execute(
+            f"INSERT OR REPLACE INTO {self.CACHE_TABLE_NAME} "
+            "(query_hash, table_versions, result_rows, cached_at) VALUES (?, ?, ?, current_timestamp)",
+            [query_hash, table_versions, result_rows],
+        )
+        return rows
+
+    def _record(self, table_name: str, row_count: int, checksum: str) -> TableStats:
+        stats = self.get(table_name)
+        if stats and stats.row_count == row_count and stats.checksum == checksum:
+            return stats
+        self.connection.execute(
+            f"INSERT OR REPLACE INTO {self.TABLE_NAME} "
+            "(table_name, row_count, checksum, run_id, updated_at) VALUES (?, ?, ?, ?, current_timestamp)",
+            [table_name, row_count, checksum, self.run_id],
+        )
+        return self.get(table_name)
+
+    def _table_exists(self, table_name: str) -> bool:
+        result = self.connection.execute(
+            "SELECT count(*) FROM duckdb_tables() WHERE lower(table_name) = lower(?)", [table_name]
+        ).fetchone()
+        return result[0] > 0
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
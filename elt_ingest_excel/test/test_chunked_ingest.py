@@ -0,0 +1,105 @@
+"""Tests for streaming Excel sheets into DuckDB in fixed-size chunks."""
+
+import datetime
+import tempfile
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook
+
+from elt_ingest_excel.loaders import ExcelReader, SheetProcessor
+from elt_ingest_excel.models import SheetConfig, WorkbookConfig
+from elt_ingest_excel.writers import DuckDBWriter, SaveMode
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a workbook with a title row, mixed cell types and blank rows."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir)
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Workers"
+        ws.append(["Contingent workers"])
+        ws.append(["Worker ID", "Name", "Name", None, "Start Date", "Rate", "Department"])
+        for i in range(23):
+            ws.append([i, f"First {i}", f"Last {i}", None, datetime.datetime(2024, 1, i + 1), i + 0.5, "HR"])
+            if i % 10 == 4:
+                ws.append([None] * 7)
+        wb.create_sheet("Empty").append(["Worker ID", "Name"])
+        wb.save(path / "workers.xlsx")
+        yield path
+
+
+def _reader(path: Path, sheet_name: str = "Workers") -> ExcelReader:
+    return ExcelReader(path / "workers.xlsx", sheet_name=sheet_name, header_row=1)
+
+
+class TestExcelReaderChunks:
+    """Tests for ExcelReader.iter_chunks."""
+
+    def test_chunks_match_load_without_blank_rows(self, temp_dir):
+        """Test that chunks give load()'s columns and strings, minus all-blank rows."""
+        eager = _reader(temp_dir).load()
+        eager = eager[(eager != "").any(axis=1)].reset_index(drop=True)
+
+        chunks = list(_reader(temp_dir).iter_chunks(10))
+
+        assert [len(c) for c in chunks] == [10, 10, 3]
+        streamed = [row for c in chunks for row in c.values.tolist()]
+        assert chunks[0].columns.tolist() == eager.columns.tolist()
+        assert streamed == eager.astype(object).values.tolist()
+        assert streamed[0][:6] == ["0", "First 0", "Last 0", "", "2024-01-01 00:00:00", "0.5"]
+
+    def test_sheet_name_is_matched_loosely(self, temp_dir):
+        """Test that sheet names match ignoring case and extra whitespace."""
+        chunks = list(_reader(temp_dir, sheet_name=" workers ").iter_chunks(100))
+
+        assert sum(len(c) for c in chunks) == 23
+
+    def test_columns_of_sheet_without_data(self, temp_dir):
+        """Test that a header-only sheet yields no chunks but reports its columns."""
+        reader = _reader(temp_dir, sheet_name="Empty")
+        reader.header_row = 0
+
+        assert list(reader.iter_chunks(10)) == []
+        assert reader.columns() == ["worker_id", "name"]
+
+
+class TestSheetProcessorChunked:
+    """Tests for SheetProcessor with chunk_rows."""
+
+    def _process(self, path: Path, sheet: SheetConfig, save_mode: SaveMode = SaveMode.RECREATE):
+        processor = SheetProcessor(
+            data_path=path,
+            data_file_name="workers.xlsx",
+            workbook_config=WorkbookConfig(workbook_file_name="workers.xlsx", sheets=[sheet]),
+            save_mode=save_mode,
+            chunk_rows=10,
+        )
+        with DuckDBWriter(path / "test.duckdb") as writer:
+            result = processor.process_sheet(sheet, writer)
+            rows = writer.connection.execute(
+                f"SELECT * FROM {sheet.target_table_name} ORDER BY worker_id::INTEGER"
+            ).fetchall() if writer._table_exists(sheet.target_table_name) else None
+        return result, rows
+
+    def test_chunks_are_appended_to_one_table(self, temp_dir):
+        """Test that every chunk lands in the table and the result totals all chunks."""
+        sheet = SheetConfig(sheet_name="Workers", target_table_name="raw_worker", header_row=2)
+
+        self._process(temp_dir, sheet)
+        result, rows = self._process(temp_dir, sheet)
+
+        assert (result.rows_written, result.row_count) == (23, 23)
+        assert rows[22][:3] == ("22", "First 22", "Last 22")
+        assert rows[0][-1] == "HR"
+
+    def test_header_only_sheet_recreates_as_empty(self, temp_dir):
+        """Test that a sheet without data rows leaves no table on RECREATE."""
+        sheet = SheetConfig(sheet_name="Empty", target_table_name="raw_empty", header_row=1)
+
+        result, rows = self._process(temp_dir, sheet)
+
+        assert (result.rows_written, result.row_count) == (0, 0)
+        assert rows is None
@@ -0,0 +1,96 @@
+"""Tests for the DuckDB connection shared across pipeline phases."""
+
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from elt_ingest_excel import ConnectionManager
+from elt_ingest_excel.models import PublishConfig, PublishSheetConfig, PublishWorkbookConfig
+from elt_ingest_excel.publish import ExcelPublisherOoxml
+from elt_ingest_excel.transform import SqlExecutor
+from elt_ingest_excel.writers import DuckDBWriter, SaveMode
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory with a transform and a publish template."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir)
+        (path / "sql").mkdir()
+        (path / "sql" / "clean.sql").write_text(
+            "CREATE OR REPLACE TABLE clean AS "
+            "SELECT id, name, get_phone_type(phone, 'GB') AS phone_type FROM raw;"
+        )
+        (path / "sql" / "order.txt").write_text("clean.sql\n")
+
+        wb = Workbook()
+        wb.active.title = "Clean"
+        wb.active.append(["ID", "Name", "Phone Type"])
+        wb.save(path / "template.xlsx")
+        yield path
+
+
+def _publish_config(path: Path, *names: str) -> PublishConfig:
+    return PublishConfig(
+        workbooks=[
+            PublishWorkbookConfig(
+                src_workbook_path=str(path),
+                src_workbook_file_name="template.xlsx",
+                tgt_workbook_path=str(path),
+                tgt_workbook_file_name=name,
+                sheets=[PublishSheetConfig(src_table_name="clean", sheet_name="Clean", header_row=1, data_row=2)],
+            )
+            for name in names
+        ]
+    )
+
+
+class TestConnectionManager:
+    """Tests for ConnectionManager."""
+
+    def test_settings_are_applied(self, temp_dir):
+        """Test that threads, memory_limit and temp_directory reach DuckDB."""
+        spill = temp_dir / "spill"
+        with ConnectionManager(temp_dir / "test.duckdb", threads=2, memory_limit="512MB", temp_directory=spill) as cm:
+            settings = dict(
+                cm.connection.execute(
+                    "SELECT name, value FROM duckdb_settings() "
+                    "WHERE name IN ('threads', 'memory_limit', 'temp_directory')"
+                ).fetchall()
+            )
+
+        assert settings["threads"] == "2"
+        assert settings["memory_limit"] in ("512.0 MiB", "488.2 MiB")
+        assert Path(settings["temp_directory"]) == spill
+        assert cm.is_open is False
+
+    def test_phases_share_one_connection(self, temp_dir):
+        """Test that load, transform and publish run on one connection left open between them."""
+        df = pd.DataFrame({"id": [1, 2], "name": ["a", "b"], "phone": ["07700 900123", "020 7946 0018"]})
+
+        with ConnectionManager(temp_dir / "test.duckdb") as cm:
+            with DuckDBWriter(cm.database_path, connections=cm) as writer:
+                writer.write(df, "raw", SaveMode.RECREATE)
+            results = SqlExecutor(temp_dir / "sql", cm.database_path, connections=cm).execute()
+            with ExcelPublisherOoxml(cm.database_path, connections=cm) as publisher:
+                published = publisher.publish(_publish_config(temp_dir, "output"))
+
+            assert cm.is_open
+            assert cm.open_count == 1
+            assert results[0].success
+            assert published[0].success and published[0].rows_written == 2
+
+    def test_parallel_publish_releases_and_reopens(self, temp_dir):
+        """Test that parallel publishing closes the shared connection and reopens it afterwards."""
+        with ConnectionManager(temp_dir / "test.duckdb") as cm:
+            cm.connection.execute("CREATE TABLE clean AS SELECT 1 AS id, 'a' AS name, 'MOBILE' AS phone_type")
+            with ExcelPublisherOoxml(cm.database_path, max_workers=2, connections=cm) as publisher:
+                results = publisher.publish(_publish_config(temp_dir, "first", "second"))
+                assert publisher.connection is cm.connection
+
+            assert [r.success for r in results] == [True, True]
+            assert cm.open_count == 2
+            assert cm.connection.execute("SELECT count(*) FROM clean").fetchone() == (1,)
@@ -0,0 +1,276 @@
+"""Tests for publishing DuckDB tables into Excel templates."""
+
+import datetime
+import tempfile
+import zipfile
+from pathlib import Path
+
+import duckdb
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font
+
+from elt_ingest_excel.models import PublishConfig, PublishSheetConfig, PublishWorkbookConfig
+from elt_ingest_excel.publish import ExcelPublisherOoxml, ExcelPublisherOpenpyxl
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a template workbook and a database with a table to publish."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir)
+
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Supplier"
+        ws["A1"] = "Put Supplier"
+        ws.append([])
+        ws.append(["Supplier ID", "Name", "Amount"])
+        ws["B4"].font = Font(bold=True)
+        ws["E4"] = "template note"
+        ws["A40"] = "Footer"
+        notes = wb.create_sheet("Notes")
+        notes["A1"] = "Keep me"
+        wb.save(path / "template.xlsx")
+
+        with duckdb.connect(str(path / "test.duckdb")) as conn:
+            conn.execute(
+                "CREATE TABLE supplier AS "
+                "SELECT 'S' || range AS supplier_id, 'Name ' || range AS name, range * 1.5 AS amount "
+                "FROM range(25)"
+            )
+            conn.execute(
+                "CREATE TABLE dated AS SELECT DATE '2024-01-31' AS hire_date, NULL::VARCHAR AS note, "
+                "'a < b & c' AS text, true AS flag"
+            )
+        yield path
+
+
+def _config(path: Path, table: str = "supplier") -> PublishConfig:
+    return PublishConfig(
+        workbooks=[
+            PublishWorkbookConfig(
+                src_workbook_path=str(path),
+                src_workbook_file_name="template.xlsx",
+                tgt_workbook_path=str(path),
+                tgt_workbook_file_name="output",
+                sheets=[PublishSheetConfig(src_table_name=table, sheet_name="Supplier", header_row=3, data_row=4)],
+            )
+        ]
+    )
+
+
+def _add_calc_chain(path: Path, cell: str) -> None:
+    """Add a calculation chain for one formula cell, as Excel saves it."""
+    with zipfile.ZipFile(path) as zf:
+        members = {name: zf.read(name) for name in zf.namelist()}
+    members["xl/calcChain.xml"] = (
+        '<calcChain xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        f'<c r="{cell}" i="1"/></calcChain>'
+    ).encode()
+    members["xl/_rels/workbook.xml.rels"] = members["xl/_rels/workbook.xml.rels"].replace(
+        b"</Relationships>",
+        b'<Relationship Id="rIdCalc" Target="calcChain.xml" '
+        b'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/calcChain"/></Relationships>',
+    )
+    members["[Content_Types].xml"] = members["[Content_Types].xml"].replace(
+        b"</Types>",
+        b'<Override PartName="/xl/calcChain.xml" '
+        b'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.calcChain+xml"/></Types>',
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+
+
+class TestExcelPublisherOpenpyxl:
+    """Tests for ExcelPublisherOpenpyxl."""
+
+    def test_batches_are_written_contiguously(self, temp_dir, monkeypatch):
+        """Test that rows streamed in several batches land below the header in order."""
+        monkeypatch.setattr(ExcelPublisherOpenpyxl, "BATCH_ROWS", 10)
+
+        with ExcelPublisherOpenpyxl(temp_dir / "test.duckdb") as publisher:
+            results = publisher.publish(_config(temp_dir))
+
+        assert results[0].success and results[0].rows_written == 25
+        ws = load_workbook(temp_dir / "output.xlsx")["Supplier"]
+        rows = list(ws.iter_rows(min_row=4, max_row=28, max_col=3, values_only=True))
+        assert ws["A29"].value is None
+        assert rows[0] == ("S0", "Name 0", 0)
+        assert rows[24] == ("S24", "Name 24", 36)
+
+    def test_template_content_is_kept(self, temp_dir):
+        """Test that header rows, other sheets and template cell styles survive."""
+        with ExcelPublisherOpenpyxl(temp_dir / "test.duckdb") as publisher:
+            publisher.publish(_config(temp_dir))
+
+        wb = load_workbook(temp_dir / "output.xlsx")
+        assert wb["Supplier"]["A1"].value == "Put Supplier"
+        assert wb["Supplier"]["A3"].value == "Supplier ID"
+        assert wb["Supplier"]["B4"].value == "Name 0"
+        assert wb["Supplier"]["B4"].font.bold is True
+        assert wb["Notes"]["A1"].value == "Keep me"
+
+    def test_missing_table_fails_sheet(self, temp_dir):
+        """Test that a query error is reported as a failed PublishResult."""
+        with ExcelPublisherOpenpyxl(temp_dir / "test.duckdb") as publisher:
+            results = publisher.publish(_config(temp_dir, table="missing"))
+
+        assert results[0].success is False
+        assert "missing" in results[0].error
+
+
+class TestExcelPublisherOoxml:
+    """Tests for ExcelPublisherOoxml."""
+
+    def test_rows_are_written_into_template(self, temp_dir, monkeypatch):
+        """Test that streamed rows, template rows and template styles all survive."""
+        monkeypatch.setattr(ExcelPublisherOoxml, "BATCH_ROWS", 10)
+
+        with ExcelPublisherOoxml(temp_dir / "test.duckdb") as publisher:
+            results = publisher.publish(_config(temp_dir))
+
+        assert results[0].success and results[0].rows_written == 25
+        wb = load_workbook(temp_dir / "output.xlsx")
+        ws = wb["Supplier"]
+        assert ws["A1"].value == "Put Supplier"
+        assert ws["A3"].value == "Supplier ID"
+        rows = list(ws.iter_rows(min_row=4, max_row=28, max_col=3, values_only=True))
+        assert rows[0] == ("S0", "Name 0", 0)
+        assert rows[24] == ("S24", "Name 24", 36)
+        assert ws["B4"].font.bold is True
+        assert ws["E4"].value == "template note"
+        assert ws["A40"].value == "Footer"
+        assert ws.max_row == 40
+        assert wb["Notes"]["A1"].value == "Keep me"
+
+    def test_other_members_are_copied_unchanged(self, temp_dir):
+        """Test that only the target worksheet part differs from the template."""
+        with ExcelPublisherOoxml(temp_dir / "test.duckdb") as publisher:
+            publisher.publish(_config(temp_dir))
+
+        with zipfile.ZipFile(temp_dir / "template.xlsx") as src, zipfile.ZipFile(temp_dir / "output.xlsx") as tgt:
+            assert src.namelist() == tgt.namelist()
+            changed = [name for name in src.namelist() if src.read(name) != tgt.read(name)]
+        assert changed == ["xl/worksheets/sheet1.xml"]
+
+    @pytest.mark.parametrize("formula_cell, chain_kept", [("C5", False), ("C41", True)])
+    def test_calc_chain_dropped_with_overwritten_formulas(self, temp_dir, formula_cell, chain_kept):
+        """Test that calcChain.xml is removed only when data replaces template formulas."""
+        wb = load_workbook(temp_dir / "template.xlsx")
+        wb["Supplier"][formula_cell] = "=A1"
+        wb.save(temp_dir / "template.xlsx")
+        _add_calc_chain(temp_dir / "template.xlsx", formula_cell)
+
+        with ExcelPublisherOoxml(temp_dir / "test.duckdb") as publisher:
+            publisher.publish(_config(temp_dir))
+
+        with zipfile.ZipFile(temp_dir / "output.xlsx") as zf:
+            assert zf.testzip() is None
+            assert ("xl/calcChain.xml" in zf.namelist()) is chain_kept
+            assert ("calcChain" in zf.read("xl/_rels/workbook.xml.rels").decode()) is chain_kept
+            assert ("calcChain" in zf.read("[Content_Types].xml").decode()) is chain_kept
+        assert load_workbook(temp_dir / "output.xlsx")["Supplier"]["C5"].value == 1.5
+
+    def test_values_are_typed(self, temp_dir):
+        """Test that dates get a date format and strings are escaped."""
+        with ExcelPublisherOoxml(temp_dir / "test.duckdb") as publisher:
+            results = publisher.publish(_config(temp_dir, table="dated"))
+
+        assert results[0].success
+        ws = load_workbook(temp_dir / "output.xlsx")["Supplier"]
+        assert ws["A4"].value == datetime.datetime(2024, 1, 31)
+        assert ws["A4"].is_date
+        assert ws["B4"].value is None
+        assert ws["B4"].font.bold is True
+        assert ws["C4"].value == "a < b & c"
+        assert ws["D4"].value is True
+
+    def test_missing_sheet_fails(self, temp_dir):
+        """Test that an unknown sheet name is reported and the workbook still saves."""
+        config = _config(temp_dir)
+        config.workbooks[0].sheets[0].sheet_name = "Missing"
+
+        with ExcelPublisherOoxml(temp_dir / "test.duckdb") as publisher:
+            results = publisher.publish(config)
+
+        assert results[0].success is False
+        assert "Missing" in results[0].error
+        assert load_workbook(temp_dir / "output.xlsx")["Notes"]["A1"].value == "Keep me"
+
+
+class TestParallelPublish:
+    """Tests for publishing several workbooks in worker processes."""
+
+    @pytest.mark.parametrize("publisher_class", [ExcelPublisherOpenpyxl, ExcelPublisherOoxml])
+    def test_workbooks_are_published_in_config_order(self, temp_dir, publisher_class):
+        """Test that parallel publishing writes every workbook and keeps result order."""
+        config = _config(temp_dir)
+        second = _config(temp_dir, table="dated").workbooks[0]
+        second.tgt_workbook_file_name = "output_dated"
+        config.workbooks.append(second)
+
+        with publisher_class(temp_dir / "test.duckdb", max_workers=2) as publisher:
+            results = publisher.publish(config)
+            # The parent connection is usable again afterwards
+            assert publisher.connection.execute("SELECT count(*) FROM supplier").fetchone() == (25,)
+
+        assert [(r.table_name, r.rows_written, r.success) for r in results] == [
+            ("supplier", 25, True),
+            ("dated", 1, True),
+        ]
+        assert load_workbook(temp_dir / "output.xlsx")["Supplier"]["A28"].value == "S24"
+        assert load_workbook(temp_dir / "output_dated.xlsx")["Supplier"]["C4"].value == "a < b & c"
+
+
+class TestPublishProjection:
+    """Tests for columns, where, orderBy and chunkSize in publish sheet configs."""
+
+    @pytest.mark.parametrize("publisher_class", [ExcelPublisherOpenpyxl, ExcelPublisherOoxml])
+    def test_columns_mapped_to_template_headers(self, temp_dir, publisher_class):
+        """Test that mapped columns land under their headers, filtered and ordered."""
+        config = _config(temp_dir)
+        sheet = config.workbooks[0].sheets[0]
+        sheet.columns = {"amount": "amount", "Supplier  ID": "supplier_id"}
+        sheet.where = "amount >= 30"
+        sheet.order_by = "amount DESC"
+        sheet.chunk_size = 2
+
+        with publisher_class(temp_dir / "test.duckdb") as publisher:
+            results = publisher.publish(config)
+
+        assert results[0].success and results[0].rows_written == 5
+        ws = load_workbook(temp_dir / "output.xlsx")["Supplier"]
+        rows = list(ws.iter_rows(min_row=4, max_row=8, max_col=3, values_only=True))
+        assert rows == [
+            ("S24", None, 36),
+            ("S23", None, 34.5),
+            ("S22", None, 33),
+            ("S21", None, 31.5),
+            ("S20", None, 30),
+        ]
+        assert ws["A9"].value is None
+
+    def test_column_list_is_positional(self, temp_dir):
+        """Test that a list of columns is written in order from column A."""
+        config = _config(temp_dir)
+        config.workbooks[0].sheets[0].columns = ["name"]
+        config.workbooks[0].sheets[0].where = "supplier_id = 'S3'"
+
+        with ExcelPublisherOoxml(temp_dir / "test.duckdb") as publisher:
+            publisher.publish(config)
+
+        ws = load_workbook(temp_dir / "output.xlsx")["Supplier"]
+        assert [ws["A4"].value, ws["B4"].value] == ["Name 3", None]
+
+    def test_unknown_header_fails_sheet(self, temp_dir):
+        """Test that a mapped header missing from the template fails the sheet."""
+        config = _config(temp_dir)
+        config.workbooks[0].sheets[0].columns = {"Supplier Code": "supplier_id"}
+
+        with ExcelPublisherOpenpyxl(temp_dir / "test.duckdb") as publisher:
+            results = publisher.publish(config)
+
+        assert results[0].success is False
+        assert "Supplier Code" in results[0].error
@@ -0,0 +1,116 @@
+"""Tests for ingest manifest change detection."""
+
+import os
+import tempfile
+from pathlib import Path
+
+import openpyxl
+import pytest
+
+from elt_ingest_excel import DuckDBWriter, SaveMode, SheetConfig, SheetProcessor, WorkbookConfig
+from elt_ingest_excel.writers import IngestManifest
+
+
+def _write_workbook(path: Path, rows: list[tuple]) -> None:
+    """Write a single-sheet workbook with a header row."""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(("id", "name"))
+    for row in rows:
+        ws.append(row)
+    wb.save(path)
+
+
+class TestIngestManifest:
+    """Tests for skipping unchanged sheets via IngestManifest."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for workbook and database."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    @pytest.fixture
+    def sheet_config(self):
+        """Sheet configuration for the test workbook."""
+        return SheetConfig(sheet_name="Data", target_table_name="test_table")
+
+    def _process(self, temp_dir: Path, sheet_config: SheetConfig, save_mode=SaveMode.RECREATE):
+        workbook_config = WorkbookConfig(workbook_file_name="source.xlsx", sheets=[sheet_config])
+        with DuckDBWriter(temp_dir / "test.duckdb") as writer:
+            processor = SheetProcessor(
+                data_path=temp_dir,
+                data_file_name="source.xlsx",
+                workbook_config=workbook_config,
+                save_mode=save_mode,
+                manifest=IngestManifest(writer.connection),
+            )
+            return processor.process_sheets([sheet_config], writer)[0]
+
+    def test_first_load_is_not_skipped(self, temp_dir, sheet_config):
+        """Test that a sheet with no manifest entry is loaded."""
+        _write_workbook(temp_dir / "source.xlsx", [(1, "Alice"), (2, "Bob")])
+
+        result = self._process(temp_dir, sheet_config)
+
+        assert result.skipped is False
+        assert result.rows_written == 2
+
+    def test_unchanged_sheet_is_skipped(self, temp_dir, sheet_config):
+        """Test that a second load of the same file is skipped."""
+        _write_workbook(temp_dir / "source.xlsx", [(1, "Alice"), (2, "Bob")])
+        self._process(temp_dir, sheet_config)
+
+        result = self._process(temp_dir, sheet_config)
+
+        assert result.skipped is True
+        assert result.rows_written == 0
+        assert result.row_count == 2
+
+    def test_changed_file_is_reloaded(self, temp_dir, sheet_config):
+        """Test that modifying the source file forces a reload."""
+        path = temp_dir / "source.xlsx"
+        _write_workbook(path, [(1, "Alice")])
+        self._process(temp_dir, sheet_config)
+
+        _write_workbook(path, [(1, "Alice"), (2, "Bob"), (3, "Charlie")])
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        result = self._process(temp_dir, sheet_config)
+
+        assert result.skipped is False
+        assert result.row_count == 3
+
+    def test_changed_config_is_reloaded(self, temp_dir, sheet_config):
+        """Test that changing the sheet config forces a reload."""
+        _write_workbook(temp_dir / "source.xlsx", [(1, "Alice")])
+        self._process(temp_dir, sheet_config)
+
+        result = self._process(temp_dir, sheet_config, save_mode=SaveMode.OVERWRITE)
+
+        assert result.skipped is False
+
+    def test_dropped_table_is_reloaded(self, temp_dir, sheet_config):
+        """Test that a missing target table forces a reload."""
+        _write_workbook(temp_dir / "source.xlsx", [(1, "Alice")])
+        self._process(temp_dir, sheet_config)
+
+        with DuckDBWriter(temp_dir / "test.duckdb") as writer:
+            writer.connection.execute("DROP TABLE test_table")
+
+        result = self._process(temp_dir, sheet_config)
+
+        assert result.skipped is False
+        assert result.row_count == 1
+
+    def test_append_mode_is_never_skipped(self, temp_dir, sheet_config):
+        """Test that APPEND loads always run."""
+        _write_workbook(temp_dir / "source.xlsx", [(1, "Alice")])
+        self._process(temp_dir, sheet_config, save_mode=SaveMode.APPEND)
+
+        result = self._process(temp_dir, sheet_config, save_mode=SaveMode.APPEND)
+
+        assert result.skipped is False
+        assert result.row_count == 2
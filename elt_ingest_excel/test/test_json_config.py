@@ -10,6 +10,7 @@ from elt_ingest_excel import (
     JsonConfigParser,
     ExcelIngestConfig,
     FileType,
+    PublishConfigParser,
     WorkbookConfig,
     SheetConfig,
 )
@@ -488,3 +489,53 @@ class TestFileType:
 
         assert data[0]["fileType"] == "EXCEL"
         assert data[1]["fileType"] == "DELIMITED"
+
+
+class TestPublishConfigParser:
+    """Tests for publish sheet options."""
+
+    def _sheet(self, **options) -> dict:
+        return [
+            {
+                "srcWorkbookPathName": "/templates",
+                "srcWorkbookFileName": "template.xlsm",
+                "tgtWorkbookPathName": "/output",
+                "tgtWorkbookFileName": "output",
+                "sheets": [{"srcTableName": "workday_supplier", "sheetName": "Supplier", **options}],
+            }
+        ]
+
+    def test_sheet_projection_options(self):
+        """Test parsing columns, where, orderBy and chunkSize."""
+        config = PublishConfigParser.from_json(
+            self._sheet(
+                columns={"Supplier ID": "supplier_id"},
+                where="is_active",
+                orderBy="supplier_id",
+                chunkSize="500",
+            )
+        )
+
+        sheet = config.workbooks[0].sheets[0]
+        assert sheet.columns == {"Supplier ID": "supplier_id"}
+        assert sheet.where == "is_active"
+        assert sheet.order_by == "supplier_id"
+        assert sheet.chunk_size == 500
+
+    def test_sheet_projection_defaults(self):
+        """Test that sheets without options publish every column."""
+        sheet = PublishConfigParser.from_json(self._sheet()).workbooks[0].sheets[0]
+
+        assert sheet.columns is None
+        assert sheet.where is None
+        assert sheet.order_by is None
+        assert sheet.chunk_size is None
+
+    @pytest.mark.parametrize(
+        "options",
+        [{"columns": []}, {"columns": "supplier_id"}, {"columns": {"A": 1}}, {"chunkSize": 0}],
+    )
+    def test_invalid_sheet_options(self, options):
+        """Test that malformed columns or chunkSize are rejected."""
+        with pytest.raises(ValueError):
+            PublishConfigParser.from_json(self._sheet(**options))
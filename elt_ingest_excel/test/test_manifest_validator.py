@@ -0,0 +1,151 @@
+"""Tests for the Excel-free ValidationManifest runner."""
+
+import csv
+import tempfile
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.worksheet.datavalidation import DataValidation
+
+from elt_ingest_excel.macro.manifest_validator import RESULT_COLUMNS, read_manifest, validate_workbook
+
+
+@pytest.fixture
+def workbook():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "supplier.xlsx"
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Supplier Name"
+        ws.append(["Supplier Name"])
+        ws.append([])
+        ws.append(["Supplier ID", "Supplier  Name", "Category", "Tax ID", "Tax Type"])
+        ws.append(["S1", "Acme", "Legal", None, None])
+        ws.append(["S2", None, "Catering", "GB1", None])
+        ws.append(["S1", "Acme Again", "Unknown", None, None])
+        ws.append([None, None, None, None, None])
+        ws.append([4.0, "Four", "Legal", None, "VAT"])
+        validation = DataValidation(type="list", formula1='"Legal,Catering"')
+        validation.add("C4:C100")
+        ws.add_data_validation(validation)
+
+        email = wb.create_sheet("Supplier Email")
+        email.append(["Supplier ID", "Email"])
+        email.append(["S1", "a@example.com"])
+        email.append(["S9", "bad-address"])
+
+        manifest = wb.create_sheet("ValidationManifest")
+        manifest.append(["Validation rules"])
+        manifest.append(["Sheet", "Col", "Rule Type", "Values", "When Column", "Message", "Enabled"])
+        manifest.append(["Supplier Name", "Supplier ID", "DUPLICATE", None, None, "Duplicate supplier", None])
+        manifest.append(["Supplier Name", "supplier name", "MISSING", None, None, None, "Y"])
+        manifest.append(["Supplier Name", "Category", "MATCH", None, None, None, None])
+        manifest.append(["Supplier Name", "Tax Type", "ENSURE_DATA", None, "Tax ID", None, None])
+        manifest.append(["Supplier Name", "Tax ID", "MISSING", None, None, None, "No"])
+        manifest.append(["Supplier Email", "Email", "FORMAT", "^[^@ ]+@[^@ ]+$", None, None, None])
+        manifest.append(["Supplier Email", "Supplier ID", "CROSS_TAB", "Supplier Name", None, None, None])
+        manifest.append(["Supplier Email", "Email", "SPELLING", None, None, None, None])
+
+        results = wb.create_sheet("Validation Results")
+        for i in range(12):
+            results.append(["stale", i])
+        wb.save(path)
+        yield path
+
+
+def test_read_manifest(workbook):
+    """Rules are read below the header row; disabled rows are left out."""
+    rules = read_manifest(workbook)
+
+    assert [(r.sheet, r.column, r.rule_type) for r in rules][:2] == [
+        ("Supplier Name", "Supplier ID", "DUPLICATE"),
+        ("Supplier Name", "supplier name", "MISSING"),
+    ]
+    assert len(rules) == 7
+    assert rules[3].when_column == "Tax ID"
+    assert rules[0].row == 3
+
+
+def test_validate_workbook(workbook):
+    """Issues match the manifest rules and replace earlier results in the sheet."""
+    report = workbook.with_name("report.csv")
+
+    result = validate_workbook(workbook, report_path=report)
+
+    assert result.rule_count == 6
+    assert result.rows_checked == {"Supplier Name": 4, "Supplier Email": 2}
+    assert len(result.skipped) == 1 and "SPELLING" in result.skipped[0]
+    assert [issue[:5] + issue[6:] for issue in result.issues] == [
+        ("Supplier Name", "DUPLICATE", "Supplier ID", "S1", "S1", 4),
+        ("Supplier Name", "ENSURE_DATA", "Tax Type", "S2", "GB1", 5),
+        ("Supplier Name", "MISSING", "Supplier Name", "S2", None, 5),
+        ("Supplier Name", "DUPLICATE", "Supplier ID", "S1", "S1", 6),
+        ("Supplier Name", "MATCH", "Category", "S1", "Unknown", 6),
+        ("Supplier Email", "CROSS_TAB", "Supplier ID", "S9", "S9", 3),
+        ("Supplier Email", "FORMAT", "Email", "S9", "bad-address", 3),
+    ]
+    assert result.issues[0][5] == "Duplicate supplier"
+
+    with open(report) as f:
+        assert len(list(csv.reader(f))) == len(result.issues) + 1
+
+    wb = load_workbook(workbook, read_only=True)
+    rows = [row for row in wb["Validation Results"].iter_rows(values_only=True) if any(v is not None for v in row)]
+    assert rows[0] == RESULT_COLUMNS
+    assert rows[1:] == [tuple(issue) for issue in result.issues]
+    assert wb["Supplier Name"]["A4"].value == "S1"
+
+
+def test_missing_results_sheet(workbook):
+    """Without a results sheet to write into, only a report can be produced."""
+    with pytest.raises(ValueError):
+        validate_workbook(workbook, results_sheet="Missing Sheet")
+
+    result = validate_workbook(workbook, results_sheet="Missing Sheet", save=False)
+    assert len(result.issues) == 7
+
+
+def test_boolean_drop_down_values(workbook):
+    """Boolean cells match a drop-down list read from boolean cells."""
+    wb = load_workbook(workbook)
+    lists = wb.create_sheet("Lists")
+    lists.append([True])
+    lists.append([False])
+    flags = wb.create_sheet("Flags")
+    flags.append(["Active"])
+    flags.append([True])
+    flags.append([False])
+    flags.append(["Maybe"])
+    validation = DataValidation(type="list", formula1="Lists!$A$1:$A$2")
+    validation.add("A2:A100")
+    flags.add_data_validation(validation)
+    manifest = wb["ValidationManifest"]
+    manifest.delete_rows(3, manifest.max_row)
+    manifest.append(["Flags", "Active", "MATCH", None, None, None, None])
+    wb.save(workbook)
+
+    result = validate_workbook(workbook, save=False)
+
+    assert [issue[4] for issue in result.issues] == ["Maybe"]
+
+
+def test_unknown_column_skips_only_its_rule(workbook):
+    """A mistyped column skips its own rule; the sheet's other rules still run."""
+    wb = load_workbook(workbook)
+    manifest = wb["ValidationManifest"]
+    manifest.delete_rows(3, manifest.max_row)
+    manifest.append(["Supplier Name", "Supplier ID", "DUPLICATE", None, None, None, None])
+    manifest.append(["Supplier Name", "Supplier Name", "MISSING", None, None, None, None])
+    manifest.append(["Supplier Name", "Supplier Nmae", "MISSING", None, None, None, None])
+    manifest.append(["Supplier Email", "Supplier ID", "CROSS_TAB", "Supplier Name!Supplier Key", None, None, None])
+    wb.save(workbook)
+
+    result = validate_workbook(workbook, save=False)
+
+    assert result.rule_count == 2
+    assert result.skipped == [
+        "Row 5: column 'Supplier Nmae' not found on sheet 'Supplier Name'",
+        "Row 6: column 'Supplier Key' not found on sheet 'Supplier Name'",
+    ]
+    assert [issue[1] for issue in result.issues] == ["DUPLICATE", "MISSING", "DUPLICATE"]
@@ -0,0 +1,108 @@
+"""Tests for the master workbook cache and the county check built on it."""
+
+import tempfile
+from pathlib import Path
+
+import duckdb
+import openpyxl
+import pytest
+
+from elt_ingest_excel import ConnectionManager
+from elt_ingest_excel.transform import MasterWorkbookCache
+from elt_ingest_excel.transform.validation import validate_counties_against_master
+
+SHEET = "Country States-Regions"
+
+
+def _write_master(path: Path, instances: list[tuple[str, str]]) -> None:
+    """Master workbook with two preamble rows and the header on row 3."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = SHEET
+    sheet.append(["Country States-Regions"])
+    sheet.append([])
+    sheet.append(["Country", "Region Type", "Instance"])
+    for country, instance in instances:
+        sheet.append([country, "County", instance])
+    workbook.save(path)
+
+
+@pytest.fixture
+def workspace():
+    """Database with ref_post_code_county and a master workbook."""
+    with tempfile.TemporaryDirectory() as tmp:
+        database = Path(tmp) / "master.duckdb"
+        master = Path(tmp) / "master.xlsx"
+        with duckdb.connect(str(database)) as conn:
+            conn.execute("CREATE TABLE ref_post_code_county (county VARCHAR, country_name VARCHAR)")
+            conn.executemany(
+                "INSERT INTO ref_post_code_county VALUES (?, ?)",
+                [
+                    ("Kent", "England"),
+                    ("kent ", "England"),
+                    ("Barnsley", "England"),
+                    ("Fife", "Scotland"),
+                    ("Atlantis", "Wales"),
+                    ("Paris", "France"),
+                    ("", "England"),
+                ],
+            )
+        _write_master(
+            master,
+            [
+                ("United Kingdom", "Kent"),
+                ("United Kingdom", "Barnsley (obsolete)"),
+                ("United Kingdom", "Fife"),
+                ("France", "Atlantis"),
+            ],
+        )
+        yield database, master
+
+
+class TestMasterWorkbookCache:
+    """Tests for MasterWorkbookCache."""
+
+    def test_sheet_cached_until_workbook_changes(self, workspace):
+        """The sheet is read once and re-read only when the workbook content changes."""
+        database, master = workspace
+        with ConnectionManager(database) as connections:
+            cache = MasterWorkbookCache(master, database, connections=connections)
+
+            first = cache.sheet(SHEET, header=2)
+            assert first.table_name == "master_country_states_regions"
+            assert first.reloaded
+            assert first.row_count == 4
+
+            assert not cache.sheet(SHEET, header=2).reloaded
+
+            _write_master(master, [("United Kingdom", "Kent")])
+            third = cache.sheet(SHEET, header=2)
+            assert third.reloaded
+            assert third.row_count == 1
+            assert connections.connection.execute(
+                f"SELECT country, region_type, instance FROM {third.table_name}"
+            ).fetchall() == [("United Kingdom", "County", "Kent")]
+
+    def test_missing_workbook_or_sheet(self, workspace):
+        """A missing workbook or sheet yields None."""
+        database, master = workspace
+        assert MasterWorkbookCache(master.with_name("nope.xlsx"), database).sheet(SHEET) is None
+        assert MasterWorkbookCache(master, database).sheet("No Such Sheet") is None
+
+
+class TestCountyValidation:
+    """Tests for validate_counties_against_master."""
+
+    def test_counties_checked_against_cache(self, workspace):
+        """UK counties missing from the master list are reported, obsolete base names allowed."""
+        database, master = workspace
+        ok, missing, allowed = validate_counties_against_master(database, master)
+
+        assert not ok
+        assert missing == {"atlantis"}
+        assert allowed == {"kent", "barnsley (obsolete)", "barnsley", "fife"}
+
+    def test_missing_master_passes(self, workspace):
+        """Validation is skipped when the master workbook does not exist."""
+        database, master = workspace
+        assert validate_counties_against_master(database, master.with_name("nope.xlsx")) == (True, set(), set())
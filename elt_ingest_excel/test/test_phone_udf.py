@@ -0,0 +1,108 @@
+"""Tests for the vectorized phone UDFs."""
+
+import duckdb
+import pytest
+
+from elt_ingest_excel.transform.udf import phone
+from elt_ingest_excel.transform.udf.cache import UdfCache, set_udf_cache
+
+
+@pytest.fixture(autouse=True)
+def udf_cache():
+    """Give every test an empty in-memory UDF cache."""
+    cache = UdfCache()
+    set_udf_cache(cache)
+    yield cache
+    set_udf_cache(None)
+
+
+@pytest.fixture
+def conn():
+    """In-memory DuckDB connection with the phone UDFs registered."""
+    with duckdb.connect() as conn:
+        phone.register(conn)
+        yield conn
+
+
+ROWS = [
+    ("+44 20 7946 0958", "GB"),
+    ("07700 900123", "GB"),
+    ("(212) 555-0199", "US"),
+    ("0800 123 456", "GB"),
+    ("", None),
+    (None, None),
+    (None, "FR"),
+]
+
+
+def _query(conn, rows):
+    conn.execute("CREATE OR REPLACE TABLE phones (phone VARCHAR, country VARCHAR)")
+    conn.executemany("INSERT INTO phones VALUES (?, ?)", rows)
+    return conn.execute(
+        "SELECT udf_parse_phone(phone, country), get_area_code(phone, country), "
+        "get_phone_type(phone, country) FROM phones"
+    ).fetchall()
+
+
+class TestPhoneUdf:
+    """Tests for batch evaluation of udf_parse_phone, get_area_code and get_phone_type."""
+
+    def test_batch_matches_row_functions(self, conn):
+        """Test that each batch row equals the row-at-a-time result."""
+        results = _query(conn, ROWS)
+
+        expected = [
+            (
+                phone._parse_phone(p, c),
+                phone._get_area_code(p, c),
+                phone._get_phone_type(p, c),
+            )
+            for p, c in ROWS
+        ]
+        assert results == expected
+
+    def test_null_input_keeps_special_handling(self, conn):
+        """Test that NULL inputs reach the parser rather than short-circuiting to NULL."""
+        parsed, area_code, phone_type = _query(conn, [(None, "FR")])[0]
+
+        assert parsed["phone_country_code"] == "FR"
+        assert parsed["device_type"] == "Landline"
+        assert area_code is None
+        assert phone_type is None
+
+    def test_duplicates_are_parsed_once(self, conn, monkeypatch):
+        """Test that repeated (phone, country) pairs in a batch are parsed once."""
+        calls = []
+        original = phone._FUNCTIONS["get_area_code"]
+        monkeypatch.setitem(
+            phone._FUNCTIONS,
+            "get_area_code",
+            lambda p, c: calls.append((p, c)) or original(p, c),
+        )
+
+        conn.execute("SELECT get_area_code('020 7946 0958', 'GB') FROM range(1000)").fetchall()
+
+        assert calls == [("020 7946 0958", "GB")]
+
+    def test_cached_results_are_reused(self, conn, udf_cache, monkeypatch):
+        """Test that a second query is answered from the UDF cache."""
+        first = conn.execute("SELECT get_phone_type('07911 123456', 'GB')").fetchone()[0]
+        monkeypatch.setitem(phone._FUNCTIONS, "get_phone_type", lambda p, c: "not cached")
+
+        result = conn.execute("SELECT get_phone_type(' 07911 123456 ', 'gb')").fetchone()[0]
+
+        assert first == "Mobile"
+        assert result == "Mobile"
+        assert udf_cache.stats["get_phone_type"].memory_hits == 1
+
+    def test_process_pool_matches_in_process(self, conn, monkeypatch):
+        """Test that batches parsed in the process pool give the same results."""
+        rows = [(f"07700 9{i:05d}", "GB") for i in range(40)] + ROWS
+        expected = _query(conn, rows)
+
+        monkeypatch.setattr(phone, "PROCESS_POOL_MIN_BATCH", 8)
+        monkeypatch.setattr(phone, "PROCESS_POOL_WORKERS", 2)
+        set_udf_cache(UdfCache())
+
+        assert _query(conn, rows) == expected
+        assert phone._process_pool is not None
@@ -0,0 +1,160 @@
+"""Tests for the postcode enrichment stage against a local stand-in for postcodes.io."""
+
+import json
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from elt_ingest_excel.transform.enrichment import PostcodeEnrichment, PostcodesIoClient
+
+KNOWN = {
+    "AL5 2LG": {"postcode": "AL5 2LG", "outcode": "AL5", "admin_district": "St Albans",
+                "admin_county": "Hertfordshire", "region": "East of England",
+                "country": "England", "latitude": 51.81, "longitude": -0.35},
+    "W1B 5TR": {"postcode": "W1B 5TR", "outcode": "W1B", "admin_district": "Westminster",
+                "admin_county": None, "region": "London",
+                "country": "England", "latitude": 51.51, "longitude": -0.14},
+}
+
+COUNTY_CSV = """postcode,easting,northing,latitude,longitude,city,county,country_code,country_name,iso3166-2,region_code,region_name
+EC1,,,,,London,London,ENG,England,GB-ENG,LONDON,London
+"""
+
+
+class _StandIn(BaseHTTPRequestHandler):
+    """Minimal POST /postcodes bulk endpoint."""
+
+    batches: list[list[str]] = []
+    fail_first = 0
+
+    def do_POST(self):
+        if type(self).fail_first > 0:
+            type(self).fail_first -= 1
+            self.send_response(503)
+            self.end_headers()
+            return
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        type(self).batches.append(body["postcodes"])
+        payload = {
+            "status": 200,
+            "result": [{"query": q, "result": KNOWN.get(q)} for q in body["postcodes"]],
+        }
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Run the stand-in server on a free local port."""
+    _StandIn.batches = []
+    _StandIn.fail_first = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _StandIn)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def temp_dir():
+    """Transform directory, reference data and a database with raw postcodes."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir)
+        (path / "sql").mkdir()
+        (path / "sql" / "enrich_postcodes.sql").write_text(
+            "-- raw postcodes\nSELECT post_code FROM raw_supplier;\n"
+        )
+        (path / "data").mkdir()
+        (path / "data" / "ref_post_code_county.csv").write_text(COUNTY_CSV)
+        with duckdb.connect(str(path / "test.duckdb")) as conn:
+            conn.execute("CREATE TABLE raw_supplier (post_code VARCHAR)")
+            conn.executemany(
+                "INSERT INTO raw_supplier VALUES (?)",
+                [["al5 2lg"], ["AL5-2LG"], ["W1B5TR, London"], ["EC1A 1BB"], ["ZZ9 9ZZ"], ["UNKNOWN"], [None]],
+            )
+        yield path
+
+
+def _enrichment(temp_dir: Path, base_url: str, **client_kwargs) -> PostcodeEnrichment:
+    return PostcodeEnrichment(
+        transform_path=temp_dir / "sql",
+        database_path=temp_dir / "test.duckdb",
+        client=PostcodesIoClient(base_url=base_url, backoff_seconds=0.01, **client_kwargs),
+        udf_cache_path=temp_dir / "udf_cache.sqlite",
+        data_path=temp_dir / "data",
+    )
+
+
+def _lookup_rows(temp_dir: Path) -> list[tuple]:
+    with duckdb.connect(str(temp_dir / "test.duckdb")) as conn:
+        return conn.execute(
+            "SELECT postcode, admin_district, admin_county, source FROM ref_postcode_lookup ORDER BY postcode"
+        ).fetchall()
+
+
+class TestPostcodeEnrichment:
+    """Tests for PostcodeEnrichment."""
+
+    def test_distinct_postcodes_are_resolved_in_bulk(self, temp_dir, server):
+        """Test that distinct normalised postcodes are resolved and written to the lookup table."""
+        result = _enrichment(temp_dir, server, batch_size=2).execute()
+
+        assert result.postcodes == 4
+        assert (result.remote, result.offline, result.unresolved) == (2, 1, 1)
+        assert sorted(q for batch in _StandIn.batches for q in batch) == [
+            "AL5 2LG", "EC1A 1BB", "W1B 5TR", "ZZ9 9ZZ",
+        ]
+        assert all(len(batch) <= 2 for batch in _StandIn.batches)
+        assert _lookup_rows(temp_dir) == [
+            ("AL5 2LG", "St Albans", "Hertfordshire", "postcodes.io"),
+            ("EC1A 1BB", None, "London", "offline"),
+            ("W1B 5TR", "Westminster", None, "postcodes.io"),
+        ]
+
+    def test_second_run_uses_cache(self, temp_dir, server):
+        """Test that resolved postcodes are not requested again on the next run."""
+        _enrichment(temp_dir, server).execute()
+        _StandIn.batches = []
+
+        result = _enrichment(temp_dir, server).execute()
+
+        assert result.cached == 2
+        assert _StandIn.batches == [["EC1A 1BB", "ZZ9 9ZZ"]]
+        assert len(_lookup_rows(temp_dir)) == 3
+
+    def test_server_errors_are_retried(self, temp_dir, server):
+        """Test that 503 responses are retried before the batch is resolved."""
+        _StandIn.fail_first = 2
+
+        result = _enrichment(temp_dir, server).execute()
+
+        assert result.remote == 2
+        assert result.requests == 3
+        assert result.failed_batches == 0
+
+    def test_unreachable_service_falls_back_offline(self, temp_dir):
+        """Test that postcodes resolve offline when the service cannot be reached."""
+        result = _enrichment(temp_dir, "http://127.0.0.1:9", retries=1, timeout=1).execute()
+
+        assert result.failed_batches == 1
+        assert result.offline == 1
+        assert [row[3] for row in _lookup_rows(temp_dir)] == ["offline"]
+
+    def test_missing_extract_file(self, temp_dir, server):
+        """Test that the stage does nothing without enrich_postcodes.sql."""
+        (temp_dir / "sql" / "enrich_postcodes.sql").unlink()
+
+        assert _enrichment(temp_dir, server).execute() is None
+        assert _StandIn.batches == []
@@ -0,0 +1,114 @@
+"""Tests for the offline GB postcode index used by udf_normalize_address."""
+
+import tempfile
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from elt_ingest_excel.transform.udf import address
+from elt_ingest_excel.transform.udf.postcode_index import PostcodeIndex
+
+
+COUNTY_CSV = """postcode,easting,northing,latitude,longitude,city,county,country_code,country_name,iso3166-2,region_code,region_name
+AL5,,,,,Harpenden,Hertfordshire,ENG,England,GB-ENG,EAST,East of England
+EC1,,,,,,London,ENG,England,GB-ENG,LONDON,London
+"""
+
+DISTRICT_CSV = """Postcode,Latitude,Longitude,Easting,Northing,Grid Reference,Town/Area,Region,Postcodes,Active postcodes,Population,Households,Nearby districts,UK region,Post Town
+AL5,,,,,,Harpenden,St Albans,,,,,,East of England,Harpenden
+EC1,,,,,,Clerkenwell,Islington,,,,,,London,London
+IM3,,,,,,Onchan,Isle of Man,,,,,,Isle of Man,
+"""
+
+
+@pytest.fixture
+def data_path():
+    """Directory with small postcode reference CSVs."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir)
+        (path / "ref_post_code_county.csv").write_text(COUNTY_CSV)
+        (path / "ref_post_code_district.csv").write_text(DISTRICT_CSV)
+        yield path
+
+
+class TestPostcodeIndex:
+    """Tests for PostcodeIndex construction and lookup."""
+
+    def test_full_postcode_resolves_district(self, data_path):
+        """Test that a full postcode in any spacing/case resolves to its district."""
+        index = PostcodeIndex.from_csv(data_path)
+
+        assert index.lookup("al52lg") == {
+            "postcode": "AL5 2LG",
+            "post_town": "Harpenden",
+            "admin_county": "Hertfordshire",
+            "region": "East of England",
+            "country": "England",
+        }
+
+    def test_district_only_file_fills_gaps(self, data_path):
+        """Test that districts missing from the county file use the district file."""
+        index = PostcodeIndex.from_csv(data_path)
+
+        result = index.lookup("IM3 1AD")
+
+        assert result["post_town"] == "Onchan"
+        assert result["admin_county"] == "Isle of Man"
+        assert result["region"] == "Isle of Man"
+        assert result["country"] is None
+
+    def test_sub_district_falls_back_to_district(self, data_path):
+        """Test that an unknown sub-district falls back to its parent district."""
+        index = PostcodeIndex.from_csv(data_path)
+
+        assert index.lookup("EC1A 1BB")["post_town"] == "London"
+        assert index.lookup("EC1A")["postcode"] == "EC1A"
+
+    def test_unknown_district_does_not_match_prefix(self, data_path):
+        """Test that digits are never stripped to reach a different district."""
+        index = PostcodeIndex.from_csv(data_path)
+
+        assert index.lookup("EC10 1AA") is None
+        assert index.lookup("AL55") is None
+
+    def test_unknown_postcode(self, data_path):
+        """Test that postcodes outside every district return None."""
+        index = PostcodeIndex.from_csv(data_path)
+
+        assert index.lookup("ZZ9 9ZZ") is None
+        assert index.lookup("") is None
+
+    def test_shipped_reference_data(self):
+        """Test that the index builds from the CSVs shipped in config/data."""
+        index = PostcodeIndex.from_csv(Path(__file__).parent.parent / "config" / "data")
+
+        assert len(index) > 2000
+        assert index.lookup("SW1A 1AA")["post_town"] == "London"
+        assert index.lookup("CR20 1AA") is None
+        assert index.lookup("W15 1AA") is None
+        assert index.lookup("SW29") is None
+
+
+class TestNormalizeAddressOffline:
+    """Tests for udf_normalize_address resolving GB postcodes locally."""
+
+    def test_gb_postcode_resolved_without_network(self, data_path, monkeypatch):
+        """Test that GB addresses are normalised from the index, not postcodes.io."""
+        def no_network(*args, **kwargs):
+            raise AssertionError("remote lookup called")
+
+        monkeypatch.setattr(address, "_lookup_gb", no_network)
+        monkeypatch.setattr(address, "_geocode", no_network)
+
+        with duckdb.connect() as conn:
+            address.register(conn, data_path=data_path)
+            result = conn.execute(
+                "SELECT udf_normalize_address("
+                "'1 High Street', NULL, NULL, NULL, NULL, NULL, 'AL5 2LG', 'GB')"
+            ).fetchone()[0]
+
+        assert result["city"] == "Harpenden"
+        assert result["region"] == "Hertfordshire"
+        assert result["postal_code"] == "AL5 2LG"
+        assert result["country_code"] == "GB"
@@ -0,0 +1,94 @@
+"""Tests for the reference data registry."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from elt_ingest_excel import ConnectionManager
+from elt_ingest_excel.transform.reference_data import ReferenceDataRegistry, registry_table_name
+
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+
+
+@pytest.fixture
+def workspace():
+    """Temporary data directory and database path."""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = Path(tmp) / "data"
+        data_path.mkdir()
+        (data_path / "ref_country.json").write_text(
+            json.dumps([{"country_code": "GBR", "phone_code": 44}, {"country_code": "FRA", "phone_code": 33}])
+        )
+        (data_path / "ref_post_code_county.json").write_text(json.dumps([{"postcode": "AL5"}]))
+        (data_path / "ref_post_code_county.csv").write_text("postcode,County Name\nAL5,Hertfordshire\nEC1,London\n")
+        (data_path / "notes.txt").write_text("not reference data")
+        yield data_path, Path(tmp) / "ref.duckdb"
+
+
+class TestReferenceDataRegistry:
+    """Tests for ReferenceDataRegistry."""
+
+    def test_table_names(self, workspace):
+        """Tables drop the ref_ prefix; a CSV shadowed by a JSON file gets _csv."""
+        data_path, _ = workspace
+        assert registry_table_name(data_path / "ref_country.json") == "refdata_country"
+        assert registry_table_name(data_path / "ref_post_code_county.json") == "refdata_post_code_county"
+        assert registry_table_name(data_path / "ref_post_code_county.csv") == "refdata_post_code_county_csv"
+
+    def test_load_and_skip_unchanged(self, workspace):
+        """Files load once and are only reloaded when their content changes."""
+        data_path, database = workspace
+        with ConnectionManager(database) as connections:
+            registry = ReferenceDataRegistry(data_path, database, connections=connections)
+
+            first = registry.load()
+            assert [r.table_name for r in first] == [
+                "refdata_country",
+                "refdata_post_code_county_csv",
+                "refdata_post_code_county",
+            ]
+            assert all(r.reloaded for r in first)
+
+            second = registry.load()
+            assert not any(r.reloaded for r in second)
+            assert [r.row_count for r in second] == [2, 2, 1]
+
+            (data_path / "ref_country.json").write_text(json.dumps([{"country_code": "DEU", "phone_code": 49}]))
+            third = {r.table_name: r for r in registry.load()}
+            assert third["refdata_country"].reloaded
+            assert third["refdata_country"].row_count == 1
+            assert not third["refdata_post_code_county"].reloaded
+
+            conn = connections.connection
+            assert conn.execute("SELECT country_code, phone_code FROM refdata_country").fetchall() == [("DEU", 49)]
+            assert conn.execute('SELECT "County Name" FROM refdata_post_code_county_csv ORDER BY 1').fetchall() == [
+                ("Hertfordshire",),
+                ("London",),
+            ]
+
+    def test_dropped_table_is_reloaded(self, workspace):
+        """A registry table missing from the database is reloaded even if its hash matches."""
+        data_path, database = workspace
+        registry = ReferenceDataRegistry(data_path, database)
+        registry.load()
+        with duckdb.connect(str(database)) as conn:
+            conn.execute("DROP TABLE refdata_country")
+
+        results = {r.table_name: r for r in registry.load()}
+        assert results["refdata_country"].reloaded
+        assert not results["refdata_post_code_county_csv"].reloaded
+
+    def test_ref_sql_reads_registry(self):
+        """Every ref_*.sql transform runs against the registry tables of config/data."""
+        with tempfile.TemporaryDirectory() as tmp:
+            database = Path(tmp) / "ref.duckdb"
+            ReferenceDataRegistry(CONFIG_DIR / "data", database).load()
+            with duckdb.connect(str(database)) as conn:
+                for sql_file in sorted((CONFIG_DIR / "transform" / "sql" / "ref").glob("ref_*.sql")):
+                    sql = sql_file.read_text()
+                    assert "/Users/" not in sql
+                    conn.execute(sql)
+                    assert conn.execute(f"SELECT count(*) FROM {sql_file.stem}").fetchone()[0] > 0
@@ -0,0 +1,186 @@
+"""Tests for the declarative validation rule engine."""
+
+import tempfile
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from elt_ingest_excel import ConnectionManager, RuleEngine, ValidationRulesParser
+from elt_ingest_excel.models import RuleKind
+from elt_ingest_excel.transform import compile_rule_set
+from elt_ingest_excel.writers import TableStatistics
+
+VALIDATE_DIR = Path(__file__).parent.parent / "config" / "validate" / "finance" / "supplier"
+
+NAME_ROWS = [
+    # supplier_id, supplier_name, reference_id, supplier_category, worktag_only,
+    # supplier_change_source, supplier_source, external_entity_id
+    ("S1", "Acme", "R1", "Legal", "Yes", None, None, None),
+    ("S2", "Acme", "R1", "Lawn care", "Maybe", "Manual", " ", None),
+    ("S2", "Beta", None, "", None, None, None, "X9"),
+    ("S3", "Gamma", None, None, "No", None, "Import", "X10"),
+]
+
+EMAIL_ROWS = [
+    # supplier_id, email_id, email_address, public_flag, primary_flag, use_for
+    ("S1", "E1", "a@acme.com", "Yes", "Yes", "Business"),
+    ("S1", "E1", "a@acme.com", "No", "No", "Business"),
+    ("S9", "E2", "not an email", "Maybe", "", "Business"),
+    (None, None, None, None, None, None),
+]
+
+
+@pytest.fixture
+def database():
+    """DuckDB file with small supplier name and email tables."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "rules.duckdb"
+        with duckdb.connect(str(path)) as conn:
+            conn.execute(
+                "CREATE TABLE workday_supplier_name (supplier_id VARCHAR, supplier_name VARCHAR, "
+                "reference_id VARCHAR, supplier_category VARCHAR, worktag_only VARCHAR, "
+                "supplier_change_source VARCHAR, supplier_source VARCHAR, external_entity_id VARCHAR)"
+            )
+            conn.executemany("INSERT INTO workday_supplier_name VALUES (?, ?, ?, ?, ?, ?, ?, ?)", NAME_ROWS)
+            conn.execute(
+                "CREATE TABLE workday_supplier_email (supplier_id VARCHAR, email_id VARCHAR, "
+                "email_address VARCHAR, public_flag VARCHAR, primary_flag VARCHAR, use_for VARCHAR)"
+            )
+            conn.executemany("INSERT INTO workday_supplier_email VALUES (?, ?, ?, ?, ?, ?)", EMAIL_ROWS)
+        yield path
+
+
+def _issues(conn: duckdb.DuckDBPyConnection, where: str = "") -> list[tuple]:
+    return sorted(
+        conn.execute(f"SELECT * FROM validation_supplier_issues {where}").fetchall(),
+        key=lambda row: tuple("" if v is None else v for v in row),
+    )
+
+
+class TestValidationRulesParser:
+    """Tests for ValidationRulesParser."""
+
+    def test_supplier_rules_parse(self):
+        """The shipped supplier rules parse with the expected defaults."""
+        config = ValidationRulesParser.from_json(VALIDATE_DIR / "rules_supplier.json")
+
+        assert [t.table_name for t in config.tables] == [
+            "workday_supplier_name",
+            "workday_supplier_email",
+            "workday_supplier_phone",
+        ]
+        fk = config.tables[1].rules[0]
+        assert fk.kind == RuleKind.FOREIGN_KEY
+        assert fk.rule_type == "CROSS_TAB"
+        assert fk.ref_column == "supplier_id"
+
+    def test_unknown_rule_type(self):
+        """An unknown rule type is rejected."""
+        data = [{"tableName": "t", "sheetName": "T", "keyColumn": "id",
+                 "rules": [{"type": "between", "column": "a", "message": "m"}]}]
+        with pytest.raises(ValueError, match="Unknown rule type 'between'"):
+            ValidationRulesParser.from_json(data)
+
+    def test_missing_rule_field(self):
+        """Kind-specific fields are required."""
+        data = [{"tableName": "t", "sheetName": "T", "keyColumn": "id",
+                 "rules": [{"type": "regex", "column": "a", "message": "m"}]}]
+        with pytest.raises(ValueError, match="requires: pattern"):
+            ValidationRulesParser.from_json(data)
+
+
+class TestRuleEngine:
+    """Tests for RuleEngine."""
+
+    def test_matches_hand_written_sql(self, database):
+        """The fused queries report the same issues as validate_supplier_*.sql."""
+        config = ValidationRulesParser.from_json(VALIDATE_DIR / "rules_supplier.json")
+        config.tables = config.tables[:2]
+
+        with duckdb.connect(str(database)) as conn:
+            for name in ("validate_supplier_name.sql", "validate_supplier_email.sql"):
+                conn.execute((VALIDATE_DIR / name).read_text())
+            # ONE_PRIMARY is a group-level rule the engine does not express
+            expected = _issues(conn, "WHERE rule_type != 'ONE_PRIMARY'")
+            conn.execute("DROP TABLE validation_supplier_issues")
+
+        results = RuleEngine(config, database).execute()
+
+        assert all(r.success for r in results)
+        with duckdb.connect(str(database)) as conn:
+            actual = _issues(conn)
+        assert actual == expected
+        assert sum(r.issues for r in results) == len(expected)
+
+    def test_single_scan_per_table(self):
+        """Each table is read once, plus once per foreign-key reference."""
+        config = ValidationRulesParser.from_json(VALIDATE_DIR / "rules_supplier.json")
+        sql = compile_rule_set(config.tables[1])
+
+        assert sql.count('FROM "workday_supplier_email"') == 1
+        assert sql.count('FROM "workday_supplier_name"') == 1
+
+    def test_rerun_replaces_issues(self, database):
+        """Running again replaces the sheet's earlier issues instead of adding to them."""
+        config = ValidationRulesParser.from_json(VALIDATE_DIR / "rules_supplier.json")
+        config.tables = config.tables[:2]
+
+        with ConnectionManager(database) as connections:
+            first = RuleEngine(config, database, connections=connections).execute()
+            second = RuleEngine(config, database, connections=connections).execute()
+            count = connections.connection.execute(
+                "SELECT count(*) FROM validation_supplier_issues"
+            ).fetchone()[0]
+
+        assert [r.issues for r in first] == [r.issues for r in second]
+        assert count == sum(r.issues for r in second)
+
+    def test_rerun_keeps_other_issues(self, database):
+        """Issues the rules do not produce, such as ONE_PRIMARY from SQL, survive a run."""
+        config = ValidationRulesParser.from_json(VALIDATE_DIR / "rules_supplier.json")
+        config.tables = config.tables[:2]
+
+        with ConnectionManager(database) as connections:
+            conn = connections.connection
+            conn.execute((VALIDATE_DIR / "validate_supplier_email.sql").read_text())
+            expected = _issues(conn)
+            RuleEngine(config, database, connections=connections).execute()
+            kept = _issues(conn, "WHERE rule_type = 'ONE_PRIMARY'")
+            after = _issues(conn, "WHERE sheet = 'Supplier Email'")
+
+        assert kept and kept == [row for row in expected if row[1] == "ONE_PRIMARY"]
+        # The ported checks replace the SQL's rows for the same checks instead of duplicating them
+        assert after == expected
+
+    def test_issue_statistics_refreshed(self, database):
+        """Issues tables' recorded statistics follow the rows the run inserted."""
+        config = ValidationRulesParser.from_json(VALIDATE_DIR / "rules_supplier.json")
+        config.tables = config.tables[:2]
+
+        with ConnectionManager(database) as connections:
+            conn = connections.connection
+            conn.execute((VALIDATE_DIR / "validate_supplier_email.sql").read_text())
+            TableStatistics(conn, "run1").refresh("validation_supplier_issues")
+            RuleEngine(config, database, connections=connections, run_id="run2").execute()
+            stats = TableStatistics(conn).get("validation_supplier_issues")
+            count = conn.execute("SELECT count(*) FROM validation_supplier_issues").fetchone()[0]
+
+        assert (stats.row_count, stats.run_id) == (count, "run2")
+
+    def test_failed_rule_set_reported(self, database):
+        """A rule on a missing column fails its table without stopping the others."""
+        data = [
+            {"tableName": "workday_supplier_name", "sheetName": "Supplier Name",
+             "keyColumn": "supplier_id", "issuesTable": "validation_supplier_issues",
+             "rules": [{"type": "notNull", "column": "no_such_column", "message": "m"}]},
+            {"tableName": "workday_supplier_email", "sheetName": "Supplier Email",
+             "keyColumn": "supplier_id", "issuesTable": "validation_supplier_issues",
+             "rules": [{"type": "notNull", "column": "email_id", "message": "m"}]},
+        ]
+        results = RuleEngine(ValidationRulesParser.from_json(data), database).execute()
+
+        assert not results[0].success
+        assert "no_such_column" in results[0].error
+        assert results[1].success
+        assert results[1].issues == 1
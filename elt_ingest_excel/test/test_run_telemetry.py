@@ -0,0 +1,133 @@
+"""Tests for pipeline run telemetry recorded by FileIngestor."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import duckdb
+import pytest
+from openpyxl import Workbook
+
+from elt_ingest_excel import FileIngestor
+
+
+@pytest.fixture
+def temp_dir():
+    """Create ingest, transform and publish configs with a source and template workbook."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir)
+        data = path / "data"
+        data.mkdir()
+        wb = Workbook()
+        wb.active.title = "Suppliers"
+        wb.active.append(["id", "name"])
+        for i in range(5):
+            wb.active.append([i, f"Supplier {i}"])
+        wb.save(data / "source.xlsx")
+
+        template = Workbook()
+        template.active.title = "Out"
+        template.active.append(["id", "name"])
+        template.save(data / "template.xlsx")
+
+        config = path / "config"
+        (config / "ingest").mkdir(parents=True)
+        (config / "ingest" / "ingest.json").write_text(json.dumps([{
+            "workbookFileName": "source.xlsx",
+            "sheets": [{"sheetName": "Suppliers", "headerRow": "1", "dataRow": "2", "targetTableName": "raw_supplier"}],
+        }]))
+        (config / "transform").mkdir()
+        (config / "transform" / "clean.sql").write_text(
+            "CREATE OR REPLACE TABLE clean_supplier AS SELECT * FROM raw_supplier;"
+        )
+        (config / "transform" / "order.txt").write_text("clean.sql\n")
+        (config / "publish").mkdir()
+        (config / "publish" / "publish.json").write_text(json.dumps([{
+            "srcWorkbookPathName": str(data),
+            "srcWorkbookFileName": "template.xlsx",
+            "tgtWorkbookPathName": str(path),
+            "tgtWorkbookFileName": "output",
+            "sheets": [{"srcTableName": "clean_supplier", "sheetName": "Out", "headerRow": "1", "dataRow": "2"}],
+        }]))
+        yield path
+
+
+def _ingestor(path: Path, **kwargs) -> FileIngestor:
+    return FileIngestor(
+        config_base_path=path / "config",
+        cfg_ingest_path="ingest",
+        cfg_ingest_name="ingest.json",
+        cfg_transform_path="transform",
+        cfg_publish_path="publish",
+        cfg_publish_name="publish.json",
+        data_path=path / "data",
+        database_path=path / "test.duckdb",
+        publisher_type="ooxml",
+        **kwargs,
+    )
+
+
+class TestRunTelemetry:
+    """Tests for the pipeline_run_log table and JSON export."""
+
+    def test_run_is_logged_per_unit(self, temp_dir):
+        """Test that workbooks, sheets, SQL files and publish sheets are each logged."""
+        ingestor = _ingestor(temp_dir, run_log_dir=temp_dir / "runs")
+        ingestor.process()
+        run_id = ingestor.run_log.run_id
+
+        with duckdb.connect(str(temp_dir / "test.duckdb")) as conn:
+            rows = conn.execute(
+                "SELECT phase, scope, name, parent, row_count, bytes IS NOT NULL, "
+                "elapsed_seconds >= 0, success FROM pipeline_run_log WHERE run_id = ? ORDER BY seq",
+                [run_id],
+            ).fetchall()
+
+        assert rows == [
+            ("pipeline", "run", "pipeline", None, None, False, True, True),
+            ("ingest", "phase", "ingest", None, 5, False, True, True),
+            ("ingest", "workbook", "source.xlsx", None, 5, True, True, True),
+            ("ingest", "sheet", "raw_supplier", "source.xlsx", 5, False, True, True),
+            ("transform", "phase", "transform", None, None, False, True, True),
+            ("transform", "sql_file", "clean.sql", None, None, False, True, True),
+            ("publish", "phase", "publish", None, 5, False, True, True),
+            ("publish", "publish_sheet", "Out", "output.xlsx", 5, False, True, True),
+            ("publish", "workbook", "output.xlsx", None, 5, True, True, True),
+        ]
+
+        exported = json.loads((temp_dir / "runs" / f"pipeline_run_{run_id}.json").read_text())
+        assert exported["run_id"] == run_id
+        assert len(exported["entries"]) == len(rows)
+
+    def test_runs_accumulate_under_their_own_ids(self, temp_dir):
+        """Test that each process() call appends a new run and a failed run is still logged."""
+        _ingestor(temp_dir).process("ingest")
+        (temp_dir / "config" / "transform" / "clean.sql").write_text("SELECT * FROM missing_table;")
+        failing = _ingestor(temp_dir)
+        with pytest.raises(RuntimeError):
+            failing.process()
+
+        with duckdb.connect(str(temp_dir / "test.duckdb")) as conn:
+            runs = conn.execute(
+                "SELECT run_id, bool_and(success) FROM pipeline_run_log GROUP BY run_id"
+            ).fetchall()
+            run_row = conn.execute(
+                "SELECT success, error FROM pipeline_run_log WHERE run_id = ? AND scope = 'run'",
+                [failing.run_log.run_id],
+            ).fetchone()
+
+        assert len(runs) == 2
+        assert dict(runs)[failing.run_log.run_id] is False
+        assert run_row[0] is False and "Transform failed" in run_row[1]
+
+    def test_run_log_failure_is_reported(self, temp_dir, capsys):
+        """Test that a failing run log write neither fails the run nor hides its error."""
+        blocked = temp_dir / "runs"
+        blocked.write_text("not a directory")
+
+        _ingestor(temp_dir, run_log_dir=blocked).process()
+        assert "Run telemetry not written" in capsys.readouterr().out
+
+        (temp_dir / "config" / "transform" / "clean.sql").write_text("SELECT * FROM missing_table;")
+        with pytest.raises(RuntimeError, match="Transform failed"):
+            _ingestor(temp_dir, run_log_dir=blocked).process()
@@ -0,0 +1,287 @@
+"""Tests for DAG, incremental, selective and profiled transform execution."""
+
+import tempfile
+from pathlib import Path
+
+import duckdb
+import pytest
+
+from elt_ingest_excel.transform import SqlExecutor
+from elt_ingest_excel.transform.dependency_graph import SqlDependencyGraph
+from elt_ingest_excel.writers import TableStatistics
+
+
+def _write_transform(transform_path: Path, files: dict[str, str]) -> None:
+    """Write SQL files and an order.txt listing them in insertion order."""
+    transform_path.mkdir(parents=True, exist_ok=True)
+    for name, sql in files.items():
+        (transform_path / name).write_text(sql)
+    (transform_path / "order.txt").write_text("\n".join(files) + "\n")
+
+
+SQL_FILES = {
+    "src_a.sql": "CREATE OR REPLACE TABLE src_a AS SELECT range AS id FROM range(10);",
+    "src_b.sql": "CREATE OR REPLACE TABLE src_b AS SELECT range AS id FROM range(5);",
+    "mid_a.sql": "CREATE OR REPLACE TABLE mid_a AS SELECT id * 2 AS id FROM src_a;",
+    "mid_b.sql": "-- reads src_b only\nCREATE OR REPLACE TABLE mid_b AS SELECT id FROM src_b;",
+    "final.sql": (
+        "CREATE OR REPLACE TABLE final AS\n"
+        "SELECT a.id FROM mid_a a JOIN mid_b b ON a.id = b.id;"
+    ),
+}
+
+
+class TestSqlDependencyGraph:
+    """Tests for dependency detection between order.txt entries."""
+
+    @pytest.fixture
+    def transform_path(self):
+        """Create a temporary transform directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    def _build(self, transform_path: Path, files: dict[str, str]) -> SqlDependencyGraph:
+        _write_transform(transform_path, files)
+        return SqlDependencyGraph.build(duckdb.connect(), transform_path, list(files))
+
+    def test_dependencies_follow_table_references(self, transform_path):
+        """Test that files depend only on the files producing what they read."""
+        graph = self._build(transform_path, SQL_FILES)
+
+        deps = {node.sql_file: node.depends_on for node in graph.nodes}
+        assert deps["src_a.sql"] == set()
+        assert deps["src_b.sql"] == set()
+        assert deps["mid_a.sql"] == {0}
+        assert deps["mid_b.sql"] == {1}
+        assert deps["final.sql"] == {2, 3}
+        assert graph.critical_path_length() == 3
+
+    def test_comma_joins_are_dependencies(self, transform_path):
+        """Test that every table of a leading-comma FROM list is a dependency."""
+        files = {
+            **{name: SQL_FILES[name] for name in ("src_a.sql", "src_b.sql")},
+            "joined.sql": (
+                "CREATE OR REPLACE TABLE joined AS\n"
+                "SELECT a.id\n"
+                "  FROM src_a a\n"
+                "     , src_b AS b\n"
+                " WHERE a.id = b.id;"
+            ),
+        }
+        graph = self._build(transform_path, files)
+
+        assert graph.nodes[2].sources == {"src_a", "src_b"}
+        assert graph.nodes[2].depends_on == {0, 1}
+
+    def test_macro_calls_are_dependencies(self, transform_path):
+        """Test that calling a macro depends on the file creating it."""
+        graph = self._build(
+            transform_path,
+            {
+                "fn_double.sql": "CREATE OR REPLACE MACRO fn_double(x) AS x * 2;",
+                "use.sql": "CREATE OR REPLACE TABLE t AS SELECT fn_double(1) AS v;",
+            },
+        )
+
+        assert graph.nodes[1].depends_on == {0}
+
+    def test_session_statements_are_barriers(self, transform_path):
+        """Test that files with SET/LOAD statements serialise the graph around them."""
+        graph = self._build(
+            transform_path,
+            {
+                "a.sql": "CREATE OR REPLACE TABLE a AS SELECT 1 AS v;",
+                "settings.sql": "SET threads = 2;",
+                "b.sql": "CREATE OR REPLACE TABLE b AS SELECT 1 AS v;",
+            },
+        )
+
+        assert graph.nodes[1].barrier is True
+        assert graph.nodes[1].depends_on == {0}
+        assert graph.nodes[2].depends_on == {1}
+
+    def test_repeated_entries_are_ordered(self, transform_path):
+        """Test that a file listed twice runs in order.txt order."""
+        _write_transform(
+            transform_path,
+            {"t.sql": "CREATE OR REPLACE TABLE t AS SELECT 1 AS v;"},
+        )
+        graph = SqlDependencyGraph.build(duckdb.connect(), transform_path, ["t.sql", "t.sql"])
+
+        assert graph.nodes[1].depends_on == {0}
+
+
+class TestSqlExecutorParallel:
+    """Tests for SqlExecutor with max_workers > 1."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for SQL files and database."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    def _tables(self, database_path: Path) -> dict[str, list]:
+        # table_statistics is compared without its timestamps
+        bookkeeping = {TableStatistics.TABLE_NAME, TableStatistics.CACHE_TABLE_NAME}
+        with duckdb.connect(str(database_path)) as conn:
+            names = [r[0] for r in conn.execute("SHOW TABLES").fetchall() if r[0] not in bookkeeping]
+            tables = {
+                name: conn.execute(f"SELECT * FROM {name} ORDER BY ALL").fetchall()
+                for name in names
+            }
+            tables[TableStatistics.TABLE_NAME] = conn.execute(
+                f"SELECT table_name, row_count, checksum FROM {TableStatistics.TABLE_NAME} ORDER BY ALL"
+            ).fetchall()
+            return tables
+
+    def test_parallel_matches_sequential(self, temp_dir):
+        """Test that DAG mode builds the same tables as sequential mode."""
+        _write_transform(temp_dir / "sql", SQL_FILES)
+
+        sequential = SqlExecutor(temp_dir / "sql", temp_dir / "seq.duckdb").execute()
+        parallel = SqlExecutor(temp_dir / "sql", temp_dir / "par.duckdb", max_workers=4).execute()
+
+        assert [r.sql_file for r in parallel] == [r.sql_file for r in sequential]
+        assert all(r.success for r in parallel)
+        assert self._tables(temp_dir / "par.duckdb") == self._tables(temp_dir / "seq.duckdb")
+
+    def test_failure_stops_dependents(self, temp_dir):
+        """Test that files depending on a failed file are not run."""
+        files = dict(SQL_FILES)
+        files["mid_a.sql"] = "CREATE OR REPLACE TABLE mid_a AS SELECT missing_column FROM src_a;"
+        _write_transform(temp_dir / "sql", files)
+
+        results = SqlExecutor(temp_dir / "sql", temp_dir / "test.duckdb", max_workers=4).execute()
+
+        by_file = {r.sql_file: r for r in results}
+        assert by_file["mid_a.sql"].success is False
+        assert "final.sql" not in by_file
+        assert "final" not in self._tables(temp_dir / "test.duckdb")
+
+
+class TestIncrementalTransform:
+    """Tests for incremental and selective transform runs."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory with SQL files and an ingested table."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            files = dict(SQL_FILES)
+            files["src_b.sql"] = "CREATE OR REPLACE TABLE src_b AS SELECT id FROM ingested;"
+            _write_transform(path / "sql", files)
+            with duckdb.connect(str(path / "test.duckdb")) as conn:
+                conn.execute("CREATE TABLE ingested AS SELECT range AS id FROM range(5)")
+            yield path
+
+    def _run(self, temp_dir: Path, **kwargs) -> dict[str, bool]:
+        results = SqlExecutor(temp_dir / "sql", temp_dir / "test.duckdb", **kwargs).execute()
+        assert all(r.success for r in results)
+        return {r.sql_file: r.skipped for r in results}
+
+    def test_unchanged_files_are_skipped(self, temp_dir):
+        """Test that a second incremental run skips every file."""
+        first = self._run(temp_dir, incremental=True)
+        second = self._run(temp_dir, incremental=True)
+
+        assert not any(first.values())
+        assert all(second.values())
+
+    def test_changed_sql_reruns_downstream(self, temp_dir):
+        """Test that editing a file reruns it and the files reading its output."""
+        self._run(temp_dir, incremental=True)
+        (temp_dir / "sql" / "mid_a.sql").write_text(
+            "CREATE OR REPLACE TABLE mid_a AS SELECT id * 3 AS id FROM src_a;"
+        )
+
+        skipped = self._run(temp_dir, incremental=True)
+
+        assert skipped == {
+            "src_a.sql": True,
+            "src_b.sql": True,
+            "mid_a.sql": False,
+            "mid_b.sql": True,
+            "final.sql": False,
+        }
+
+    def test_changed_source_table_reruns_readers(self, temp_dir):
+        """Test that new data in a table not built by order.txt reruns its readers."""
+        self._run(temp_dir, incremental=True)
+        with duckdb.connect(str(temp_dir / "test.duckdb")) as conn:
+            conn.execute("INSERT INTO ingested VALUES (99)")
+
+        skipped = self._run(temp_dir, incremental=True, max_workers=4)
+
+        assert [f for f, s in skipped.items() if not s] == ["src_b.sql", "mid_b.sql", "final.sql"]
+
+    def test_missing_output_is_rebuilt(self, temp_dir):
+        """Test that a dropped output table forces its file to rerun."""
+        self._run(temp_dir, incremental=True)
+        with duckdb.connect(str(temp_dir / "test.duckdb")) as conn:
+            conn.execute("DROP TABLE mid_b")
+
+        skipped = self._run(temp_dir, incremental=True)
+
+        assert [f for f, s in skipped.items() if not s] == ["mid_b.sql"]
+
+    def test_select_with_downstream(self, temp_dir):
+        """Test that "file+" runs the file and everything downstream of it."""
+        self._run(temp_dir)
+
+        skipped = self._run(temp_dir, select=["mid_a+"])
+
+        assert [f for f, s in skipped.items() if not s] == ["mid_a.sql", "final.sql"]
+
+    def test_select_unknown_file(self, temp_dir):
+        """Test that a select pattern matching nothing is rejected."""
+        with pytest.raises(ValueError, match="missing.sql"):
+            SqlExecutor(temp_dir / "sql", temp_dir / "test.duckdb", select=["missing.sql"]).execute()
+
+
+class TestTransformProfile:
+    """Tests for per-statement transform profiling."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory with SQL files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir)
+            _write_transform(path / "sql", SQL_FILES)
+            yield path
+
+    def _profile_rows(self, temp_dir: Path) -> list[tuple]:
+        with duckdb.connect(str(temp_dir / "test.duckdb")) as conn:
+            return conn.execute(
+                "SELECT sql_file, statement_index, statement_type, row_count, "
+                "peak_buffer_memory IS NOT NULL, profile IS NOT NULL "
+                "FROM transform_profile ORDER BY sql_file"
+            ).fetchall()
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_statements_are_profiled(self, temp_dir, max_workers):
+        """Test that every statement gets a transform_profile row with its row count."""
+        SqlExecutor(
+            temp_dir / "sql", temp_dir / "test.duckdb", max_workers=max_workers, profile=True
+        ).execute()
+
+        rows = self._profile_rows(temp_dir)
+
+        assert rows == [
+            ("final.sql", 1, "CREATE", 3, True, True),
+            ("mid_a.sql", 1, "CREATE", 10, True, True),
+            ("mid_b.sql", 1, "CREATE", 5, True, True),
+            ("src_a.sql", 1, "CREATE", 10, True, True),
+            ("src_b.sql", 1, "CREATE", 5, True, True),
+        ]
+
+    def test_profile_report_is_ranked(self, temp_dir, capsys):
+        """Test that the console report lists statements slowest first."""
+        from elt_ingest_excel.reporting import PipelineReporter
+
+        SqlExecutor(
+            temp_dir / "sql", temp_dir / "test.duckdb", reporter=PipelineReporter(), profile=True
+        ).execute()
+
+        report = capsys.readouterr().out.split("Transform Profile", 1)[1]
+        assert report.count(".sql #1 CREATE") == 5
+        assert "hottest:" in report
@@ -0,0 +1,101 @@
+"""Tests for table statistics and the query result cache."""
+
+import tempfile
+from pathlib import Path
+
+import duckdb
+import pandas as pd
+import pytest
+
+from elt_ingest_excel.transform import SqlExecutor
+from elt_ingest_excel.writers import DuckDBWriter, SaveMode, TableStatistics
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def _frame(ids: range) -> pd.DataFrame:
+    return pd.DataFrame({"id": [str(i) for i in ids], "name": [f"Name {i}" if i % 3 else None for i in ids]})
+
+
+class TestWriterStatistics:
+    """Tests for statistics maintained by DuckDBWriter."""
+
+    def test_append_matches_rescan(self, temp_dir):
+        """Appends update count and checksum incrementally to what a rescan computes."""
+        with DuckDBWriter(temp_dir / "db.duckdb", run_id="run1") as writer:
+            writer.write(_frame(range(10)), "t", SaveMode.RECREATE)
+            result = writer.write(_frame(range(10, 15)), "t", SaveMode.APPEND)
+            appended = writer.statistics.get("t")
+            rescanned = writer.statistics.refresh("t")
+
+        assert result.row_count == 15
+        assert appended == rescanned
+        assert appended.run_id == "run1"
+
+    def test_run_id_changes_only_with_content(self, temp_dir):
+        """Rewriting the same rows keeps the run id of the last real change."""
+        database = temp_dir / "db.duckdb"
+        with DuckDBWriter(database, run_id="run1") as writer:
+            writer.write(_frame(range(5)), "t", SaveMode.RECREATE)
+        with DuckDBWriter(database, run_id="run2") as writer:
+            writer.write(_frame(range(5)), "t", SaveMode.OVERWRITE)
+            unchanged = writer.statistics.get("t")
+            writer.write(_frame(range(6)), "t", SaveMode.OVERWRITE)
+            changed = writer.statistics.get("t")
+            writer.write(_frame(range(6)), "t", SaveMode.DROP)
+            dropped = writer.statistics.get("t")
+
+        assert (unchanged.row_count, unchanged.run_id) == (5, "run1")
+        assert (changed.row_count, changed.run_id) == (6, "run2")
+        assert dropped is None
+
+    def test_typed_append_matches_rescan(self, temp_dir):
+        """Widening a typed table before an append keeps the statistics consistent."""
+        with DuckDBWriter(temp_dir / "db.duckdb", typed_load=True) as writer:
+            writer.write(_frame(range(10)), "t", SaveMode.RECREATE)
+            writer.write(_frame(range(10, 12)), "t", SaveMode.APPEND, infer_types=False)
+            appended = writer.statistics.get("t")
+            rescanned = writer.statistics.refresh("t")
+
+        assert appended.version == rescanned.version
+
+
+def test_transform_records_statistics(temp_dir):
+    """The executor records the tables each SQL file builds, with the run id."""
+    sql = temp_dir / "sql"
+    sql.mkdir()
+    (sql / "order.txt").write_text("a.sql\nb.sql\n")
+    (sql / "a.sql").write_text("CREATE OR REPLACE TABLE a AS SELECT range AS v FROM range(4);")
+    (sql / "b.sql").write_text("CREATE OR REPLACE TABLE b AS SELECT v FROM a WHERE v > 1;\nDROP TABLE IF EXISTS gone;")
+
+    SqlExecutor(sql, temp_dir / "db.duckdb", run_id="run1").execute()
+    SqlExecutor(sql, temp_dir / "db.duckdb", run_id="run2", max_workers=2).execute()
+
+    with DuckDBWriter(temp_dir / "db.duckdb") as writer:
+        stats = {s.table_name: (s.row_count, s.run_id) for s in writer.statistics.matching()}
+
+    assert stats == {"a": (4, "run1"), "b": (2, "run1")}
+
+
+def test_cached_query_follows_table_version(temp_dir):
+    """A cached result is reused until the statistics of a table it reads change."""
+    with DuckDBWriter(temp_dir / "db.duckdb") as writer:
+        writer.write(_frame(range(3)), "t", SaveMode.RECREATE)
+        statistics = writer.statistics
+        query = "SELECT count(*) FROM t"
+
+        assert statistics.cached_query(query, ["t"]) == [(3,)]
+        # A change the statistics have not seen is not visible through the cache
+        writer.connection.execute("DELETE FROM t")
+        assert statistics.cached_query(query, ["t"]) == [(3,)]
+        statistics.refresh("t")
+        assert statistics.cached_query(query, ["t"]) == [(0,)]
+
+
+def test_read_only_without_statistics():
+    """A read-only reader of a database without statistics finds none."""
+    assert TableStatistics(duckdb.connect(), read_only=True).get("t") is None
@@ -0,0 +1,165 @@
+"""Tests for column type inference and typed loads."""
+
+import datetime
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from elt_ingest_excel.loaders import SheetProcessor
+from elt_ingest_excel.models import SheetConfig, WorkbookConfig
+from elt_ingest_excel.writers import ColumnTypeInference, DuckDBWriter, SaveMode
+
+
+def _frame(rows: int = 40) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "id": [str(i) for i in range(rows)],
+            "big_id": [str(10_000_000_000 + i) for i in range(rows)],
+            "rate": [f"{i}.5" if i % 2 else str(i) for i in range(rows)],
+            "active": ["True" if i % 3 else "False" for i in range(rows)],
+            "start_date": [f"2024-01-{i % 28 + 1:02d} 00:00:00" for i in range(rows)],
+            "updated_at": [f"2024-01-01 10:{i % 60:02d}:00" for i in range(rows)],
+            "country": ["GB" if i % 2 else "IE" for i in range(rows)],
+            "phone": [f"0770090{i:04d}" for i in range(rows)],
+            "name": [f"Name {i}" for i in range(rows)],
+            "optional": ["" if i % 2 else str(i) for i in range(rows)],
+            "blank": [""] * rows,
+        }
+    )
+
+
+@pytest.fixture
+def temp_db():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir) / "typed.duckdb"
+
+
+class TestColumnTypeInference:
+    """Tests for ColumnTypeInference."""
+
+    def test_types_inferred_and_applied(self, temp_db):
+        """Each column gets the most compact type that reproduces its text."""
+        with DuckDBWriter(temp_db, typed_load=True) as writer:
+            result = writer.write(_frame(), "workers", SaveMode.RECREATE)
+            types = dict(
+                writer.connection.execute(
+                    "SELECT column_name, data_type FROM information_schema.columns WHERE table_name = 'workers'"
+                ).fetchall()
+            )
+            optional = writer.connection.execute("SELECT count(optional) FROM workers").fetchone()[0]
+
+        assert result.column_types == {
+            "id": "INTEGER",
+            "big_id": "BIGINT",
+            "rate": "DOUBLE",
+            "active": "BOOLEAN",
+            "start_date": "DATE",
+            "updated_at": "TIMESTAMP",
+            "country": "ENUM",
+            "phone": "VARCHAR",
+            "name": "VARCHAR",
+            "optional": "INTEGER",
+            "blank": "VARCHAR",
+        }
+        assert types["country"] == "ENUM('GB', 'IE')"
+        assert optional == 20
+
+    def test_full_table_check_overrides_sample(self, temp_db):
+        """A value outside the sample that does not round-trip keeps the column VARCHAR."""
+        df = pd.DataFrame({"code": [str(i) for i in range(500)] + ["007"]})
+        with DuckDBWriter(temp_db) as writer:
+            writer.write(df, "codes", SaveMode.RECREATE)
+            inference = ColumnTypeInference(writer.connection, sample_rows=10)
+            assert inference.infer("codes") == {"code": "VARCHAR"}
+
+    def test_untyped_write_keeps_varchar(self, temp_db):
+        """Without typed_load every column stays VARCHAR."""
+        with DuckDBWriter(temp_db) as writer:
+            result = writer.write(_frame(), "workers", SaveMode.RECREATE)
+            types = {
+                row[0]
+                for row in writer.connection.execute(
+                    "SELECT DISTINCT data_type FROM information_schema.columns WHERE table_name = 'workers'"
+                ).fetchall()
+            }
+
+        assert result.column_types is None
+        assert types == {"VARCHAR"}
+
+    def test_append_widens_then_reinfers(self, temp_db):
+        """Appending rows that no longer fit a typed column turns it back into text."""
+        with DuckDBWriter(temp_db, typed_load=True) as writer:
+            writer.write(pd.DataFrame({"id": ["1", "2"], "code": ["10", "20"]}), "t", SaveMode.RECREATE)
+            result = writer.write(pd.DataFrame({"id": ["3"], "code": ["A1"]}), "t", SaveMode.APPEND)
+            rows = writer.connection.execute("SELECT id, code FROM t ORDER BY id").fetchall()
+
+        assert result.column_types == {"id": "INTEGER", "code": "VARCHAR"}
+        assert rows == [(1, "10"), (2, "20"), (3, "A1")]
+
+
+    def test_append_keeps_original_text(self, temp_db):
+        """Widening restores the text typed columns were converted from, blanks included."""
+        first = pd.DataFrame(
+            {
+                "d": ["2024-01-01 00:00:00", "2024-01-02 00:00:00"],
+                "b": ["True", "False"],
+                "x": ["2", "1.5"],
+                "n": ["", "7"],
+            }
+        )
+        later = pd.DataFrame({"d": ["soon"], "b": ["maybe"], "x": ["n/a"], "n": ["x"]})
+        with DuckDBWriter(temp_db, typed_load=True) as writer:
+            typed = writer.write(first, "t", SaveMode.RECREATE)
+            result = writer.write(later, "t", SaveMode.APPEND)
+            rows = writer.connection.execute("SELECT d, b, x, n FROM t").fetchall()
+
+        assert typed.column_types == {"d": "DATE", "b": "BOOLEAN", "x": "DOUBLE", "n": "INTEGER"}
+        assert set(result.column_types.values()) == {"VARCHAR"}
+        assert sorted(rows) == sorted(pd.concat([first, later]).itertuples(index=False, name=None))
+
+    def test_lossy_text_stays_varchar(self, temp_db):
+        """Values a typed column would render differently keep the column VARCHAR."""
+        df = pd.DataFrame({"b": ["true", "false"], "d": ["2024-01-01", "2024-01-02"], "x": ["2.0", "1.5"]})
+        with DuckDBWriter(temp_db) as writer:
+            writer.write(df, "t", SaveMode.RECREATE)
+            types = ColumnTypeInference(writer.connection).infer("t")
+
+        assert types == {"b": "VARCHAR", "d": "VARCHAR", "x": "VARCHAR"}
+
+
+class TestTypedSheetLoad:
+    """Tests for typed loads through SheetProcessor."""
+
+    @pytest.mark.parametrize("chunk_rows", [None, 7])
+    def test_sheet_load_is_typed(self, temp_db, chunk_rows):
+        """Whole-sheet and chunked loads infer the same types."""
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Workers"
+        ws.append(["Worker ID", "Start Date", "Rate", "Country"])
+        for i in range(20):
+            ws.append([i, datetime.datetime(2024, 1, i + 1), i + 0.25, "GB"])
+        wb.save(temp_db.parent / "workers.xlsx")
+
+        sheet = SheetConfig(sheet_name="Workers", target_table_name="workers")
+        processor = SheetProcessor(
+            data_path=temp_db.parent,
+            data_file_name="workers.xlsx",
+            workbook_config=WorkbookConfig(workbook_file_name="workers.xlsx", sheets=[sheet]),
+            chunk_rows=chunk_rows,
+        )
+        with DuckDBWriter(temp_db, typed_load=True) as writer:
+            result = processor.process_sheet(sheet, writer)
+            first = writer.connection.execute("SELECT * FROM workers ORDER BY worker_id LIMIT 1").fetchone()
+
+        assert result.row_count == 20
+        assert result.column_types == {
+            "worker_id": "INTEGER",
+            "start_date": "DATE",
+            "rate": "DOUBLE",
+            "country": "ENUM",
+        }
+        assert first == (0, datetime.date(2024, 1, 1), 0.25, "GB")
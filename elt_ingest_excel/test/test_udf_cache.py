@@ -0,0 +1,77 @@
+"""Tests for the shared UDF result cache."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from elt_ingest_excel.transform import SqlExecutor
+from elt_ingest_excel.transform.udf import phone
+from elt_ingest_excel.transform.udf.cache import UdfCache
+
+
+@pytest.fixture
+def temp_dir():
+    """Create a temporary directory for cache files."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+class TestUdfCache:
+    """Tests for UdfCache."""
+
+    def test_memory_lru_is_bounded(self):
+        """Test that the least recently used entries are evicted."""
+        cache = UdfCache(max_entries=2)
+        cache.put("f", "1", "a", 1)
+        cache.put("f", "1", "b", 2)
+        cache.get("f", "1", "a")
+        cache.put("f", "1", "c", 3)
+
+        assert cache.get_many("f", "1", ["a", "b", "c"]) == {"a": 1, "c": 3}
+
+    def test_disk_store_survives_restart(self, temp_dir):
+        """Test that values written by one cache are read by the next."""
+        first = UdfCache(temp_dir / "cache.sqlite")
+        first.put_many("f", "1", {("07700", "GB"): {"device_type": "Mobile"}, ("x", None): None})
+        first.close()
+
+        second = UdfCache(temp_dir / "cache.sqlite")
+        found = second.get_many("f", "1", [("07700", "GB"), ("x", None), ("y", None)])
+
+        assert found == {("07700", "GB"): {"device_type": "Mobile"}, ("x", None): None}
+        assert second.stats["f"].disk_hits == 2
+        assert second.stats["f"].misses == 1
+
+    def test_version_isolates_entries(self, temp_dir):
+        """Test that entries from another UDF version are not returned."""
+        cache = UdfCache(temp_dir / "cache.sqlite")
+        cache.put("f", "1", "a", "old")
+
+        assert cache.get("f", "2", "a") is None
+
+
+class TestSqlExecutorUdfCache:
+    """Tests for UDF caching across SqlExecutor runs."""
+
+    def test_second_run_reads_disk_cache(self, temp_dir):
+        """Test that a rerun reuses UDF results persisted by the previous run."""
+        sql_path = temp_dir / "sql"
+        sql_path.mkdir()
+        (sql_path / "phones.sql").write_text(
+            "CREATE OR REPLACE TABLE phones AS "
+            "SELECT get_phone_type('07700 9' || lpad(range::VARCHAR, 5, '0'), 'GB') AS t "
+            "FROM range(20);"
+        )
+        (sql_path / "order.txt").write_text("phones.sql\n")
+
+        def run():
+            SqlExecutor(
+                sql_path, temp_dir / "test.duckdb", udf_cache_path=temp_dir / "udf.sqlite"
+            ).execute()
+
+        run()
+        cache = UdfCache(temp_dir / "udf.sqlite")
+        keys = [(f"07700 9{i:05d}", "GB") for i in range(20)]
+
+        assert len(cache.get_many("get_phone_type", phone.UDF_VERSION, keys)) == 20
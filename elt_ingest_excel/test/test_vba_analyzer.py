@@ -0,0 +1,237 @@
+"""Tests for the VBA project analyzer."""
+
+import random
+import struct
+import tempfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from elt_ingest_excel.macro import excel_macro_runner
+from elt_ingest_excel.macro.vba_analyzer import (
+    VbaMacroAnalyzer,
+    analyze_folder,
+    decompress_vba_stream,
+    iter_printable_strings,
+    list_vba_entry_points,
+    read_vba_modules,
+)
+
+MODULE1 = """Attribute VB_Name = "Module1"
+' Sub NotAMacro()
+Public Sub runAllValidationsFromSheet()
+    MsgBox "Sub Fake"
+End Sub
+
+Private Sub helper()
+End Sub
+
+Function Total(a, b)
+    Total = a + b
+End Function
+
+Sub Auto_Open()
+End Sub
+
+Private Declare PtrSafe Function GetTickCount Lib "kernel32" () As Long
+"""
+
+SHEET1 = """Attribute VB_Name = "Sheet1"
+Private Sub Worksheet_Change(ByVal Target As Range)
+End Sub
+"""
+
+ENDOFCHAIN, FREESECT, FATSECT, NOSTREAM = 0xFFFFFFFE, 0xFFFFFFFF, 0xFFFFFFFD, 0xFFFFFFFF
+
+
+def _compress(data: bytes) -> bytes:
+    """MS-OVBA compressed container using raw chunks and literal-only chunks."""
+    out = bytearray(b"\x01")
+    for start in range(0, len(data), 4096):
+        piece = data[start:start + 4096]
+        if len(piece) == 4096:
+            out += struct.pack("<H", 0x3FFF) + piece
+            continue
+        chunk = bytearray()
+        for i in range(0, len(piece), 8):
+            chunk += b"\x00" + piece[i:i + 8]
+        out += struct.pack("<H", 0xB000 | (len(chunk) - 1)) + chunk
+    return bytes(out)
+
+
+def _record(record_id: int, data: bytes = b"") -> bytes:
+    return struct.pack("<HI", record_id, len(data)) + data
+
+
+def _vba_project(modules: list[tuple[str, str, bool]]) -> bytes:
+    """Build a vbaProject.bin with a VBA storage holding dir and one stream per module."""
+    directory = _record(0x0003, struct.pack("<H", 1252))
+    directory += struct.pack("<HIIH", 0x0009, 4, 1, 0)  # PROJECTVERSION
+    directory += _record(0x000F, struct.pack("<H", len(modules)))
+    streams: dict[str, bytes] = {}
+    for name, source, document in modules:
+        cache = b"\xcc" * 4096  # performance cache before the source
+        streams[name] = cache + _compress(source.replace("\n", "\r\n").encode("cp1252"))
+        directory += _record(0x0019, name.encode())
+        directory += _record(0x001A, name.encode()) + _record(0x0032, name.encode("utf-16-le"))
+        directory += _record(0x0031, struct.pack("<I", len(cache)))
+        directory += _record(0x0022 if document else 0x0021)
+        directory += _record(0x002B)
+    directory += _record(0x0010)
+    # Pad so every stream is above the 4096-byte mini stream cutoff
+    streams = {"dir": _compress(directory.ljust(4096, b"\x00")), **streams}
+    return _compound_file(streams)
+
+
+def _compound_file(streams: dict[str, bytes]) -> bytes:
+    """Minimal CFB v3 file: Root Entry > VBA storage > streams, all in regular sectors."""
+    names = list(streams)
+    entries = [
+        _dir_entry("Root Entry", 5, child=1),
+        _dir_entry("VBA", 1, child=2),
+    ]
+    dir_sectors = -(-(len(names) + 2) // 4)
+    fat = [FATSECT] + [i + 2 for i in range(dir_sectors - 1)] + [ENDOFCHAIN]
+    body = bytearray()
+    for i, name in enumerate(names):
+        data = streams[name]
+        sectors = -(-len(data) // 512)
+        start = len(fat)
+        fat += [start + k + 1 for k in range(sectors - 1)] + [ENDOFCHAIN]
+        body += data.ljust(sectors * 512, b"\x00")
+        right = i + 3 if i + 1 < len(names) else NOSTREAM
+        entries.append(_dir_entry(name, 2, right=right, start=start, size=len(data)))
+    assert len(fat) <= 128
+    while len(entries) % 4:
+        entries.append(b"\x00" * 64 + struct.pack("<HBBIII", 0, 0, 0, NOSTREAM, NOSTREAM, NOSTREAM) + b"\x00" * 48)
+    header = struct.pack(
+        "<8s16sHHHHH6sIIIIIIIII",
+        bytes.fromhex("D0CF11E0A1B11AE1"), b"\x00" * 16, 0x3E, 3, 0xFFFE, 9, 6, b"\x00" * 6,
+        0, 1, 1, 0, 4096, ENDOFCHAIN, 0, ENDOFCHAIN, 0,
+    ) + struct.pack("<I", 0) + struct.pack("<I", FREESECT) * 108
+    fat_sector = b"".join(struct.pack("<I", x) for x in fat).ljust(512, b"\xff")
+    return header + fat_sector + b"".join(entries) + bytes(body)
+
+
+def _dir_entry(name: str, kind: int, child: int = NOSTREAM, right: int = NOSTREAM, start: int = ENDOFCHAIN, size: int = 0) -> bytes:
+    encoded = (name + "\x00").encode("utf-16-le")
+    return (
+        encoded.ljust(64, b"\x00")
+        + struct.pack("<HBBIII", len(encoded), kind, 1, NOSTREAM, right, child)
+        + b"\x00" * 16
+        + struct.pack("<IQQIQ", 0, 0, 0, start, size)
+    )
+
+
+def _write_workbook(path: Path, vba_project: bytes) -> Path:
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr(
+            "xl/workbook.xml",
+            '<workbook><sheets><sheet name="Data"/><sheet name="Validation Results"/></sheets></workbook>',
+        )
+        zf.writestr("xl/vbaProject.bin", vba_project)
+    return path
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def vba_project():
+    return _vba_project([("Module1", MODULE1, False), ("Sheet1", SHEET1, True)])
+
+
+class TestVbaMacroAnalyzer:
+    """Tests for VbaMacroAnalyzer."""
+
+    def test_modules_decompressed(self, vba_project):
+        """Each module's source is decompressed from its offset in the module stream."""
+        modules = read_vba_modules(vba_project)
+
+        assert [(m.name, m.module_type) for m in modules] == [("Module1", "standard"), ("Sheet1", "document")]
+        assert modules[0].source == MODULE1
+
+    def test_macros_parsed_from_source(self, temp_dir, vba_project):
+        """Declarations come from real source lines, not comments, strings or Declare statements."""
+        workbook = _write_workbook(temp_dir / "book.xlsm", vba_project)
+        result = VbaMacroAnalyzer(workbook).analyze()
+
+        assert [(m.macro_type, m.name, m.module, m.scope) for m in result.macros] == [
+            ("Function", "Total", "Module1", "Public"),
+            ("Sub", "helper", "Module1", "Private"),
+            ("Sub", "runAllValidationsFromSheet", "Module1", "Public"),
+            ("Sub", "Worksheet_Change", "Sheet1", "Private"),
+        ]
+        assert result.modules == ["Module1", "Sheet1"]
+        assert result.validation_sheets == ["Validation Results"]
+
+    def test_entry_points(self, temp_dir, vba_project):
+        """Entry points are the non-Private macros, from both listing functions."""
+        workbook = _write_workbook(temp_dir / "book.xlsm", vba_project)
+
+        assert list_vba_entry_points(workbook) == ["Total", "runAllValidationsFromSheet"]
+        assert excel_macro_runner.list_vba_entry_points(workbook) == ["runAllValidationsFromSheet", "Total"]
+
+    def test_unparseable_project_falls_back_to_strings(self, temp_dir):
+        """A project that is not an OLE file is scanned for printable strings."""
+        workbook = _write_workbook(temp_dir / "book.xlsm", b"\x00\x01Sub runAllValidationsFromSheet()\x00")
+
+        result = VbaMacroAnalyzer(workbook).analyze()
+
+        assert [m.name for m in result.macros] == ["runAllValidationsFromSheet"]
+        assert result.modules == []
+
+
+def test_decompress_copy_tokens():
+    """Copy tokens repeat earlier output, including overlapping copies."""
+    # Literals "abc", then a copy token with offset 3 and length 6
+    chunk = bytes([0x08]) + b"abc" + struct.pack("<H", 0x2003)
+    data = b"\x01" + struct.pack("<H", 0xB000 | (len(chunk) - 1)) + chunk
+
+    assert decompress_vba_stream(data) == b"abcabcabc"
+    with pytest.raises(ValueError):
+        decompress_vba_stream(b"\x00")
+
+
+def test_printable_strings_match_byte_loop():
+    """The compiled regex finds the same runs as a byte-by-byte scan."""
+    data = bytes(random.Random(7).choice([0, 9, 32, 65, 97, 126, 127, 200]) for _ in range(5000))
+
+    def loop(min_len):
+        strings, current = [], bytearray()
+        for b in data + b"\x00":
+            if 32 <= b <= 126:
+                current.append(b)
+                continue
+            if len(current) >= min_len:
+                strings.append(current.decode("ascii"))
+            current = bytearray()
+        return strings
+
+    for min_len in (1, 2, 4):
+        assert list(iter_printable_strings(data, min_len)) == loop(min_len)
+
+
+def test_analyze_folder(temp_dir, vba_project):
+    """Folders are analyzed in parallel; unreadable workbooks report an error."""
+    (temp_dir / "sub").mkdir()
+    _write_workbook(temp_dir / "a.xlsm", vba_project)
+    _write_workbook(temp_dir / "sub" / "b.xlam", _vba_project([("Tools", "Sub Export()\nEnd Sub\n", False)]))
+    (temp_dir / "broken.xlsm").write_bytes(b"not a zip")
+    (temp_dir / "~$a.xlsm").write_bytes(b"lock")
+    (temp_dir / "notes.xlsx").write_bytes(b"ignored")
+
+    results = analyze_folder(temp_dir, workers=2)
+
+    assert [Path(r.workbook_path).name for r in results] == ["a.xlsm", "broken.xlsm", "b.xlam"]
+    assert len(results[0].macros) == 4
+    assert results[1].error
+    assert [m.name for m in results[2].macros] == ["Export"]
+    assert [Path(r.workbook_path).name for r in analyze_folder(temp_dir, workers=1, recursive=False)] == [
+        "a.xlsm",
+        "broken.xlsm",
+    ]
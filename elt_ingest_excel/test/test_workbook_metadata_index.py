@@ -0,0 +1,123 @@
+"""Tests for the workbook metadata index of list validations and defined names."""
+
+import json
+import tempfile
+import zipfile
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.workbook.defined_name import DefinedName
+from openpyxl.worksheet.datavalidation import DataValidation
+
+from elt_ingest_excel.ooxml import WorkbookMetadataIndex
+
+# x14 list validation as Excel writes it for lists on another sheet
+X14_EXT = (
+    '<extLst><ext uri="{CCE6A557-97BC-4b89-ADB6-D9C93CAAB3DF}" '
+    'xmlns:x14="http://schemas.microsoft.com/office/spreadsheetml/2009/9/main">'
+    '<x14:dataValidations count="1" xmlns:xm="http://schemas.microsoft.com/office/excel/2006/main">'
+    '<x14:dataValidation type="list" allowBlank="1"><x14:formula1><xm:f>Lists!$C$2:$C$3</xm:f>'
+    "</x14:formula1><xm:sqref>F4:F50</xm:sqref></x14:dataValidation></x14:dataValidations></ext></extLst>"
+)
+
+
+def _build_workbook(path: Path) -> None:
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Supplier Name"
+    ws.append(["Supplier ID", "Category", "Public", "Worktag", "Country", "Region"])
+    for i in range(2, 200):
+        ws.append([f"S{i}", "Legal", "Yes", None, "United Kingdom", None])
+
+    lists = wb.create_sheet("Lists")
+    lists.append(["Worktag", "Category", "Region"])
+    lists.append(["Yes", "Legal", "North"])
+    lists.append(["No", "Benefits", "South"])
+    lists.append([None, " Catering ", None])
+    lists.append([7, None, None])
+
+    wb.defined_names["Categories"] = DefinedName("Categories", attr_text="Lists!$B$2:$B$4")
+    wb.defined_names["United_Kingdom_Tax_Type"] = DefinedName(
+        "United_Kingdom_Tax_Type", attr_text="'Lists'!$A$2:$A$3"
+    )
+
+    public = DataValidation(type="list", formula1='"Yes,No"')
+    public.add("C2:C100")
+    worktag = DataValidation(type="list", formula1="Lists!$A$2:$A$5")
+    worktag.add("D2:D100")
+    category = DataValidation(type="list", formula1="=Categories")
+    category.add("B2:B100")
+    dynamic = DataValidation(type="list", formula1='INDIRECT(SUBSTITUTE($E2," ","_")&"_Tax_Type")')
+    dynamic.add("E2:E100")
+    for dv in (public, worktag, category, dynamic):
+        ws.add_data_validation(dv)
+    wb.save(path)
+
+    # Add an x14 validation to the first sheet
+    temp = path.with_suffix(".tmp")
+    with zipfile.ZipFile(path) as src, zipfile.ZipFile(temp, "w", zipfile.ZIP_DEFLATED) as out:
+        for info in src.infolist():
+            data = src.read(info)
+            if info.filename == "xl/worksheets/sheet1.xml":
+                data = data.replace(b"</worksheet>", X14_EXT.encode() + b"</worksheet>")
+            out.writestr(info, data)
+    temp.replace(path)
+
+
+@pytest.fixture
+def workbook_path():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "supplier.xlsx"
+        _build_workbook(path)
+        yield path
+
+
+class TestWorkbookMetadataIndex:
+    """Tests for WorkbookMetadataIndex."""
+
+    def test_cell_lookups(self, workbook_path):
+        """Quoted lists, ranges, defined names and x14 validations resolve to values."""
+        index = WorkbookMetadataIndex.build(workbook_path)
+
+        assert index.list_values("Supplier Name", cell="C10") == ["No", "Yes"]
+        assert index.list_values("Supplier Name", cell="D10") == ["7", "No", "Yes"]
+        assert index.list_values("Supplier Name", cell="B10") == ["Benefits", "Catering", "Legal"]
+        assert index.list_values("Supplier Name", cell="F10") == ["North", "South"]
+        assert index.list_values("Supplier Name", cell="C101") == []
+        assert index.list_values("Supplier Name", column="C") == ["No", "Yes"]
+        assert index.list_values("Supplier Name", column=6) == ["North", "South"]
+
+    def test_unresolvable_formula_kept(self, workbook_path):
+        """INDIRECT lists are recorded unresolved; defined names are resolved on their own."""
+        index = WorkbookMetadataIndex.build(workbook_path)
+
+        dynamic = [v for v in index.validations["Supplier Name"] if v.formula.startswith("INDIRECT")]
+        assert len(dynamic) == 1
+        assert dynamic[0].values is None
+        assert index.list_values("Supplier Name", cell="E10") == []
+        assert index.defined_names["Categories"] == "Lists!$B$2:$B$4"
+        assert index.named_values["United_Kingdom_Tax_Type"] == ["Yes", "No"]
+
+    def test_index_cached_by_file_hash(self, workbook_path, monkeypatch):
+        """load() saves <sha256>.json and reuses it until the workbook content changes."""
+        index_dir = workbook_path.parent / "index"
+        first = WorkbookMetadataIndex.load(workbook_path, index_dir)
+        index_file = index_dir / f"{first.file_hash}.json"
+        assert json.loads(index_file.read_text())["file_hash"] == first.file_hash
+
+        def fail(*args, **kwargs):
+            raise AssertionError("workbook should not be re-read")
+
+        monkeypatch.setattr(WorkbookMetadataIndex, "build", classmethod(fail))
+        cached = WorkbookMetadataIndex.load(workbook_path, index_dir)
+        assert cached == first
+
+        monkeypatch.undo()
+        wb = load_workbook(workbook_path)
+        wb["Lists"]["A3"] = "Maybe"
+        wb.save(workbook_path)
+        changed = WorkbookMetadataIndex.load(workbook_path, index_dir)
+        assert changed.file_hash != first.file_hash
+        assert changed.list_values("Supplier Name", cell="D10") == ["7", "Maybe", "Yes"]
+        assert len(list(index_dir.glob("*.json"))) == 2
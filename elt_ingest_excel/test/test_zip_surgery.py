@@ -0,0 +1,80 @@
+"""Tests for zip member replacement without recompression."""
+
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from elt_ingest_excel.ooxml import copy_with_replacements, replace_members
+
+
+def _raw_member(path: Path, name: str) -> bytes:
+    """A member's compressed bytes as stored in the package."""
+    with zipfile.ZipFile(path) as zf, open(path, "rb") as raw:
+        info = zf.getinfo(name)
+        raw.seek(info.header_offset + 26)
+        name_len, extra_len = int.from_bytes(raw.read(2), "little"), int.from_bytes(raw.read(2), "little")
+        raw.seek(name_len + extra_len, os.SEEK_CUR)
+        return raw.read(info.compress_size)
+
+
+@pytest.fixture
+def package():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "book.xlsm"
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+            zf.writestr("[Content_Types].xml", "<Types/>")
+            zf.writestr("xl/worksheets/sheet1.xml", "<worksheet>old</worksheet>" * 100)
+            zf.writestr("xl/media/image1.png", os.urandom(5000), zipfile.ZIP_STORED)
+            zf.writestr("xl/vbaProject.bin", b"\xd0\xcf\x11\xe0" * 2000)
+            zf.writestr("xl/données.xml", "<x/>")
+            zf.comment = b"template"
+        yield path
+
+
+def test_unchanged_members_copied_raw(package):
+    """Unchanged members keep their stored bytes; replaced members hold the new content."""
+    target = package.with_name("out.xlsm")
+
+    copy_with_replacements(
+        package,
+        target,
+        {
+            "xl/worksheets/sheet1.xml": lambda stream: stream.write(b"<worksheet>new</worksheet>"),
+            "[Content_Types].xml": b"<Types><Default/></Types>",
+            "docProps/custom.xml": b"<Properties/>",
+        },
+    )
+
+    with zipfile.ZipFile(package) as before, zipfile.ZipFile(target) as after:
+        assert after.testzip() is None
+        assert after.namelist() == before.namelist() + ["docProps/custom.xml"]
+        assert after.read("xl/worksheets/sheet1.xml") == b"<worksheet>new</worksheet>"
+        assert after.read("[Content_Types].xml") == b"<Types><Default/></Types>"
+        assert after.read("docProps/custom.xml") == b"<Properties/>"
+        assert after.read("xl/données.xml") == b"<x/>"
+        assert after.getinfo("xl/media/image1.png").compress_type == zipfile.ZIP_STORED
+        assert after.getinfo("xl/vbaProject.bin").date_time == before.getinfo("xl/vbaProject.bin").date_time
+        assert after.comment == b"template"
+    for name in ("xl/media/image1.png", "xl/vbaProject.bin", "xl/données.xml"):
+        assert _raw_member(target, name) == _raw_member(package, name)
+
+
+def test_replace_members_in_place(package):
+    """replace_members rewrites the package at its own path; None removes a member."""
+    replace_members(package, {"xl/vbaProject.bin": b"patched", "xl/données.xml": None, "absent.xml": None})
+
+    with zipfile.ZipFile(package) as zf:
+        assert zf.testzip() is None
+        assert "xl/données.xml" not in zf.namelist() and "absent.xml" not in zf.namelist()
+        assert zf.read("xl/vbaProject.bin") == b"patched"
+        assert zf.read("xl/worksheets/sheet1.xml").startswith(b"<worksheet>old")
+    assert not package.with_name(f".{package.name}.tmp").exists()
+
+
+def test_copy_over_source_rejected(package):
+    """Writing over the source must go through replace_members."""
+    with pytest.raises(ValueError):
+        copy_with_replacements(package, package, {})